@@ -3,13 +3,45 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_jwt_extended import JWTManager
 from flask_mail import Mail
 from flask_cors import CORS
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import math
 import os
+import sqlite3
 
 db = SQLAlchemy()
 jwt = JWTManager()
 mail = Mail()
 
 
+@event.listens_for(Engine, 'connect')
+def _enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    """Enforce foreign keys (and their ON DELETE actions) on SQLite.
+
+    SQLite ignores foreign key constraints unless enabled per connection.
+    """
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
+
+
+@event.listens_for(Engine, 'connect')
+def _ensure_sqlite_math_functions(dbapi_connection, connection_record):
+    """Provide ln() and exp() on SQLite builds without math functions.
+
+    Item freshness is computed in SQL with ln and exp, which SQLite only
+    has when compiled with SQLITE_ENABLE_MATH_FUNCTIONS (3.35+). Without
+    them, Python implementations are registered on the connection.
+    """
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        try:
+            dbapi_connection.execute('SELECT ln(1), exp(0)')
+        except sqlite3.OperationalError:
+            dbapi_connection.create_function('ln', 1, math.log, deterministic=True)
+            dbapi_connection.create_function('exp', 1, math.exp, deterministic=True)
+
+
 def create_app(config_name='development'):
     """Application factory function."""
     from app.config.production import Production
@@ -34,14 +66,26 @@ def create_app(config_name='development'):
     jwt.init_app(app)
     mail.init_app(app)
     
+    # Bounded LRU cache for serialized read responses, keyed by data version
+    from app.utils.lru_cache import LRUCache
+    app.extensions['response_cache'] = LRUCache(
+        max_entries=app.config['RESPONSE_CACHE_MAX_ENTRIES'],
+        max_size=app.config['RESPONSE_CACHE_MAX_SIZE']
+    )
+    
+    # Request-scoped batching loaders for repository lookups
+    from app.repositories import loaders
+    loaders.init_app(app)
+    
     # Enable CORS with configurable origins
     cors_origins = os.getenv('CORS_ORIGINS', 'http://localhost:5173').split(',')
     
     CORS(app, resources={
         r"/api/*": {
             "origins": cors_origins,
-            "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-            "allow_headers": ["Content-Type", "Authorization"],
+            "methods": ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+            "allow_headers": ["Content-Type", "Authorization", "Idempotency-Key"],
+            "expose_headers": ["Idempotent-Replayed"],
             "supports_credentials": True
         }
     })
@@ -57,8 +101,10 @@ def create_app(config_name='development'):
     def root():
         return {'status': 'ok'}, 200
     
-    # Create database tables
-    with app.app_context():
-        db.create_all()
+    # Create missing tables and apply pending schema migrations
+    if app.config['MIGRATE_ON_STARTUP']:
+        from app.migrations import upgrade_database
+        with app.app_context():
+            upgrade_database()
     
     return app
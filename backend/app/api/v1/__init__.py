@@ -41,3 +41,6 @@ api_bp.register_blueprint(value_bp, url_prefix='/value')
 
 from .verification import verification_bp
 api_bp.register_blueprint(verification_bp, url_prefix='/verification')
+
+from .blob import blob_bp
+api_bp.register_blueprint(blob_bp, url_prefix='/blob')
@@ -0,0 +1,41 @@
+"""
+Blob Routes
+Serves content-addressed images (profile pictures, category images).
+"""
+from flask import Blueprint, current_app, jsonify, request
+from app.services.blob_service import BlobService
+
+blob_bp = Blueprint('blob', __name__)
+
+_blob_service = BlobService()
+
+
+@blob_bp.route('/<string:blob_hash>', methods=['GET'])
+def get_blob(blob_hash: str):
+    """Get the content of a blob.
+    
+    Public so image tags can load it without an Authorization header; the
+    URL is the SHA-256 of the content, so it is unguessable and the
+    response can be cached forever.
+    
+    Path Parameters:
+        blob_hash (str): Hex SHA-256 of the content
+        
+    Returns:
+        200: Blob content with its content type
+        304: Client already holds this blob
+        404: Blob not found
+    """
+    if request.if_none_match.contains(blob_hash):
+        response = current_app.response_class(status=304)
+    else:
+        blob = _blob_service.get_blob(blob_hash)
+        if blob is None:
+            return jsonify({'message': 'Blob not found'}), 404
+        data, content_type = blob
+        response = current_app.response_class(data, status=200, mimetype=content_type)
+
+    response.set_etag(blob_hash)
+    response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    response.headers['X-Content-Type-Options'] = 'nosniff'
+    return response
@@ -6,6 +6,8 @@ from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required
 from app.services.category_service import CategoryService
 from app.api.v1.schemas.category_schema import CategorySchemaResponse
+from app.models.data_version import DataVersion
+from app.utils.http_cache import conditional
 
 category_bp = Blueprint('category', __name__)
 
@@ -14,6 +16,7 @@ service = CategoryService()
 
 @category_bp.route('/', methods=['GET'])
 @jwt_required()
+@conditional(lambda: [DataVersion.CATEGORIES])
 def get_categories():
     """Get all item categories.
     
@@ -53,6 +56,7 @@ def get_categories():
 
 @category_bp.route('/<int:category_id>', methods=['GET'])
 @jwt_required()
+@conditional(lambda category_id: [DataVersion.CATEGORIES])
 def get_category_by_id(category_id: int):
     """Get a specific category by ID.
     
@@ -1,25 +1,94 @@
 """Item endpoints."""
-from flask import Blueprint, jsonify, request
+import io
+import json
+
+from flask import Blueprint, current_app, jsonify, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from pydantic import ValidationError
 
-from app.services.item_service import ItemService
+from app.services.item_service import ItemEditForbiddenError, ItemNotFoundError, ItemService
+from app.services.item_import_service import ItemImportService, read_csv, read_ndjson
 from app.services.user_service import UserService
-from app.api.v1.schemas.item_schema import CreateItemRequest, ItemResponse
+from app.api.v1.schemas.item_schema import CreateItemRequest, ItemResponse, UpdateItemRequest
+from app.models.data_version import DataVersion
+from app.repositories.base.item_repository_interface import ItemSort
+from app.utils.fieldsets import Fieldset
+from app.utils.http_cache import conditional
+from app.utils.idempotency import idempotent
+from app.utils.item_filters import ItemFilters
 
 item_bp = Blueprint('item', __name__)
 
 _item_service = ItemService()
+_item_import_service = ItemImportService()
 _user_service = UserService()
 
 
+def _user_city_scopes(*args, **kwargs):
+    """Data version scopes for endpoints serving the current user's city feed.
+    
+    Returns None (no conditional handling) when the user has no city, so
+    the view can report the error itself.
+    """
+    user = _user_service.get_user_by_id(get_jwt_identity())
+    if not user or not user.rotation_city_id:
+        return None
+    return [DataVersion.city_items_scope(user.rotation_city_id)]
+
+
+def _validation_errors(error: ValidationError) -> list[dict]:
+    """JSON-serializable errors of a failed request validation.
+    
+    Each error keeps its loc, msg and type, and its ctx (e.g. the limit
+    that was exceeded) with the values converted to strings.
+    """
+    errors = []
+    for detail in error.errors():
+        serializable_error = {
+            'loc': detail['loc'],
+            'msg': detail['msg'],
+            'type': detail['type']
+        }
+        if 'ctx' in detail:
+            serializable_error['ctx'] = {k: str(v) for k, v in detail['ctx'].items()}
+        errors.append(serializable_error)
+    return errors
+
+
+def _documents_response(documents: list[str], envelope: dict = None):
+    """Build a JSON response from pre-rendered item documents.
+    
+    Documents are spliced into the body as-is instead of being parsed
+    and re-serialized.
+    
+    Args:
+        documents: Rendered item JSON documents
+        envelope: Optional extra top-level fields; when given the documents
+            are returned under an ``items`` key alongside them
+    
+    Returns:
+        Flask response with application/json body
+    """
+    body = '[' + ','.join(documents) + ']'
+    if envelope is not None:
+        fields = [f'"items":{body}'] + [
+            f'{json.dumps(key)}:{json.dumps(value)}'
+            for key, value in sorted(envelope.items())
+        ]
+        body = '{' + ','.join(fields) + '}'
+    return current_app.response_class(body, status=200, mimetype='application/json')
+
+
 @item_bp.route('/', methods=['POST'])
 @jwt_required()
+@idempotent
 def create_item():
     """Create a new item with categories and tags.
     
     Headers:
         Authorization: Bearer <access_token>
+        Idempotency-Key (optional): Retries with the same key get the first
+            response back instead of creating the item again
     
     Request Body:
         name (str): Item name
@@ -65,22 +134,9 @@ def create_item():
         return jsonify(ItemResponse.model_validate(item).model_dump()), 201
     
     except ValidationError as e:
-        # Convert errors to ensure all values are JSON serializable
-        errors = []
-        for error in e.errors():
-            serializable_error = {
-                'loc': error['loc'],
-                'msg': error['msg'],
-                'type': error['type']
-            }
-            if 'ctx' in error:
-                # Convert context values to strings if they're not serializable
-                serializable_error['ctx'] = {k: str(v) for k, v in error['ctx'].items()}
-            errors.append(serializable_error)
-        
         return jsonify({
             'message': 'Validation error',
-            'errors': errors
+            'errors': _validation_errors(e)
         }), 400
     
     except ValueError as e:
@@ -91,20 +147,114 @@ def create_item():
         return jsonify({'message': 'An error occurred while creating item'}), 500
 
 
+@item_bp.route('/import', methods=['POST'])
+@jwt_required()
+def import_items():
+    """Bulk import items into the current user's rotation city.
+    
+    The body is streamed and written in batches; rows that fail validation
+    or reference unknown categories are reported and skipped while the
+    others are imported. Tags that do not exist yet are created.
+    
+    Headers:
+        Authorization: Bearer <access_token>
+        Content-Type: application/x-ndjson (one item object per line) or
+            text/csv (columns name, location, walking_distance, categories
+            and tag:<name>)
+    
+    Request Body (per NDJSON line):
+        name (str): Item name
+        location (str): Item location
+        walking_distance (float, optional): Walking distance in meters
+        categories (list): Category IDs or names (at least one)
+        tags (dict, optional): Tag name to value
+    
+    Returns:
+        200: {"imported", "failed", "errors": [{"row", "message"}]}
+        400: User has no rotation city or body is not valid UTF-8
+        415: Unsupported content type
+        500: Internal server error
+    """
+    readers = {
+        'application/x-ndjson': read_ndjson,
+        'application/jsonl': read_ndjson,
+        'text/csv': read_csv
+    }
+    reader = readers.get(request.mimetype)
+    if reader is None:
+        return jsonify({'message': 'Content-Type must be application/x-ndjson or text/csv'}), 415
+    
+    try:
+        user = _user_service.get_user_by_id(get_jwt_identity())
+        if not user or not user.rotation_city_id:
+            return jsonify({'message': 'User rotation city not found'}), 400
+        
+        lines = io.TextIOWrapper(request.stream, encoding='utf-8', newline='')
+        report = _item_import_service.import_rows(
+            reader(lines),
+            rotation_city_id=user.rotation_city_id,
+            added_by_user_id=user.user_id,
+            max_rows=current_app.config['ITEM_IMPORT_MAX_ROWS']
+        )
+        return jsonify(report.to_dict()), 200
+    
+    except UnicodeDecodeError:
+        return jsonify({'message': 'Request body must be UTF-8 encoded'}), 400
+    
+    except Exception as e:
+        # Log the error in production
+        return jsonify({'message': 'An error occurred while importing items'}), 500
+
+
+def _feed_sort(args) -> ItemSort:
+    """Parse the feed order from the sort query parameter."""
+    try:
+        return ItemSort(args.get('sort', ItemSort.NEWEST.value))
+    except ValueError:
+        raise ValueError(
+            f"sort must be one of: {', '.join(sort.value for sort in ItemSort)}"
+        )
+
+
 @item_bp.route('/', methods=['GET'])
 @jwt_required()
+@conditional(_user_city_scopes)
 def get_all_items():
     """Get all items for the current user's rotation city.
     
     Returns all items shared by students in the authenticated user's city,
     with full details including categories, tags, and values.
     
+    Items are listed newest first, or with ``sort=freshness`` by their
+    time-decayed verification count (never verified items last).
+    
+    When ``limit`` or ``cursor`` is given, the feed is paginated with a
+    keyset cursor on (sort key, item_id) and wrapped in an envelope with
+    ``items`` and ``next_cursor``. Without them the full list is returned.
+    
+    Filter parameters narrow the feed; tag parameters take
+    ``<tag_id>:<value>`` and may be repeated (all must match).
+    
     Headers:
         Authorization: Bearer <access_token>
     
+    Query Parameters:
+        sort: newest (default) or freshness
+        limit: Page size (default 50, max 200)
+        cursor: Opaque next_cursor value from the previous page (same sort)
+        fields: Comma-separated item fields to return (e.g. name,added_by_user.first_name)
+        exclude: Comma-separated item fields to omit (e.g. added_by_user.profile_picture)
+        category_id: Only items in this category (repeatable, any matches)
+        tag_bool: Boolean tag equals, e.g. 3:true
+        tag_min / tag_max: Numeric tag bounds, e.g. 5:10
+        tag_text: Text tag equals (case-insensitive), e.g. 7:vegan
+        max_walking_distance: Maximum walking distance in meters
+        min_verifications: Minimum number of verifications
+    
     Returns:
-        200: List of items in user's rotation city
-        400: User has no rotation city assigned
+        200: List of items, or a page envelope when paginating
+        400: User has no rotation city assigned, invalid cursor or sort,
+            unknown field or malformed filter
         500: Internal server error
     """
     try:
@@ -115,17 +265,145 @@ def get_all_items():
         if not user or not user.rotation_city_id:
             return jsonify({'message': 'User has no rotation city assigned'}), 400
         
-        # Get items filtered by rotation city with full details
-        items = _item_service.get_all_items_with_details(user.rotation_city_id)
-        return jsonify([ItemResponse.model_validate(item).model_dump() for item in items]), 200
+        fieldset = Fieldset.from_args(request.args, ItemResponse)
+        filters = ItemFilters.from_args(request.args)
+        sort = _feed_sort(request.args)
+        paginated = 'limit' in request.args or 'cursor' in request.args
+        limit = max(1, min(request.args.get('limit', 50, type=int), 200))  # Cap at 200
+        
+        if fieldset is not None:
+            # Sparse responses are loaded column-pruned instead of from documents
+            if paginated:
+                items, next_cursor = _item_service.get_items_page(
+                    user.rotation_city_id,
+                    limit=limit,
+                    cursor=request.args.get('cursor'),
+                    fieldset=fieldset,
+                    filters=filters,
+                    sort=sort
+                )
+                return jsonify({
+                    'items': [fieldset.project(item) for item in items],
+                    'limit': limit,
+                    'next_cursor': next_cursor
+                }), 200
+            
+            items = _item_service.get_all_items_with_details(
+                user.rotation_city_id, fieldset=fieldset, filters=filters, sort=sort
+            )
+            return jsonify([fieldset.project(item) for item in items]), 200
+        
+        if paginated:
+            documents, next_cursor = _item_service.get_item_documents_page(
+                user.rotation_city_id,
+                limit=limit,
+                cursor=request.args.get('cursor'),
+                filters=filters,
+                sort=sort
+            )
+            return _documents_response(
+                documents, {'next_cursor': next_cursor, 'limit': limit}
+            )
+        
+        # Serve precomputed item documents for the rotation city
+        return _documents_response(
+            _item_service.get_item_documents(user.rotation_city_id, filters=filters, sort=sort)
+        )
+    
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
     
     except Exception as e:
         # Log the error in production
         return jsonify({'message': 'An error occurred while fetching items'}), 500
 
 
+@item_bp.route('/facets', methods=['GET'])
+@jwt_required()
+@conditional(_user_city_scopes)
+def get_item_facets():
+    """Get filter facet counts for the current user's rotation city.
+    
+    Returns the number of matching items, per-category item counts and,
+    for each tag, how many items have each value. Accepts the same filter
+    parameters as ``GET /item`` and counts only the items they match.
+    
+    Headers:
+        Authorization: Bearer <access_token>
+    
+    Query Parameters:
+        category_id, tag_bool, tag_min, tag_max, tag_text,
+        max_walking_distance, min_verifications: See ``GET /item``
+    
+    Returns:
+        200: {"total", "categories": [...], "tags": [{..., "values": [...]}]}
+        400: User has no rotation city assigned or malformed filter
+        500: Internal server error
+    """
+    try:
+        user = _user_service.get_user_by_id(get_jwt_identity())
+        if not user or not user.rotation_city_id:
+            return jsonify({'message': 'User has no rotation city assigned'}), 400
+        
+        filters = ItemFilters.from_args(request.args)
+        return current_app.response_class(
+            _item_service.get_item_facets(user.rotation_city_id, filters),
+            status=200,
+            mimetype='application/json'
+        )
+    
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    
+    except Exception as e:
+        # Log the error in production
+        return jsonify({'message': 'An error occurred while counting items'}), 500
+
+
+@item_bp.route('/search', methods=['GET'])
+@jwt_required()
+@conditional(_user_city_scopes)
+def search_items():
+    """Full-text search the items of the current user's rotation city.
+    
+    Matches item name, location and text tag values. Every word of the
+    query must match the start of a word; results are ranked by relevance
+    blended with the number of verifications.
+    
+    Headers:
+        Authorization: Bearer <access_token>
+    
+    Query Parameters:
+        q: Search text
+        limit: Maximum number of results (default 20, max 100)
+    
+    Returns:
+        200: List of matching items, best match first
+        400: Missing query or user has no rotation city assigned
+        500: Internal server error
+    """
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            return jsonify({'message': 'Search query (q) is required'}), 400
+        
+        user = _user_service.get_user_by_id(get_jwt_identity())
+        if not user or not user.rotation_city_id:
+            return jsonify({'message': 'User has no rotation city assigned'}), 400
+        
+        limit = max(1, min(request.args.get('limit', 20, type=int), 100))
+        return _documents_response(
+            _item_service.search_item_documents(user.rotation_city_id, query, limit)
+        )
+    
+    except Exception as e:
+        # Log the error in production
+        return jsonify({'message': 'An error occurred while searching items'}), 500
+
+
 @item_bp.route('/<int:item_id>', methods=['GET'])
 @jwt_required()
+@conditional(_user_city_scopes)
 def get_item_by_id(item_id):
     """Get item by ID (must belong to user's rotation city).
     
@@ -138,6 +416,10 @@ def get_item_by_id(item_id):
     Headers:
         Authorization: Bearer <access_token>
     
+    Query Parameters:
+        fields: Comma-separated item fields to return
+        exclude: Comma-separated item fields to omit
+    
     Returns:
         200: Item details with all relationships loaded
     Args:
@@ -145,10 +427,15 @@ def get_item_by_id(item_id):
     
     Returns:
         200: Item details
-        400: User has no rotation city assigned
+        400: User has no rotation city assigned or unknown field
         404: Item not found or doesn't belong to user's rotation city
         500: Internal server error
     """
+    try:
+        fieldset = Fieldset.from_args(request.args, ItemResponse)
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    
     try:
         # Get user's rotation_city_id
         user_id = get_jwt_identity()
@@ -157,9 +444,15 @@ def get_item_by_id(item_id):
         if not user or not user.rotation_city_id:
             return jsonify({'message': 'User has no rotation city assigned'}), 400
         
-        # Get item filtered by rotation city with full details
-        item = _item_service.get_item_by_id_with_details(item_id, user.rotation_city_id)
-        return jsonify(ItemResponse.model_validate(item).model_dump()), 200
+        if fieldset is not None:
+            item = _item_service.get_item_by_id_with_details(
+                item_id, user.rotation_city_id, fieldset=fieldset
+            )
+            return jsonify(fieldset.project(item)), 200
+        
+        # Serve the precomputed document of the item in the user's city
+        document = _item_service.get_item_document(item_id, user.rotation_city_id)
+        return current_app.response_class(document, status=200, mimetype='application/json')
     
     except ValueError as e:
         return jsonify({'message': str(e)}), 404
@@ -169,8 +462,93 @@ def get_item_by_id(item_id):
         return jsonify({'message': 'An error occurred while fetching item'}), 500
 
 
+@item_bp.route('/<int:item_id>', methods=['PATCH'])
+@jwt_required()
+def update_item(item_id):
+    """Partially update an item in the user's rotation city.
+    
+    Only the fields sent are changed; only the categories and tag values
+    that differ from the current ones are written.
+    
+    Path Parameters:
+        item_id (int): ID of the item to update
+        
+    Headers:
+        Authorization: Bearer <access_token>
+    
+    Request Body (all optional):
+        name (str): Item name
+        location (str): Item location
+        walking_distance (float | null): Walking distance in meters
+        category_ids (list[int]): The item's categories (replaces them)
+        existing_tags (list[dict]): {tag_id, value} pairs; with new_tags,
+            the item's complete set of tags
+        new_tags (list[dict]): {name, value_type, value} of tags to create
+    
+    Only the user who added the item can edit it.
+    
+    Returns:
+        200: Updated item
+        400: Validation error or user has no rotation city
+        403: Item was added by another user
+        404: Item not found or doesn't belong to user's rotation city
+        500: Internal server error
+    """
+    user_id = get_jwt_identity()
+    
+    if not request.json:
+        return jsonify({'message': 'Request body is required'}), 400
+    
+    try:
+        validated_data = UpdateItemRequest(**request.json)
+        
+        user = _user_service.get_user_by_id(user_id)
+        if not user or not user.rotation_city_id:
+            return jsonify({'message': 'User rotation city not found'}), 400
+        
+        sent = validated_data.model_fields_set
+        document = _item_service.update_item(
+            item_id,
+            user.rotation_city_id,
+            user.user_id,
+            fields=validated_data.model_dump(
+                include={'name', 'location', 'walking_distance'} & sent
+            ),
+            category_ids=validated_data.category_ids,
+            existing_tags=(
+                [tag.model_dump() for tag in validated_data.existing_tags]
+                if 'existing_tags' in sent else None
+            ),
+            new_tags=(
+                [tag.model_dump() for tag in validated_data.new_tags]
+                if 'new_tags' in sent else None
+            )
+        )
+        return current_app.response_class(document, status=200, mimetype='application/json')
+    
+    except ValidationError as e:
+        return jsonify({
+            'message': 'Validation error',
+            'errors': _validation_errors(e)
+        }), 400
+    
+    except ItemNotFoundError as e:
+        return jsonify({'message': str(e)}), 404
+    
+    except ItemEditForbiddenError as e:
+        return jsonify({'message': str(e)}), 403
+    
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    
+    except Exception as e:
+        # Log the error in production
+        return jsonify({'message': 'An error occurred while updating item'}), 500
+
+
 @item_bp.route('/user/<int:user_id>', methods=['GET'])
 @jwt_required()
+@conditional(lambda user_id: [DataVersion.ITEMS])
 def get_user_items(user_id):
     """Get all items added by a specific user.
     
@@ -184,20 +562,33 @@ def get_user_items(user_id):
     Headers:
         Authorization: Bearer <access_token>
     
+    Query Parameters:
+        fields: Comma-separated item fields to return
+        exclude: Comma-separated item fields to omit
+    
     Returns:
         200: List of items added by the user
+        400: Unknown field
         404: User not found
         500: Internal server error
     """
+    try:
+        fieldset = Fieldset.from_args(request.args, ItemResponse)
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    
     try:
         # Verify user exists
         user = _user_service.get_user_by_id(user_id)
         if not user:
             return jsonify({'message': f'User with ID {user_id} not found'}), 404
         
-        # Get all items added by this user
-        items = _item_service.get_user_items(user_id)
-        return jsonify([ItemResponse.model_validate(item).model_dump() for item in items]), 200
+        if fieldset is not None:
+            items = _item_service.get_user_items(user_id, fieldset=fieldset)
+            return jsonify([fieldset.project(item) for item in items]), 200
+        
+        # Serve precomputed documents of all items added by this user
+        return _documents_response(_item_service.get_user_item_documents(user_id))
     
     except Exception as e:
         # Log the error in production
@@ -1,11 +1,14 @@
 from flask import jsonify, Blueprint
 from app.services.rotation_city_service import RotationCityService
 from app.api.v1.schemas.rotation_city_schema import RotationCityResponse
+from app.models.data_version import DataVersion
+from app.utils.http_cache import conditional
 
 rotation_city_bp = Blueprint('rotation_city', __name__)
 
 
 @rotation_city_bp.route('/', methods=['GET'])
+@conditional(lambda: [DataVersion.ROTATION_CITIES])
 def get_rotation_cities():
     """Get list of all Minerva rotation cities.
     
@@ -26,6 +29,7 @@ def get_rotation_cities():
 
 
 @rotation_city_bp.route('/<int:city_id>', methods=['GET'])
+@conditional(lambda city_id: [DataVersion.ROTATION_CITIES])
 def get_rotation_city(city_id):
     """Get a specific rotation city by ID.
     
@@ -1,13 +1,13 @@
 """Category response schema."""
 from pydantic import BaseModel
-from typing import Optional
+from app.utils.blobs import BlobUrl
 
 
 class CategorySchemaResponse(BaseModel):
     """Schema for category response."""
     category_id: int
     category_name: str
-    category_pic: Optional[str] = None
+    category_pic: BlobUrl = None
 
     model_config = {
         "from_attributes": True
@@ -1,7 +1,8 @@
 """Item API schemas for requests and responses."""
 from datetime import datetime
 from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
+from app.utils.blobs import BlobUrl
 
 
 # Nested response schemas for related objects
@@ -21,7 +22,7 @@ class UserNested(BaseModel):
     first_name: str
     last_name: str
     email: str
-    profile_picture: Optional[str] = None
+    profile_picture: BlobUrl = None
     
     model_config = ConfigDict(from_attributes=True)
 
@@ -121,6 +122,87 @@ class CreateItemRequest(BaseModel):
         return v
 
 
+class UpdateItemRequest(BaseModel):
+    """Schema for partially updating an item.
+    
+    Omitted fields are left unchanged. When existing_tags or new_tags is
+    given, the item's tags become exactly those listed (tags not listed are
+    removed); likewise category_ids replaces the item's categories.
+    """
+    name: Optional[str] = Field(None, min_length=1, max_length=200, description="Item name")
+    location: Optional[str] = Field(None, min_length=1, max_length=500, description="Item location")
+    walking_distance: Optional[float] = Field(None, ge=0, description="Walking distance in meters")
+    category_ids: Optional[List[int]] = Field(None, min_length=1, description="The item's categories")
+    existing_tags: Optional[List[ExistingTagRequest]] = Field(None, description="Existing tags with values")
+    new_tags: Optional[List[NewTagRequest]] = Field(None, description="New tags to create")
+
+    model_config = ConfigDict(
+        extra='forbid',
+        str_strip_whitespace=True
+    )
+
+    @field_validator('name', 'location')
+    @classmethod
+    def validate_not_empty(cls, v: Optional[str]) -> Optional[str]:
+        """Validate strings are not null or empty after stripping."""
+        if v is None or not v.strip():
+            raise ValueError("Field cannot be empty")
+        return v.strip()
+
+    @field_validator('category_ids')
+    @classmethod
+    def validate_category_ids(cls, v: Optional[List[int]]) -> List[int]:
+        """Validate category IDs are present, positive and unique."""
+        if v is None:
+            raise ValueError("At least one category is required")
+        return CreateItemRequest.validate_category_ids(v)
+
+    @field_validator('existing_tags')
+    @classmethod
+    def validate_existing_tags(cls, v: Optional[List[ExistingTagRequest]]) -> List[ExistingTagRequest]:
+        """Validate each tag is listed once."""
+        v = v or []
+        tag_ids = [tag.tag_id for tag in v]
+        if len(tag_ids) != len(set(tag_ids)):
+            raise ValueError("Duplicate tag IDs are not allowed")
+        return v
+
+    @field_validator('new_tags')
+    @classmethod
+    def validate_new_tags(cls, v: Optional[List[NewTagRequest]]) -> List[NewTagRequest]:
+        """Treat null as an empty list."""
+        return v or []
+
+
+class ImportItemRow(BaseModel):
+    """Schema for one row of a bulk item import.
+    
+    Categories and tags are referenced by name (categories also by ID);
+    tags that do not exist yet are created by the import.
+    """
+    name: str = Field(..., min_length=1, max_length=200, description="Item name")
+    location: str = Field(..., min_length=1, max_length=500, description="Item location")
+    walking_distance: Optional[float] = Field(None, ge=0, description="Walking distance in meters")
+    categories: List[Union[int, str]] = Field(..., min_length=1, description="Category IDs or names")
+    tags: Dict[str, Union[bool, float, str]] = Field(default_factory=dict, description="Tag name to value")
+
+    model_config = ConfigDict(
+        extra='forbid',
+        str_strip_whitespace=True
+    )
+
+    @field_validator('tags')
+    @classmethod
+    def validate_tag_names(cls, v: Dict[str, Union[bool, float, str]]) -> Dict[str, Union[bool, float, str]]:
+        """Validate tag names are non-empty, short enough and unique ignoring case."""
+        names = [name.strip() for name in v]
+        if any(not name or len(name) > 100 for name in names):
+            raise ValueError("Tag names must be 1-100 characters")
+        if len({name.lower() for name in names}) != len(names):
+            raise ValueError("Duplicate tag names are not allowed")
+        return {name.strip(): value for name, value in v.items()}
+
+
 class ItemResponse(BaseModel):
     """Response schema for item with full nested objects."""
     item_id: int
@@ -132,6 +214,35 @@ class ItemResponse(BaseModel):
     categories: List[CategoryNested]
     tags: List[TagWithValue]
     number_of_verifications: int
+    last_verified_date: Optional[datetime] = None
     created_at: datetime
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class CategoryFacet(BaseModel):
+    """Number of matching items in one category."""
+    category_id: int
+    name: str
+    count: int
+
+
+class TagValueFacet(BaseModel):
+    """Number of matching items having one value of a tag."""
+    value: Union[bool, str, float]
+    count: int
+
+
+class TagFacet(BaseModel):
+    """Value distribution of one tag over matching items."""
+    tag_id: int
+    name: str
+    value_type: str
+    values: List[TagValueFacet]
+
+
+class ItemFacetsResponse(BaseModel):
+    """Facet counts over a city's items (after filters)."""
+    total: int
+    categories: List[CategoryFacet]
+    tags: List[TagFacet]
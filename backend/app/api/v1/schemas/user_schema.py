@@ -1,5 +1,6 @@
 from pydantic import BaseModel, ConfigDict
 from app.api.v1.schemas.rotation_city_schema import RotationCityResponse
+from app.utils.blobs import BlobUrl
 
 
 class UserResponse(BaseModel):
@@ -8,7 +9,7 @@ class UserResponse(BaseModel):
     first_name: str
     last_name: str
     email: str | None = None
-    profile_picture: str | None = None
+    profile_picture: BlobUrl = None
     rotation_city: RotationCityResponse | None = None
 
     model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -4,6 +4,7 @@ Pydantic schemas for verification request/response validation.
 """
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 from typing import Optional, List
+from app.utils.blobs import BlobUrl
 
 
 class VerifyItemRequest(BaseModel):
@@ -25,12 +26,31 @@ class VerifyItemRequest(BaseModel):
         return v
 
 
+# Items accepted per POST /verification/items/batch request
+MAX_BATCH_ITEMS = 50
+
+
+class BatchVerifyItem(VerifyItemRequest):
+    """One item of a batch verification request."""
+    item_id: int = Field(..., gt=0, description="ID of the item to verify")
+
+
+class BatchVerifyRequest(BaseModel):
+    """Request schema for verifying several items at once."""
+    items: List[BatchVerifyItem] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_ITEMS,
+        description="Items to verify, each with an optional note"
+    )
+
+
 class VerificationResponse(BaseModel):
     """Response schema for a single verification."""
     verification_id: int = Field(..., description="Unique verification ID")
     user_id: int = Field(..., description="ID of user who verified")
     user_name: str = Field(..., description="Full name of user who verified")
-    user_photo: Optional[str] = Field(None, description="Profile photo URL of user who verified")
+    user_photo: BlobUrl = Field(None, description="Profile photo URL of user who verified")
     item_id: int = Field(..., description="ID of item verified")
     item_name: str = Field(..., description="Name of item verified")
     note: Optional[str] = Field(None, description="Verification note")
@@ -62,6 +82,10 @@ class ItemVerificationsResponse(BaseModel):
         ...,
         description="Number of verifications in this response"
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor of the next page, null on the last page"
+    )
 
 
 class UserVerificationsResponse(BaseModel):
@@ -75,3 +99,50 @@ class UserVerificationsResponse(BaseModel):
         ...,
         description="Number of verifications returned"
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor of the next page, null on the last page"
+    )
+
+
+class BatchVerificationResult(BaseModel):
+    """Outcome of verifying one item of a batch."""
+    item_id: int = Field(..., description="ID of the item")
+    status: str = Field(
+        ...,
+        description="verified, not_found, already_verified_today or duplicate"
+    )
+    message: Optional[str] = Field(None, description="Why the item was not verified")
+    verification: Optional[CreateVerificationResponse] = Field(
+        None,
+        description="The created verification, if verified"
+    )
+
+
+class BatchVerifyResponse(BaseModel):
+    """Response schema for a batch verification."""
+    results: List[BatchVerificationResult] = Field(
+        ...,
+        description="One result per requested item, in request order"
+    )
+    verified_count: int = Field(..., description="Number of items verified")
+    failed_count: int = Field(..., description="Number of items not verified")
+
+
+class VerificationTrendDay(BaseModel):
+    """Verifications made on one day."""
+    day: str = Field(..., description="UTC day, ISO formatted")
+    verification_count: int = Field(..., description="Verifications made that day")
+
+
+class VerificationTrendResponse(BaseModel):
+    """Response schema for verifications per day of a city or item."""
+    rotation_city_id: Optional[int] = Field(None, description="ID of the city, for a city trend")
+    item_id: Optional[int] = Field(None, description="ID of the item, for an item trend")
+    start: str = Field(..., description="First day covered, ISO formatted")
+    end: str = Field(..., description="Last day covered, ISO formatted")
+    total_count: int = Field(..., description="Verifications over the whole range")
+    days: List[VerificationTrendDay] = Field(
+        ...,
+        description="One entry per day from start to end, including days without verifications"
+    )
@@ -4,6 +4,8 @@ from flask_jwt_extended import jwt_required
 
 from app.services.tag_service import TagService
 from app.api.v1.schemas.tag_schema import TagResponse
+from app.models.data_version import DataVersion
+from app.utils.http_cache import conditional
 
 tag_bp = Blueprint('tag', __name__)
 
@@ -12,6 +14,7 @@ _tag_service = TagService()
 
 @tag_bp.route('/', methods=['GET'])
 @jwt_required()
+@conditional(lambda: [DataVersion.TAGS])
 def get_all_tags():
     """Get all available tags.
     
@@ -4,21 +4,25 @@ from flask_jwt_extended import jwt_required, get_jwt_identity
 
 from app.services.user_service import UserService
 from app.api.v1.schemas.user_schema import UserResponse
+from app.utils.fieldsets import Fieldset
 
 user_bp = Blueprint('user', __name__)
 
 _user_service: UserService = UserService()
 
 
-def _serialize_user(user):
+def _serialize_user(user, fieldset=None):
     """Serialize user model to response dictionary.
     
     Args:
         user: User model instance
+        fieldset: Optional sparse fieldset selecting the fields to return
         
     Returns:
         Dictionary with user data validated by UserResponse schema
     """
+    if fieldset is not None:
+        return fieldset.project(user)
     return UserResponse.model_validate(user).model_dump()
 
 @user_bp.route('/me', methods=['GET'])
@@ -31,20 +35,30 @@ def get_current_user():
     Headers:
         Authorization: Bearer <access_token>
         
+    Query Parameters:
+        fields: Comma-separated user fields to return
+        exclude: Comma-separated user fields to omit (e.g. profile_picture)
+        
     Returns:
         200: User information including rotation city
+        400: Unknown field
         404: User not found
         500: Internal server error
     """
     user_id = get_jwt_identity()
     
     try:
-        user = _user_service.get_user_by_id(user_id)
+        fieldset = Fieldset.from_args(request.args, UserResponse)
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+    
+    try:
+        user = _user_service.get_user_by_id(user_id, fieldset)
 
         if user is None:
             return jsonify({'message': 'User not found.'}), 404
 
-        return jsonify(_serialize_user(user)), 200
+        return jsonify(_serialize_user(user, fieldset)), 200
 
     except Exception as e:
         return jsonify({'message': 'An error occurred while fetching user data.'}), 500
@@ -62,17 +76,27 @@ def get_user(user_id):
     Headers:
         Authorization: Bearer <access_token>
         
+    Query Parameters:
+        fields: Comma-separated user fields to return
+        exclude: Comma-separated user fields to omit (e.g. profile_picture)
+        
     Returns:
         200: User information
+        400: Unknown field
         404: User not found or not verified
         500: Internal server error
     """
-    user = _user_service.get_verified_user_by_id(user_id)
+    try:
+        fieldset = Fieldset.from_args(request.args, UserResponse)
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+
+    user = _user_service.get_verified_user_by_id(user_id, fieldset)
 
     if user is None:
         return jsonify({'message': 'User not found.'}), 404
 
-    return jsonify(_serialize_user(user)), 200
+    return jsonify(_serialize_user(user, fieldset)), 200
 
 @user_bp.route('/me', methods=['PUT'])
 @jwt_required()
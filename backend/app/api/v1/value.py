@@ -2,12 +2,15 @@ from flask import jsonify, Blueprint, request
 from app.services.value_service import ValueService
 from app.api.v1.schemas.value_schema import ValueSchemaResponse
 from flask_jwt_extended import jwt_required
+from app.models.data_version import DataVersion
+from app.utils.http_cache import conditional
 
 value_bp = Blueprint('value', __name__)
 service = ValueService()
 
 @value_bp.route('/', methods=['GET'])
 @jwt_required()
+@conditional(lambda: [DataVersion.VALUES])
 def get_values():
     """Get all values in the system.
     
@@ -31,6 +34,7 @@ def get_values():
 
 @value_bp.route('/tag/<int:tag_id>', methods=['GET'])
 @jwt_required()
+@conditional(lambda tag_id: [DataVersion.VALUES])
 def get_text_values_by_tag(tag_id):
     """Get all text values for a specific tag.
     
@@ -60,6 +64,7 @@ def get_text_values_by_tag(tag_id):
 
 @value_bp.route('/<int:value_id>', methods=['GET'])
 @jwt_required()
+@conditional(lambda value_id: [DataVersion.VALUES])
 def get_value_by_id(value_id):
     """Get a specific value by ID.
     
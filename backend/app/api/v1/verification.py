@@ -2,6 +2,8 @@
 Verification API Endpoints
 Routes for item verification operations.
 """
+from datetime import date, datetime, timedelta
+from typing import Optional
 from flask import Blueprint, request, jsonify
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from pydantic import ValidationError
@@ -9,29 +11,43 @@ from app.services.verification_service import (
     VerificationService,
     ItemNotFoundError,
     AlreadyVerifiedTodayError,
+    RotationCityNotFoundError,
     VerificationNotFoundError
 )
 from app.api.v1.schemas.verification_schema import (
+    BatchVerifyRequest,
+    BatchVerifyResponse,
     VerifyItemRequest,
     CreateVerificationResponse,
     VerificationResponse,
     ItemVerificationsResponse,
-    UserVerificationsResponse
+    UserVerificationsResponse,
+    VerificationTrendResponse
 )
+from app.utils.fieldsets import Fieldset
+from app.utils.idempotency import idempotent
 
 
 verification_bp = Blueprint('verifications', __name__)
 verification_service = VerificationService()
 
+# Days covered by a trend request that gives no start
+DEFAULT_TREND_DAYS = 30
+
 
 @verification_bp.route('/items/<int:item_id>', methods=['POST'])
 @jwt_required()
+@idempotent
 def verify_item(item_id: int):
     """
     Verify that an item exists.
     
     Required: JWT authentication
     
+    Optional Header:
+        Idempotency-Key: Retries with the same key get the first response
+            back instead of being verified again
+    
     Request Body:
         {
             "note": "Optional note about verification"
@@ -77,6 +93,60 @@ def verify_item(item_id: int):
         }), 500
 
 
+@verification_bp.route('/items/batch', methods=['POST'])
+@jwt_required()
+@idempotent
+def verify_items():
+    """
+    Verify several items in one request.
+    
+    Required: JWT authentication
+    
+    Optional Header:
+        Idempotency-Key: Retries with the same key get the first response
+            back instead of being verified again
+    
+    Request Body:
+        {
+            "items": [
+                {"item_id": 1, "note": "Optional note"},
+                {"item_id": 2}
+            ]
+        }
+    
+    Returns:
+        200: Per-item results; items that were not found, already verified
+             today or listed twice are reported and the rest verified
+        400: Validation error (empty list or more than 50 items)
+    """
+    try:
+        user_id = get_jwt_identity()
+        request_data = BatchVerifyRequest(**(request.get_json(silent=True) or {}))
+        
+        results = verification_service.verify_items(
+            user_id=user_id,
+            entries=[(item.item_id, item.note) for item in request_data.items]
+        )
+        
+        verified_count = sum(result["status"] == "verified" for result in results)
+        response = BatchVerifyResponse(
+            results=results,
+            verified_count=verified_count,
+            failed_count=len(results) - verified_count
+        )
+        return jsonify(response.model_dump()), 200
+        
+    except ValidationError as e:
+        return jsonify({
+            "message": "Validation error",
+        }), 400
+        
+    except Exception as e:
+        return jsonify({
+            "message": "error occurred during item verification",
+        }), 500
+
+
 @verification_bp.route('/<int:verification_id>', methods=['GET'])
 @jwt_required()
 def get_verification(verification_id: int):
@@ -85,18 +155,30 @@ def get_verification(verification_id: int):
     
     Required: JWT authentication
     
+    Query Parameters:
+        fields: Comma-separated verification fields to return
+        exclude: Comma-separated verification fields to omit (e.g. user_photo)
+    
     Returns:
         200: Verification data
+        400: Unknown field
         404: Verification not found
     """
     try:
+        fieldset = Fieldset.from_args(request.args, VerificationResponse)
         verification_data = verification_service.get_verification(
-            verification_id
+            verification_id, fieldset
         )
         
+        if fieldset is not None:
+            return jsonify(fieldset.project(verification_data)), 200
+        
         response = VerificationResponse(**verification_data)
         return jsonify(response.model_dump()), 200
         
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+        
     except VerificationNotFoundError as e:
         return jsonify({"message": str(e)}), 404
         
@@ -110,29 +192,45 @@ def get_verification(verification_id: int):
 @jwt_required()
 def get_item_verifications(item_id: int):
     """
-    Get all verifications for an item.
+    Get the verifications of an item, newest first, one page at a time.
     
     Required: JWT authentication
     
     Query Parameters:
         limit: Maximum number of verifications to return (default 50, max 200)
+        cursor: Opaque next_cursor value from the previous page
+        fields: Comma-separated verification fields to return
+        exclude: Comma-separated verification fields to omit (e.g. user_photo)
     
     Returns:
-        200: List of verifications with total count
+        200: Page of verifications, newest first, with total count and
+             next_cursor (null on the last page)
+        400: Unknown field or invalid cursor
     """
     try:
         # Parse limit parameter
-        limit = request.args.get('limit', 50, type=int)
-        limit = min(limit, 200)  # Cap at 200
+        limit = max(1, min(request.args.get('limit', 50, type=int), 200))  # Cap at 200
+        fieldset = Fieldset.from_args(request.args, VerificationResponse)
         
         verifications_data = verification_service.get_item_verifications(
             item_id=item_id,
-            limit=limit
+            limit=limit,
+            fieldset=fieldset,
+            cursor=request.args.get('cursor')
         )
         
+        if fieldset is not None:
+            verifications_data["verifications"] = [
+                fieldset.project(v) for v in verifications_data["verifications"]
+            ]
+            return jsonify(verifications_data), 200
+        
         response = ItemVerificationsResponse(**verifications_data)
         return jsonify(response.model_dump()), 200
         
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+        
     except Exception as e:
         return jsonify({
             "message": "error occurred while retrieving item verifications",
@@ -143,30 +241,103 @@ def get_item_verifications(item_id: int):
 @jwt_required()
 def get_user_verifications(user_id: int):
     """
-    Get all verifications by a user.
+    Get the verifications by a user, newest first, one page at a time.
     
     Required: JWT authentication
     
     Query Parameters:
         limit: Maximum number of verifications to return (default 50, max 200)
+        cursor: Opaque next_cursor value from the previous page
+        fields: Comma-separated verification fields to return
+        exclude: Comma-separated verification fields to omit (e.g. user_photo)
     
     Returns:
-        200: List of verifications
+        200: Page of verifications, newest first, with next_cursor (null
+             on the last page)
+        400: Unknown field or invalid cursor
     """
     try:
         # Parse limit parameter
-        limit = request.args.get('limit', 50, type=int)
-        limit = min(limit, 200)  # Cap at 200
+        limit = max(1, min(request.args.get('limit', 50, type=int), 200))  # Cap at 200
+        fieldset = Fieldset.from_args(request.args, VerificationResponse)
         
         verifications_data = verification_service.get_user_verifications(
             user_id=user_id,
-            limit=limit
+            limit=limit,
+            fieldset=fieldset,
+            cursor=request.args.get('cursor')
         )
         
+        if fieldset is not None:
+            verifications_data["verifications"] = [
+                fieldset.project(v) for v in verifications_data["verifications"]
+            ]
+            return jsonify(verifications_data), 200
+        
         response = UserVerificationsResponse(**verifications_data)
         return jsonify(response.model_dump()), 200
         
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+        
     except Exception as e:
         return jsonify({
             "message": "error occurred while retrieving user verifications",
         }), 500
+
+
+def _trend_day(args, name: str) -> Optional[date]:
+    """Parse an optional YYYY-MM-DD query parameter."""
+    value = args.get(name)
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"{name} must be a day in YYYY-MM-DD format")
+
+
+@verification_bp.route('/trend', methods=['GET'])
+@jwt_required()
+def get_verification_trend():
+    """
+    Get the number of verifications per day of a city or of one item.
+    
+    Required: JWT authentication
+    
+    Query Parameters:
+        city_id: Rotation city whose items' verifications are counted
+        item_id: Item whose verifications are counted (instead of city_id)
+        start: First UTC day, YYYY-MM-DD (default 29 days before end)
+        end: Last UTC day, YYYY-MM-DD (default today)
+    
+    Returns:
+        200: One count per day from start to end, with the total
+        400: Missing city_id/item_id, invalid day or range over 366 days
+        404: City or item not found
+    """
+    try:
+        end = _trend_day(request.args, 'end') or datetime.utcnow().date()
+        start = _trend_day(request.args, 'start') or end - timedelta(days=DEFAULT_TREND_DAYS - 1)
+        
+        trend_data = verification_service.get_verification_trend(
+            start=start,
+            end=end,
+            rotation_city_id=request.args.get('city_id', type=int),
+            item_id=request.args.get('item_id', type=int)
+        )
+        
+        response = VerificationTrendResponse(**trend_data)
+        return jsonify(response.model_dump()), 200
+        
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+        
+    except (ItemNotFoundError, RotationCityNotFoundError) as e:
+        return jsonify({"message": str(e)}), 404
+        
+    except Exception as e:
+        return jsonify({
+            "message": "error occurred while retrieving verification trend",
+        }), 500
+
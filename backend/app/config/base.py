@@ -29,6 +29,9 @@ class Config:
     
     # Database
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Apply pending schema migrations when the app starts (see app.migrations);
+    # turn off to migrate only with scripts/migrate.py
+    MIGRATE_ON_STARTUP = os.getenv('MIGRATE_ON_STARTUP', 'true').lower() == 'true'
     
     # Verification Settings
     VERIFICATION_CODE_LENGTH = 6
@@ -39,6 +42,30 @@ class Config:
     VERIFICATION_CODE_MAX_PER_HOUR = get_int_env('VERIFICATION_CODE_MAX_PER_HOUR', 3)
     VERIFICATION_CODE_RATE_LIMIT_WINDOW_MINUTES = get_int_env('VERIFICATION_CODE_RATE_LIMIT_WINDOW_MINUTES', 60)
 
+    # In-process response cache (bounded LRU shared by cached read endpoints)
+    RESPONSE_CACHE_MAX_ENTRIES = get_int_env('RESPONSE_CACHE_MAX_ENTRIES', 256)
+    RESPONSE_CACHE_MAX_SIZE = get_int_env('RESPONSE_CACHE_MAX_SIZE', 64 * 1024 * 1024)
+
+    # Item freshness decays by half every this many days (see app.utils.freshness);
+    # run scripts/backfill_freshness.py after changing it
+    FRESHNESS_HALF_LIFE_DAYS = float(os.getenv('FRESHNESS_HALF_LIFE_DAYS', '30'))
+
+    # Bulk item import: rows accepted per POST /item/import request
+    ITEM_IMPORT_MAX_ROWS = get_int_env('ITEM_IMPORT_MAX_ROWS', 5000)
+
+    # Idempotency-Key handling for retried writes: how long responses are
+    # replayed, how long an unfinished request holds its key, and how long a
+    # concurrent duplicate waits for the first one's response
+    IDEMPOTENCY_TTL_SECONDS = get_int_env('IDEMPOTENCY_TTL_SECONDS', 24 * 60 * 60)
+    IDEMPOTENCY_LOCK_SECONDS = get_int_env('IDEMPOTENCY_LOCK_SECONDS', 60)
+    IDEMPOTENCY_WAIT_SECONDS = get_int_env('IDEMPOTENCY_WAIT_SECONDS', 10)
+
+    # Blob storage for images: 'database' (default) or 'filesystem'
+    BLOB_STORAGE = os.getenv('BLOB_STORAGE', 'database')
+    BLOB_STORAGE_PATH = os.getenv('BLOB_STORAGE_PATH')  # default: <instance>/blobs
+    # Public origin of this API, prefixed to blob URLs for cross-origin clients
+    BLOB_BASE_URL = os.getenv('BLOB_BASE_URL', '')
+
     # Security
     SECRET_KEY = os.getenv('SECRET_KEY', 'your-default-secret-key')
 
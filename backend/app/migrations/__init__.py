@@ -0,0 +1,175 @@
+"""Versioned schema migrations.
+
+``db.create_all()`` creates missing tables but never changes existing ones,
+so on its own a live database never gets new indexes, constraints or data
+fixes. Those changes are migrations: numbered modules in
+``app/migrations/versions`` named ``v<NNNN>_<name>.py``, each with an
+``upgrade(connection)`` function. Applied versions are recorded in the
+schema_version table, and each pending migration runs once, in order, in
+its own transaction.
+
+Migrations issue SQL through the connection they are given and never use the
+ORM models, which describe the latest schema rather than the one a migration
+runs against. They also run right after create_all has added any missing
+tables from the current models, so their DDL must tolerate objects that
+already exist (CREATE INDEX IF NOT EXISTS, ...).
+
+SQLite can only change a table's constraints by rebuilding the table
+(create a copy, move the rows, drop the original, rename the copy). A
+migration doing that sets ``SQLITE_FOREIGN_KEYS_OFF = True``: enforcement is
+then switched off while it runs, so dropping the original neither fires the
+ON DELETE actions of the tables referencing it nor fails, and the
+migration's rows are checked with ``PRAGMA foreign_key_check`` before it
+commits.
+
+A database with no tables yet is created from the models and stamped with
+every version; no migration runs.
+
+Usage:
+    upgrade_database()  # on startup, inside an app context
+"""
+import importlib
+import pkgutil
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy import inspect, text
+
+from app import db
+from app.migrations import versions
+from app.models.schema_version import SchemaVersion
+
+_MODULE_NAME = re.compile(r'^v(\d{4})_(\w+)$')
+# Key of the PostgreSQL advisory lock serializing concurrent migration runs
+_ADVISORY_LOCK_KEY = 7_240_517
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A numbered schema migration.
+
+    Attributes:
+        version: The number the module name starts with
+        name: The rest of the module name
+        description: First line of the module docstring
+        upgrade: Function applying the migration to a connection
+        sqlite_foreign_keys_off: Whether SQLite foreign key enforcement is
+            off while it runs (migrations rebuilding tables)
+    """
+    version: int
+    name: str
+    description: str
+    upgrade: Callable
+    sqlite_foreign_keys_off: bool = False
+
+
+def load_migrations() -> list[Migration]:
+    """Discover the migration modules, ordered by version.
+
+    Returns:
+        Every migration, oldest first
+
+    Raises:
+        RuntimeError: If a module is misnamed or the versions are not
+            numbered 1, 2, 3, ... without gaps
+    """
+    migrations = []
+    for module_info in pkgutil.iter_modules(versions.__path__):
+        match = _MODULE_NAME.match(module_info.name)
+        if not match:
+            raise RuntimeError(f"Migration module {module_info.name} is not named v<NNNN>_<name>")
+        module = importlib.import_module(f'{versions.__name__}.{module_info.name}')
+        migrations.append(Migration(
+            version=int(match.group(1)),
+            name=match.group(2),
+            description=(module.__doc__ or '').strip().split('\n')[0],
+            upgrade=module.upgrade,
+            sqlite_foreign_keys_off=getattr(module, 'SQLITE_FOREIGN_KEYS_OFF', False)
+        ))
+    migrations.sort(key=lambda migration: migration.version)
+    if [migration.version for migration in migrations] != list(range(1, len(migrations) + 1)):
+        raise RuntimeError("Migration versions must be numbered 1, 2, 3, ... without gaps")
+    return migrations
+
+
+def applied_versions() -> set[int]:
+    """Versions recorded in schema_version (empty before it exists)."""
+    if not inspect(db.engine).has_table(SchemaVersion.__tablename__):
+        return set()
+    with db.engine.connect() as connection:
+        return set(connection.execute(db.select(SchemaVersion.version)).scalars())
+
+
+def upgrade_database() -> list[Migration]:
+    """Bring the database schema up to date.
+
+    Creates missing tables from the models, then runs the migrations not
+    applied yet. A database without any tables is created at the latest
+    version, so its migrations are recorded without running.
+
+    Returns:
+        The migrations that ran
+    """
+    existing_tables = set(inspect(db.engine).get_table_names()) & set(db.metadata.tables)
+    db.create_all()
+    migrations = load_migrations()
+
+    if not existing_tables:
+        with db.engine.begin() as connection:
+            connection.execute(db.insert(SchemaVersion), [
+                {'version': migration.version, 'name': migration.name}
+                for migration in migrations
+            ])
+        return []
+
+    applied = applied_versions()
+    ran = []
+    for migration in migrations:
+        if migration.version in applied:
+            continue
+        with db.engine.connect() as connection, \
+                _sqlite_foreign_keys_off(connection, migration.sqlite_foreign_keys_off), \
+                connection.begin():
+            if connection.dialect.name == 'postgresql':
+                # Another process may be migrating; wait, then re-check
+                connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {'key': _ADVISORY_LOCK_KEY})
+                if connection.execute(
+                    db.select(SchemaVersion.version).filter_by(version=migration.version)
+                ).first():
+                    continue
+            migration.upgrade(connection)
+            if connection.dialect.name == 'sqlite' and migration.sqlite_foreign_keys_off:
+                violations = connection.exec_driver_sql('PRAGMA foreign_key_check').all()
+                if violations:
+                    raise RuntimeError(
+                        f"Migration {migration.version} leaves {len(violations)} rows "
+                        f"violating foreign keys, e.g. {tuple(violations[0])}"
+                    )
+            connection.execute(
+                db.insert(SchemaVersion).values(version=migration.version, name=migration.name)
+            )
+        ran.append(migration)
+    return ran
+
+
+@contextmanager
+def _sqlite_foreign_keys_off(connection, enabled: bool):
+    """Switch SQLite foreign key enforcement off on a connection for a block.
+
+    The pragma has no effect inside a transaction, so it is set before the
+    block begins one and restored after it ends. Does nothing on other
+    databases or when not enabled.
+    """
+    if not enabled or connection.dialect.name != 'sqlite':
+        yield
+        return
+    connection.exec_driver_sql('PRAGMA foreign_keys=OFF')
+    connection.commit()
+    try:
+        yield
+    finally:
+        connection.rollback()
+        connection.exec_driver_sql('PRAGMA foreign_keys=ON')
+        connection.commit()
@@ -0,0 +1 @@
+"""Migration modules, named v<NNNN>_<name>.py (see app.migrations)."""
@@ -0,0 +1,28 @@
+"""Index the foreign key and filter columns of hot queries.
+
+Databases created before these indexes were declared on the models scan
+whole tables for city feeds, item and user verification history, facet
+counts and cascading deletes.
+"""
+from sqlalchemy import text
+
+# (index name, table, columns)
+INDEXES = [
+    ('ix_item_city_created_at_item_id', 'item', 'rotation_city_id, created_at, item_id'),
+    ('ix_item_added_by_user_id', 'item', 'added_by_user_id'),
+    ('ix_user_rotation_city_id', 'user', 'rotation_city_id'),
+    ('ix_category_item_item_id_category_id', 'category_item', 'item_id, category_id'),
+    ('ix_category_item_category_id_item_id', 'category_item', 'category_id, item_id'),
+    ('ix_item_tag_value_item_id_value_id', 'item_tag_value', 'item_id, value_id'),
+    ('ix_item_tag_value_value_id_item_id', 'item_tag_value', 'value_id, item_id'),
+    ('ix_value_tag_id', 'value', 'tag_id'),
+    ('ix_item_verification_item_id_created_at', 'item_verification', 'item_id, created_at'),
+    ('ix_item_verification_user_id_item_id_created_at', 'item_verification',
+     'user_id, item_id, created_at'),
+]
+
+
+def upgrade(connection):
+    for name, table, columns in INDEXES:
+        # "user" is a reserved word on PostgreSQL
+        connection.execute(text(f'CREATE INDEX IF NOT EXISTS {name} ON "{table}" ({columns})'))
@@ -0,0 +1,52 @@
+"""Collapse duplicate tag values and make values unique per tag.
+
+Databases created before values were interned hold one value row per item
+using a tag (e.g. a Wifi = true row per item). For each (tag, typed value)
+the lowest value_id is kept: item links are repointed to it, links made
+redundant are dropped and the duplicates deleted. The partial unique
+indexes then keep values interned.
+
+Documents of the repointed items are deleted; they are rebuilt from the
+tables on their next read.
+"""
+from sqlalchemy import text
+
+TYPED_COLUMNS = ('boolean_val', 'name_val', 'numerical_value')
+
+
+def upgrade(connection):
+    for column in TYPED_COLUMNS:
+        duplicates = (
+            "SELECT dup.value_id FROM value dup JOIN value keep "
+            f"ON keep.tag_id = dup.tag_id AND keep.{column} = dup.{column} "
+            "AND keep.value_id < dup.value_id"
+        )
+        connection.execute(text(
+            "DELETE FROM item_document WHERE item_id IN "
+            f"(SELECT item_id FROM item_tag_value WHERE value_id IN ({duplicates}))"
+        ))
+        connection.execute(text(
+            "UPDATE item_tag_value SET value_id = ("
+            "SELECT min(keep.value_id) FROM value dup JOIN value keep "
+            f"ON keep.tag_id = dup.tag_id AND keep.{column} = dup.{column} "
+            "WHERE dup.value_id = item_tag_value.value_id"
+            f") WHERE value_id IN ({duplicates})"
+        ))
+        connection.execute(text(f"DELETE FROM value WHERE value_id IN ({duplicates})"))
+
+    # An item linked to several copies of a value now links it more than once
+    connection.execute(text(
+        "DELETE FROM item_tag_value WHERE item_tag_value_id NOT IN "
+        "(SELECT min(item_tag_value_id) FROM item_tag_value GROUP BY item_id, value_id)"
+    ))
+    if connection.dialect.name == 'sqlite':
+        # The SQLite full-text index keeps its own copy of text values
+        connection.execute(text(
+            "DELETE FROM value_search WHERE rowid NOT IN (SELECT value_id FROM value)"
+        ))
+
+    for column in TYPED_COLUMNS:
+        connection.execute(text(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS uq_value_tag_id_{column} "
+            f"ON value (tag_id, {column}) WHERE {column} IS NOT NULL"
+        ))
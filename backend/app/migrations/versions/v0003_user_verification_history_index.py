@@ -0,0 +1,13 @@
+"""Index a user's verifications by (created_at, verification_id).
+
+User verification history is keyset-paginated newest first; without this
+index every page sorts all of the user's verifications.
+"""
+from sqlalchemy import text
+
+
+def upgrade(connection):
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_item_verification_user_id_created_at "
+        "ON item_verification (user_id, created_at, verification_id)"
+    ))
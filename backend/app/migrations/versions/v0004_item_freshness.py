@@ -0,0 +1,20 @@
+"""Add item freshness and index the city feed by it.
+
+Adds item.freshness (0 for every existing item) and the
+(rotation_city_id, freshness, item_id) index. Run
+scripts/backfill_freshness.py afterwards to compute freshness and
+last_verified_date from the existing verifications.
+"""
+from sqlalchemy import inspect, text
+
+
+def upgrade(connection):
+    columns = {column['name'] for column in inspect(connection).get_columns('item')}
+    if 'freshness' not in columns:
+        connection.execute(text(
+            "ALTER TABLE item ADD COLUMN freshness FLOAT NOT NULL DEFAULT 0"
+        ))
+    connection.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_item_city_freshness_item_id "
+        "ON item (rotation_city_id, freshness, item_id)"
+    ))
@@ -0,0 +1,24 @@
+"""Fill the daily verification rollup from the existing verifications.
+
+The verification_daily_count table itself is created from the models. This
+counts the verifications already recorded, per item city, UTC day and item,
+in one grouped INSERT ... SELECT; from then on verifying an item keeps its
+row current. scripts/rebuild_verification_daily_counts.py repeats the same
+recomputation.
+"""
+from sqlalchemy import text
+
+
+def upgrade(connection):
+    if connection.dialect.name == 'sqlite':
+        day = "date(item_verification.created_at)"
+    else:
+        day = "CAST(item_verification.created_at AS DATE)"
+    connection.execute(text("DELETE FROM verification_daily_count"))
+    connection.execute(text(
+        "INSERT INTO verification_daily_count "
+        "(rotation_city_id, day, item_id, verification_count) "
+        f"SELECT item.rotation_city_id, {day}, item_verification.item_id, count(*) "
+        "FROM item_verification JOIN item ON item.item_id = item_verification.item_id "
+        f"GROUP BY item.rotation_city_id, {day}, item_verification.item_id"
+    ))
@@ -0,0 +1,119 @@
+"""Make foreign keys to cities, users, items, categories, tags and values cascade.
+
+Deletes rely on the database removing dependent rows (ON DELETE CASCADE)
+and the ORM no longer deletes them itself, but create_all only gives new
+tables those constraints. Every listed foreign key still without the
+cascade is recreated with it:
+
+PostgreSQL: the constraint is dropped and added again under its own name.
+
+SQLite: constraints cannot be altered, so each affected table is rebuilt
+from its own CREATE TABLE statement with the cascade added: a copy is
+created and filled, the original dropped and the copy renamed, and the
+table's indexes and triggers are recreated. Foreign key enforcement is off
+meanwhile (see SQLITE_FOREIGN_KEYS_OFF) and the result is checked before
+committing.
+"""
+import re
+
+from sqlalchemy import inspect, text
+
+SQLITE_FOREIGN_KEYS_OFF = True
+
+# Table -> foreign key columns that must cascade on delete
+CASCADING_FOREIGN_KEYS = {
+    'user': ('rotation_city_id',),
+    'item': ('added_by_user_id', 'rotation_city_id'),
+    'item_verification': ('user_id', 'item_id'),
+    'item_document': ('item_id',),
+    'item_tag_value': ('item_id', 'value_id'),
+    'category_item': ('item_id', 'category_id'),
+    'value': ('tag_id',),
+    'verification_code': ('user_id',),
+    'idempotency_key': ('user_id',),
+}
+
+# A table-level foreign key clause as SQLAlchemy writes it, with any actions
+_SQLITE_FOREIGN_KEY = re.compile(
+    r'FOREIGN KEY\s*\(\s*"?(?P<column>\w+)"?\s*\)\s*'
+    r'REFERENCES\s+"?(?P<table>\w+)"?\s*\(\s*"?(?P<referred>\w+)"?\s*\)'
+    r'(?:\s+ON\s+(?:DELETE|UPDATE)\s+(?:SET\s+NULL|SET\s+DEFAULT|CASCADE|RESTRICT|NO\s+ACTION))*',
+    re.IGNORECASE
+)
+
+
+def upgrade(connection):
+    for table, columns in CASCADING_FOREIGN_KEYS.items():
+        foreign_keys = [
+            foreign_key for foreign_key in inspect(connection).get_foreign_keys(table)
+            if foreign_key['constrained_columns'][0] in columns
+            and ((foreign_key.get('options') or {}).get('ondelete') or '').upper() != 'CASCADE'
+        ]
+        if not foreign_keys:
+            continue
+        if connection.dialect.name == 'sqlite':
+            _rebuild_sqlite_table(
+                connection, table,
+                {foreign_key['constrained_columns'][0] for foreign_key in foreign_keys}
+            )
+        else:
+            _recreate_constraints(connection, table, foreign_keys)
+
+
+def _recreate_constraints(connection, table, foreign_keys):
+    """Drop and re-add foreign key constraints with ON DELETE CASCADE (PostgreSQL)."""
+    clauses = []
+    for foreign_key in foreign_keys:
+        name = foreign_key['name']
+        clauses.append(f'DROP CONSTRAINT "{name}"')
+        clauses.append(
+            f'ADD CONSTRAINT "{name}" FOREIGN KEY ("{foreign_key["constrained_columns"][0]}") '
+            f'REFERENCES "{foreign_key["referred_table"]}" ("{foreign_key["referred_columns"][0]}") '
+            'ON DELETE CASCADE'
+        )
+    connection.execute(text(f'ALTER TABLE "{table}" ' + ', '.join(clauses)))
+
+
+def _rebuild_sqlite_table(connection, table, columns):
+    """Rebuild a SQLite table with its foreign keys on columns cascading."""
+    create_sql = connection.execute(
+        text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {'name': table}
+    ).scalar_one()
+    dependents = connection.execute(
+        text(
+            "SELECT sql FROM sqlite_master "
+            "WHERE type IN ('index', 'trigger') AND tbl_name = :name AND sql IS NOT NULL"
+        ),
+        {'name': table}
+    ).scalars().all()
+
+    rewritten = set()
+
+    def cascade(match):
+        if match.group('column') not in columns:
+            return match.group(0)
+        rewritten.add(match.group('column'))
+        return (
+            f'FOREIGN KEY({match.group("column")}) REFERENCES "{match.group("table")}" '
+            f'({match.group("referred")}) ON DELETE CASCADE'
+        )
+
+    new_table = f'{table}_cascade_rebuild'
+    new_sql = _SQLITE_FOREIGN_KEY.sub(cascade, create_sql)
+    if rewritten != columns:
+        raise RuntimeError(
+            f"Cannot find the foreign keys {sorted(columns - rewritten)} in the schema of {table}"
+        )
+    new_sql = re.sub(
+        r'^\s*CREATE TABLE\s+(?:"[^"]+"|\w+)', f'CREATE TABLE "{new_table}"', new_sql, count=1
+    )
+
+    # Schema SQL is run as is; text() would read any ':word' in it as a parameter
+    connection.exec_driver_sql(f'DROP TABLE IF EXISTS "{new_table}"')
+    connection.exec_driver_sql(new_sql)
+    connection.exec_driver_sql(f'INSERT INTO "{new_table}" SELECT * FROM "{table}"')
+    connection.exec_driver_sql(f'DROP TABLE "{table}"')
+    connection.exec_driver_sql(f'ALTER TABLE "{new_table}" RENAME TO "{table}"')
+    for statement in dependents:
+        connection.exec_driver_sql(statement)
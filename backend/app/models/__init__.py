@@ -16,6 +16,13 @@ from app.models.verification_stutus_enum import VerificationStatusEnum
 from app.models.tag import Tag
 from app.models.value import Value
 from app.models.item_tag_value import ItemTagValue
+from app.models.item_document import ItemDocument
+from app.models.data_version import DataVersion
+from app.models.blob import Blob
+from app.models.idempotency_key import IdempotencyKey
+from app.models.schema_version import SchemaVersion
+from app.models.verification_daily_count import VerificationDailyCount
+from app.models import search_index  # noqa: F401 (registers search index DDL)
 
 # Export all models
 __all__ = [
@@ -32,5 +39,11 @@ __all__ = [
     'Tag',
     'Value',
     'ItemTagValue',
+    'ItemDocument',
+    'DataVersion',
+    'Blob',
+    'IdempotencyKey',
+    'SchemaVersion',
+    'VerificationDailyCount',
 ]
 
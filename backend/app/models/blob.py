@@ -0,0 +1,44 @@
+"""
+Blob Model
+Content-addressed binary objects (profile pictures, category images).
+Each distinct content is stored once under the SHA-256 of its bytes.
+"""
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Integer, LargeBinary, String
+
+from app import db
+
+
+class Blob(db.Model):
+    """Metadata (and, for database storage, the bytes) of a stored blob.
+    
+    Rows referencing a blob (e.g. User.profile_picture) hold its hash. Since
+    the hash is derived from the content, a blob never changes once written
+    and identical uploads share one row.
+    
+    Attributes:
+        blob_hash (str): Primary key, hex SHA-256 of the content
+        content_type (str): MIME type served with the content
+        size (int): Content length in bytes
+        data (bytes): Content, or None when kept on the filesystem
+        created_at (datetime): When the blob was first stored
+    """
+    __tablename__ = 'blob'
+    
+    # Primary Key is the content hash
+    blob_hash = Column(String(64), primary_key=True)
+    
+    # Content Information
+    content_type = Column(String(100), nullable=False)
+    size = Column(Integer, nullable=False)
+    data = Column(LargeBinary, nullable=True)
+    
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        """Return string representation of Blob instance."""
+        return (
+            f"<Blob(blob_hash='{self.blob_hash}', "
+            f"content_type='{self.content_type}', size={self.size})>"
+        )
@@ -17,7 +17,7 @@ class Category(db.Model):
     Attributes:
         category_id (int): Primary key, auto-incrementing
         category_name (str): Unique category name (max 100 chars)
-        category_pic (str): Base64 encoded image data for category icon
+        category_pic (str): Blob hash (or external URL) of the category icon
         category_items: Relationship to items through junction table
     """
     __tablename__ = 'category'
@@ -27,13 +27,14 @@ class Category(db.Model):
     
     # Category Information
     category_name = Column(String(100), nullable=False, unique=True)
-    category_pic = Column(Text, nullable=True)  # Base64 encoded image data
+    category_pic = Column(Text, nullable=True)  # Blob hash of the image
     
     # Relationships
     category_items = relationship(
         "CategoryItem",
         back_populates="category",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     
     def __repr__(self):
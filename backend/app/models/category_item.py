@@ -3,7 +3,7 @@ CategoryItem Model
 Junction table linking items to categories (many-to-many relationship).
 An item can belong to multiple categories.
 """
-from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy import Column, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 
 from app import db
@@ -23,6 +23,11 @@ class CategoryItem(db.Model):
         category: Relationship to Category model
     """
     __tablename__ = 'category_item'
+    __table_args__ = (
+        # One index per direction of the many-to-many lookup
+        Index('ix_category_item_item_id_category_id', 'item_id', 'category_id'),
+        Index('ix_category_item_category_id_item_id', 'category_id', 'item_id'),
+    )
     
     # Primary Key with descriptive name
     category_item_id = Column(Integer, primary_key=True, autoincrement=True)
@@ -30,12 +35,12 @@ class CategoryItem(db.Model):
     # Foreign Keys
     item_id = Column(
         Integer,
-        ForeignKey('item.item_id'),
+        ForeignKey('item.item_id', ondelete='CASCADE'),
         nullable=False
     )
     category_id = Column(
         Integer,
-        ForeignKey('category.category_id'),
+        ForeignKey('category.category_id', ondelete='CASCADE'),
         nullable=False
     )
     
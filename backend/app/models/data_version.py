@@ -0,0 +1,47 @@
+"""
+DataVersion Model
+Monotonic version counters for groups of data (e.g. one city's items).
+Used to key caches so that any write simply moves readers to a new key.
+"""
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app import db
+
+
+class DataVersion(db.Model):
+    """Version counter for a named scope of data.
+    
+    Write paths bump the counter of every scope they change; readers
+    include the current version in cache keys, so cached results are never
+    served after a change without needing explicit invalidation.
+    
+    Attributes:
+        scope (str): Primary key naming the data group (e.g. 'city:3:items')
+        version (int): Counter incremented on every change to the scope
+        updated_at (datetime): When the scope last changed
+    """
+    __tablename__ = 'data_version'
+    
+    # Well-known scopes for reference data served to every user
+    CATEGORIES = 'categories'
+    TAGS = 'tags'
+    VALUES = 'values'
+    ROTATION_CITIES = 'rotation_cities'
+    ITEMS = 'items'
+    
+    # Primary Key is the scope name
+    scope = Column(String(100), primary_key=True)
+    
+    # Version Information
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    @staticmethod
+    def city_items_scope(rotation_city_id: int) -> str:
+        """Scope covering every item rendered in a rotation city's feed."""
+        return f"city:{rotation_city_id}:items"
+    
+    def __repr__(self):
+        """Return string representation of DataVersion instance."""
+        return f"<DataVersion(scope='{self.scope}', version={self.version})>"
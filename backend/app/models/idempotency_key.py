@@ -0,0 +1,58 @@
+"""
+IdempotencyKey Model
+Responses of write requests sent with an Idempotency-Key header, replayed
+when a client retries the same request.
+"""
+from datetime import datetime
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+
+from app import db
+
+
+class IdempotencyKey(db.Model):
+    """A user's Idempotency-Key and the outcome of the request that used it.
+
+    The row is claimed (inserted) before the request runs, so a concurrent
+    retry finds it and waits instead of running the request again. Until
+    the response is stored, response_status is None and expires_at is a
+    short lock lifetime, after which a crashed request's key can be
+    claimed again; once stored, expires_at is the replay TTL.
+
+    Attributes:
+        user_id (int): Foreign key to the user who sent the request
+        key (str): Client-chosen Idempotency-Key header value
+        request_hash (str): Hex SHA-256 of the request method, path and body
+        response_status (int): Stored status code, None while in progress
+        response_body (str): Stored response body
+        content_type (str): Content type of the stored response
+        created_at (datetime): When the key was claimed
+        expires_at (datetime): When the key may be claimed anew
+    """
+    __tablename__ = 'idempotency_key'
+
+    # Keys are scoped per user
+    user_id = Column(
+        Integer,
+        ForeignKey('user.user_id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    key = Column(String(255), primary_key=True)
+
+    # Request Information
+    request_hash = Column(String(64), nullable=False)
+
+    # Stored Response
+    response_status = Column(Integer, nullable=True)
+    response_body = Column(Text, nullable=True)
+    content_type = Column(String(100), nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        """Return string representation of IdempotencyKey instance."""
+        return (
+            f"<IdempotencyKey(user_id={self.user_id}, key='{self.key}', "
+            f"response_status={self.response_status})>"
+        )
@@ -4,7 +4,7 @@ Items that can be found/verified in rotation cities.
 Each item belongs to categories through the junction table.
 """
 from datetime import datetime
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from app import db
@@ -25,14 +25,25 @@ class Item(db.Model):
         walking_distance (float): Optional walking distance in meters
         last_verified_date (datetime): When item was last verified as still available
         number_of_verifications (int): Count of user verifications
+        freshness (float): Log of the time-decayed verification count, 0 if
+            never verified (see app.utils.freshness)
         created_at (datetime): Item creation timestamp
         added_by_user: Relationship to User who added the item
         rotation_city: Relationship to RotationCity where item is located
         category_items: Relationship to categories through junction table
         item_verifications: Relationship to user verifications of this item
         item_tag_values: Relationship to tag values assigned to this item
+        document: Relationship to the precomputed ItemDocument read model
     """
     __tablename__ = 'item'
+    __table_args__ = (
+        # City feed: filter by city, keyset order on (created_at, item_id)
+        Index('ix_item_city_created_at_item_id', 'rotation_city_id', 'created_at', 'item_id'),
+        # City feed sorted by freshness, keyset order on (freshness, item_id)
+        Index('ix_item_city_freshness_item_id', 'rotation_city_id', 'freshness', 'item_id'),
+        # A user's items; serves ON DELETE CASCADE from user
+        Index('ix_item_added_by_user_id', 'added_by_user_id'),
+    )
     
     # Primary Key with descriptive name
     item_id = Column(Integer, primary_key=True, autoincrement=True)
@@ -40,12 +51,12 @@ class Item(db.Model):
     # Foreign Keys
     added_by_user_id = Column(
         Integer,
-        ForeignKey('user.user_id'),
+        ForeignKey('user.user_id', ondelete='CASCADE'),
         nullable=False
     )
     rotation_city_id = Column(
         Integer,
-        ForeignKey('rotation_city.city_id'),
+        ForeignKey('rotation_city.city_id', ondelete='CASCADE'),
         nullable=False
     )
     
@@ -55,27 +66,39 @@ class Item(db.Model):
     walking_distance = Column(Float, nullable=True)
     last_verified_date = Column(DateTime, nullable=True)
     number_of_verifications = Column(Integer, default=0)
+    freshness = Column(Float, nullable=False, default=0.0, server_default='0')
     
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
     
-    # Relationships
+    # Relationships (children are deleted by the database's ON DELETE
+    # CASCADE; passive_deletes stops the ORM loading them to delete one by one)
     added_by_user = relationship("User", back_populates="added_items")
     rotation_city = relationship("RotationCity", back_populates="items")
     category_items = relationship(
         "CategoryItem",
         back_populates="item",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     item_verifications = relationship(
         "ItemVerification",
         back_populates="item",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     item_tag_values = relationship(
         "ItemTagValue",
         back_populates="item",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+    document = relationship(
+        "ItemDocument",
+        back_populates="item",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     
     def __repr__(self):
@@ -0,0 +1,53 @@
+"""
+ItemDocument Model
+Denormalized read model holding the fully rendered JSON of each item.
+Rebuilt whenever a write touches the item so reads skip the ORM graph.
+"""
+from datetime import datetime
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, Text
+from sqlalchemy.orm import relationship
+
+from app import db
+
+
+class ItemDocument(db.Model):
+    """Precomputed API representation of an item.
+    
+    Stores the exact JSON body served for an item (categories, tags, values,
+    city and author embedded) so list and detail endpoints can return it
+    without loading and serializing five related tables per request.
+    
+    Attributes:
+        item_id (int): Primary key and foreign key to the item
+        document (str): Rendered item JSON
+        updated_at (datetime): When the document was last rebuilt
+        item: Relationship to Item model
+    """
+    __tablename__ = 'item_document'
+    
+    # Primary Key shared with the item it renders
+    item_id = Column(
+        Integer,
+        ForeignKey('item.item_id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    
+    # Rendered Document
+    document = Column(Text, nullable=False)
+    
+    # Timestamps
+    updated_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow
+    )
+    
+    # Relationships
+    item = relationship("Item", back_populates="document")
+    
+    def __repr__(self):
+        """Return string representation of ItemDocument instance."""
+        return (
+            f"<ItemDocument(item_id={self.item_id}, "
+            f"updated_at={self.updated_at})>"
+        )
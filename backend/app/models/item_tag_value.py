@@ -3,7 +3,7 @@ ItemTagValue Model
 Junction table linking items to specific tag values.
 Associates items with their tag metadata.
 """
-from sqlalchemy import Column, ForeignKey, Integer
+from sqlalchemy import Column, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 
 from app import db
@@ -24,6 +24,12 @@ class ItemTagValue(db.Model):
         value: Relationship to Value model (which links to Tag)
     """
     __tablename__ = 'item_tag_value'
+    __table_args__ = (
+        # Covers item -> values lookups and the feed's tag filter subqueries
+        Index('ix_item_tag_value_item_id_value_id', 'item_id', 'value_id'),
+        # Value -> items lookups (document refreshes, merges, ON DELETE CASCADE)
+        Index('ix_item_tag_value_value_id_item_id', 'value_id', 'item_id'),
+    )
     
     # Primary Key with descriptive name
     item_tag_value_id = Column(Integer, primary_key=True, autoincrement=True)
@@ -31,12 +37,12 @@ class ItemTagValue(db.Model):
     # Foreign Keys
     item_id = Column(
         Integer,
-        ForeignKey('item.item_id'),
+        ForeignKey('item.item_id', ondelete='CASCADE'),
         nullable=False
     )
     value_id = Column(
         Integer,
-        ForeignKey('value.value_id'),
+        ForeignKey('value.value_id', ondelete='CASCADE'),
         nullable=False
     )
     
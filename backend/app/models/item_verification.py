@@ -4,7 +4,7 @@ Records when users verify that an item still exists/is available.
 Helps keep item information current.
 """
 from datetime import datetime
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, Text
 from sqlalchemy.orm import relationship
 
 from app import db
@@ -26,6 +26,14 @@ class ItemVerification(db.Model):
         item: Relationship to Item model
     """
     __tablename__ = 'item_verification'
+    __table_args__ = (
+        # An item's history, newest first; also serves ON DELETE CASCADE from item
+        Index('ix_item_verification_item_id_created_at', 'item_id', 'created_at'),
+        # "Verified today?" checks; also serves ON DELETE CASCADE from user
+        Index('ix_item_verification_user_id_item_id_created_at', 'user_id', 'item_id', 'created_at'),
+        # A user's history, newest first, paginated on (created_at, verification_id)
+        Index('ix_item_verification_user_id_created_at', 'user_id', 'created_at', 'verification_id'),
+    )
     
     # Primary Key with descriptive name
     verification_id = Column(Integer, primary_key=True, autoincrement=True)
@@ -33,12 +41,12 @@ class ItemVerification(db.Model):
     # Foreign Keys
     user_id = Column(
         Integer,
-        ForeignKey('user.user_id'),
+        ForeignKey('user.user_id', ondelete='CASCADE'),
         nullable=False
     )
     item_id = Column(
         Integer,
-        ForeignKey('item.item_id'),
+        ForeignKey('item.item_id', ondelete='CASCADE'),
         nullable=False
     )
     
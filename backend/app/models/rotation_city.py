@@ -33,16 +33,19 @@ class RotationCity(db.Model):
     time_zone = Column(String(50), nullable=False)
     res_hall_location = Column(String(200), nullable=True)
     
-    # Relationships
+    # Relationships (children are deleted by the database's ON DELETE
+    # CASCADE; passive_deletes stops the ORM loading them to delete one by one)
     users = relationship(
         "User",
         back_populates="rotation_city",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     items = relationship(
         "Item",
         back_populates="rotation_city",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     
     def __repr__(self):
@@ -0,0 +1,32 @@
+"""
+SchemaVersion Model
+Migrations applied to the database, one row per migration.
+"""
+from datetime import datetime
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app import db
+
+
+class SchemaVersion(db.Model):
+    """A schema migration that has been applied (see app.migrations).
+    
+    The database's schema version is the highest version recorded.
+    
+    Attributes:
+        version (int): Primary key, the migration's number
+        name (str): The migration's module name without its number
+        applied_at (datetime): When the migration ran (or was stamped)
+    """
+    __tablename__ = 'schema_version'
+    
+    # Primary Key is the migration number
+    version = Column(Integer, primary_key=True, autoincrement=False)
+    
+    # Migration Information
+    name = Column(String(100), nullable=False)
+    applied_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        """Return string representation of SchemaVersion instance."""
+        return f"<SchemaVersion(version={self.version}, name='{self.name}')>"
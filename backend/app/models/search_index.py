@@ -0,0 +1,68 @@
+"""
+Search Index Schema
+Full-text index tables for item and tag value search.
+
+The index uses database-specific features (FTS5 virtual tables on SQLite,
+tsvector columns with GIN indexes on PostgreSQL) that declarative models
+cannot express, so its DDL is attached to the metadata's create/drop events
+and runs alongside ``db.create_all()`` / ``db.drop_all()``.
+
+SQLite:
+    item_search: FTS5 table keyed by rowid = item_id, indexing name,
+        location and the item's text tag values; rotation_city_id is
+        stored unindexed for filtering
+    value_search: FTS5 table keyed by rowid = value_id over text values
+
+PostgreSQL:
+    item_search: (item_id, rotation_city_id, document tsvector) with a GIN
+        index on document
+    value: expression GIN index on to_tsvector(name_val), so text values
+        need no separate table
+"""
+from sqlalchemy import DDL, event
+
+from app import db
+
+# Both backends fold case and do no stemming, so a query matches the same
+# words whichever database is in use (SQLite also folds accents).
+SQLITE_TOKENIZER = "unicode61 remove_diacritics 2"
+POSTGRES_TEXT_SEARCH_CONFIG = 'simple'
+
+_CREATE = {
+    'sqlite': [
+        "CREATE VIRTUAL TABLE IF NOT EXISTS item_search USING fts5("
+        "name, location, tags, rotation_city_id UNINDEXED, "
+        f"tokenize='{SQLITE_TOKENIZER}')",
+        "CREATE VIRTUAL TABLE IF NOT EXISTS value_search USING fts5("
+        "name_val, tag_id UNINDEXED, "
+        f"tokenize='{SQLITE_TOKENIZER}')",
+    ],
+    'postgresql': [
+        "CREATE TABLE IF NOT EXISTS item_search ("
+        "item_id INTEGER PRIMARY KEY REFERENCES item (item_id) ON DELETE CASCADE, "
+        "rotation_city_id INTEGER NOT NULL, "
+        "document TSVECTOR NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS ix_item_search_document "
+        "ON item_search USING GIN (document)",
+        "CREATE INDEX IF NOT EXISTS ix_value_name_val_search ON value USING GIN "
+        f"(to_tsvector('{POSTGRES_TEXT_SEARCH_CONFIG}', coalesce(name_val, '')))",
+    ],
+}
+
+_DROP = {
+    'sqlite': [
+        "DROP TABLE IF EXISTS item_search",
+        "DROP TABLE IF EXISTS value_search",
+    ],
+    'postgresql': [
+        "DROP TABLE IF EXISTS item_search",
+    ],
+}
+
+for _dialect, _statements in _CREATE.items():
+    for _statement in _statements:
+        event.listen(db.metadata, 'after_create', DDL(_statement).execute_if(dialect=_dialect))
+
+for _dialect, _statements in _DROP.items():
+    for _statement in _statements:
+        event.listen(db.metadata, 'before_drop', DDL(_statement).execute_if(dialect=_dialect))
@@ -113,7 +113,8 @@ class Tag(db.Model):
     values = relationship(
         "Value",
         back_populates="tag",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
 
     @property
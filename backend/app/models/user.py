@@ -23,7 +23,7 @@ class User(db.Model):
         first_name (str): User's first name (max 50 chars)
         last_name (str): User's last name (max 50 chars)
         email (str): Unique email address (max 100 chars)
-        profile_picture (str): Optional profile picture as base64 string
+        profile_picture (str): Optional blob hash of the profile picture
         created_at (datetime): Account creation timestamp
         updated_at (datetime): Last update timestamp
         is_verified (bool): Email verification status
@@ -41,15 +41,16 @@ class User(db.Model):
     # Foreign Keys
     rotation_city_id = Column(
         Integer,
-        ForeignKey('rotation_city.city_id'),
-        nullable=False
+        ForeignKey('rotation_city.city_id', ondelete='CASCADE'),
+        nullable=False,
+        index=True
     )
     
     # User Information
     first_name = Column(String(50), nullable=False)
     last_name = Column(String(50), nullable=False)
     email = Column(String(100), unique=True, nullable=False)
-    # Optional profile picture stored as base64 for simplicity
+    # Optional profile picture, as the hash of its blob (see Blob)
     profile_picture = Column(Text, nullable=True)
     
     # Timestamps
@@ -70,9 +71,18 @@ class User(db.Model):
     
     # Relationships
     rotation_city = relationship("RotationCity", back_populates="users")
-    added_items = relationship("Item", back_populates="added_by_user")
-    item_verifications = relationship("ItemVerification", back_populates="user")
-    verification_codes = relationship("VerificationCode", back_populates="user")
+    # Dependent rows are removed by the database (ON DELETE CASCADE)
+    added_items = relationship("Item", back_populates="added_by_user", passive_deletes=True)
+    item_verifications = relationship(
+        "ItemVerification",
+        back_populates="user",
+        passive_deletes=True
+    )
+    verification_codes = relationship(
+        "VerificationCode",
+        back_populates="user",
+        passive_deletes=True
+    )
     
     def __repr__(self):
         """Return string representation of User instance."""
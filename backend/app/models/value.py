@@ -3,7 +3,7 @@ Value Model
 Possible values for tags. Supports different data types through
 separate columns.
 """
-from sqlalchemy import Boolean, Column, Float, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, Float, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import relationship
 
 from app import db
@@ -16,6 +16,10 @@ class Value(db.Model):
     Only one column (boolean_val, name_val, or numerical_value) should be set
     per value instance, determined by the associated tag's value_type.
     
+    Values are interned: each (tag, typed value) pair is stored once and
+    shared by every item using it, enforced by one partial unique index per
+    typed column. Create them through ValueRepository.get_or_create_values.
+    
     Attributes:
         value_id (int): Primary key, auto-incrementing
         tag_id (int): Foreign key to tag this value belongs to
@@ -26,6 +30,17 @@ class Value(db.Model):
         item_tag_values: Relationship to items using this value
     """
     __tablename__ = 'value'
+    __table_args__ = tuple(
+        Index(
+            f'uq_value_tag_id_{column}',
+            'tag_id',
+            column,
+            unique=True,
+            sqlite_where=text(f'{column} IS NOT NULL'),
+            postgresql_where=text(f'{column} IS NOT NULL')
+        )
+        for column in ('boolean_val', 'name_val', 'numerical_value')
+    )
     
     # Primary Key with descriptive name
     value_id = Column(Integer, primary_key=True, autoincrement=True)
@@ -33,8 +48,9 @@ class Value(db.Model):
     # Foreign Keys
     tag_id = Column(
         Integer,
-        ForeignKey('tag.tag_id'),
-        nullable=False
+        ForeignKey('tag.tag_id', ondelete='CASCADE'),
+        nullable=False,
+        index=True
     )
     
     # Value Information (different types stored in different columns)
@@ -47,7 +63,8 @@ class Value(db.Model):
     item_tag_values = relationship(
         "ItemTagValue",
         back_populates="value",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
     
     def __repr__(self):
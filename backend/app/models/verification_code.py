@@ -47,7 +47,7 @@ class VerificationCode(db.Model):
     __tablename__ = 'verification_code'
 
     verification_code_id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.user_id'), nullable=False, index=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.user_id', ondelete='CASCADE'), nullable=False, index=True)
 
     # Code information
     code_hash = db.Column(db.String(255), nullable=False, unique=True)
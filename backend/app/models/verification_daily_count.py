@@ -0,0 +1,53 @@
+"""
+VerificationDailyCount Model
+Daily rollup of item verifications, per city and item.
+Kept current by every verification so trends never scan item_verification.
+"""
+from sqlalchemy import Column, Date, ForeignKey, Index, Integer
+
+from app import db
+
+
+class VerificationDailyCount(db.Model):
+    """Number of verifications an item received on one (UTC) day.
+
+    Verifying an item upserts its row for the day in the same transaction
+    as the verification, so a city's per-day totals are read from at most
+    one row per item verified that day instead of from every verification.
+    Days without verifications have no row.
+
+    Attributes:
+        rotation_city_id (int): Foreign key to the item's rotation city
+        day (date): UTC day of the verifications
+        item_id (int): Foreign key to the verified item
+        verification_count (int): Verifications of the item on that day
+    """
+    __tablename__ = 'verification_daily_count'
+    __table_args__ = (
+        # An item's trend; also serves ON DELETE CASCADE from item
+        Index('ix_verification_daily_count_item_id_day', 'item_id', 'day'),
+    )
+
+    # Composite Primary Key, ordered for a city's trend over a range of days
+    rotation_city_id = Column(
+        Integer,
+        ForeignKey('rotation_city.city_id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    day = Column(Date, primary_key=True)
+    item_id = Column(
+        Integer,
+        ForeignKey('item.item_id', ondelete='CASCADE'),
+        primary_key=True
+    )
+
+    # Rollup
+    verification_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        """Return string representation of VerificationDailyCount instance."""
+        return (
+            f"<VerificationDailyCount(rotation_city_id={self.rotation_city_id}, "
+            f"day={self.day}, item_id={self.item_id}, "
+            f"verification_count={self.verification_count})>"
+        )
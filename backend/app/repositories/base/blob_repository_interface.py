@@ -0,0 +1,22 @@
+"""Blob repository interface."""
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+
+class BlobRepositoryInterface(ABC):
+    """Interface for content-addressed blob storage."""
+
+    @abstractmethod
+    def exists(self, blob_hash: str) -> bool:
+        """Check whether a blob is stored."""
+        pass
+
+    @abstractmethod
+    def save(self, blob_hash: str, content_type: str, data: bytes) -> None:
+        """Store content under its hash (no-op if already stored)."""
+        pass
+
+    @abstractmethod
+    def get_content(self, blob_hash: str) -> Optional[Tuple[bytes, str]]:
+        """Get (data, content_type) of a blob, or None if not stored."""
+        pass
@@ -22,6 +22,11 @@ class CategoryRepositoryInterface(ABC):
         """Get multiple categories by IDs."""
         pass
 
+    @abstractmethod
+    def get_categories_by_names(self, names: List[str]) -> List[Category]:
+        """Get multiple categories by name (case-insensitive)."""
+        pass
+
     @abstractmethod
     def category_exists(self, category_id: int) -> bool:
         """Check if category exists."""
@@ -0,0 +1,23 @@
+"""Data version repository interface."""
+from abc import ABC, abstractmethod
+from typing import Iterable, List
+from app.models.data_version import DataVersion
+
+
+class DataVersionRepositoryInterface(ABC):
+    """Interface for data version counter operations."""
+
+    @abstractmethod
+    def get_version(self, scope: str) -> int:
+        """Get the current version of a scope (0 if never bumped)."""
+        pass
+
+    @abstractmethod
+    def get_versions(self, scopes: Iterable[str]) -> List[DataVersion]:
+        """Get the version rows of several scopes (missing scopes are omitted)."""
+        pass
+
+    @abstractmethod
+    def bump_versions(self, scopes: Iterable[str]) -> None:
+        """Atomically increment the version of each scope."""
+        pass
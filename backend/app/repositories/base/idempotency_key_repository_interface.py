@@ -0,0 +1,42 @@
+"""Idempotency key repository interface."""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from app.models.idempotency_key import IdempotencyKey
+
+
+class IdempotencyKeyRepositoryInterface(ABC):
+    """Interface for stored responses of idempotent write requests."""
+
+    @abstractmethod
+    def claim(self, user_id: int, key: str, request_hash: str, expires_at: datetime) -> bool:
+        """Record a key as in progress unless a live record exists."""
+        pass
+
+    @abstractmethod
+    def get(self, user_id: int, key: str) -> Optional[IdempotencyKey]:
+        """Get the current record of a key."""
+        pass
+
+    @abstractmethod
+    def complete(
+        self,
+        user_id: int,
+        key: str,
+        status: int,
+        body: str,
+        content_type: str,
+        expires_at: datetime
+    ) -> None:
+        """Store the response of a claimed key."""
+        pass
+
+    @abstractmethod
+    def release(self, user_id: int, key: str) -> None:
+        """Delete a claimed key so the request can be retried."""
+        pass
+
+    @abstractmethod
+    def delete_expired(self, now: datetime) -> int:
+        """Delete every expired key."""
+        pass
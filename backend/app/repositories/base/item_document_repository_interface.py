@@ -0,0 +1,45 @@
+"""Item document repository interface."""
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+from app.repositories.base.item_repository_interface import ItemSort
+from app.utils.item_filters import ItemFilters
+
+
+class ItemDocumentRepositoryInterface(ABC):
+    """Interface for item document read model operations."""
+
+    @abstractmethod
+    def save_documents(self, documents: dict[int, str]) -> None:
+        """Insert or replace rendered documents keyed by item ID."""
+        pass
+
+    @abstractmethod
+    def get_city_documents(
+        self,
+        rotation_city_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[tuple] = None,
+        filters: Optional[ItemFilters] = None,
+        sort: ItemSort = ItemSort.NEWEST
+    ) -> list[Any]:
+        """Get (item_id, created_at, document, freshness) rows for a city in feed order.
+
+        The cursor is the (sort key, item_id) of the last row already seen.
+        document is None for items whose document has not been built yet.
+        """
+        pass
+
+    @abstractmethod
+    def get_document(self, item_id: int, rotation_city_id: int) -> Optional[Any]:
+        """Get the (item_id, created_at, document) row for one item in a city."""
+        pass
+
+    @abstractmethod
+    def get_documents(self, item_ids: list[int]) -> list[Any]:
+        """Get (item_id, created_at, document) rows for several items."""
+        pass
+
+    @abstractmethod
+    def get_user_documents(self, user_id: int) -> list[Any]:
+        """Get (item_id, created_at, document) rows for items added by a user."""
+        pass
@@ -1,7 +1,36 @@
 """Item repository interface."""
 from abc import ABC, abstractmethod
+from datetime import datetime
+from enum import Enum
 from typing import Optional
 from app.models.item import Item
+from app.utils.fieldsets import Fieldset
+from app.utils.item_filters import ItemFilters
+
+
+class ItemLoadStrategy(Enum):
+    """How item detail queries load categories, tags and values.
+    
+    Members:
+        JOINED: One query with chained JOINs (rows = items x categories x tags)
+        SELECTIN: One query for items plus one batched IN query per collection
+        TWO_PHASE: Resolve matching item ids first, then load them by primary key
+    """
+    JOINED = "joined"
+    SELECTIN = "selectin"
+    TWO_PHASE = "two_phase"
+
+
+class ItemSort(Enum):
+    """Order of a rotation city's item feed, most relevant first.
+    
+    Members:
+        NEWEST: By creation time, keyset (created_at, item_id)
+        FRESHNESS: By time-decayed verification count, keyset
+            (freshness, item_id); never verified items come last
+    """
+    NEWEST = "newest"
+    FRESHNESS = "freshness"
 
 
 class ItemRepositoryInterface(ABC):
@@ -19,6 +48,16 @@ class ItemRepositoryInterface(ABC):
         """Create a new item."""
         pass
 
+    @abstractmethod
+    def insert_items(self, rows: list[dict]) -> list[int]:
+        """Insert many items at once, returning their IDs in order."""
+        pass
+
+    @abstractmethod
+    def update_item(self, item: Item, fields: dict) -> Item:
+        """Set columns (name, location, walking_distance) of an item."""
+        pass
+
     @abstractmethod
     def get_item_by_id(self, item_id: int, rotation_city_id: int) -> Optional[Item]:
         """Get item by ID (filtered by rotation city)."""
@@ -30,20 +69,92 @@ class ItemRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def get_all_items_with_details(self, rotation_city_id: int) -> list[Item]:
-        """Get all items with relationships loaded (filtered by rotation city)."""
+    def get_all_items_with_details(
+        self,
+        rotation_city_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[tuple] = None,
+        strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN,
+        fieldset: Optional[Fieldset] = None,
+        filters: Optional[ItemFilters] = None,
+        sort: ItemSort = ItemSort.NEWEST
+    ) -> list[Item]:
+        """Get items with relationships loaded (filtered by rotation city).
+
+        Supports keyset pagination on (sort key, item_id), in sort order.
+        A sparse fieldset restricts the columns and relationships loaded;
+        filters restrict which items are returned.
+        """
         pass
 
     @abstractmethod
-    def get_item_by_id_with_details(self, item_id: int, rotation_city_id: int) -> Optional[Item]:
+    def get_item_by_id_with_details(
+        self,
+        item_id: int,
+        rotation_city_id: int,
+        strategy: ItemLoadStrategy = ItemLoadStrategy.JOINED,
+        fieldset: Optional[Fieldset] = None
+    ) -> Optional[Item]:
         """Get item by ID with relationships loaded (filtered by rotation city)."""
         pass
 
     @abstractmethod
-    def get_items_by_user(self, user_id: int) -> list[Item]:
+    def get_items_by_user(
+        self,
+        user_id: int,
+        strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN,
+        fieldset: Optional[Fieldset] = None
+    ) -> list[Item]:
         """Get all items added by a specific user with relationships loaded."""
         pass
 
+    @abstractmethod
+    def get_items_by_ids_with_details(
+        self,
+        item_ids: list[int],
+        strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN
+    ) -> list[Item]:
+        """Get several items by ID with relationships loaded."""
+        pass
+
+    @abstractmethod
+    def get_item_ids_by_user(self, user_id: int) -> list[int]:
+        """Get the IDs of all items added by a specific user."""
+        pass
+
+    @abstractmethod
+    def get_item_ids_added_outside_city(self, rotation_city_id: int) -> list[int]:
+        """Get the IDs of items in other cities added by users of a city."""
+        pass
+
+    @abstractmethod
+    def delete_item(self, item_id: int) -> bool:
+        """Delete an item; the database cascades to its dependent rows."""
+        pass
+
+    @abstractmethod
+    def count_items(self, rotation_city_id: int, filters: Optional[ItemFilters] = None) -> int:
+        """Count the items of a city matching filters."""
+        pass
+
+    @abstractmethod
+    def get_category_counts(
+        self,
+        rotation_city_id: int,
+        filters: Optional[ItemFilters] = None
+    ) -> list:
+        """Get (category_id, category_name, count) rows for matching items."""
+        pass
+
+    @abstractmethod
+    def get_tag_value_counts(
+        self,
+        rotation_city_id: int,
+        filters: Optional[ItemFilters] = None
+    ) -> list:
+        """Get per tag value item counts for matching items."""
+        pass
+
     @abstractmethod
     def exists(self, item_id: int) -> bool:
         """Check if an item exists by ID.
@@ -57,17 +168,109 @@ class ItemRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def update_verification_count(self, item_id: int, count: int) -> None:
-        """Update the verification count for an item.
+    def get_item_names(self, item_ids: list[int]) -> dict[int, str]:
+        """Look up the names of existing items in any rotation city.
 
         Args:
-            item_id: The ID of the item whose verification count should be updated.
-            count: The new verification count to set for the item.
+            item_ids: IDs of the items to look up.
 
         Returns:
-            None
+            Mapping of item ID to name for the items that exist.
+        """
+        pass
+
+    @abstractmethod
+    def get_rotation_city_ids(self) -> list[int]:
+        """Get the IDs of the rotation cities that have items.
 
-        Raises:
-            ValueError: If the specified item does not exist.
+        Returns:
+            Distinct rotation city IDs.
+        """
+        pass
+
+    @abstractmethod
+    def get_item_city_ids(self, item_ids: list[int]) -> dict[int, int]:
+        """Look up the rotation cities of existing items.
+
+        Args:
+            item_ids: IDs of the items to look up.
+
+        Returns:
+            Mapping of item ID to rotation city ID for the items that exist.
+        """
+        pass
+
+    @abstractmethod
+    def get_verification_count(self, item_id: int) -> int:
+        """Read the stored verification count of an item.
+
+        Args:
+            item_id: The ID of the item.
+
+        Returns:
+            The item's verification count, or 0 if the item does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def increment_verification_count(
+        self,
+        item_id: int,
+        by: int = 1,
+        verified_at: Optional[datetime] = None
+    ) -> Optional[int]:
+        """Atomically record new verifications of an item.
+
+        Adds to the verification count, sets last_verified_date and folds
+        the verifications into the item's freshness.
+
+        Args:
+            item_id: The ID of the item that was verified.
+            by: Number of new verifications.
+            verified_at: When they were made (default now).
+
+        Returns:
+            The item's new verification count, or None if the item does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def increment_verification_counts(
+        self,
+        item_ids: list[int],
+        verified_at: Optional[datetime] = None
+    ) -> dict[int, int]:
+        """Atomically record one new verification of each of several items.
+
+        Args:
+            item_ids: IDs of the items that were verified.
+            verified_at: When the verifications were made (default now).
+
+        Returns:
+            Mapping of item ID to its new verification count.
+        """
+        pass
+
+    @abstractmethod
+    def backfill_freshness(self, item_ids: Optional[list[int]] = None) -> int:
+        """Recompute last_verified_date and freshness from the verifications.
+
+        Args:
+            item_ids: Items to recompute; None recomputes every item
+
+        Returns:
+            Number of items updated.
+        """
+        pass
+
+    @abstractmethod
+    def reconcile_verification_counts(self, item_ids: Optional[list[int]] = None) -> list[int]:
+        """Reset items' verification counts to their number of verifications.
+
+        Args:
+            item_ids: Items to recount; None recounts every item.
+
+        Returns:
+            IDs of the items whose count was wrong.
         """
         pass
\ No newline at end of file
@@ -3,8 +3,11 @@ Item Verification Repository Interface
 Defines the contract for verification data access operations.
 """
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from datetime import datetime
+from typing import Optional, List, Set, Tuple
+from sqlalchemy.engine import Row
 from app.models.item_verification import ItemVerification
+from app.utils.fieldsets import Fieldset
 
 
 class IItemVerificationRepository(ABC):
@@ -31,10 +34,27 @@ class IItemVerificationRepository(ABC):
         pass
     
     @abstractmethod
-    def get_verification_by_id(
+    def create_verifications(
         self,
-        verification_id: int
-    ) -> Optional[ItemVerification]:
+        user_id: int,
+        entries: List[Tuple[int, Optional[str]]],
+        created_at: datetime
+    ) -> List[int]:
+        """
+        Create verifications of several items at once.
+        
+        Args:
+            user_id: ID of the user verifying the items
+            entries: (item_id, note) pairs
+            created_at: Timestamp recorded on every verification
+            
+        Returns:
+            IDs of the created verifications, in the order of entries
+        """
+        pass
+    
+    @abstractmethod
+    def get_verification_by_id(self, verification_id: int) -> Optional[ItemVerification]:
         """
         Get a verification by its ID.
         
@@ -46,21 +66,46 @@ class IItemVerificationRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_verification_row(
+        self,
+        verification_id: int,
+        fieldset: Optional[Fieldset] = None
+    ) -> Optional[Row]:
+        """
+        Get a verification as a flat row, with its user and item columns.
+        
+        Args:
+            verification_id: ID of the verification
+            fieldset: Optional sparse fieldset limiting the columns selected
+            
+        Returns:
+            Row with verification_id, user_id, item_id, note, created_at
+            and, unless the fieldset leaves them out, first_name,
+            last_name, profile_picture and item_name; None if not found
+        """
+        pass
+    
     @abstractmethod
     def get_verifications_by_item_id(
         self,
         item_id: int,
-        limit: Optional[int] = None
-    ) -> List[ItemVerification]:
+        limit: Optional[int] = None,
+        fieldset: Optional[Fieldset] = None,
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> List[Row]:
         """
         Get all verifications for a specific item.
         
         Args:
             item_id: ID of the item
             limit: Optional limit on number of results
+            fieldset: Optional sparse fieldset limiting the columns selected
+            cursor: Optional (created_at, verification_id) keyset position
+                to start after
             
         Returns:
-            List of ItemVerification instances
+            Rows as returned by get_verification_row, newest first
         """
         pass
     
@@ -68,17 +113,22 @@ class IItemVerificationRepository(ABC):
     def get_verifications_by_user_id(
         self,
         user_id: int,
-        limit: Optional[int] = None
-    ) -> List[ItemVerification]:
+        limit: Optional[int] = None,
+        fieldset: Optional[Fieldset] = None,
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> List[Row]:
         """
         Get all verifications by a specific user.
         
         Args:
             user_id: ID of the user
             limit: Optional limit on number of results
+            fieldset: Optional sparse fieldset limiting the columns selected
+            cursor: Optional (created_at, verification_id) keyset position
+                to start after
             
         Returns:
-            List of ItemVerification instances
+            Rows as returned by get_verification_row, newest first
         """
         pass
     
@@ -100,6 +150,50 @@ class IItemVerificationRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_item_ids_verified_by_user(self, user_id: int) -> List[int]:
+        """
+        Get the IDs of the items a user has verified.
+        
+        Args:
+            user_id: ID of the user
+            
+        Returns:
+            Distinct IDs of the items the user verified
+        """
+        pass
+    
+    @abstractmethod
+    def get_item_ids_verified_outside_city(self, rotation_city_id: int) -> List[int]:
+        """
+        Get the IDs of items in other cities verified by a city's users.
+        
+        Args:
+            rotation_city_id: The city whose users made the verifications
+            
+        Returns:
+            Distinct IDs of the verified items
+        """
+        pass
+    
+    @abstractmethod
+    def get_item_ids_verified_today(
+        self,
+        user_id: int,
+        item_ids: List[int]
+    ) -> Set[int]:
+        """
+        Find which of several items the user has already verified today.
+        
+        Args:
+            user_id: ID of the user
+            item_ids: IDs of the items to check
+            
+        Returns:
+            IDs of the items verified by the user today
+        """
+        pass
+    
     @abstractmethod
     def get_verification_count_for_item(
         self,
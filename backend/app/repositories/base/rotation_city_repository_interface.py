@@ -23,4 +23,8 @@ class IRotationCityRepository(ABC):
 
     @abstractmethod
     def validate_city_id(self, city_id) -> int:
+        pass
+
+    @abstractmethod
+    def delete_rotation_city(self, city_id: int) -> bool:
         pass
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""Search index repository interface."""
+from abc import ABC, abstractmethod
+
+
+class SearchIndexRepositoryInterface(ABC):
+    """Interface for the full-text index over items and text tag values."""
+
+    @abstractmethod
+    def index_items(self, item_ids: list[int]) -> None:
+        """Replace the index entries of items (removing deleted ones)."""
+        pass
+
+    @abstractmethod
+    def remove_city_items(self, rotation_city_id: int) -> None:
+        """Remove the index entries of every item in a city."""
+        pass
+
+    @abstractmethod
+    def index_values(self, value_ids: list[int]) -> None:
+        """Replace the index entries of text values."""
+        pass
+
+    @abstractmethod
+    def search_items(self, rotation_city_id: int, query: str, limit: int) -> list[int]:
+        """Get IDs of items in a city matching query, best match first.
+
+        Relevance is blended with the item's number of verifications.
+        """
+        pass
+
+    @abstractmethod
+    def search_values(self, tag_id: int, query: str, limit: int) -> list[int]:
+        """Get IDs of a tag's text values matching query, best match first."""
+        pass
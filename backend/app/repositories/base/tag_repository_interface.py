@@ -1,6 +1,6 @@
 """Tag repository interface."""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from app.models.tag import Tag
 
 
@@ -17,12 +17,27 @@ class TagRepositoryInterface(ABC):
         """Get tag by ID."""
         pass
 
+    @abstractmethod
+    def get_tags_by_ids(self, tag_ids: List[int]) -> List[Tag]:
+        """Get multiple tags by ID."""
+        pass
+
     @abstractmethod
     def get_tag_by_name(self, name: str) -> Optional[Tag]:
         """Get tag by name."""
         pass
 
+    @abstractmethod
+    def get_tags_by_names(self, names: List[str]) -> List[Tag]:
+        """Get multiple tags by name (case-insensitive)."""
+        pass
+
     @abstractmethod
     def create_tag(self, name: str, value_type: str) -> Tag:
         """Create a new tag."""
         pass
+
+    @abstractmethod
+    def create_tags(self, tags: List[Tuple[str, str]]) -> List[Tag]:
+        """Create several tags from (name, value_type) pairs."""
+        pass
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Optional, List
 from app.models.user import User
+from app.utils.fieldsets import Fieldset
 
 
 class IUserRepository(ABC):
@@ -25,13 +26,21 @@ class IUserRepository(ABC):
         pass
     
     @abstractmethod
-    def get_user_by_id(self, user_id: int) -> Optional[User]:
+    def get_user_by_id(self, user_id: int, fieldset: Optional[Fieldset] = None) -> Optional[User]:
+        pass
+    
+    @abstractmethod
+    def get_users_by_ids(self, user_ids: List[int]) -> List[User]:
         pass
     
     @abstractmethod
     def get_all_users(self) -> List[User]:
         pass
     
+    @abstractmethod
+    def delete_user(self, user_id: int) -> bool:
+        pass
+    
     @abstractmethod
     def update(self, user_id: int, **kwargs) -> User:
         pass
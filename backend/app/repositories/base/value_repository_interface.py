@@ -1,6 +1,6 @@
 """Value repository interface."""
 from abc import ABC, abstractmethod
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 from app.models.value import Value
 
 
@@ -17,6 +17,24 @@ class ValueRepositoryInterface(ABC):
         """Create a new value for a tag."""
         pass
 
+    @abstractmethod
+    def get_or_create_values(
+        self,
+        entries: List[Tuple[int, Union[str, int], Union[bool, str, float]]]
+    ) -> List[Value]:
+        """Resolve (tag_id, value_type, value) triples to interned values, creating missing ones."""
+        pass
+
+    @abstractmethod
+    def find_value(
+        self,
+        tag_id: int,
+        value_type: Union[str, int],
+        value: Union[bool, str, float]
+    ) -> Optional[Value]:
+        """Find the interned value of a tag without creating it."""
+        pass
+
     @abstractmethod
     def get_value_by_id(self, value_id: int) -> Optional[Value]:
         """Get value by ID."""
@@ -44,11 +62,17 @@ class ValueRepositoryInterface(ABC):
         """Update an existing value."""
         pass
 
+    @abstractmethod
+    def merge_values(self, source_id: int, target_id: int) -> List[int]:
+        """Repoint items from one value to another and delete the first."""
+        pass
+
     @abstractmethod
     def find_similar_text_values(
         self,
         tag_id: int,
-        value: str
+        value: str,
+        limit: int = 20
     ) -> List[Value]:
-        """Find a similar text value for a tag."""
+        """Find text values of a tag matching value (full-text, best first)."""
         pass
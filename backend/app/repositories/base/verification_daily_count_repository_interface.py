@@ -0,0 +1,38 @@
+"""Verification daily count repository interface."""
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+
+
+class VerificationDailyCountRepositoryInterface(ABC):
+    """Interface for the daily rollup of item verifications."""
+
+    @abstractmethod
+    def add_verifications(self, item_ids: List[int], verified_at: datetime) -> None:
+        """Count one verification of each item on the day of verified_at."""
+        pass
+
+    @abstractmethod
+    def rebuild(self, item_ids: Optional[List[int]] = None) -> int:
+        """Recompute the rollup of some or all items from their verifications."""
+        pass
+
+    @abstractmethod
+    def get_city_daily_counts(
+        self,
+        rotation_city_id: int,
+        start: date,
+        end: date
+    ) -> List[Tuple[date, int]]:
+        """Get a city's verifications per day between two days, inclusive."""
+        pass
+
+    @abstractmethod
+    def get_item_daily_counts(
+        self,
+        item_id: int,
+        start: date,
+        end: date
+    ) -> List[Tuple[date, int]]:
+        """Get an item's verifications per day between two days, inclusive."""
+        pass
@@ -0,0 +1,82 @@
+"""Multi-row INSERT helpers for bulk writes.
+
+Bulk loads skip the ORM unit of work and hand lists of parameter dicts to
+``insert()``, which SQLAlchemy sends as multi-row ``INSERT ... VALUES``
+statements. Callers finish with ``save()`` like any repository write.
+"""
+from sqlalchemy import insert
+
+from app import db
+
+
+def insert_returning_ids(primary_key, rows: list[dict]) -> list[int]:
+    """Insert rows with multi-row INSERTs and return their generated keys.
+
+    Asking SQLAlchemy to match RETURNING rows to parameter order makes it
+    fall back to one INSERT per row on SQLite. SQLite assigns integer keys
+    in increasing order within a write transaction, though, so there the
+    keys are sorted instead, which gives the same order.
+
+    Args:
+        primary_key: Integer primary key attribute of the model, e.g. Item.item_id
+        rows: Column values per row; every row must bind the same columns
+
+    Returns:
+        Generated keys, in the order of rows
+    """
+    if not rows:
+        return []
+
+    # Insert into the table rather than the mapped class: ORM bulk inserts
+    # drop None values and split the batch wherever the bound columns change
+    column = primary_key.property.columns[0]
+    statement = insert(column.table)
+    if db.session.get_bind().dialect.name == 'sqlite':
+        return sorted(db.session.execute(statement.returning(column), rows).scalars())
+    return db.session.execute(
+        statement.returning(column, sort_by_parameter_order=True), rows
+    ).scalars().all()
+
+
+def insert_ignoring_conflicts(table, rows: list[dict]) -> int:
+    """Insert rows with multi-row INSERTs, skipping rows that violate a unique key.
+
+    Uses ``INSERT ... ON CONFLICT DO NOTHING``, so rows inserted meanwhile
+    by another transaction are skipped instead of failing the batch.
+
+    Args:
+        table: Table to insert into, e.g. Value.__table__
+        rows: Column values per row; every row must bind the same columns
+
+    Returns:
+        Number of rows actually inserted
+
+    Raises:
+        ValueError: If the database has no ON CONFLICT support
+    """
+    if not rows:
+        return 0
+    return db.session.execute(upsert(table).on_conflict_do_nothing(), rows).rowcount
+
+
+def upsert(table):
+    """Start an ``INSERT`` that can take an ``ON CONFLICT`` clause.
+
+    Args:
+        table: Table to insert into
+
+    Returns:
+        The database's insert construct, with on_conflict_do_nothing and
+        on_conflict_do_update
+
+    Raises:
+        ValueError: If the database has no ON CONFLICT support
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    elif dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    else:
+        raise ValueError(f"Conflict-handling inserts are not supported on {dialect}")
+    return dialect_insert(table)
@@ -0,0 +1,132 @@
+"""Blob repository implementations."""
+import os
+from typing import Optional, Tuple
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.models.blob import Blob
+from app.repositories.base.blob_repository_interface import (
+    BlobRepositoryInterface
+)
+
+
+class DatabaseBlobRepository(BlobRepositoryInterface):
+    """Stores blob content in the blob table alongside its metadata."""
+
+    def exists(self, blob_hash: str) -> bool:
+        """Check whether a blob is stored.
+        
+        Args:
+            blob_hash: Hex SHA-256 of the content
+            
+        Returns:
+            True if the blob row exists
+        """
+        return db.session.query(
+            db.session.query(Blob).filter_by(blob_hash=blob_hash).exists()
+        ).scalar()
+
+    def save(self, blob_hash: str, content_type: str, data: bytes) -> None:
+        """Store content under its hash.
+        
+        Args:
+            blob_hash: Hex SHA-256 of the content
+            content_type: MIME type of the content
+            data: Raw content
+        """
+        self._save_row(blob_hash, content_type, len(data), data)
+
+    def get_content(self, blob_hash: str) -> Optional[Tuple[bytes, str]]:
+        """Retrieve the content of a blob.
+        
+        Args:
+            blob_hash: Hex SHA-256 of the content
+            
+        Returns:
+            Tuple of (data, content_type), or None if not stored
+        """
+        row = db.session.execute(
+            db.select(Blob.data, Blob.content_type).filter_by(blob_hash=blob_hash)
+        ).first()
+        if row is None or row.data is None:
+            return None
+        return row.data, row.content_type
+
+    def _save_row(
+        self,
+        blob_hash: str,
+        content_type: str,
+        size: int,
+        data: Optional[bytes]
+    ) -> None:
+        """Insert a blob row unless one already exists for the hash."""
+        if self.exists(blob_hash):
+            return
+        try:
+            with db.session.begin_nested():
+                db.session.add(Blob(
+                    blob_hash=blob_hash,
+                    content_type=content_type,
+                    size=size,
+                    data=data
+                ))
+        except IntegrityError:
+            # Same content stored concurrently; content is identical
+            pass
+        db.session.commit()
+
+
+class FileSystemBlobRepository(DatabaseBlobRepository):
+    """Stores blob content as files under a root directory.
+    
+    The blob table still records metadata (content type, size) but leaves
+    ``data`` empty. Files are fanned out by hash prefix
+    (``root/ab/cd/abcd...``) to keep directories small.
+    """
+
+    def __init__(self, root: str):
+        """Initialize repository with its storage directory.
+        
+        Args:
+            root: Directory blobs are written under (created if missing)
+        """
+        self.root = root
+
+    def save(self, blob_hash: str, content_type: str, data: bytes) -> None:
+        """Write content to its file, then record its metadata.
+        
+        Args:
+            blob_hash: Hex SHA-256 of the content
+            content_type: MIME type of the content
+            data: Raw content
+        """
+        path = self._path(blob_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write then rename so readers never see a partial file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        self._save_row(blob_hash, content_type, len(data), None)
+
+    def get_content(self, blob_hash: str) -> Optional[Tuple[bytes, str]]:
+        """Read the content of a blob from its file.
+        
+        Args:
+            blob_hash: Hex SHA-256 of the content
+            
+        Returns:
+            Tuple of (data, content_type), or None if not stored
+        """
+        content_type = db.session.execute(
+            db.select(Blob.content_type).filter_by(blob_hash=blob_hash)
+        ).scalar_one_or_none()
+        path = self._path(blob_hash)
+        if content_type is None or not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read(), content_type
+
+    def _path(self, blob_hash: str) -> str:
+        """Return the file path of a blob."""
+        return os.path.join(self.root, blob_hash[:2], blob_hash[2:4], blob_hash)
@@ -1,6 +1,10 @@
 """Category-Item junction repository."""
+from sqlalchemy import delete, insert
 from app import db
+from app.models.category import Category
 from app.models.category_item import CategoryItem
+from app.models.item import Item
+from app.repositories.unit_of_work import save
 
 
 class CategoryItemRepository:
@@ -15,8 +19,57 @@ class CategoryItemRepository:
         db.session.add(category_item)
         return category_item
 
-    def add_categories_to_item(self, item_id: int, category_ids: list[int]) -> None:
-        """Link multiple categories to an item."""
-        for category_id in category_ids:
-            self.add_category_to_item(item_id, category_id)
-        db.session.commit()
+    def add_categories_to_item(self, item: Item, categories: list[Category]) -> None:
+        """Link multiple categories to an item.
+        
+        Links are added through the item's relationship, so they work for
+        an item not yet flushed and leave item.category_items loaded.
+        """
+        for category in categories:
+            item.category_items.append(CategoryItem(category=category))
+        save()
+
+    def insert_links(self, links: list[tuple[int, int]]) -> None:
+        """Link items to categories with one multi-row INSERT.
+        
+        Args:
+            links: (item_id, category_id) pairs
+        """
+        if not links:
+            return
+        db.session.execute(
+            insert(CategoryItem.__table__),
+            [{'item_id': item_id, 'category_id': category_id} for item_id, category_id in links]
+        )
+        save()
+
+    def get_category_ids_by_item(self, item_id: int) -> list[int]:
+        """Get the IDs of the categories linked to an item, in link order."""
+        return db.session.execute(
+            db.select(CategoryItem.category_id)
+            .filter_by(item_id=item_id)
+            .order_by(CategoryItem.category_item_id)
+        ).scalars().all()
+
+    def delete_links(self, item_id: int, category_ids: list[int]) -> None:
+        """Unlink categories from an item with one DELETE.
+        
+        Args:
+            item_id: ID of the item
+            category_ids: IDs of the categories to unlink
+        """
+        if not category_ids:
+            return
+        db.session.execute(
+            delete(CategoryItem.__table__).where(
+                CategoryItem.item_id == item_id,
+                CategoryItem.category_id.in_(category_ids)
+            )
+        )
+        save()
+
+    def get_item_ids_by_category(self, category_id: int) -> list[int]:
+        """Get the IDs of all items linked to a category."""
+        return db.session.execute(
+            db.select(CategoryItem.item_id).filter_by(category_id=category_id)
+        ).scalars().all()
@@ -1,5 +1,6 @@
 """Category repository implementation."""
 from typing import List, Optional
+from sqlalchemy import func
 from app import db
 from app.models.category import Category
 from app.repositories.base.category_repository_interface import (
@@ -47,6 +48,21 @@ class CategoryRepository(CategoryRepositoryInterface):
             db.select(Category).filter(Category.category_id.in_(category_ids))
         ).scalars().all()
 
+    def get_categories_by_names(self, names: List[str]) -> List[Category]:
+        """Retrieve multiple categories by name (case-insensitive).
+        
+        Args:
+            names: Category names to look up
+            
+        Returns:
+            List of Category objects found
+        """
+        return db.session.execute(
+            db.select(Category).filter(
+                func.lower(Category.category_name).in_([name.lower() for name in names])
+            )
+        ).scalars().all()
+
     def category_exists(self, category_id: int) -> bool:
         """Check if a category exists in the database.
         
@@ -0,0 +1,71 @@
+"""Data version repository implementation."""
+from datetime import datetime
+from typing import Iterable, List
+from sqlalchemy.exc import IntegrityError
+from app import db
+from app.repositories.unit_of_work import save
+from app.models.data_version import DataVersion
+from app.repositories.base.data_version_repository_interface import (
+    DataVersionRepositoryInterface
+)
+
+
+class DataVersionRepository(DataVersionRepositoryInterface):
+    """Repository for data version counters.
+    
+    Versions are bumped with a single UPDATE ... SET version = version + 1
+    so concurrent writers never lose an increment.
+    """
+
+    def get_version(self, scope: str) -> int:
+        """Retrieve the current version of a scope.
+        
+        Args:
+            scope: Name of the data scope
+            
+        Returns:
+            Current version, or 0 if the scope has never been bumped
+        """
+        version = db.session.execute(
+            db.select(DataVersion.version).filter_by(scope=scope)
+        ).scalar_one_or_none()
+        return version or 0
+
+    def get_versions(self, scopes: Iterable[str]) -> List[DataVersion]:
+        """Retrieve the version rows of several scopes in one query.
+        
+        Args:
+            scopes: Names of the data scopes
+            
+        Returns:
+            List of DataVersion rows; scopes never bumped are omitted
+        """
+        return db.session.execute(
+            db.select(DataVersion).filter(DataVersion.scope.in_(list(scopes)))
+        ).scalars().all()
+
+    def bump_versions(self, scopes: Iterable[str]) -> None:
+        """Increment the version of each scope, creating missing ones.
+        
+        Args:
+            scopes: Names of the data scopes that changed
+        """
+        now = datetime.utcnow()
+        for scope in sorted(set(scopes)):
+            updated = db.session.execute(
+                db.update(DataVersion)
+                .where(DataVersion.scope == scope)
+                .values(version=DataVersion.version + 1, updated_at=now)
+            ).rowcount
+            if not updated:
+                try:
+                    with db.session.begin_nested():
+                        db.session.add(DataVersion(scope=scope, version=1, updated_at=now))
+                except IntegrityError:
+                    # Another writer created the row first; increment theirs
+                    db.session.execute(
+                        db.update(DataVersion)
+                        .where(DataVersion.scope == scope)
+                        .values(version=DataVersion.version + 1, updated_at=now)
+                    )
+        save()
@@ -0,0 +1,132 @@
+"""Idempotency key repository implementation."""
+from datetime import datetime
+from typing import Optional
+from app import db
+from app.repositories.bulk_insert import insert_ignoring_conflicts
+from app.repositories.unit_of_work import save
+from app.models.idempotency_key import IdempotencyKey
+from app.repositories.base.idempotency_key_repository_interface import (
+    IdempotencyKeyRepositoryInterface
+)
+
+
+class IdempotencyKeyRepository(IdempotencyKeyRepositoryInterface):
+    """Repository for stored responses of idempotent write requests.
+    
+    Claims are plain inserts that skip existing rows, so of several
+    concurrent requests with one key exactly one wins, whatever the
+    isolation level.
+    """
+
+    def claim(self, user_id: int, key: str, request_hash: str, expires_at: datetime) -> bool:
+        """Record a key as in progress unless a live record exists.
+        
+        An expired record (an old response, or a claim whose request died)
+        is replaced.
+        
+        Args:
+            user_id: ID of the user sending the request
+            key: Idempotency-Key header value
+            request_hash: Fingerprint of the request
+            expires_at: When the claim lapses if no response is stored
+            
+        Returns:
+            True if this request now owns the key
+        """
+        now = datetime.utcnow()
+        db.session.execute(
+            db.delete(IdempotencyKey).where(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.key == key,
+                IdempotencyKey.expires_at <= now
+            )
+        )
+        claimed = insert_ignoring_conflicts(IdempotencyKey.__table__, [{
+            'user_id': user_id,
+            'key': key,
+            'request_hash': request_hash,
+            'created_at': now,
+            'expires_at': expires_at
+        }])
+        save()
+        return claimed == 1
+
+    def get(self, user_id: int, key: str) -> Optional[IdempotencyKey]:
+        """Get the current record of a key.
+        
+        Always reads the row again, so polling sees changes committed by
+        other requests.
+        
+        Args:
+            user_id: ID of the user sending the request
+            key: Idempotency-Key header value
+            
+        Returns:
+            IdempotencyKey object, or None if the key is not recorded
+        """
+        return db.session.execute(
+            db.select(IdempotencyKey)
+            .filter_by(user_id=user_id, key=key)
+            .execution_options(populate_existing=True)
+        ).scalar_one_or_none()
+
+    def complete(
+        self,
+        user_id: int,
+        key: str,
+        status: int,
+        body: str,
+        content_type: str,
+        expires_at: datetime
+    ) -> None:
+        """Store the response of a claimed key.
+        
+        Args:
+            user_id: ID of the user sending the request
+            key: Idempotency-Key header value
+            status: Response status code
+            body: Response body
+            content_type: Response content type
+            expires_at: When the stored response stops being replayed
+        """
+        db.session.execute(
+            db.update(IdempotencyKey)
+            .where(IdempotencyKey.user_id == user_id, IdempotencyKey.key == key)
+            .values(
+                response_status=status,
+                response_body=body,
+                content_type=content_type,
+                expires_at=expires_at
+            )
+        )
+        save()
+
+    def release(self, user_id: int, key: str) -> None:
+        """Delete a claimed key so the request can be retried.
+        
+        Args:
+            user_id: ID of the user sending the request
+            key: Idempotency-Key header value
+        """
+        db.session.execute(
+            db.delete(IdempotencyKey).where(
+                IdempotencyKey.user_id == user_id,
+                IdempotencyKey.key == key
+            )
+        )
+        save()
+
+    def delete_expired(self, now: datetime) -> int:
+        """Delete every expired key.
+        
+        Args:
+            now: Current time
+            
+        Returns:
+            Number of keys deleted
+        """
+        deleted = db.session.execute(
+            db.delete(IdempotencyKey).where(IdempotencyKey.expires_at <= now)
+        ).rowcount
+        save()
+        return deleted
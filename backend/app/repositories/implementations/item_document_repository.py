@@ -0,0 +1,136 @@
+"""Item document repository implementation."""
+from typing import Any, Optional
+from app import db
+from app.repositories.unit_of_work import save
+from app.models.item import Item
+from app.models.item_document import ItemDocument
+from app.repositories.base.item_document_repository_interface import (
+    ItemDocumentRepositoryInterface
+)
+from app.repositories.base.item_repository_interface import ItemSort
+from app.repositories.implementations.item_repository import ItemRepository
+from app.utils.item_filters import ItemFilters
+
+
+class ItemDocumentRepository(ItemDocumentRepositoryInterface):
+    """Repository for the denormalized item document read model.
+    
+    Reads go through the item table so that items whose document has not
+    been built yet are still returned (with a None document) and can be
+    filled in by the caller.
+    """
+
+    def save_documents(self, documents: dict[int, str]) -> None:
+        """Insert or replace rendered documents.
+        
+        Args:
+            documents: Mapping of item_id to rendered JSON document
+        """
+        if not documents:
+            return
+
+        existing = {
+            doc.item_id: doc
+            for doc in db.session.execute(
+                db.select(ItemDocument).filter(ItemDocument.item_id.in_(documents))
+            ).scalars()
+        }
+        for item_id, document in documents.items():
+            if item_id in existing:
+                existing[item_id].document = document
+            else:
+                db.session.add(ItemDocument(item_id=item_id, document=document))
+        save()
+
+    def get_city_documents(
+        self,
+        rotation_city_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[tuple] = None,
+        filters: Optional[ItemFilters] = None,
+        sort: ItemSort = ItemSort.NEWEST
+    ) -> list[Any]:
+        """Retrieve rendered documents for a city in feed order.
+        
+        Args:
+            rotation_city_id: The rotation city ID to filter by
+            limit: Optional maximum number of rows to return
+            cursor: Optional (sort key, item_id) keyset position to start after
+            filters: Optional conditions items must satisfy (evaluated on
+                the normalized tables, see ItemRepository.apply_filters)
+            sort: Feed order (see ItemSort)
+            
+        Returns:
+            List of (item_id, created_at, document, freshness) rows in
+            feed order
+        """
+        query = ItemRepository.apply_feed_order(
+            ItemRepository.apply_filters(
+                self._document_select()
+                .add_columns(Item.freshness)
+                .filter(Item.rotation_city_id == rotation_city_id),
+                filters
+            ),
+            sort,
+            cursor
+        )
+
+        if limit:
+            query = query.limit(limit)
+
+        return db.session.execute(query).all()
+
+    def get_document(self, item_id: int, rotation_city_id: int) -> Optional[Any]:
+        """Retrieve the rendered document of one item in a city.
+        
+        Args:
+            item_id: The ID of the item
+            rotation_city_id: The rotation city ID the item must belong to
+            
+        Returns:
+            (item_id, created_at, document) row, or None if the item is not found
+        """
+        return db.session.execute(
+            self._document_select().filter(
+                Item.item_id == item_id,
+                Item.rotation_city_id == rotation_city_id
+            )
+        ).first()
+
+    def get_documents(self, item_ids: list[int]) -> list[Any]:
+        """Retrieve rendered documents of several items.
+        
+        Args:
+            item_ids: IDs of the items
+            
+        Returns:
+            List of (item_id, created_at, document) rows (in no particular order)
+        """
+        if not item_ids:
+            return []
+        return db.session.execute(
+            self._document_select().filter(Item.item_id.in_(item_ids))
+        ).all()
+
+    def get_user_documents(self, user_id: int) -> list[Any]:
+        """Retrieve rendered documents of items added by a user.
+        
+        Args:
+            user_id: The ID of the user who added the items
+            
+        Returns:
+            List of (item_id, created_at, document) rows, newest first
+        """
+        return db.session.execute(
+            self._document_select()
+            .filter(Item.added_by_user_id == user_id)
+            .order_by(Item.created_at.desc(), Item.item_id.desc())
+        ).all()
+
+    @staticmethod
+    def _document_select():
+        """Base select of item keys outer-joined to their documents."""
+        return (
+            db.select(Item.item_id, Item.created_at, ItemDocument.document)
+            .outerjoin(ItemDocument, ItemDocument.item_id == Item.item_id)
+        )
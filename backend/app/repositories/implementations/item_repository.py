@@ -1,12 +1,32 @@
 """Item repository implementation."""
+import math
+from datetime import datetime
 from typing import Optional
-from sqlalchemy.orm import joinedload
+from sqlalchemy import case, distinct, exists, extract, func, or_, tuple_
+from sqlalchemy.orm import joinedload, load_only, selectinload
 from app import db
+from app.repositories.bulk_insert import insert_returning_ids
+from app.repositories.unit_of_work import save
 from app.models.item import Item
+from app.models.category import Category
 from app.models.category_item import CategoryItem
+from app.models.rotation_city import RotationCity
+from app.models.tag import Tag
+from app.models.user import User
 from app.models.item_tag_value import ItemTagValue
+from app.models.item_verification import ItemVerification
 from app.models.value import Value
-from app.repositories.base.item_repository_interface import ItemRepositoryInterface
+from app.repositories.base.item_repository_interface import (
+    ItemLoadStrategy,
+    ItemRepositoryInterface,
+    ItemSort
+)
+from app.utils import freshness
+from app.utils.fieldsets import Fieldset
+from app.utils.item_filters import ItemFilters
+
+# Seconds from the Unix epoch to the freshness epoch
+_FRESHNESS_EPOCH_SECONDS = (freshness.EPOCH - datetime(1970, 1, 1)).total_seconds()
 
 
 class ItemRepository(ItemRepositoryInterface):
@@ -40,11 +60,46 @@ class ItemRepository(ItemRepositoryInterface):
             location=location,
             rotation_city_id=rotation_city_id,
             added_by_user_id=added_by_user_id,
-            walking_distance=walking_distance
+            walking_distance=walking_distance,
+            # A new item has no links yet; starting the collections empty
+            # spares a lazy load when they are filled in the same session
+            category_items=[],
+            item_tag_values=[]
         )
         db.session.add(item)
-        db.session.commit()
-        db.session.refresh(item)
+        save(item)
+        return item
+
+    def insert_items(self, rows: list[dict]) -> list[int]:
+        """Insert many items with one multi-row INSERT.
+        
+        Bypasses the ORM unit of work: no Item objects are created, so it
+        suits bulk loads that do not need them afterwards.
+        
+        Args:
+            rows: Column values per item (name, location, rotation_city_id,
+                added_by_user_id, walking_distance)
+            
+        Returns:
+            IDs of the inserted items, in the order of rows
+        """
+        item_ids = insert_returning_ids(Item.item_id, rows)
+        save()
+        return item_ids
+
+    def update_item(self, item: Item, fields: dict) -> Item:
+        """Set columns of an item.
+        
+        Args:
+            item: The item to update
+            fields: New values by column name (name, location, walking_distance)
+            
+        Returns:
+            The updated Item object
+        """
+        for column, value in fields.items():
+            setattr(item, column, value)
+        save(item)
         return item
 
     def get_item_by_id(self, item_id: int, rotation_city_id: int) -> Optional[Item]:
@@ -76,32 +131,84 @@ class ItemRepository(ItemRepositoryInterface):
             .order_by(Item.created_at.desc())
         ).scalars().all()
 
-    def get_all_items_with_details(self, rotation_city_id: int) -> list[Item]:
-        """Retrieve all items with relationships eagerly loaded.
+    def get_all_items_with_details(
+        self,
+        rotation_city_id: int,
+        limit: Optional[int] = None,
+        cursor: Optional[tuple] = None,
+        strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN,
+        fieldset: Optional[Fieldset] = None,
+        filters: Optional[ItemFilters] = None,
+        sort: ItemSort = ItemSort.NEWEST
+    ) -> list[Item]:
+        """Retrieve items with relationships eagerly loaded.
         
         Preloads rotation_city, added_by_user, categories, tags and values
-        to avoid N+1 query problems.
+        to avoid N+1 query problems. Items are ordered by (sort key,
+        item_id), descending, so the same ordering can be used as a keyset
+        for cursor pagination.
         
         Args:
             rotation_city_id: The rotation city ID to filter by
+            limit: Optional maximum number of items to return
+            cursor: Optional (sort key, item_id) of the last item on the
+                previous page; only items strictly after it are returned
+            strategy: How relationships are loaded (see ItemLoadStrategy)
+            fieldset: Optional sparse fieldset; only the columns and
+                relationships it needs are loaded
+            filters: Optional conditions items must satisfy
+            sort: Feed order (see ItemSort)
             
         Returns:
             List of Item objects with all relationships loaded
         """
-        result = db.session.execute(
-            db.select(Item)
-            .filter_by(rotation_city_id=rotation_city_id)
-            .order_by(Item.created_at.desc())
-            .options(
-                joinedload(Item.rotation_city),
-                joinedload(Item.added_by_user),
-                joinedload(Item.category_items).joinedload(CategoryItem.category),
-                joinedload(Item.item_tag_values).joinedload(ItemTagValue.value).joinedload(Value.tag)
-            )
+        query = self.apply_feed_order(
+            self.apply_filters(
+                db.select(Item).filter_by(rotation_city_id=rotation_city_id),
+                filters
+            ),
+            sort,
+            cursor
         )
-        return result.scalars().unique().all()
 
-    def get_item_by_id_with_details(self, item_id: int, rotation_city_id: int) -> Optional[Item]:
+        if limit:
+            query = query.limit(limit)
+
+        return self._fetch_with_details(query, strategy, fieldset)
+
+    @staticmethod
+    def sort_key(sort: ItemSort):
+        """Item column a feed order sorts on before item_id."""
+        return Item.freshness if sort is ItemSort.FRESHNESS else Item.created_at
+
+    @classmethod
+    def apply_feed_order(cls, query, sort: ItemSort, cursor: Optional[tuple] = None):
+        """Order a city feed query, starting after a keyset cursor.
+        
+        Both orders are served by an index on (rotation_city_id, sort key,
+        item_id).
+        
+        Args:
+            query: Select over Item filtered to one rotation city
+            sort: Feed order
+            cursor: Optional (sort key, item_id) of the last item already seen
+            
+        Returns:
+            The ordered query
+        """
+        key = cls.sort_key(sort)
+        query = query.order_by(key.desc(), Item.item_id.desc())
+        if cursor is not None:
+            query = query.filter(tuple_(key, Item.item_id) < tuple_(*cursor))
+        return query
+
+    def get_item_by_id_with_details(
+        self,
+        item_id: int,
+        rotation_city_id: int,
+        strategy: ItemLoadStrategy = ItemLoadStrategy.JOINED,
+        fieldset: Optional[Fieldset] = None
+    ) -> Optional[Item]:
         """Retrieve an item by ID with all relationships eagerly loaded.
         
         Preloads rotation_city, added_by_user, categories, tags and values.
@@ -110,23 +217,26 @@ class ItemRepository(ItemRepositoryInterface):
         Args:
             item_id: The ID of the item to retrieve
             rotation_city_id: The rotation city ID to filter by
+            strategy: How relationships are loaded (see ItemLoadStrategy)
+            fieldset: Optional sparse fieldset; only the columns and
+                relationships it needs are loaded
             
         Returns:
             Item object with all relationships loaded if found, None otherwise
         """
-        result = db.session.execute(
-            db.select(Item)
-            .filter_by(item_id=item_id, rotation_city_id=rotation_city_id)
-            .options(
-                joinedload(Item.rotation_city),
-                joinedload(Item.added_by_user),
-                joinedload(Item.category_items).joinedload(CategoryItem.category),
-                joinedload(Item.item_tag_values).joinedload(ItemTagValue.value).joinedload(Value.tag)
-            )
+        items = self._fetch_with_details(
+            db.select(Item).filter_by(item_id=item_id, rotation_city_id=rotation_city_id),
+            strategy,
+            fieldset
         )
-        return result.unique().scalar_one_or_none()
+        return items[0] if items else None
 
-    def get_items_by_user(self, user_id: int) -> list[Item]:
+    def get_items_by_user(
+        self,
+        user_id: int,
+        strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN,
+        fieldset: Optional[Fieldset] = None
+    ) -> list[Item]:
         """Retrieve all items added by a specific user.
         
         Preloads all relationships for efficient access.
@@ -134,31 +244,528 @@ class ItemRepository(ItemRepositoryInterface):
         
         Args:
             user_id: The ID of the user who added the items
+            strategy: How relationships are loaded (see ItemLoadStrategy)
+            fieldset: Optional sparse fieldset; only the columns and
+                relationships it needs are loaded
             
         Returns:
             List of Item objects with all relationships loaded
         """
-        result = db.session.execute(
+        return self._fetch_with_details(
             db.select(Item)
             .filter_by(added_by_user_id=user_id)
-            .order_by(Item.created_at.desc())
-            .options(
+            .order_by(Item.created_at.desc(), Item.item_id.desc()),
+            strategy,
+            fieldset
+        )
+
+    def get_items_by_ids_with_details(
+        self,
+        item_ids: list[int],
+        strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN
+    ) -> list[Item]:
+        """Retrieve several items by ID with all relationships eagerly loaded.
+        
+        Args:
+            item_ids: IDs of the items to retrieve
+            strategy: How relationships are loaded (see ItemLoadStrategy)
+            
+        Returns:
+            List of Item objects found (in no particular order)
+        """
+        if not item_ids:
+            return []
+        return self._fetch_with_details(
+            db.select(Item).filter(Item.item_id.in_(item_ids)),
+            strategy
+        )
+
+    def get_item_ids_by_user(self, user_id: int) -> list[int]:
+        """Retrieve the IDs of all items added by a specific user.
+        
+        Args:
+            user_id: The ID of the user who added the items
+            
+        Returns:
+            List of item IDs
+        """
+        return db.session.execute(
+            db.select(Item.item_id).filter_by(added_by_user_id=user_id)
+        ).scalars().all()
+
+    def get_item_ids_added_outside_city(self, rotation_city_id: int) -> list[int]:
+        """Retrieve the IDs of items in other cities added by a city's users.
+        
+        Args:
+            rotation_city_id: The city whose users added the items
+            
+        Returns:
+            List of item IDs
+        """
+        return db.session.execute(
+            db.select(Item.item_id)
+            .join(User, Item.added_by_user_id == User.user_id)
+            .filter(
+                User.rotation_city_id == rotation_city_id,
+                Item.rotation_city_id != rotation_city_id
+            )
+        ).scalars().all()
+
+    def delete_item(self, item_id: int) -> bool:
+        """Delete an item with one DELETE statement.
+        
+        Its categories, tag values, verifications and document are removed
+        by the database (ON DELETE CASCADE), without loading them.
+        
+        Args:
+            item_id: The ID of the item to delete
+            
+        Returns:
+            True if the item existed
+        """
+        result = db.session.execute(db.delete(Item).where(Item.item_id == item_id))
+        save()
+        return result.rowcount == 1
+
+    def _fetch_with_details(
+        self,
+        query,
+        strategy: ItemLoadStrategy,
+        fieldset: Optional[Fieldset] = None
+    ) -> list[Item]:
+        """Execute an item query, loading relationships with the given strategy.
+        
+        Args:
+            query: A select(Item) statement with filters, ordering and limit applied
+            strategy: How relationships are loaded (see ItemLoadStrategy)
+            fieldset: Optional sparse fieldset restricting what is loaded
+            
+        Returns:
+            List of Item objects in the order produced by the query
+        """
+        options = self._detail_options(strategy, fieldset)
+
+        if strategy == ItemLoadStrategy.JOINED:
+            result = db.session.execute(query.options(*options))
+            return result.scalars().unique().all()
+
+        if strategy == ItemLoadStrategy.TWO_PHASE:
+            # Phase one resolves the page as bare ids (index-only scan);
+            # phase two loads exactly those rows by primary key.
+            item_ids = db.session.execute(
+                query.with_only_columns(Item.item_id)
+            ).scalars().all()
+            if not item_ids:
+                return []
+
+            items = db.session.execute(
+                db.select(Item)
+                .filter(Item.item_id.in_(item_ids))
+                .options(*options)
+            ).scalars().all()
+            by_id = {item.item_id: item for item in items}
+            return [by_id[item_id] for item_id in item_ids if item_id in by_id]
+
+        return db.session.execute(query.options(*options)).scalars().all()
+
+    @staticmethod
+    def _detail_options(
+        strategy: ItemLoadStrategy,
+        fieldset: Optional[Fieldset] = None
+    ) -> list:
+        """Loader options for the relationships rendered with an item.
+        
+        JOINED joins every collection into one result set (rows returned =
+        items x categories x tags, deduplicated in Python). The other
+        strategies batch collections with SELECT ... IN queries; many-to-one
+        relationships stay joined since they never multiply rows.
+        
+        With a fieldset, unrequested relationships are not loaded at all and
+        requested ones only select the columns their requested fields need
+        (e.g. excluding added_by_user.profile_picture keeps the avatar out
+        of the query).
+        """
+        collection = joinedload if strategy == ItemLoadStrategy.JOINED else selectinload
+
+        if fieldset is None:
+            return [
                 joinedload(Item.rotation_city),
                 joinedload(Item.added_by_user),
-                joinedload(Item.category_items).joinedload(CategoryItem.category),
-                joinedload(Item.item_tag_values).joinedload(ItemTagValue.value).joinedload(Value.tag)
+                collection(Item.category_items).joinedload(CategoryItem.category),
+                collection(Item.item_tag_values).joinedload(ItemTagValue.value).joinedload(Value.tag)
+            ]
+
+        options = [load_only(
+            *fieldset.attributes(Item),
+            Item.created_at,
+            Item.freshness,
+            Item.rotation_city_id,
+            Item.added_by_user_id
+        )]
+        if fieldset.wants('rotation_city'):
+            options.append(joinedload(Item.rotation_city).load_only(
+                *fieldset.attributes(RotationCity, 'rotation_city')
+            ))
+        if fieldset.wants('added_by_user'):
+            options.append(joinedload(Item.added_by_user).load_only(
+                *fieldset.attributes(User, 'added_by_user')
+            ))
+        if fieldset.wants('categories'):
+            options.append(
+                collection(Item.category_items).joinedload(CategoryItem.category)
+                .load_only(*fieldset.attributes(Category, 'categories'))
+            )
+        if fieldset.wants('tags'):
+            options.append(
+                collection(Item.item_tag_values).joinedload(ItemTagValue.value).joinedload(Value.tag)
+            )
+        return options
+
+    def count_items(self, rotation_city_id: int, filters: Optional[ItemFilters] = None) -> int:
+        """Count the items of a city matching filters.
+        
+        Args:
+            rotation_city_id: The rotation city ID to filter by
+            filters: Optional conditions items must satisfy
+            
+        Returns:
+            Number of matching items
+        """
+        return db.session.execute(
+            self.apply_filters(
+                db.select(func.count(Item.item_id))
+                .filter(Item.rotation_city_id == rotation_city_id),
+                filters
+            )
+        ).scalar_one()
+
+    def get_category_counts(
+        self,
+        rotation_city_id: int,
+        filters: Optional[ItemFilters] = None
+    ) -> list:
+        """Count matching items per category in one grouped query.
+        
+        Args:
+            rotation_city_id: The rotation city ID to filter by
+            filters: Optional conditions items must satisfy
+            
+        Returns:
+            List of (category_id, category_name, count) rows, largest first
+        """
+        return db.session.execute(
+            db.select(
+                Category.category_id,
+                Category.category_name,
+                func.count(distinct(CategoryItem.item_id)).label('count')
             )
+            .join(Category, Category.category_id == CategoryItem.category_id)
+            .filter(CategoryItem.item_id.in_(self._filtered_item_ids(rotation_city_id, filters)))
+            .group_by(Category.category_id, Category.category_name)
+            .order_by(func.count(distinct(CategoryItem.item_id)).desc(), Category.category_name)
+        ).all()
+
+    def get_tag_value_counts(
+        self,
+        rotation_city_id: int,
+        filters: Optional[ItemFilters] = None
+    ) -> list:
+        """Count matching items per tag value in one grouped query.
+        
+        Values are grouped by their typed content rather than value_id, so
+        equal values stored in separate rows are counted together.
+        
+        Args:
+            rotation_city_id: The rotation city ID to filter by
+            filters: Optional conditions items must satisfy
+            
+        Returns:
+            List of (tag_id, name, value_type, boolean_val, name_val,
+            numerical_value, count) rows ordered by tag
+        """
+        return db.session.execute(
+            db.select(
+                Tag.tag_id,
+                Tag.name,
+                Tag.value_type,
+                Value.boolean_val,
+                Value.name_val,
+                Value.numerical_value,
+                func.count(distinct(ItemTagValue.item_id)).label('count')
+            )
+            .join(Value, Value.value_id == ItemTagValue.value_id)
+            .join(Tag, Tag.tag_id == Value.tag_id)
+            .filter(ItemTagValue.item_id.in_(self._filtered_item_ids(rotation_city_id, filters)))
+            .group_by(
+                Tag.tag_id, Tag.name, Tag.value_type,
+                Value.boolean_val, Value.name_val, Value.numerical_value
+            )
+            .order_by(Tag.name, Tag.tag_id, func.count(distinct(ItemTagValue.item_id)).desc())
+        ).all()
+
+    def _filtered_item_ids(self, rotation_city_id: int, filters: Optional[ItemFilters]):
+        """Select of the IDs of a city's items matching filters, for use in IN."""
+        return self.apply_filters(
+            db.select(Item.item_id).filter(Item.rotation_city_id == rotation_city_id),
+            filters
         )
-        return result.scalars().unique().all()
+
+    @staticmethod
+    def apply_filters(query, filters: Optional[ItemFilters]):
+        """Restrict a query over the item table to items matching filters.
+        
+        Category and tag conditions compile to correlated EXISTS subqueries
+        instead of joins, so matching several categories or tags never
+        multiplies item rows and no DISTINCT is needed. Each tag condition
+        gets its own subquery: an item matches only if it has a value for
+        every filtered tag.
+        
+        Args:
+            query: A select statement whose FROM includes the item table
+            filters: Conditions to apply, or None to leave the query as is
+            
+        Returns:
+            The query with the filter conditions added
+        """
+        if filters is None:
+            return query
+
+        if filters.category_ids:
+            query = query.filter(exists().where(
+                CategoryItem.item_id == Item.item_id,
+                CategoryItem.category_id.in_(filters.category_ids)
+            ))
+
+        tag_conditions = [
+            (tag_id, Value.boolean_val == value)
+            for tag_id, value in filters.boolean_tags
+        ] + [
+            (tag_id, func.lower(Value.name_val) == text.lower())
+            for tag_id, text in filters.text_tags
+        ]
+        for tag_id, low, high in filters.numeric_ranges:
+            bounds = []
+            if low is not None:
+                bounds.append(Value.numerical_value >= low)
+            if high is not None:
+                bounds.append(Value.numerical_value <= high)
+            tag_conditions.append((tag_id, *bounds))
+
+        for tag_id, *conditions in tag_conditions:
+            query = query.filter(exists().where(
+                ItemTagValue.item_id == Item.item_id,
+                ItemTagValue.value_id == Value.value_id,
+                Value.tag_id == tag_id,
+                *conditions
+            ))
+
+        if filters.max_walking_distance is not None:
+            query = query.filter(Item.walking_distance <= filters.max_walking_distance)
+        if filters.min_verifications is not None:
+            query = query.filter(Item.number_of_verifications >= filters.min_verifications)
+        return query
+
     def exists(self, item_id: int) -> bool:
         """Check if item exists regardless of rotation city."""
         return db.session.query(
             db.session.query(Item).filter_by(item_id=item_id).exists()
         ).scalar()
 
-    def update_verification_count(self, item_id: int, count: int) -> None:
-        """Update the number of verifications for an item."""
-        item = db.session.get(Item, item_id)
-        if item:
-            item.number_of_verifications = count
-            db.session.commit()
+    def get_item_names(self, item_ids: list[int]) -> dict[int, str]:
+        """Look up the names of existing items (any rotation city) in one query."""
+        if not item_ids:
+            return {}
+        return dict(db.session.execute(
+            db.select(Item.item_id, Item.name).filter(Item.item_id.in_(item_ids))
+        ).tuples().all())
+
+    def get_rotation_city_ids(self) -> list[int]:
+        """IDs of the rotation cities that have items."""
+        return db.session.execute(
+            db.select(distinct(Item.rotation_city_id))
+        ).scalars().all()
+
+    def get_item_city_ids(self, item_ids: list[int]) -> dict[int, int]:
+        """Look up the rotation cities of existing items in one query."""
+        if not item_ids:
+            return {}
+        return dict(db.session.execute(
+            db.select(Item.item_id, Item.rotation_city_id).filter(Item.item_id.in_(item_ids))
+        ).tuples().all())
+
+    def get_verification_count(self, item_id: int) -> int:
+        """Read the stored verification count of an item (0 if it does not exist)."""
+        return db.session.execute(
+            db.select(Item.number_of_verifications).filter_by(item_id=item_id)
+        ).scalar() or 0
+
+    def increment_verification_count(
+        self,
+        item_id: int,
+        by: int = 1,
+        verified_at: Optional[datetime] = None
+    ) -> Optional[int]:
+        """Atomically record new verifications of an item.
+        
+        A single UPDATE ... SET number_of_verifications = number_of_verifications + n
+        so concurrent verifications never lose an increment, with the new
+        count read back through RETURNING. The same statement sets
+        last_verified_date and folds the verifications into freshness.
+        """
+        verified_at = verified_at or datetime.utcnow()
+        weight = freshness.verification_weight(verified_at) + math.log(by)
+        count = db.session.execute(
+            db.update(Item)
+            .where(Item.item_id == item_id)
+            .ordered_values(
+                (Item.number_of_verifications, func.coalesce(Item.number_of_verifications, 0) + by),
+                *self._verified_values(verified_at, weight)
+            )
+            .returning(Item.number_of_verifications)
+        ).scalar_one_or_none()
+        save()
+        return count
+
+    def increment_verification_counts(
+        self,
+        item_ids: list[int],
+        verified_at: Optional[datetime] = None
+    ) -> dict[int, int]:
+        """Atomically record one new verification of each of several items.
+        
+        One set-based UPDATE for all of them, returning the new counts.
+        """
+        if not item_ids:
+            return {}
+        verified_at = verified_at or datetime.utcnow()
+        counts = dict(db.session.execute(
+            db.update(Item)
+            .where(Item.item_id.in_(item_ids))
+            .ordered_values(
+                (Item.number_of_verifications, func.coalesce(Item.number_of_verifications, 0) + 1),
+                *self._verified_values(verified_at, freshness.verification_weight(verified_at))
+            )
+            .returning(Item.item_id, Item.number_of_verifications)
+            .execution_options(synchronize_session='fetch')
+        ).tuples().all())
+        save()
+        return counts
+
+    @staticmethod
+    def _verified_values(verified_at: datetime, weight: float) -> list[tuple]:
+        """SET clauses recording verifications made at verified_at.
+        
+        Freshness becomes ln(exp(freshness) + exp(weight)), computed as
+        max + ln(1 + exp(min - max)) so it never overflows; 0 stands for
+        no verifications yet.
+        """
+        current = Item.freshness
+        return [
+            (Item.last_verified_date, case(
+                (Item.last_verified_date > verified_at, Item.last_verified_date),
+                else_=verified_at
+            )),
+            (Item.freshness, case(
+                (current == 0, weight),
+                (current >= weight, current + func.ln(1 + func.exp(weight - current))),
+                else_=weight + func.ln(1 + func.exp(current - weight))
+            ))
+        ]
+
+    def backfill_freshness(self, item_ids: Optional[list[int]] = None) -> int:
+        """Recompute last_verified_date and freshness from the verifications.
+        
+        Set-based: one UPDATE ... FROM a grouped aggregate over
+        item_verification sets both columns of every verified item, with
+        freshness = latest weight + ln(sum(exp(weight - latest weight))),
+        then one UPDATE resets items that have no verifications left.
+        
+        Args:
+            item_ids: Items to recompute; None recomputes every item
+        
+        Returns:
+            Number of items updated
+        """
+        if item_ids is not None and not item_ids:
+            return 0
+        rate = freshness.decay_rate()
+        latest = (
+            db.select(
+                ItemVerification.item_id,
+                func.max(ItemVerification.created_at).label('last_verified')
+            )
+            .group_by(ItemVerification.item_id)
+        )
+        if item_ids is not None:
+            latest = latest.where(ItemVerification.item_id.in_(item_ids))
+        latest = latest.subquery()
+        last_seconds = self._unix_seconds(latest.c.last_verified)
+        scores = (
+            db.select(
+                ItemVerification.item_id,
+                latest.c.last_verified,
+                (
+                    rate * (last_seconds - _FRESHNESS_EPOCH_SECONDS)
+                    + func.ln(func.sum(func.exp(
+                        rate * (self._unix_seconds(ItemVerification.created_at) - last_seconds)
+                    )))
+                ).label('freshness')
+            )
+            .join(latest, latest.c.item_id == ItemVerification.item_id)
+            .group_by(ItemVerification.item_id, latest.c.last_verified)
+            .subquery()
+        )
+        updated = db.session.execute(
+            db.update(Item)
+            .where(Item.item_id == scores.c.item_id)
+            .values(last_verified_date=scores.c.last_verified, freshness=scores.c.freshness)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        reset = db.update(Item).where(
+            ~exists().where(ItemVerification.item_id == Item.item_id),
+            or_(Item.freshness != 0, Item.last_verified_date.isnot(None))
+        )
+        if item_ids is not None:
+            reset = reset.where(Item.item_id.in_(item_ids))
+        updated += db.session.execute(
+            reset
+            .values(last_verified_date=None, freshness=0)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        save()
+        return updated
+
+    @staticmethod
+    def _unix_seconds(column):
+        """SQL expression for a naive UTC timestamp column as Unix seconds."""
+        if db.session.get_bind().dialect.name == 'sqlite':
+            return (func.julianday(column) - 2440587.5) * 86400
+        return extract('epoch', column)
+
+    def reconcile_verification_counts(self, item_ids: Optional[list[int]] = None) -> list[int]:
+        """Reset items' verification counts to their number of verifications.
+        
+        One set-based UPDATE correcting only the items whose counter has
+        drifted (e.g. verifications deleted by hand or with their author).
+        
+        Args:
+            item_ids: Items to recount; None recounts every item
+        """
+        actual = (
+            db.select(func.count(ItemVerification.verification_id))
+            .where(ItemVerification.item_id == Item.item_id)
+            .scalar_subquery()
+        )
+        statement = db.update(Item).where(func.coalesce(Item.number_of_verifications, -1) != actual)
+        if item_ids is not None:
+            if not item_ids:
+                return []
+            statement = statement.where(Item.item_id.in_(item_ids))
+        corrected = db.session.execute(
+            statement
+            .values(number_of_verifications=actual)
+            .returning(Item.item_id)
+            .execution_options(synchronize_session='fetch')
+        ).scalars().all()
+        save()
+        return sorted(corrected)
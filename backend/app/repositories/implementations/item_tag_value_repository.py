@@ -1,6 +1,10 @@
 """Item-Tag-Value junction repository."""
+from sqlalchemy import delete, insert
 from app import db
+from app.models.item import Item
 from app.models.item_tag_value import ItemTagValue
+from app.models.value import Value
+from app.repositories.unit_of_work import save
 
 
 class ItemTagValueRepository:
@@ -15,8 +19,57 @@ class ItemTagValueRepository:
         db.session.add(item_tag_value)
         return item_tag_value
 
-    def add_tag_values_to_item(self, item_id: int, value_ids: list[int]) -> None:
-        """Link multiple tag values to an item."""
-        for value_id in value_ids:
-            self.add_tag_value_to_item(item_id, value_id)
-        db.session.commit()
+    def add_tag_values_to_item(self, item: Item, values: list[Value]) -> None:
+        """Link multiple tag values to an item.
+        
+        Links are added through the item's relationship, so they work for
+        an item not yet flushed and leave item.item_tag_values loaded.
+        """
+        for value in values:
+            item.item_tag_values.append(ItemTagValue(value=value))
+        save()
+
+    def insert_links(self, links: list[tuple[int, int]]) -> None:
+        """Link items to tag values with one multi-row INSERT.
+        
+        Args:
+            links: (item_id, value_id) pairs
+        """
+        if not links:
+            return
+        db.session.execute(
+            insert(ItemTagValue.__table__),
+            [{'item_id': item_id, 'value_id': value_id} for item_id, value_id in links]
+        )
+        save()
+
+    def get_value_ids_by_item(self, item_id: int) -> list[int]:
+        """Get the IDs of the tag values linked to an item, in link order."""
+        return db.session.execute(
+            db.select(ItemTagValue.value_id)
+            .filter_by(item_id=item_id)
+            .order_by(ItemTagValue.item_tag_value_id)
+        ).scalars().all()
+
+    def delete_links(self, item_id: int, value_ids: list[int]) -> None:
+        """Unlink tag values from an item with one DELETE.
+        
+        Args:
+            item_id: ID of the item
+            value_ids: IDs of the tag values to unlink
+        """
+        if not value_ids:
+            return
+        db.session.execute(
+            delete(ItemTagValue.__table__).where(
+                ItemTagValue.item_id == item_id,
+                ItemTagValue.value_id.in_(value_ids)
+            )
+        )
+        save()
+
+    def get_item_ids_by_value(self, value_id: int) -> list[int]:
+        """Get the IDs of all items linked to a tag value."""
+        return db.session.execute(
+            db.select(ItemTagValue.item_id).filter_by(value_id=value_id).distinct()
+        ).scalars().all()
@@ -2,16 +2,27 @@
 Item Verification Repository Implementation
 Implements verification data access operations using SQLAlchemy.
 """
-from typing import Optional, List
+from typing import Optional, List, Set, Tuple
 from datetime import datetime, timedelta
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, tuple_
+from sqlalchemy.engine import Row
+from app.models.item import Item
 from app.models.item_verification import ItemVerification
+from app.models.user import User
 from app.repositories.base.item_verification_repository_interface import (
     IItemVerificationRepository
 )
+from app.repositories.bulk_insert import insert_returning_ids
+from app.repositories.unit_of_work import save
+from app.utils.fieldsets import Fieldset
 from app import db
 
 
+def _today_start() -> datetime:
+    """Start of the current UTC day (00:00:00)."""
+    return datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+
+
 class ItemVerificationRepository(IItemVerificationRepository):
     """SQLAlchemy implementation of item verification repository."""
     
@@ -38,14 +49,34 @@ class ItemVerificationRepository(IItemVerificationRepository):
             note=note
         )
         db.session.add(verification)
-        db.session.commit()
-        db.session.refresh(verification)
+        save(verification)
         return verification
     
-    def get_verification_by_id(
+    def create_verifications(
         self,
-        verification_id: int
-    ) -> Optional[ItemVerification]:
+        user_id: int,
+        entries: List[Tuple[int, Optional[str]]],
+        created_at: datetime
+    ) -> List[int]:
+        """
+        Create verifications of several items with one multi-row INSERT.
+        
+        Args:
+            user_id: ID of the user verifying the items
+            entries: (item_id, note) pairs
+            created_at: Timestamp recorded on every verification
+            
+        Returns:
+            IDs of the created verifications, in the order of entries
+        """
+        verification_ids = insert_returning_ids(ItemVerification.verification_id, [
+            {'user_id': user_id, 'item_id': item_id, 'note': note, 'created_at': created_at}
+            for item_id, note in entries
+        ])
+        save()
+        return verification_ids
+    
+    def get_verification_by_id(self, verification_id: int) -> Optional[ItemVerification]:
         """
         Get a verification by its ID.
         
@@ -59,53 +90,141 @@ class ItemVerificationRepository(IItemVerificationRepository):
             ItemVerification.verification_id == verification_id
         ).first()
     
+    def get_verification_row(
+        self,
+        verification_id: int,
+        fieldset: Optional[Fieldset] = None
+    ) -> Optional[Row]:
+        """
+        Get a verification as a flat row, with its user and item columns.
+        
+        Args:
+            verification_id: ID of the verification
+            fieldset: Optional sparse fieldset limiting the columns selected
+            
+        Returns:
+            Row (see _select_rows) if found, None otherwise
+        """
+        return db.session.execute(
+            self._select_rows(fieldset)
+            .filter(ItemVerification.verification_id == verification_id)
+        ).first()
+    
     def get_verifications_by_item_id(
         self,
         item_id: int,
-        limit: Optional[int] = None
-    ) -> List[ItemVerification]:
+        limit: Optional[int] = None,
+        fieldset: Optional[Fieldset] = None,
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> List[Row]:
         """
         Get all verifications for a specific item.
         
         Args:
             item_id: ID of the item
             limit: Optional limit on number of results
+            fieldset: Optional sparse fieldset limiting the columns selected
+            cursor: Optional (created_at, verification_id) of the last
+                verification on the previous page; only older ones are
+                returned
             
         Returns:
-            List of ItemVerification instances ordered by most recent first
+            Rows (see _select_rows) ordered by most recent first
         """
-        query = db.session.query(ItemVerification).filter(
-            ItemVerification.item_id == item_id
-        ).order_by(ItemVerification.created_at.desc())
-        
-        if limit:
-            query = query.limit(limit)
-        
-        return query.all()
+        return self._fetch_page(
+            ItemVerification.item_id == item_id, limit, fieldset, cursor
+        )
     
     def get_verifications_by_user_id(
         self,
         user_id: int,
-        limit: Optional[int] = None
-    ) -> List[ItemVerification]:
+        limit: Optional[int] = None,
+        fieldset: Optional[Fieldset] = None,
+        cursor: Optional[Tuple[datetime, int]] = None
+    ) -> List[Row]:
         """
         Get all verifications by a specific user.
         
         Args:
             user_id: ID of the user
             limit: Optional limit on number of results
+            fieldset: Optional sparse fieldset limiting the columns selected
+            cursor: Optional (created_at, verification_id) of the last
+                verification on the previous page; only older ones are
+                returned
             
         Returns:
-            List of ItemVerification instances ordered by most recent first
+            Rows (see _select_rows) ordered by most recent first
         """
-        query = db.session.query(ItemVerification).filter(
-            ItemVerification.user_id == user_id
-        ).order_by(ItemVerification.created_at.desc())
+        return self._fetch_page(
+            ItemVerification.user_id == user_id, limit, fieldset, cursor
+        )
+    
+    def _fetch_page(
+        self,
+        condition,
+        limit: Optional[int],
+        fieldset: Optional[Fieldset],
+        cursor: Optional[Tuple[datetime, int]]
+    ) -> List[Row]:
+        """Rows of the verifications matching a condition, newest first."""
+        query = self._select_rows(fieldset).filter(condition).order_by(
+            ItemVerification.created_at.desc(),
+            ItemVerification.verification_id.desc()
+        )
+        
+        if cursor is not None:
+            query = query.filter(
+                tuple_(ItemVerification.created_at, ItemVerification.verification_id)
+                < tuple_(*cursor)
+            )
         
         if limit:
             query = query.limit(limit)
         
-        return query.all()
+        return db.session.execute(query).all()
+    
+    @staticmethod
+    def _select_rows(fieldset: Optional[Fieldset] = None):
+        """
+        One SELECT of the verification columns and what is rendered with them.
+        
+        Rows always carry verification_id, user_id, item_id, note and
+        created_at. The verifier's first_name and last_name, their
+        profile_picture and the item_name are added, joining user and item
+        only when needed, unless a sparse fieldset leaves out user_name,
+        user_photo or item_name. No ORM objects are built, so listing rows
+        never lazy-loads a user or item per verification.
+        
+        Args:
+            fieldset: Sparse fieldset, or None to select every column
+            
+        Returns:
+            Select statement without filter or ordering
+        """
+        def wants(field: str) -> bool:
+            return fieldset is None or fieldset.wants(field)
+        
+        columns = [
+            ItemVerification.verification_id,
+            ItemVerification.user_id,
+            ItemVerification.item_id,
+            ItemVerification.note,
+            ItemVerification.created_at
+        ]
+        if wants('user_name'):
+            columns += [User.first_name, User.last_name]
+        if wants('user_photo'):
+            columns.append(User.profile_picture)
+        if wants('item_name'):
+            columns.append(Item.name.label('item_name'))
+        
+        query = db.select(*columns).select_from(ItemVerification)
+        if wants('user_name') or wants('user_photo'):
+            query = query.join(User, ItemVerification.user_id == User.user_id)
+        if wants('item_name'):
+            query = query.join(Item, ItemVerification.item_id == Item.item_id)
+        return query
     
     def user_verified_item_today(
         self,
@@ -122,22 +241,79 @@ class ItemVerificationRepository(IItemVerificationRepository):
         Returns:
             True if user verified this item today, False otherwise
         """
-        # Get start of today (00:00:00)
-        today_start = datetime.utcnow().replace(
-            hour=0, minute=0, second=0, microsecond=0
-        )
-        
         # Check if verification exists for this user + item today
         existing_verification = db.session.query(ItemVerification).filter(
             and_(
                 ItemVerification.user_id == user_id,
                 ItemVerification.item_id == item_id,
-                ItemVerification.created_at >= today_start
+                ItemVerification.created_at >= _today_start()
             )
         ).first()
         
         return existing_verification is not None
     
+    def get_item_ids_verified_today(
+        self,
+        user_id: int,
+        item_ids: List[int]
+    ) -> Set[int]:
+        """
+        Find which of several items the user has already verified today.
+        
+        Args:
+            user_id: ID of the user
+            item_ids: IDs of the items to check
+            
+        Returns:
+            IDs of the items verified by the user today
+        """
+        if not item_ids:
+            return set()
+        return set(db.session.execute(
+            db.select(ItemVerification.item_id).filter(
+                ItemVerification.user_id == user_id,
+                ItemVerification.item_id.in_(item_ids),
+                ItemVerification.created_at >= _today_start()
+            )
+        ).scalars())
+    
+    def get_item_ids_verified_by_user(self, user_id: int) -> List[int]:
+        """
+        Get the IDs of the items a user has verified.
+        
+        Args:
+            user_id: ID of the user
+            
+        Returns:
+            Distinct IDs of the items the user verified
+        """
+        return db.session.execute(
+            db.select(ItemVerification.item_id)
+            .filter(ItemVerification.user_id == user_id)
+            .distinct()
+        ).scalars().all()
+    
+    def get_item_ids_verified_outside_city(self, rotation_city_id: int) -> List[int]:
+        """
+        Get the IDs of items in other cities verified by a city's users.
+        
+        Args:
+            rotation_city_id: The city whose users made the verifications
+            
+        Returns:
+            Distinct IDs of the verified items
+        """
+        return db.session.execute(
+            db.select(ItemVerification.item_id)
+            .join(User, ItemVerification.user_id == User.user_id)
+            .join(Item, ItemVerification.item_id == Item.item_id)
+            .filter(
+                User.rotation_city_id == rotation_city_id,
+                Item.rotation_city_id != rotation_city_id
+            )
+            .distinct()
+        ).scalars().all()
+    
     def get_verification_count_for_item(
         self,
         item_id: int
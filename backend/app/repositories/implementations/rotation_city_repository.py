@@ -3,6 +3,7 @@ from app.models.rotation_city import RotationCity
 from app.repositories.base.rotation_city_repository_interface import (
     IRotationCityRepository
 )
+from app.repositories.unit_of_work import save
 from app import db
 
 
@@ -86,4 +87,22 @@ class RotationCityRepository(IRotationCityRepository):
             raise ValueError("rotation_city_id must be an integer")
         if not self.check_city_exists(city_id):
             raise ValueError(f"rotation_city_id {city_id} does not exist")
-        return city_id
\ No newline at end of file
+        return city_id
+
+    def delete_rotation_city(self, city_id: int) -> bool:
+        """Delete a rotation city with one DELETE statement.
+        
+        Its users and items, and everything depending on them, are removed
+        by the database (ON DELETE CASCADE) without being loaded.
+        
+        Args:
+            city_id: The ID of the city to delete
+            
+        Returns:
+            True if the city existed
+        """
+        result = db.session.execute(
+            db.delete(RotationCity).where(RotationCity.city_id == city_id)
+        )
+        save()
+        return result.rowcount == 1
@@ -0,0 +1,330 @@
+"""Search index repository implementations."""
+import re
+from sqlalchemy import bindparam, text
+from app import db
+from app.models.item import Item
+from app.models.item_tag_value import ItemTagValue
+from app.models.search_index import POSTGRES_TEXT_SEARCH_CONFIG
+from app.models.value import Value
+from app.repositories.base.search_index_repository_interface import (
+    SearchIndexRepositoryInterface
+)
+from app.repositories.unit_of_work import save
+
+# Ranking multiplies text relevance by 1 + BOOST * n / (n + HALF), where n is
+# the item's number of verifications: well-verified items rise, but the boost
+# saturates (at most x1.5) so relevance still dominates.
+VERIFICATION_BOOST = 0.5
+VERIFICATION_HALF = 5.0
+
+_BLENDED = (
+    f"(1 + {VERIFICATION_BOOST} * coalesce(item.number_of_verifications, 0)"
+    f" / (coalesce(item.number_of_verifications, 0) + {VERIFICATION_HALF}))"
+)
+
+
+def _ids_param(statement: str):
+    """Text statement with an expanding ``:ids`` IN-list parameter."""
+    return text(statement).bindparams(bindparam('ids', expanding=True))
+
+
+class SearchIndexRepository(SearchIndexRepositoryInterface):
+    """Shared parts of the full-text index implementations.
+
+    Subclasses store and query the index with database-specific SQL; this
+    class gathers what gets indexed and tokenizes user queries.
+    """
+
+    def remove_city_items(self, rotation_city_id: int) -> None:
+        """Remove the index entries of every item in a city.
+
+        One DELETE on the stored rotation_city_id, so a whole city leaves
+        the index without listing its items.
+
+        Args:
+            rotation_city_id: ID of the city being removed
+        """
+        db.session.execute(
+            text("DELETE FROM item_search WHERE rotation_city_id = :rotation_city_id"),
+            {'rotation_city_id': rotation_city_id}
+        )
+        save()
+
+    @staticmethod
+    def _tokens(query: str) -> list[str]:
+        """Split a user query into lowercase word tokens.
+
+        Punctuation and operators are dropped so user input can never be
+        interpreted as query syntax by the database.
+        """
+        return re.findall(r'\w+', query.lower())
+
+    @staticmethod
+    def _item_rows(item_ids: list[int]) -> list[dict]:
+        """Collect the indexed text of items.
+
+        Args:
+            item_ids: IDs of the items to index
+
+        Returns:
+            One dict per existing item with item_id, rotation_city_id,
+            name, location and tags (its text values joined by spaces)
+        """
+        items = db.session.execute(
+            db.select(Item.item_id, Item.rotation_city_id, Item.name, Item.location)
+            .filter(Item.item_id.in_(item_ids))
+        ).all()
+
+        tags: dict[int, list[str]] = {}
+        for item_id, name_val in db.session.execute(
+            db.select(ItemTagValue.item_id, Value.name_val)
+            .join(Value, ItemTagValue.value_id == Value.value_id)
+            .filter(ItemTagValue.item_id.in_(item_ids), Value.name_val.isnot(None))
+        ):
+            tags.setdefault(item_id, []).append(name_val)
+
+        return [
+            {
+                'item_id': row.item_id,
+                'rotation_city_id': row.rotation_city_id,
+                'name': row.name,
+                'location': row.location,
+                'tags': ' '.join(tags.get(row.item_id, []))
+            }
+            for row in items
+        ]
+
+
+class SqliteSearchIndexRepository(SearchIndexRepository):
+    """Full-text index on SQLite FTS5 virtual tables.
+
+    Rows are keyed by rowid (= item_id / value_id) so replacing an entry is
+    a primary key delete plus insert. Relevance is bm25 with the name
+    weighted above the location and tags.
+    """
+
+    def index_items(self, item_ids: list[int]) -> None:
+        """Replace the index entries of items.
+
+        Args:
+            item_ids: IDs of items that were written; IDs of deleted items
+                just lose their entry
+        """
+        if not item_ids:
+            return
+
+        rows = self._item_rows(item_ids)
+        db.session.execute(
+            _ids_param("DELETE FROM item_search WHERE rowid IN :ids"),
+            {'ids': list(item_ids)}
+        )
+        if rows:
+            db.session.execute(
+                text(
+                    "INSERT INTO item_search (rowid, name, location, tags, rotation_city_id) "
+                    "VALUES (:item_id, :name, :location, :tags, :rotation_city_id)"
+                ),
+                rows
+            )
+        save()
+
+    def index_values(self, value_ids: list[int]) -> None:
+        """Replace the index entries of text values.
+
+        Args:
+            value_ids: IDs of values that were written; non-text values
+                are skipped
+        """
+        if not value_ids:
+            return
+
+        rows = db.session.execute(
+            db.select(Value.value_id, Value.tag_id, Value.name_val)
+            .filter(Value.value_id.in_(value_ids), Value.name_val.isnot(None))
+        ).mappings().all()
+        db.session.execute(
+            _ids_param("DELETE FROM value_search WHERE rowid IN :ids"),
+            {'ids': list(value_ids)}
+        )
+        if rows:
+            db.session.execute(
+                text(
+                    "INSERT INTO value_search (rowid, name_val, tag_id) "
+                    "VALUES (:value_id, :name_val, :tag_id)"
+                ),
+                [dict(row) for row in rows]
+            )
+        save()
+
+    def search_items(self, rotation_city_id: int, query: str, limit: int) -> list[int]:
+        """Find items in a city whose name, location or text tags match.
+
+        Every query word must match the start of a word in the item.
+
+        Args:
+            rotation_city_id: The rotation city ID to search in
+            query: User search text
+            limit: Maximum number of results
+
+        Returns:
+            Item IDs, best match first
+        """
+        match = self._match(query)
+        if not match:
+            return []
+
+        # bm25() is negative (lower is better), so the boost sorts ascending
+        return db.session.execute(
+            text(
+                "SELECT item_search.rowid FROM item_search "
+                "JOIN item ON item.item_id = item_search.rowid "
+                "WHERE item_search MATCH :match AND item_search.rotation_city_id = :city "
+                f"ORDER BY bm25(item_search, 10.0, 4.0, 2.0, 0.0) * {_BLENDED} "
+                "LIMIT :limit"
+            ),
+            {'match': match, 'city': rotation_city_id, 'limit': limit}
+        ).scalars().all()
+
+    def search_values(self, tag_id: int, query: str, limit: int) -> list[int]:
+        """Find text values of a tag matching query.
+
+        Args:
+            tag_id: The ID of the tag whose values are searched
+            query: User search text
+            limit: Maximum number of results
+
+        Returns:
+            Value IDs, best match first
+        """
+        match = self._match(query)
+        if not match:
+            return []
+
+        return db.session.execute(
+            text(
+                "SELECT rowid FROM value_search "
+                "WHERE value_search MATCH :match AND tag_id = :tag_id "
+                "ORDER BY rank LIMIT :limit"
+            ),
+            {'match': match, 'tag_id': tag_id, 'limit': limit}
+        ).scalars().all()
+
+    def _match(self, query: str) -> str:
+        """Build an FTS5 MATCH expression: every token, as a prefix."""
+        return ' '.join(f'"{token}"*' for token in self._tokens(query))
+
+
+class PostgresSearchIndexRepository(SearchIndexRepository):
+    """Full-text index on PostgreSQL tsvector columns with GIN indexes.
+
+    Item documents weight the name (A) above the location (B) and tags (C).
+    Text values are matched through an expression index on the value table,
+    so they need no maintenance on write.
+    """
+
+    def index_items(self, item_ids: list[int]) -> None:
+        """Replace the index entries of items.
+
+        Args:
+            item_ids: IDs of items that were written; IDs of deleted items
+                just lose their entry
+        """
+        if not item_ids:
+            return
+
+        rows = self._item_rows(item_ids)
+        db.session.execute(
+            _ids_param("DELETE FROM item_search WHERE item_id IN :ids"),
+            {'ids': list(item_ids)}
+        )
+        if rows:
+            config = POSTGRES_TEXT_SEARCH_CONFIG
+            db.session.execute(
+                text(
+                    "INSERT INTO item_search (item_id, rotation_city_id, document) VALUES ("
+                    ":item_id, :rotation_city_id, "
+                    f"setweight(to_tsvector('{config}', :name), 'A') || "
+                    f"setweight(to_tsvector('{config}', :location), 'B') || "
+                    f"setweight(to_tsvector('{config}', :tags), 'C'))"
+                ),
+                rows
+            )
+        save()
+
+    def index_values(self, value_ids: list[int]) -> None:
+        """No-op: the expression index on value is maintained by PostgreSQL."""
+        return None
+
+    def search_items(self, rotation_city_id: int, query: str, limit: int) -> list[int]:
+        """Find items in a city whose name, location or text tags match.
+
+        Every query word must match the start of a word in the item.
+
+        Args:
+            rotation_city_id: The rotation city ID to search in
+            query: User search text
+            limit: Maximum number of results
+
+        Returns:
+            Item IDs, best match first
+        """
+        tsquery = self._tsquery(query)
+        if not tsquery:
+            return []
+
+        return db.session.execute(
+            text(
+                "SELECT item_search.item_id FROM item_search "
+                "JOIN item ON item.item_id = item_search.item_id, "
+                f"to_tsquery('{POSTGRES_TEXT_SEARCH_CONFIG}', :tsquery) AS query "
+                "WHERE item_search.rotation_city_id = :city AND item_search.document @@ query "
+                f"ORDER BY ts_rank(item_search.document, query) * {_BLENDED} DESC "
+                "LIMIT :limit"
+            ),
+            {'tsquery': tsquery, 'city': rotation_city_id, 'limit': limit}
+        ).scalars().all()
+
+    def search_values(self, tag_id: int, query: str, limit: int) -> list[int]:
+        """Find text values of a tag matching query.
+
+        Args:
+            tag_id: The ID of the tag whose values are searched
+            query: User search text
+            limit: Maximum number of results
+
+        Returns:
+            Value IDs, best match first
+        """
+        tsquery = self._tsquery(query)
+        if not tsquery:
+            return []
+
+        config = POSTGRES_TEXT_SEARCH_CONFIG
+        # Must match the ix_value_name_val_search expression to use the index
+        document = f"to_tsvector('{config}', coalesce(name_val, ''))"
+        return db.session.execute(
+            text(
+                f"SELECT value_id FROM value, to_tsquery('{config}', :tsquery) AS query "
+                f"WHERE tag_id = :tag_id AND {document} @@ query "
+                f"ORDER BY ts_rank({document}, query) DESC LIMIT :limit"
+            ),
+            {'tsquery': tsquery, 'tag_id': tag_id, 'limit': limit}
+        ).scalars().all()
+
+    def _tsquery(self, query: str) -> str:
+        """Build a to_tsquery expression: every token, as a prefix."""
+        return ' & '.join(f'{token}:*' for token in self._tokens(query))
+
+
+def get_search_index_repository() -> SearchIndexRepository:
+    """Return the search index implementation for the configured database.
+
+    Raises:
+        ValueError: If the database has no supported full-text engine
+    """
+    dialect = db.engine.dialect.name
+    if dialect == 'sqlite':
+        return SqliteSearchIndexRepository()
+    if dialect == 'postgresql':
+        return PostgresSearchIndexRepository()
+    raise ValueError(f"Full-text search is not supported on {dialect}")
@@ -1,6 +1,8 @@
 """Tag repository implementation."""
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
+from sqlalchemy import func
 from app import db
+from app.repositories.unit_of_work import save
 from app.models.tag import Tag, TagValueType
 from app.repositories.base.tag_repository_interface import TagRepositoryInterface
 
@@ -34,6 +36,19 @@ class TagRepository(TagRepositoryInterface):
             db.select(Tag).filter_by(tag_id=tag_id)
         ).scalar_one_or_none()
 
+    def get_tags_by_ids(self, tag_ids: List[int]) -> List[Tag]:
+        """Retrieve multiple tags by their IDs.
+        
+        Args:
+            tag_ids: IDs of the tags to retrieve
+            
+        Returns:
+            List of Tag objects found
+        """
+        return db.session.execute(
+            db.select(Tag).filter(Tag.tag_id.in_(tag_ids))
+        ).scalars().all()
+
     def get_tag_by_name(self, name: str) -> Optional[Tag]:
         """Retrieve a tag by its name (case-insensitive search).
         
@@ -47,6 +62,42 @@ class TagRepository(TagRepositoryInterface):
             db.select(Tag).filter(Tag.name.ilike(name))
         ).scalar_one_or_none()
 
+    def get_tags_by_names(self, names: List[str]) -> List[Tag]:
+        """Retrieve multiple tags by name (case-insensitive).
+        
+        Args:
+            names: Tag names to look up
+            
+        Returns:
+            List of Tag objects found
+        """
+        return db.session.execute(
+            db.select(Tag).filter(func.lower(Tag.name).in_([name.lower() for name in names]))
+        ).scalars().all()
+
+    def create_tags(self, tags: List[Tuple[str, Union[str, int]]]) -> List[Tag]:
+        """Create several tags with one flush.
+        
+        Args:
+            tags: (name, value_type) pairs; value_type as for create_tag
+            
+        Returns:
+            Created Tag objects, in the order given
+        """
+        created = [
+            Tag(
+                name=name,
+                value_type=(
+                    TagValueType.from_label(value_type).code
+                    if isinstance(value_type, str) else value_type
+                )
+            )
+            for name, value_type in tags
+        ]
+        db.session.add_all(created)
+        save(*created)
+        return created
+
     def create_tag(self, name: str, value_type: Union[str, int]) -> Tag:
         """Create a new tag in the database.
         
@@ -64,6 +115,5 @@ class TagRepository(TagRepositoryInterface):
         
         tag = Tag(name=name, value_type=value_type)
         db.session.add(tag)
-        db.session.commit()
-        db.session.refresh(tag)
+        save(tag)
         return tag
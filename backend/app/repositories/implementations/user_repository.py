@@ -5,7 +5,10 @@ from app.models.verification_stutus_enum import VerificationStatusEnum
 from app.repositories.base.user_repository_interface import (
     IUserRepository
 )
-from sqlalchemy.orm import joinedload
+from app.repositories.unit_of_work import save
+from app.models.rotation_city import RotationCity
+from app.utils.fieldsets import Fieldset
+from sqlalchemy.orm import joinedload, load_only
 
 
 class UserRepository(IUserRepository):
@@ -77,16 +80,39 @@ class UserRepository(IUserRepository):
             db.session.refresh(user)
         return user
     
-    def get_user_by_id(self, user_id: int) -> Optional[User]:
+    def get_user_by_id(self, user_id: int, fieldset: Optional[Fieldset] = None) -> Optional[User]:
         """Retrieve a user by their ID with rotation city preloaded.
         
         Args:
             user_id: The ID of the user to retrieve
+            fieldset: Optional sparse fieldset; only the columns it needs
+                (plus verification status) are loaded
             
         Returns:
             User object with rotation_city relationship loaded, None if not found
         """
-        return User.query.options(joinedload(User.rotation_city)).filter_by(user_id=user_id).first()
+        if fieldset is None:
+            options = [joinedload(User.rotation_city)]
+        else:
+            options = [load_only(*fieldset.attributes(User), User.is_verified)]
+            if fieldset.wants('rotation_city'):
+                options.append(joinedload(User.rotation_city).load_only(
+                    *fieldset.attributes(RotationCity, 'rotation_city')
+                ))
+        return User.query.options(*options).filter_by(user_id=user_id).first()
+    
+    def get_users_by_ids(self, user_ids: List[int]) -> List[User]:
+        """Retrieve multiple users by ID with rotation cities preloaded.
+        
+        Args:
+            user_ids: IDs of the users to retrieve
+            
+        Returns:
+            List of User objects found
+        """
+        return User.query.options(joinedload(User.rotation_city)).filter(
+            User.user_id.in_(user_ids)
+        ).all()
     
     def get_all_users(self) -> List[User]:
         """Retrieve all users from the database.
@@ -96,6 +122,22 @@ class UserRepository(IUserRepository):
         """
         return User.query.all()
     
+    def delete_user(self, user_id: int) -> bool:
+        """Delete a user with one DELETE statement.
+        
+        The items they added, their verifications, verification codes and
+        idempotency keys are removed by the database (ON DELETE CASCADE).
+        
+        Args:
+            user_id: The ID of the user to delete
+            
+        Returns:
+            True if the user existed
+        """
+        result = db.session.execute(db.delete(User).where(User.user_id == user_id))
+        save()
+        return result.rowcount == 1
+    
     def update(self, user_id: int, **kwargs) -> User:
         """Update user fields in the database.
         
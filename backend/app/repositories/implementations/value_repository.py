@@ -1,9 +1,33 @@
 """Value repository implementation."""
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
+from sqlalchemy import bindparam, delete, func, or_, tuple_, update
 from app import db
+from app.repositories.bulk_insert import insert_ignoring_conflicts
+from app.repositories.unit_of_work import save
+from app.models.item_tag_value import ItemTagValue
 from app.models.value import Value
 from app.models.tag import Tag, TagValueType
 from app.repositories.base.value_repository_interface import ValueRepositoryInterface
+from app.repositories.implementations.search_index_repository import get_search_index_repository
+
+_TYPED_COLUMNS = ('boolean_val', 'name_val', 'numerical_value')
+# Values merged per round of statements
+_MERGE_BATCH_SIZE = 500
+
+
+def _value_key(
+    tag_id: int,
+    value_type: Union[str, int],
+    value: Union[bool, str, float]
+) -> Tuple[int, str, Union[bool, str, float]]:
+    """Identity of an interned value: (tag_id, typed column, typed value)."""
+    if isinstance(value_type, int):
+        value_type = TagValueType.from_code(value_type).label
+    if value_type == 'boolean':
+        return tag_id, 'boolean_val', bool(value)
+    if value_type == 'numeric':
+        return tag_id, 'numerical_value', float(value)
+    return tag_id, 'name_val', str(value)
 
 
 class ValueRepository(ValueRepositoryInterface):
@@ -11,6 +35,7 @@ class ValueRepository(ValueRepositoryInterface):
     
     Handles all database operations related to tag values.
     Values can be boolean, text, or numeric depending on their associated tag.
+    Writes keep the full-text index of text values in step.
     """
 
     def create_value(
@@ -19,7 +44,10 @@ class ValueRepository(ValueRepositoryInterface):
         value: Union[bool, str, float],
         value_type: str
     ) -> Value:
-        """Create a new value for a tag.
+        """Get the value of a tag, creating it if it does not exist yet.
+        
+        Values are interned, so this returns the existing row when the tag
+        already has this value.
         
         Args:
             tag_id: The ID of the tag this value belongs to
@@ -27,22 +55,85 @@ class ValueRepository(ValueRepositoryInterface):
             value_type: Type of value ('boolean', 'text', or 'numeric')
             
         Returns:
-            Created Value object with appropriate column set
+            Value object with the appropriate column set
         """
-        value_obj = Value(tag_id=tag_id)
+        return self.get_or_create_values([(tag_id, value_type, value)])[0]
+
+    def get_or_create_values(
+        self,
+        entries: List[Tuple[int, Union[str, int], Union[bool, str, float]]]
+    ) -> List[Value]:
+        """Resolve many (tag, value) pairs to their interned Value rows.
+        
+        Existing values are found with one query; the missing ones are
+        inserted with one multi-row INSERT that skips rows created meanwhile
+        by another transaction, then read back with one more query.
         
-        # Set the appropriate column based on value_type
-        if value_type == 'boolean':
-            value_obj.boolean_val = bool(value)
-        elif value_type == 'text':
-            value_obj.name_val = str(value)
-        elif value_type == 'numeric':
-            value_obj.numerical_value = float(value)
+        Args:
+            entries: (tag_id, value_type, value) triples; value_type is a
+                label ('boolean', 'text', 'numeric') or its integer code
+            
+        Returns:
+            One Value per entry, in the order of entries (repeated entries
+            share a Value)
+        """
+        keys = [_value_key(tag_id, value_type, value) for tag_id, value_type, value in entries]
+        found = self._find_values(set(keys))
+
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if missing:
+            insert_ignoring_conflicts(Value.__table__, [
+                {'tag_id': tag_id, **dict.fromkeys(_TYPED_COLUMNS), column: typed}
+                for tag_id, column, typed in missing
+            ])
+            created = self._find_values(set(missing))
+            found.update(created)
+            text_value_ids = [
+                value.value_id for value in created.values() if value.name_val is not None
+            ]
+            save()
+            get_search_index_repository().index_values(text_value_ids)
+        return [found[key] for key in keys]
+
+    def find_value(
+        self,
+        tag_id: int,
+        value_type: Union[str, int],
+        value: Union[bool, str, float]
+    ) -> Optional[Value]:
+        """Find the interned value of a tag without creating it.
         
-        db.session.add(value_obj)
-        db.session.commit()
-        db.session.refresh(value_obj)
-        return value_obj
+        Args:
+            tag_id: The ID of the tag
+            value_type: Label or integer code of the tag's value type
+            value: The typed value
+            
+        Returns:
+            Value object if the tag has this value, None otherwise
+        """
+        key = _value_key(tag_id, value_type, value)
+        return self._find_values({key}).get(key)
+
+    def _find_values(self, keys: set) -> dict:
+        """Load the values matching (tag_id, column, typed value) keys.
+        
+        Returns:
+            Mapping of key to Value for the keys that exist
+        """
+        conditions = []
+        for column in _TYPED_COLUMNS:
+            pairs = [(tag_id, typed) for tag_id, key_column, typed in keys if key_column == column]
+            if pairs:
+                conditions.append(tuple_(Value.tag_id, getattr(Value, column)).in_(pairs))
+        if not conditions:
+            return {}
+
+        values = db.session.execute(db.select(Value).filter(or_(*conditions))).scalars()
+        found = {}
+        for value in values:
+            column = next(column for column in _TYPED_COLUMNS if getattr(value, column) is not None)
+            found[(value.tag_id, column, getattr(value, column))] = value
+        return found
 
     def get_value_by_id(self, value_id: int) -> Optional[Value]:
         """Retrieve a value by its ID.
@@ -131,21 +222,96 @@ class ValueRepository(ValueRepositoryInterface):
                 value.boolean_val = None
                 value.name_val = None
 
-        db.session.commit()
-        db.session.refresh(value)
+        save(value)
+        get_search_index_repository().index_values([value.value_id])
         return value
 
+    def merge_values(self, source_id: int, target_id: int) -> List[int]:
+        """Move every item using one value over to another, then delete it.
+        
+        Args:
+            source_id: ID of the value to merge away
+            target_id: ID of the value its items use from now on
+            
+        Returns:
+            IDs of the items that were repointed
+        """
+        return self._merge({source_id: target_id})
+
+    def _merge(self, mapping: dict) -> List[int]:
+        """Repoint item links from mapping's keys to its values and delete the keys.
+        
+        An item linked to both a duplicate and the kept value ends up with
+        one link.
+        
+        Returns:
+            IDs of the items that were repointed
+        """
+        if not mapping:
+            return []
+
+        # The statements below bypass the session, so send it pending changes first
+        db.session.flush()
+        links = ItemTagValue.__table__
+        item_ids = []
+        merged = list(mapping.items())
+        for start in range(0, len(merged), _MERGE_BATCH_SIZE):
+            batch = dict(merged[start:start + _MERGE_BATCH_SIZE])
+            item_ids.extend(db.session.execute(
+                db.select(links.c.item_id).filter(links.c.value_id.in_(list(batch))).distinct()
+            ).scalars())
+            db.session.execute(
+                update(links)
+                .where(links.c.value_id == bindparam('source_id'))
+                .values(value_id=bindparam('target_id')),
+                [{'source_id': source, 'target_id': target} for source, target in batch.items()]
+            )
+            targets = list(set(batch.values()))
+            first_links = (
+                db.select(func.min(links.c.item_tag_value_id))
+                .filter(links.c.value_id.in_(targets))
+                .group_by(links.c.item_id, links.c.value_id)
+            )
+            db.session.execute(
+                delete(links).where(
+                    links.c.value_id.in_(targets),
+                    links.c.item_tag_value_id.not_in(first_links)
+                )
+            )
+            db.session.execute(delete(Value.__table__).where(Value.value_id.in_(list(batch))))
+        save()
+        # Drops the index entries of the deleted values
+        get_search_index_repository().index_values(list(mapping))
+        return sorted(set(item_ids))
+
     def find_similar_text_values(
         self,
         tag_id: int,
-        value: str
+        value: str,
+        limit: int = 20
     ) -> List[Value]:
-        """Find similar text values for a tag."""
-        # use like to allow partial matches
-        return db.session.execute(
+        """Find similar text values for a tag.
+        
+        Uses the full-text index: every word of value must match the start
+        of a word in the stored text.
+        
+        Args:
+            tag_id: The ID of the text tag to search within
+            value: Text to match
+            limit: Maximum number of values to return
+            
+        Returns:
+            List of matching Value objects, best match first
+        """
+        value_ids = get_search_index_repository().search_values(tag_id, value, limit)
+        if not value_ids:
+            return []
+
+        values = db.session.execute(
             db.select(Value)
             .join(Tag, Value.tag_id == Tag.tag_id)
-            .filter(Value.tag_id == tag_id)
+            .filter(Value.value_id.in_(value_ids))
             .filter(Tag.value_type == TagValueType.TEXT.code)
-            .filter(Value.name_val.ilike(f"%{value}%"))
-        ).scalars().all()
\ No newline at end of file
+        ).scalars().all()
+        by_id = {found.value_id: found for found in values}
+        return [by_id[value_id] for value_id in value_ids if value_id in by_id]
\ No newline at end of file
@@ -0,0 +1,163 @@
+"""Verification daily count repository implementation."""
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+from sqlalchemy import Date, Integer, cast, func, literal
+from app import db
+from app.models.item import Item
+from app.models.item_verification import ItemVerification
+from app.models.verification_daily_count import VerificationDailyCount
+from app.repositories.base.verification_daily_count_repository_interface import (
+    VerificationDailyCountRepositoryInterface
+)
+from app.repositories.bulk_insert import upsert
+from app.repositories.unit_of_work import save
+
+
+class VerificationDailyCountRepository(VerificationDailyCountRepositoryInterface):
+    """Repository for the daily rollup of item verifications.
+
+    Rows are upserted with ``INSERT ... SELECT ... ON CONFLICT DO UPDATE``,
+    taking each item's city from the item table, so counting a batch of
+    verifications is one statement and concurrent verifications of an item
+    on the same day add up instead of conflicting.
+    """
+
+    def add_verifications(self, item_ids: List[int], verified_at: datetime) -> None:
+        """Count one verification of each item on the day of verified_at.
+
+        Args:
+            item_ids: IDs of the verified items, each listed once
+            verified_at: When the items were verified (naive UTC)
+        """
+        if not item_ids:
+            return
+        rows = (
+            db.select(
+                Item.rotation_city_id,
+                literal(verified_at.date(), Date),
+                Item.item_id,
+                literal(1, Integer)
+            )
+            .where(Item.item_id.in_(item_ids))
+        )
+        statement = upsert(VerificationDailyCount.__table__).from_select(
+            ['rotation_city_id', 'day', 'item_id', 'verification_count'], rows
+        )
+        db.session.execute(statement.on_conflict_do_update(
+            index_elements=['rotation_city_id', 'day', 'item_id'],
+            set_={
+                'verification_count':
+                    VerificationDailyCount.verification_count + statement.excluded.verification_count
+            }
+        ))
+        save()
+
+    def rebuild(self, item_ids: Optional[List[int]] = None) -> int:
+        """Recompute the rollup of some or all items from their verifications.
+
+        Deletes the items' rows, then inserts one row per (city, day, item)
+        from a single grouped aggregate over item_verification.
+
+        Args:
+            item_ids: Items to rebuild; None rebuilds the whole rollup
+
+        Returns:
+            Number of rows written
+        """
+        if item_ids is not None and not item_ids:
+            return 0
+        day = self._day(ItemVerification.created_at)
+        rows = (
+            db.select(
+                Item.rotation_city_id,
+                day,
+                ItemVerification.item_id,
+                func.count(ItemVerification.verification_id)
+            )
+            .join(Item, ItemVerification.item_id == Item.item_id)
+            .group_by(Item.rotation_city_id, day, ItemVerification.item_id)
+        )
+        delete = db.delete(VerificationDailyCount)
+        if item_ids is not None:
+            rows = rows.where(ItemVerification.item_id.in_(item_ids))
+            delete = delete.where(VerificationDailyCount.item_id.in_(item_ids))
+
+        db.session.execute(delete.execution_options(synchronize_session=False))
+        written = db.session.execute(
+            db.insert(VerificationDailyCount).from_select(
+                ['rotation_city_id', 'day', 'item_id', 'verification_count'], rows
+            )
+        ).rowcount
+        save()
+        return written
+
+    def get_city_daily_counts(
+        self,
+        rotation_city_id: int,
+        start: date,
+        end: date
+    ) -> List[Tuple[date, int]]:
+        """Get a city's verifications per day between two days, inclusive.
+
+        Reads a range of the primary key, summing the rows of the items
+        verified on each day.
+
+        Args:
+            rotation_city_id: ID of the rotation city
+            start: First day
+            end: Last day
+
+        Returns:
+            (day, verification count) pairs in day order; days without
+            verifications are omitted
+        """
+        return [
+            (day, int(count)) for day, count in db.session.execute(
+                db.select(
+                    VerificationDailyCount.day,
+                    func.sum(VerificationDailyCount.verification_count)
+                )
+                .where(
+                    VerificationDailyCount.rotation_city_id == rotation_city_id,
+                    VerificationDailyCount.day.between(start, end)
+                )
+                .group_by(VerificationDailyCount.day)
+                .order_by(VerificationDailyCount.day)
+            )
+        ]
+
+    def get_item_daily_counts(
+        self,
+        item_id: int,
+        start: date,
+        end: date
+    ) -> List[Tuple[date, int]]:
+        """Get an item's verifications per day between two days, inclusive.
+
+        Args:
+            item_id: ID of the item
+            start: First day
+            end: Last day
+
+        Returns:
+            (day, verification count) pairs in day order; days without
+            verifications are omitted
+        """
+        return [
+            (day, count) for day, count in db.session.execute(
+                db.select(VerificationDailyCount.day, VerificationDailyCount.verification_count)
+                .where(
+                    VerificationDailyCount.item_id == item_id,
+                    VerificationDailyCount.day.between(start, end)
+                )
+                .order_by(VerificationDailyCount.day)
+            )
+        ]
+
+    @staticmethod
+    def _day(column):
+        """SQL expression for the UTC day of a naive UTC timestamp column."""
+        if db.session.get_bind().dialect.name == 'sqlite':
+            # DATE(x) yields the ISO 'YYYY-MM-DD' text SQLite stores dates as
+            return func.date(column, type_=Date)
+        return cast(column, Date)
@@ -0,0 +1,119 @@
+"""Request-scoped batching loaders for repository lookups.
+
+A ``DataLoader`` sits in front of a repository's batch lookup (e.g.
+``TagRepository.get_tags_by_ids``). Keys can be queued with ``want()``
+ahead of time; the next ``load()`` resolves every queued key with one
+``IN (...)`` query. Results, including misses, are remembered, so asking
+for the same key again later in the request costs nothing.
+
+Usage:
+    loader = get_loader(tag_repo.get_tags_by_ids, attrgetter('tag_id'))
+    loader.want(tag_ids)
+    tags = [loader.load(tag_id) for tag_id in tag_ids]  # one query
+"""
+from typing import Any, Callable, Hashable, Iterable, Optional
+
+from flask import Flask, g, has_request_context
+
+_LOADERS_KEY = 'data_loaders'
+
+
+class DataLoader:
+    """Batches and memoizes lookups of objects by key.
+
+    Attributes:
+        batch_load: Callable taking a list of keys and returning the
+            objects found for them, in any order
+        key: Callable returning the key of a loaded object
+    """
+
+    def __init__(self, batch_load: Callable[[list], Iterable], key: Callable[[Any], Hashable]):
+        """Create a loader.
+
+        Args:
+            batch_load: Batch lookup, e.g. a repository ``get_..._by_ids`` method
+            key: Returns the key of a loaded object
+        """
+        self.batch_load = batch_load
+        self.key = key
+        self._cache: dict = {}
+        self._pending: dict = {}
+
+    def want(self, keys: Iterable[Hashable]) -> None:
+        """Queue keys to be fetched with the next load."""
+        for key in keys:
+            if key not in self._cache:
+                self._pending[key] = None
+
+    def load(self, key: Hashable) -> Optional[Any]:
+        """Get the object for key, fetching it and any queued keys if needed.
+
+        Returns:
+            The object, or None if no object has that key
+        """
+        if key not in self._cache:
+            self.want([key])
+            self._dispatch()
+        return self._cache[key]
+
+    def load_many(self, keys: Iterable[Hashable]) -> list:
+        """Get the objects for several keys with at most one query.
+
+        Returns:
+            One object (or None) per key, in the order of keys
+        """
+        keys = list(keys)
+        self.want(keys)
+        self._dispatch()
+        return [self._cache[key] for key in keys]
+
+    def prime(self, obj: Any) -> None:
+        """Remember an object obtained elsewhere, e.g. one just created."""
+        self._cache[self.key(obj)] = obj
+        self._pending.pop(self.key(obj), None)
+
+    def clear(self, key: Hashable) -> None:
+        """Forget a key so the next load fetches it again."""
+        self._cache.pop(key, None)
+
+    def _dispatch(self) -> None:
+        """Fetch all queued keys with one batch lookup."""
+        if not self._pending:
+            return
+        keys = list(self._pending)
+        self._pending.clear()
+        found = {self.key(obj): obj for obj in self.batch_load(keys)}
+        for key in keys:
+            self._cache[key] = found.get(key)
+
+
+def get_loader(batch_load: Callable[[list], Iterable], key: Callable[[Any], Hashable]) -> DataLoader:
+    """Return the current request's loader for a batch lookup.
+
+    Each batch lookup (a bound repository method) gets one loader per
+    request. Outside a request a fresh loader is returned every time, so
+    scripts and background work never see results memoized earlier.
+
+    Args:
+        batch_load: Batch lookup the loader calls
+        key: Returns the key of a loaded object
+    """
+    if not has_request_context():
+        return DataLoader(batch_load, key)
+
+    loaders = g.setdefault(_LOADERS_KEY, {})
+    loader = loaders.get(batch_load)
+    if loader is None:
+        loader = loaders[batch_load] = DataLoader(batch_load, key)
+    return loader
+
+
+def init_app(app: Flask) -> None:
+    """Drop an app's loaders at the end of every request.
+
+    Requests normally get their own app context (and ``g``); clearing
+    explicitly also keeps requests that share one, as in tests, apart.
+    """
+    @app.teardown_request
+    def clear_loaders(exc):
+        g.pop(_LOADERS_KEY, None)
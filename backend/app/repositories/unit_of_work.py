@@ -0,0 +1,86 @@
+"""Unit of work: group repository writes into one transaction.
+
+Repository write methods finish with ``save()`` instead of committing
+directly. On its own a write is committed immediately, as before; inside a
+``UnitOfWork`` block it is only flushed (so generated IDs are available)
+and the block commits once on exit, or rolls everything back if it raises.
+
+Usage:
+    with UnitOfWork():
+        item = item_repo.create_item(...)
+        category_item_repo.add_categories_to_item(item, categories)
+"""
+from app import db
+
+_DEPTH_KEY = 'unit_of_work_depth'
+
+
+class UnitOfWork:
+    """Context manager making the enclosed repository writes atomic.
+
+    Units nest: an inner unit joins the transaction of the outermost one,
+    which alone commits or rolls back.
+
+    Attributes:
+        expire_on_commit: Whether loaded objects are expired by the final
+            commit. Pass False when the caller goes on to read objects it
+            has just written, to avoid reloading them.
+    """
+
+    def __init__(self, expire_on_commit: bool = True):
+        """Create a unit of work.
+
+        Args:
+            expire_on_commit: Whether the final commit expires loaded objects
+        """
+        self.expire_on_commit = expire_on_commit
+
+    def __enter__(self) -> 'UnitOfWork':
+        info = db.session.info
+        info[_DEPTH_KEY] = info.get(_DEPTH_KEY, 0) + 1
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        info = db.session.info
+        info[_DEPTH_KEY] -= 1
+        if info[_DEPTH_KEY] > 0:
+            return False
+
+        if exc_type is not None:
+            db.session.rollback()
+            return False
+
+        session = db.session()
+        expire_on_commit = session.expire_on_commit
+        session.expire_on_commit = self.expire_on_commit
+        try:
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.expire_on_commit = expire_on_commit
+        return False
+
+
+def in_unit_of_work() -> bool:
+    """Check whether the current session is inside a UnitOfWork block."""
+    return db.session.info.get(_DEPTH_KEY, 0) > 0
+
+
+def save(*instances) -> None:
+    """Finish a repository write.
+
+    Commits, then reloads ``instances`` from the database; inside a unit of
+    work only flushes, leaving the commit to the enclosing block.
+
+    Args:
+        instances: Objects to refresh after a standalone commit
+    """
+    if in_unit_of_work():
+        db.session.flush()
+        return
+
+    db.session.commit()
+    for instance in instances:
+        db.session.refresh(instance)
@@ -11,6 +11,7 @@ from app.repositories.implementations.rotation_city_repository import (
     RotationCityRepository
 )
 from app.services.auth.notification_service import NotificationService
+from app.services.blob_service import BlobService
 from app.models.user import User
 from flask import current_app
 
@@ -27,7 +28,8 @@ class RegistrationService:
         self,
         user_repository: UserRepository = None,
         verification_code_repository: VerificationCodeRepository = None,
-        rotation_city_repository: RotationCityRepository = None
+        rotation_city_repository: RotationCityRepository = None,
+        blob_service: BlobService = None
     ):
         """Initialize service with optional dependency injection.
         
@@ -35,6 +37,7 @@ class RegistrationService:
             user_repository: Optional UserRepository instance for testing/DI
             verification_code_repository: Optional VerificationCodeRepository for testing/DI
             rotation_city_repository: Optional RotationCityRepository for city validation
+            blob_service: Optional BlobService storing the profile picture
         """
         self.user_repo = user_repository or UserRepository()
         verification_repo = (
@@ -47,6 +50,7 @@ class RegistrationService:
             verification_repo
         )
         self.notification_service = NotificationService()
+        self.blob_service = blob_service or BlobService()
     
     def register_user(
         self,
@@ -72,13 +76,17 @@ class RegistrationService:
             Created or updated User object
             
         Raises:
-            ValueError: If user already exists and is verified
+            ValueError: If user already exists and is verified, or the
+                profile picture is not a valid image
         """
         existing_user = self.user_repo.get_user_by_email(email)
 
         # validate rotation_city_id
         rotation_city_id = self.rotation_city_repo.validate_city_id(rotation_city_id)
 
+        # Keep only the blob reference in the user row
+        profile_picture = self.blob_service.store_image(profile_picture)
+
         if existing_user:
             if existing_user.is_verified:
                 raise ValueError(
@@ -0,0 +1,117 @@
+"""
+Blob Service
+Business logic for storing and serving content-addressed images.
+"""
+import base64
+import binascii
+import os
+from typing import Optional, Tuple
+
+from flask import current_app
+
+from app.repositories.base.blob_repository_interface import BlobRepositoryInterface
+from app.repositories.implementations.blob_repository import (
+    DatabaseBlobRepository,
+    FileSystemBlobRepository
+)
+from app.utils.blobs import content_hash, is_blob_hash, sniff_image_type
+
+
+class BlobService:
+    """Service for content-addressed blob storage.
+    
+    Image columns store the hash returned by ``store_image``; the bytes live
+    in the configured backend (BLOB_STORAGE = 'database' or 'filesystem')
+    and are served by the blob endpoint.
+    """
+
+    MAX_SIZE = 5 * 1024 * 1024
+
+    def __init__(self, blob_repository: BlobRepositoryInterface = None):
+        """Initialize service with optional dependency injection.
+        
+        Args:
+            blob_repository: Optional repository; defaults to the backend
+                selected by the BLOB_STORAGE setting
+        """
+        self._blob_repository = blob_repository
+
+    @property
+    def blob_repository(self) -> BlobRepositoryInterface:
+        """Storage backend, resolved from app config on first use."""
+        if self._blob_repository is None:
+            if current_app.config.get('BLOB_STORAGE') == 'filesystem':
+                root = current_app.config.get('BLOB_STORAGE_PATH') or os.path.join(
+                    current_app.instance_path, 'blobs'
+                )
+                self._blob_repository = FileSystemBlobRepository(root)
+            else:
+                self._blob_repository = DatabaseBlobRepository()
+        return self._blob_repository
+
+    def store(self, data: bytes, content_type: str) -> str:
+        """Store content and return its hash.
+        
+        Args:
+            data: Raw content
+            content_type: MIME type served with the content
+            
+        Returns:
+            Hex SHA-256 of the content
+        """
+        blob_hash = content_hash(data)
+        self.blob_repository.save(blob_hash, content_type, data)
+        return blob_hash
+
+    def store_image(self, value: Optional[str]) -> Optional[str]:
+        """Store an uploaded image and return the reference to keep in its column.
+        
+        Accepts a ``data:image/...;base64,`` URI or bare base64 image data.
+        Empty values, existing blob references and http(s) URLs are
+        returned unchanged.
+        
+        Args:
+            value: Image as submitted by a client (or legacy column value)
+            
+        Returns:
+            Blob hash, or the value unchanged if it holds no image data
+            
+        Raises:
+            ValueError: If the value is not a valid, supported image
+        """
+        if not value or is_blob_hash(value) or value.startswith(('http://', 'https://')):
+            return value
+
+        payload = value
+        if value.startswith('data:'):
+            header, _, payload = value.partition(',')
+            if not header.endswith(';base64'):
+                raise ValueError("Image data URI must be base64 encoded")
+
+        try:
+            data = base64.b64decode(payload, validate=True)
+        except (binascii.Error, ValueError):
+            raise ValueError("Invalid image data")
+
+        if len(data) > self.MAX_SIZE:
+            raise ValueError("Image is too large")
+
+        # Trust the bytes, not the declared type, so only real images are served
+        content_type = sniff_image_type(data)
+        if content_type is None:
+            raise ValueError("Unsupported image type")
+
+        return self.store(data, content_type)
+
+    def get_blob(self, blob_hash: str) -> Optional[Tuple[bytes, str]]:
+        """Retrieve the content of a blob.
+        
+        Args:
+            blob_hash: Hex SHA-256 of the content
+            
+        Returns:
+            Tuple of (data, content_type), or None if not stored
+        """
+        if not is_blob_hash(blob_hash):
+            return None
+        return self.blob_repository.get_content(blob_hash)
@@ -4,7 +4,12 @@ Business logic layer for category operations.
 """
 from typing import List, Optional
 from app.models.category import Category
+from app.models.data_version import DataVersion
 from app.repositories.implementations.category_repository import CategoryRepository
+from app.repositories.implementations.category_item_repository import CategoryItemRepository
+from app.repositories.implementations.data_version_repository import DataVersionRepository
+from app.services.blob_service import BlobService
+from app.services.item_service import ItemService
 
 
 class CategoryService:
@@ -13,9 +18,24 @@ class CategoryService:
     Handles business logic for managing item categories.
     """
 
-    def __init__(self):
-        """Initialize service with CategoryRepository."""
+    def __init__(
+            self,
+            item_service: ItemService = None,
+            data_version_repository: DataVersionRepository = None,
+            blob_service: BlobService = None
+    ):
+        """Initialize service with CategoryRepository.
+
+        Args:
+            item_service: Optional ItemService used to refresh item documents
+            data_version_repository: Optional DataVersionRepository for testing/DI
+            blob_service: Optional BlobService storing category images
+        """
         self.repository = CategoryRepository()
+        self.category_item_repository = CategoryItemRepository()
+        self.item_service = item_service or ItemService()
+        self.data_version_repository = data_version_repository or DataVersionRepository()
+        self.blob_service = blob_service or BlobService()
 
     def get_all_categories(self) -> List[Category]:
         """Retrieve all categories.
@@ -41,12 +61,19 @@ class CategoryService:
         
         Args:
             category_name: The name of the category
-            category_pic: URL or path to the category picture
+            category_pic: Base64 image data (stored as a blob) or image URL
             
         Returns:
             Created Category object if successful, None otherwise
+            
+        Raises:
+            ValueError: If category_pic is not a valid image
         """
-        return self.repository.add_category(category_name, category_pic)
+        category_pic = self.blob_service.store_image(category_pic)
+        category = self.repository.add_category(category_name, category_pic)
+        if category:
+            self.data_version_repository.bump_versions([DataVersion.CATEGORIES])
+        return category
 
     def update_category(
         self,
@@ -59,12 +86,22 @@ class CategoryService:
         Args:
             category_id: The ID of the category to update
             category_name: Optional new name for the category
-            category_pic: Optional new URL or path to category picture
+            category_pic: Optional new base64 image data or image URL
             
         Returns:
             Updated Category object if found, None otherwise
+            
+        Raises:
+            ValueError: If category_pic is not a valid image
         """
-        return self.repository.update_category(category_id, category_name, category_pic)
+        category_pic = self.blob_service.store_image(category_pic)
+        category = self.repository.update_category(category_id, category_name, category_pic)
+        if category:
+            # Items embed their categories, so their documents are now stale
+            item_ids = self.category_item_repository.get_item_ids_by_category(category_id)
+            self.item_service.refresh_item_documents(item_ids)
+            self.data_version_repository.bump_versions([DataVersion.CATEGORIES])
+        return category
 
     def delete_category(self, category_id: int) -> bool:
         """Delete a category.
@@ -75,4 +112,9 @@ class CategoryService:
         Returns:
             True if deletion was successful, False otherwise
         """
-        return self.repository.delete_category(category_id)
+        item_ids = self.category_item_repository.get_item_ids_by_category(category_id)
+        deleted = self.repository.delete_category(category_id)
+        if deleted:
+            self.item_service.refresh_item_documents(item_ids)
+            self.data_version_repository.bump_versions([DataVersion.CATEGORIES])
+        return deleted
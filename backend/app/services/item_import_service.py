@@ -0,0 +1,462 @@
+"""Bulk item import from NDJSON or CSV.
+
+Rows are streamed in chunks. Each chunk is validated row by row, its
+categories and tags are resolved with one query each, missing tags are
+created once, its distinct tag values are looked up (or created) in one
+batch, and the items and link rows are written with multi-row INSERTs in a
+single transaction. Invalid rows are reported with
+their row number and skipped; they never abort the rest of the import.
+
+NDJSON rows are JSON objects, one per line:
+    {"name": "...", "location": "...", "walking_distance": 120,
+     "categories": ["Food", 3], "tags": {"Vegan": true, "Price": 4.5}}
+
+CSV files have a header with the columns name, location, walking_distance
+and categories (names or IDs separated by ``;``), plus one ``tag:<name>``
+column per tag; empty cells are skipped.
+"""
+import csv
+import json
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterable, Iterator, Optional, Union
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.models.data_version import DataVersion
+from app.models.tag import TagValueType
+from app.repositories.implementations.item_repository import ItemRepository
+from app.repositories.implementations.category_repository import CategoryRepository
+from app.repositories.implementations.category_item_repository import CategoryItemRepository
+from app.repositories.implementations.tag_repository import TagRepository
+from app.repositories.implementations.value_repository import ValueRepository
+from app.repositories.implementations.item_tag_value_repository import ItemTagValueRepository
+from app.repositories.implementations.data_version_repository import DataVersionRepository
+from app.repositories.unit_of_work import UnitOfWork
+from app.repositories.implementations.search_index_repository import (
+    SearchIndexRepository,
+    get_search_index_repository
+)
+
+IMPORT_CHUNK_SIZE = 500
+TAG_COLUMN_PREFIX = 'tag:'
+
+_BOOLEAN_WORDS = {'true': True, 'yes': True, '1': True, 'false': False, 'no': False, '0': False}
+
+# A parsed input row: its row number and either the raw data or the reason
+# it could not be read
+ImportRow = tuple[int, Union[dict, ValueError]]
+
+
+def read_ndjson(lines: Iterable[str]) -> Iterator[ImportRow]:
+    """Parse NDJSON lines into import rows; blank lines are skipped.
+
+    Args:
+        lines: Text lines, e.g. an open file
+
+    Yields:
+        (line number, row dict or ValueError) pairs
+    """
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield number, ValueError(f"Invalid JSON: {e.msg}")
+            continue
+        if isinstance(data, dict):
+            yield number, data
+        else:
+            yield number, ValueError("Row must be a JSON object")
+
+
+def read_csv(lines: Iterable[str]) -> Iterator[ImportRow]:
+    """Parse CSV lines (with a header) into import rows.
+
+    Args:
+        lines: Text lines, e.g. a file opened with newline=''
+
+    Yields:
+        (line number, row dict or ValueError) pairs
+    """
+    reader = csv.DictReader(lines)
+    for record in reader:
+        try:
+            yield reader.line_num, _csv_row(record)
+        except ValueError as e:
+            yield reader.line_num, e
+
+
+def _csv_row(record: dict) -> dict:
+    """Turn a CSV record into the NDJSON row shape."""
+    tags = {}
+    row = {'tags': tags}
+    for column, cell in record.items():
+        if column is None:
+            raise ValueError("Row has more cells than the header")
+        cell = (cell or '').strip()
+        if not cell:
+            continue
+        if column.startswith(TAG_COLUMN_PREFIX):
+            tags[column[len(TAG_COLUMN_PREFIX):]] = cell
+        elif column == 'categories':
+            row['categories'] = [
+                int(part) if part.isdigit() else part
+                for part in (part.strip() for part in cell.split(';'))
+                if part
+            ]
+        else:
+            row[column] = cell
+    return row
+
+
+@dataclass
+class ImportReport:
+    """Outcome of a bulk import.
+
+    Attributes:
+        imported: Number of items created
+        errors: One {'row', 'message'} dict per row that was not imported
+    """
+    imported: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    def add_error(self, row: int, message: str) -> None:
+        """Record that a row was not imported."""
+        self.errors.append({'row': row, 'message': message})
+
+    def to_dict(self) -> dict:
+        """Serialize the report for an API response."""
+        return {'imported': self.imported, 'failed': len(self.errors), 'errors': self.errors}
+
+
+@dataclass
+class _PreparedRow:
+    """A validated row with its references resolved."""
+    number: int
+    item: dict
+    category_ids: list[int]
+    # (lowercase tag name, typed value) pairs
+    values: list[tuple[str, Union[bool, str, float]]]
+
+
+class ItemImportService:
+    """Service for importing many items at once.
+
+    Imported items get no precomputed documents; those are rendered on the
+    first read of each item, like for items written before documents existed.
+    """
+
+    def __init__(
+        self,
+        item_repository: ItemRepository = None,
+        category_repository: CategoryRepository = None,
+        category_item_repository: CategoryItemRepository = None,
+        tag_repository: TagRepository = None,
+        value_repository: ValueRepository = None,
+        item_tag_value_repository: ItemTagValueRepository = None,
+        data_version_repository: DataVersionRepository = None,
+        search_index_repository: SearchIndexRepository = None
+    ):
+        """Initialize service with optional dependency injection.
+
+        Args:
+            item_repository: Optional ItemRepository instance for testing/DI
+            category_repository: Optional CategoryRepository for testing/DI
+            category_item_repository: Optional CategoryItemRepository for testing/DI
+            tag_repository: Optional TagRepository for testing/DI
+            value_repository: Optional ValueRepository for testing/DI
+            item_tag_value_repository: Optional ItemTagValueRepository for testing/DI
+            data_version_repository: Optional DataVersionRepository for testing/DI
+            search_index_repository: Optional SearchIndexRepository for testing/DI
+                (defaults to the implementation for the configured database)
+        """
+        self.item_repo = item_repository or ItemRepository()
+        self.category_repo = category_repository or CategoryRepository()
+        self.category_item_repo = category_item_repository or CategoryItemRepository()
+        self.tag_repo = tag_repository or TagRepository()
+        self.value_repo = value_repository or ValueRepository()
+        self.item_tag_value_repo = item_tag_value_repository or ItemTagValueRepository()
+        self.data_version_repo = data_version_repository or DataVersionRepository()
+        self._search_index_repo = search_index_repository
+
+    @property
+    def search_index_repo(self) -> SearchIndexRepository:
+        """Search index for the configured database (resolved per call, needs an app context)."""
+        return self._search_index_repo or get_search_index_repository()
+
+    def import_rows(
+        self,
+        rows: Iterable[ImportRow],
+        rotation_city_id: int,
+        added_by_user_id: int,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        max_rows: Optional[int] = None
+    ) -> ImportReport:
+        """
+        Import items from parsed rows, one transaction per chunk.
+
+        Args:
+            rows: (row number, data or ValueError) pairs from read_ndjson/read_csv
+            rotation_city_id: City the items are added to
+            added_by_user_id: User recorded as adding the items
+            chunk_size: Rows written per transaction
+            max_rows: Optional limit; rows past it are not read
+
+        Returns:
+            ImportReport with the number of items created and per-row errors
+        """
+        report = ImportReport()
+        rows = iter(rows)
+        read = 0
+
+        while True:
+            take = chunk_size if max_rows is None else min(chunk_size, max_rows - read)
+            chunk = list(islice(rows, take)) if take > 0 else []
+            read += len(chunk)
+            if not chunk:
+                break
+            self._import_chunk(chunk, rotation_city_id, added_by_user_id, report)
+
+        if max_rows is not None and read == max_rows:
+            extra = next(rows, None)
+            if extra is not None:
+                report.add_error(
+                    extra[0], f"Import is limited to {max_rows} rows; this and later rows were skipped"
+                )
+        # Rows of a chunk fail in different phases; report them in input order
+        report.errors.sort(key=lambda error: error['row'])
+        return report
+
+    def _import_chunk(
+        self,
+        chunk: list[ImportRow],
+        rotation_city_id: int,
+        added_by_user_id: int,
+        report: ImportReport
+    ) -> None:
+        """Validate, resolve and write one chunk of rows."""
+        from app.api.v1.schemas.item_schema import ImportItemRow
+
+        parsed = []
+        for number, data in chunk:
+            if isinstance(data, ValueError):
+                report.add_error(number, str(data))
+                continue
+            try:
+                parsed.append((number, ImportItemRow.model_validate(data)))
+            except ValidationError as e:
+                report.add_error(number, _describe(e))
+        if not parsed:
+            return
+
+        # One lookup per chunk for everything the rows reference
+        categories = self._resolve_categories([row for _, row in parsed])
+        tags = {
+            tag.name.lower(): (tag.tag_id, tag.value_type_enum)
+            for tag in self.tag_repo.get_tags_by_names(
+                list({name for _, row in parsed for name in row.tags})
+            )
+        }
+
+        prepared = []
+        new_tags: dict[str, tuple[str, TagValueType]] = {}
+        for number, row in parsed:
+            try:
+                prepared.append(self._prepare_row(
+                    number, row, rotation_city_id, added_by_user_id, categories, tags, new_tags
+                ))
+            except ValueError as e:
+                report.add_error(number, str(e))
+
+        self._write(prepared, rotation_city_id, tags, new_tags, report)
+
+    def _resolve_categories(self, rows: list) -> dict:
+        """Map each category reference in rows (ID or lowercase name) to its ID."""
+        ids = {ref for row in rows for ref in row.categories if isinstance(ref, int)}
+        names = {ref for row in rows for ref in row.categories if isinstance(ref, str)}
+
+        resolved = {}
+        if ids:
+            for category in self.category_repo.get_categories_by_ids(list(ids)):
+                resolved[category.category_id] = category.category_id
+        if names:
+            for category in self.category_repo.get_categories_by_names(list(names)):
+                resolved[category.category_name.lower()] = category.category_id
+        return resolved
+
+    def _prepare_row(
+        self,
+        number: int,
+        row,
+        rotation_city_id: int,
+        added_by_user_id: int,
+        categories: dict,
+        tags: dict,
+        new_tags: dict
+    ) -> _PreparedRow:
+        """
+        Resolve a validated row's categories and type its tag values.
+
+        Tags not in the database are typed by the first valid row using them
+        (``true``/``false`` → boolean, numbers → numeric, else text) and
+        registered in new_tags only once the whole row is valid.
+
+        Raises:
+            ValueError: If a category is unknown or a value does not fit its tag
+        """
+        category_ids = []
+        missing = []
+        for ref in row.categories:
+            category_id = categories.get(ref.lower() if isinstance(ref, str) else ref)
+            if category_id is None:
+                missing.append(ref)
+            elif category_id not in category_ids:
+                category_ids.append(category_id)
+        if missing:
+            raise ValueError(f"Categories not found: {', '.join(str(ref) for ref in missing)}")
+
+        values = []
+        row_new_tags = {}
+        for name, raw in row.tags.items():
+            key = name.lower()
+            if key in tags:
+                value_type = tags[key][1]
+            elif key in new_tags:
+                value_type = new_tags[key][1]
+            else:
+                value_type = _infer_type(raw)
+                row_new_tags[key] = (name, value_type)
+            values.append((key, _coerce(name, raw, value_type)))
+
+        new_tags.update(row_new_tags)
+        item = {
+            'name': row.name,
+            'location': row.location,
+            'walking_distance': row.walking_distance,
+            'rotation_city_id': rotation_city_id,
+            'added_by_user_id': added_by_user_id
+        }
+        return _PreparedRow(number, item, category_ids, values)
+
+    def _write(
+        self,
+        prepared: list[_PreparedRow],
+        rotation_city_id: int,
+        tags: dict,
+        new_tags: dict,
+        report: ImportReport
+    ) -> None:
+        """
+        Write prepared rows in one transaction.
+
+        If the database rejects the batch, it is retried row by row so only
+        the offending rows are reported. Tags created by a committed write
+        are added to tags, so later writes reuse them.
+        """
+        if not prepared:
+            return
+
+        try:
+            with UnitOfWork():
+                # Only create the new tags these rows use (a retry writes a subset)
+                used = {key for row in prepared for key, _ in row.values if key not in tags}
+                created = self.tag_repo.create_tags(
+                    [(new_tags[key][0], new_tags[key][1].label) for key in sorted(used)]
+                )
+                created_tags = {
+                    tag.name.lower(): (tag.tag_id, tag.value_type_enum) for tag in created
+                }
+                chunk_tags = {**tags, **created_tags}
+
+                item_ids = self.item_repo.insert_items([row.item for row in prepared])
+
+                # Values are interned: the chunk's distinct values are resolved
+                # (and the missing ones created) in one batch
+                value_entries = []
+                value_owners = []
+                for item_id, row in zip(item_ids, prepared):
+                    for key, value in row.values:
+                        tag_id, value_type = chunk_tags[key]
+                        value_entries.append((tag_id, value_type.label, value))
+                        value_owners.append(item_id)
+                values = self.value_repo.get_or_create_values(value_entries)
+                value_ids = [value.value_id for value in values]
+
+                self.category_item_repo.insert_links([
+                    (item_id, category_id)
+                    for item_id, row in zip(item_ids, prepared)
+                    for category_id in row.category_ids
+                ])
+                self.item_tag_value_repo.insert_links(list(zip(value_owners, value_ids)))
+                self.search_index_repo.index_items(item_ids)
+
+                changed_scopes = [
+                    DataVersion.city_items_scope(rotation_city_id),
+                    DataVersion.ITEMS,
+                    DataVersion.VALUES
+                ]
+                if created:
+                    changed_scopes.append(DataVersion.TAGS)
+                self.data_version_repo.bump_versions(changed_scopes)
+        except SQLAlchemyError as e:
+            if len(prepared) > 1:
+                for row in prepared:
+                    self._write([row], rotation_city_id, tags, new_tags, report)
+            else:
+                report.add_error(prepared[0].number, f"Could not be saved: {getattr(e, 'orig', None) or e}")
+            return
+
+        tags.update(created_tags)
+        report.imported += len(prepared)
+
+
+def _describe(error: ValidationError) -> str:
+    """Summarize a pydantic validation error in one line."""
+    return '; '.join(
+        f"{'.'.join(str(part) for part in detail['loc'])}: {detail['msg']}"
+        if detail['loc'] else detail['msg']
+        for detail in error.errors()
+    )
+
+
+def _infer_type(value: Union[bool, str, float]) -> TagValueType:
+    """Pick the value type of a new tag from its first value."""
+    if isinstance(value, bool) or str(value).lower() in ('true', 'false'):
+        return TagValueType.BOOLEAN
+    if isinstance(value, (int, float)):
+        return TagValueType.NUMERIC
+    try:
+        float(value)
+        return TagValueType.NUMERIC
+    except ValueError:
+        return TagValueType.TEXT
+
+
+def _coerce(name: str, value: Union[bool, str, float], value_type: TagValueType):
+    """
+    Convert a raw value (CSV cells are strings) to the tag's value type.
+
+    Raises:
+        ValueError: If the value does not fit the type
+    """
+    if value_type is TagValueType.BOOLEAN:
+        if isinstance(value, bool):
+            return value
+        if isinstance(value, str) and value.lower() in _BOOLEAN_WORDS:
+            return _BOOLEAN_WORDS[value.lower()]
+    elif value_type is TagValueType.NUMERIC:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+        if isinstance(value, str):
+            try:
+                return float(value)
+            except ValueError:
+                pass
+    elif isinstance(value, str):
+        if len(value) > 200:
+            raise ValueError(f"Tag '{name}' value must be at most 200 characters")
+        return value
+    raise ValueError(f"Tag '{name}' expects a {value_type.label} value, got {value!r}")
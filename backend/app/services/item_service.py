@@ -1,13 +1,42 @@
 """Item service for business logic."""
-from typing import Union
+from datetime import datetime
+from operator import attrgetter
+from typing import Optional, Union
+from flask import current_app
+from app.models.data_version import DataVersion
 from app.models.item import Item
 from app.models.tag import TagValueType
+from app.repositories.base.item_repository_interface import ItemLoadStrategy, ItemSort
 from app.repositories.implementations.item_repository import ItemRepository
 from app.repositories.implementations.category_repository import CategoryRepository
 from app.repositories.implementations.category_item_repository import CategoryItemRepository
 from app.repositories.implementations.tag_repository import TagRepository
 from app.repositories.implementations.value_repository import ValueRepository
 from app.repositories.implementations.item_tag_value_repository import ItemTagValueRepository
+from app.repositories.implementations.item_document_repository import ItemDocumentRepository
+from app.repositories.implementations.data_version_repository import DataVersionRepository
+from app.repositories.implementations.verification_daily_count_repository import (
+    VerificationDailyCountRepository
+)
+from app.repositories.loaders import DataLoader, get_loader
+from app.repositories.unit_of_work import UnitOfWork
+from app.repositories.implementations.search_index_repository import (
+    SearchIndexRepository,
+    get_search_index_repository
+)
+from app.utils.fieldsets import Fieldset
+from app.utils.item_filters import ItemFilters
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+class ItemNotFoundError(ValueError):
+    """Raised when an item doesn't exist in the caller's rotation city."""
+    pass
+
+
+class ItemEditForbiddenError(Exception):
+    """Raised when a user edits an item they did not add."""
+    pass
 
 
 class ItemService:
@@ -24,7 +53,11 @@ class ItemService:
         category_item_repository: CategoryItemRepository = None,
         tag_repository: TagRepository = None,
         value_repository: ValueRepository = None,
-        item_tag_value_repository: ItemTagValueRepository = None
+        item_tag_value_repository: ItemTagValueRepository = None,
+        item_document_repository: ItemDocumentRepository = None,
+        data_version_repository: DataVersionRepository = None,
+        search_index_repository: SearchIndexRepository = None,
+        verification_daily_count_repository: VerificationDailyCountRepository = None
     ):
         """Initialize service with optional dependency injection.
         
@@ -35,6 +68,12 @@ class ItemService:
             tag_repository: Optional TagRepository for testing/DI
             value_repository: Optional ValueRepository for testing/DI
             item_tag_value_repository: Optional ItemTagValueRepository for testing/DI
+            item_document_repository: Optional ItemDocumentRepository for testing/DI
+            data_version_repository: Optional DataVersionRepository for testing/DI
+            search_index_repository: Optional SearchIndexRepository for testing/DI
+                (defaults to the implementation for the configured database)
+            verification_daily_count_repository: Optional
+                VerificationDailyCountRepository for testing/DI
         """
         self.item_repo = item_repository or ItemRepository()
         self.category_repo = category_repository or CategoryRepository()
@@ -42,6 +81,27 @@ class ItemService:
         self.tag_repo = tag_repository or TagRepository()
         self.value_repo = value_repository or ValueRepository()
         self.item_tag_value_repo = item_tag_value_repository or ItemTagValueRepository()
+        self.item_document_repo = item_document_repository or ItemDocumentRepository()
+        self.data_version_repo = data_version_repository or DataVersionRepository()
+        self._search_index_repo = search_index_repository
+        self.daily_count_repo = (
+            verification_daily_count_repository or VerificationDailyCountRepository()
+        )
+
+    @property
+    def search_index_repo(self) -> SearchIndexRepository:
+        """Search index for the configured database (resolved per call, needs an app context)."""
+        return self._search_index_repo or get_search_index_repository()
+
+    @property
+    def tag_loader(self) -> DataLoader:
+        """Request-scoped batching loader of tags by ID."""
+        return get_loader(self.tag_repo.get_tags_by_ids, attrgetter('tag_id'))
+
+    @property
+    def category_loader(self) -> DataLoader:
+        """Request-scoped batching loader of categories by ID."""
+        return get_loader(self.category_repo.get_categories_by_ids, attrgetter('category_id'))
 
     def create_item(
         self,
@@ -74,101 +134,137 @@ class ItemService:
             ValueError: If validation fails
         """
         # Validate categories exist
-        self._validate_categories(category_ids)
+        categories = self._validate_categories(category_ids)
         
         # Validate and process tags
-        self._validate_tags(existing_tags, new_tags)
-        
-        # Create the item
-        item = self.item_repo.create_item(
-            name=name,
-            location=location,
-            rotation_city_id=rotation_city_id,
-            added_by_user_id=added_by_user_id,
-            walking_distance=walking_distance
-        )
-        
-        # Link categories to item
-        self.category_item_repo.add_categories_to_item(item.item_id, category_ids)
+        tags_by_id = self._validate_tags(existing_tags, new_tags)
         
-        # Process tags
-        value_ids = []
-        
-        # Handle existing tags
-        for existing_tag in existing_tags:
-            tag_id = existing_tag['tag_id']
-            value = existing_tag['value']
+        # Every write below joins one transaction: a validation error part
+        # way through rolls back the item and everything linked to it.
+        # Objects stay loaded after the commit, so the response is built
+        # from them instead of re-querying the item.
+        with UnitOfWork(expire_on_commit=False):
+            item = self.item_repo.create_item(
+                name=name,
+                location=location,
+                rotation_city_id=rotation_city_id,
+                added_by_user_id=added_by_user_id,
+                walking_distance=walking_distance
+            )
             
-            # Get tag to know its value_type
-            tag = self.tag_repo.get_tag_by_id(tag_id)
-            if not tag:
-                raise ValueError(f"Tag with ID {tag_id} not found")
+            # Link categories to item
+            self.category_item_repo.add_categories_to_item(item, categories)
             
-            # Validate value matches tag's value_type
-            self._validate_value_type(value, tag.value_type)
+            # Process tags; tags are kept referenced so rendering the values'
+            # tags below is served from the session instead of the database
+            value_entries = []
+            tags = []
             
-            # Get the value_type label for repository methods (they expect strings)
-            value_type_label = tag.value_type_label
-            value_obj = self.value_repo.create_value(tag_id, value, value_type_label)
-            
-            value_ids.append(value_obj.value_id)
-        
-        # Handle new tags
-        for new_tag in new_tags:
-            tag_name = new_tag['name']
-            value_type = new_tag['value_type']
-            value = new_tag['value']
+            # Handle existing tags
+            for existing_tag in existing_tags:
+                tag = tags_by_id[existing_tag['tag_id']]
+                value = existing_tag['value']
+                
+                # Validate value matches tag's value_type
+                self._validate_value_type(value, tag.value_type)
+                
+                # Get the value_type label for repository methods (they expect strings)
+                value_entries.append((tag.tag_id, tag.value_type_label, value))
+                tags.append(tag)
             
-            # Validate value matches specified value_type
-            self._validate_value_type(value, value_type)
+            # Handle new tags
+            for new_tag in new_tags:
+                tag_name = new_tag['name']
+                value_type = new_tag['value_type']
+                value = new_tag['value']
+                
+                # Validate value matches specified value_type
+                self._validate_value_type(value, value_type)
+                
+                # Create new tag
+                tag = self.tag_repo.create_tag(tag_name, value_type)
+                self.tag_loader.prime(tag)
+                value_entries.append((tag.tag_id, value_type, value))
+                tags.append(tag)
             
-            # Check if tag name already exists
-            existing_tag = self.tag_repo.get_tag_by_name(tag_name)
-            if existing_tag:
-                raise ValueError(
-                    f"Tag '{tag_name}' already exists. "
-                    f"Use existing_tags with tag_id {existing_tag.tag_id} instead."
-                )
+            # Reuse the interned values (one lookup for all tags), then link them
+            if value_entries:
+                values = self.value_repo.get_or_create_values(value_entries)
+                self.item_tag_value_repo.add_tag_values_to_item(item, values)
             
-            # Create new tag
-            tag = self.tag_repo.create_tag(tag_name, value_type)
+            # Store the rendered document so reads can skip the ORM graph
+            item = self._transform_item_for_response(item)
+            self.item_document_repo.save_documents(
+                {item.item_id: self._render_item_document(item)}
+            )
+            self.search_index_repo.index_items([item.item_id])
             
-            # Create value for the new tag
-            value_obj = self.value_repo.create_value(tag.tag_id, value, value_type)
-            value_ids.append(value_obj.value_id)
-        
-        # Link tag values to item
-        if value_ids:
-            self.item_tag_value_repo.add_tag_values_to_item(item.item_id, value_ids)
-        
-        # Reload item with all relationships for response
-        return self.get_item_by_id_with_details(item.item_id, rotation_city_id)
+            # Move readers of this city's feed (and of new values/tags) to new versions
+            changed_scopes = [
+                DataVersion.city_items_scope(rotation_city_id),
+                DataVersion.ITEMS,
+                DataVersion.VALUES
+            ]
+            if new_tags:
+                changed_scopes.append(DataVersion.TAGS)
+            self.data_version_repo.bump_versions(changed_scopes)
+        return item
 
-    def _validate_categories(self, category_ids: list[int]) -> None:
-        """Validate all category IDs exist."""
-        categories = self.category_repo.get_categories_by_ids(category_ids)
-        found_ids = {cat.category_id for cat in categories}
-        missing_ids = set(category_ids) - found_ids
+    def _validate_categories(self, category_ids: list[int]) -> list:
+        """Validate all category IDs exist.
+        
+        Returns:
+            The Category objects, in the order of category_ids
+        """
+        categories = self.category_loader.load_many(category_ids)
+        missing_ids = {
+            category_id
+            for category_id, category in zip(category_ids, categories)
+            if category is None
+        }
         
         if missing_ids:
             raise ValueError(f"Categories not found: {sorted(missing_ids)}")
+        return categories
 
-    def _validate_tags(self, existing_tags: list[dict], new_tags: list[dict]) -> None:
-        """Validate tag data structure and uniqueness."""
+    def _validate_tags(self, existing_tags: list[dict], new_tags: list[dict]) -> dict:
+        """Validate tag data structure and uniqueness.
+        
+        Existing tags are fetched with one query, and so are any tags
+        already using the new tag names.
+        
+        Returns:
+            Mapping of tag_id to Tag for the existing tags referenced
+        """
+        tags_by_id = {}
+        tag_loader = self.tag_loader
+        tag_loader.want(tag['tag_id'] for tag in existing_tags if tag.get('tag_id'))
+        
         # Validate existing tags reference valid tag IDs
         for existing_tag in existing_tags:
             tag_id = existing_tag.get('tag_id')
             if not tag_id:
                 raise ValueError("existing_tags must include tag_id")
             
-            tag = self.tag_repo.get_tag_by_id(tag_id)
+            tag = tag_loader.load(tag_id)
             if not tag:
                 raise ValueError(f"Tag with ID {tag_id} not found")
+            tags_by_id[tag_id] = tag
         
         # Check for duplicate tag names in new_tags
         new_tag_names = [tag['name'].lower() for tag in new_tags]
         if len(new_tag_names) != len(set(new_tag_names)):
             raise ValueError("Duplicate tag names in new_tags are not allowed")
+        
+        # Check that no new tag name is taken
+        if new_tags:
+            taken = self.tag_repo.get_tags_by_names([tag['name'] for tag in new_tags])
+            if taken:
+                raise ValueError(
+                    f"Tag '{taken[0].name}' already exists. "
+                    f"Use existing_tags with tag_id {taken[0].tag_id} instead."
+                )
+        return tags_by_id
 
     def _validate_value_type(self, value: Union[bool, str, float], value_type: Union[int, str]) -> None:
         """Validate that value matches the expected value_type.
@@ -194,6 +290,167 @@ class ItemService:
             if not isinstance(value, (int, float)):
                 raise ValueError(f"Value must be numeric for value_type 'numeric', got {type(value).__name__}")
 
+    def update_item(
+        self,
+        item_id: int,
+        rotation_city_id: int,
+        user_id: int,
+        fields: Optional[dict] = None,
+        category_ids: Optional[list[int]] = None,
+        existing_tags: Optional[list[dict]] = None,
+        new_tags: Optional[list[dict]] = None
+    ) -> str:
+        """
+        Partially update an item, writing only what changed.
+        
+        Only the user who added the item may edit it. Current category and tag value links are diffed against the
+        requested ones and only the difference is inserted or deleted, in
+        one transaction. Tag values are resolved to their interned rows.
+        The stored document is patched in place rather than re-rendered
+        from the whole item graph.
+        
+        Args:
+            item_id: ID of the item to update
+            rotation_city_id: City the item must belong to
+            user_id: ID of the user editing the item
+            fields: New column values (name, location, walking_distance)
+            category_ids: The item's categories, or None to keep them
+            existing_tags: Existing tags with values; when this or new_tags
+                is given, the item's tags become exactly those listed
+            new_tags: Tags to create, with name, value_type and value
+            
+        Returns:
+            The item's updated JSON document
+            
+        Raises:
+            ItemNotFoundError: If the item is not in the rotation city
+            ItemEditForbiddenError: If the user did not add the item
+            ValueError: If validation fails
+        """
+        # Imported here: the api package imports this service at load time
+        from app.api.v1.schemas.item_schema import CategoryNested, TagWithValue
+
+        item = self.item_repo.get_item_by_id(item_id, rotation_city_id)
+        if not item:
+            raise ItemNotFoundError(f"Item with ID {item_id} not found in your rotation city")
+        if int(item.added_by_user_id) != int(user_id):
+            raise ItemEditForbiddenError("Only the user who added an item can edit it")
+        
+        fields = {
+            column: value for column, value in (fields or {}).items()
+            if getattr(item, column) != value
+        }
+        categories = None
+        if category_ids is not None:
+            categories = self._validate_categories(category_ids)
+        replace_tags = existing_tags is not None or new_tags is not None
+        if replace_tags:
+            existing_tags = existing_tags or []
+            new_tags = new_tags or []
+            tags_by_id = self._validate_tags(existing_tags, new_tags)
+            for existing_tag in existing_tags:
+                self._validate_value_type(
+                    existing_tag['value'], tags_by_id[existing_tag['tag_id']].value_type
+                )
+            for new_tag in new_tags:
+                self._validate_value_type(new_tag['value'], new_tag['value_type'])
+        
+        row = self.item_document_repo.get_document(item_id, rotation_city_id)
+        document = current_app.json.loads(row.document) if row.document is not None else None
+        
+        with UnitOfWork(expire_on_commit=False):
+            if fields:
+                self.item_repo.update_item(item, fields)
+            
+            added_categories = []
+            categories_changed = False
+            wanted_category_ids = set()
+            if categories is not None:
+                current_ids = self.category_item_repo.get_category_ids_by_item(item_id)
+                current_category_ids = set(current_ids)
+                wanted_category_ids = {category.category_id for category in categories}
+                removed_ids = [
+                    category_id for category_id in current_ids
+                    if category_id not in wanted_category_ids
+                ]
+                added_categories = [
+                    category for category in categories
+                    if category.category_id not in current_category_ids
+                ]
+                self.category_item_repo.delete_links(item_id, removed_ids)
+                self.category_item_repo.insert_links(
+                    [(item_id, category.category_id) for category in added_categories]
+                )
+                categories_changed = bool(removed_ids or added_categories)
+            
+            added_tags = []
+            kept_tag_ids = set()
+            tags_changed = False
+            if replace_tags:
+                tags = [tags_by_id[existing_tag['tag_id']] for existing_tag in existing_tags]
+                entries = [
+                    (tag.tag_id, tag.value_type_label, existing_tag['value'])
+                    for tag, existing_tag in zip(tags, existing_tags)
+                ]
+                for new_tag in new_tags:
+                    tag = self.tag_repo.create_tag(new_tag['name'], new_tag['value_type'])
+                    self.tag_loader.prime(tag)
+                    tags.append(tag)
+                    entries.append((tag.tag_id, new_tag['value_type'], new_tag['value']))
+                values = self.value_repo.get_or_create_values(entries) if entries else []
+                
+                current_ids = set(self.item_tag_value_repo.get_value_ids_by_item(item_id))
+                wanted_ids = {value.value_id for value in values}
+                removed_ids = list(current_ids - wanted_ids)
+                added_tags = [
+                    (tag, value) for tag, value in zip(tags, values) if value.value_id not in current_ids
+                ]
+                kept_tag_ids = {
+                    value.tag_id for value in values if value.value_id in current_ids
+                }
+                self.item_tag_value_repo.delete_links(item_id, removed_ids)
+                self.item_tag_value_repo.insert_links(
+                    [(item_id, value.value_id) for _, value in added_tags]
+                )
+                tags_changed = bool(removed_ids or added_tags)
+            
+            if not (fields or categories_changed or tags_changed):
+                return self._fill_missing_documents([row])[0]
+            
+            if document is None:
+                return self.refresh_item_documents([item_id])[item_id]
+            
+            # Patch the stored document; new links sort after the kept ones,
+            # matching the order a full re-render would produce
+            document.update(fields)
+            if categories_changed:
+                document['categories'] = [
+                    category for category in document['categories']
+                    if category['category_id'] in wanted_category_ids
+                ] + [
+                    CategoryNested.model_validate(category).model_dump()
+                    for category in added_categories
+                ]
+            if tags_changed:
+                document['tags'] = [
+                    tag for tag in document['tags'] if tag['tag_id'] in kept_tag_ids
+                ] + [
+                    TagWithValue(**self._tag_with_value(tag, value)).model_dump()
+                    for tag, value in added_tags
+                ]
+            document = current_app.json.dumps(document)
+            self.item_document_repo.save_documents({item_id: document})
+            if 'name' in fields or 'location' in fields or tags_changed:
+                self.search_index_repo.index_items([item_id])
+            
+            changed_scopes = [DataVersion.city_items_scope(rotation_city_id), DataVersion.ITEMS]
+            if tags_changed:
+                changed_scopes.append(DataVersion.VALUES)
+            if new_tags:
+                changed_scopes.append(DataVersion.TAGS)
+            self.data_version_repo.bump_versions(changed_scopes)
+        return document
+
     def get_all_items(self, rotation_city_id: int) -> list[Item]:
         """
         Get all items from specific rotation city.
@@ -225,63 +482,164 @@ class ItemService:
             raise ValueError(f"Item with ID {item_id} not found in your rotation city")
         return item
 
-    def _transform_item_for_response(self, item: Item) -> Item:
+    def _transform_item_for_response(
+        self,
+        item: Item,
+        fieldset: Optional[Fieldset] = None
+    ) -> Item:
         """
         Transform item by adding computed properties for API response.
         
         Args:
             item: Item object with relationships loaded
+            fieldset: Optional sparse fieldset; unrequested computed
+                properties are skipped since their relationships are not loaded
             
         Returns:
             Same item object with categories and tags properties added
         """
-        # Transform category_items to categories list
-        item.categories = [ci.category for ci in item.category_items]
+        if fieldset is not None and not fieldset.wants('categories'):
+            item.categories = []
+        else:
+            # Transform category_items to categories list
+            item.categories = [ci.category for ci in item.category_items]
+        
+        if fieldset is not None and not fieldset.wants('tags'):
+            item.tags = []
+            return item
         
         # Transform item_tag_values to tags list with tag info + values
         tags = []
         for itv in item.item_tag_values:
             if itv.value and itv.value.tag:
-                tag_dict = {
-                    'tag_id': itv.value.tag.tag_id,
-                    'name': itv.value.tag.name,
-                    'value_type': itv.value.tag.value_type_label,
-                }
-                
-                # Get the actual value based on value_type (using correct field names)
-                value_type_label = itv.value.tag.value_type_label
-                if value_type_label == 'boolean':
-                    tag_dict['value'] = itv.value.boolean_val
-                elif value_type_label == 'text':
-                    tag_dict['value'] = itv.value.name_val
-                elif value_type_label == 'numeric':
-                    tag_dict['value'] = itv.value.numerical_value
-                
-                tags.append(tag_dict)
+                tags.append(self._tag_with_value(itv.value.tag, itv.value))
         
         item.tags = tags
         return item
 
-    def get_all_items_with_details(self, rotation_city_id: int) -> list[Item]:
+    @staticmethod
+    def _tag_with_value(tag, value) -> dict:
+        """Render a tag and one of its values as listed in an item's tags."""
+        tag_dict = {
+            'tag_id': tag.tag_id,
+            'name': tag.name,
+            'value_type': tag.value_type_label,
+        }
+        
+        # Get the actual value based on value_type (using correct field names)
+        value_type_label = tag.value_type_label
+        if value_type_label == 'boolean':
+            tag_dict['value'] = value.boolean_val
+        elif value_type_label == 'text':
+            tag_dict['value'] = value.name_val
+        elif value_type_label == 'numeric':
+            tag_dict['value'] = value.numerical_value
+        return tag_dict
+
+    def get_all_items_with_details(
+        self,
+        rotation_city_id: int,
+        strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN,
+        fieldset: Optional[Fieldset] = None,
+        filters: Optional[ItemFilters] = None,
+        sort: ItemSort = ItemSort.NEWEST
+    ) -> list[Item]:
         """
         Get all items from rotation city with full relationship data.
         
         Args:
             rotation_city_id: ID of the rotation city to filter by
+            strategy: Relationship loader strategy for the repository query
+            fieldset: Optional sparse fieldset limiting what is loaded
+            filters: Optional conditions items must satisfy
+            sort: Feed order
         
         Returns:
             List of Item objects with relationships loaded and transformed
         """
-        items = self.item_repo.get_all_items_with_details(rotation_city_id)
-        return [self._transform_item_for_response(item) for item in items]
+        items = self.item_repo.get_all_items_with_details(
+            rotation_city_id, strategy=strategy, fieldset=fieldset, filters=filters, sort=sort
+        )
+        return [self._transform_item_for_response(item, fieldset) for item in items]
+
+    def get_items_page(
+        self,
+        rotation_city_id: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        strategy: ItemLoadStrategy = ItemLoadStrategy.TWO_PHASE,
+        fieldset: Optional[Fieldset] = None,
+        filters: Optional[ItemFilters] = None,
+        sort: ItemSort = ItemSort.NEWEST
+    ) -> tuple[list[Item], Optional[str]]:
+        """
+        Get one page of the rotation city item feed using keyset pagination.
+
+        Fetches one extra row to detect whether another page exists, so the
+        cost of a page does not depend on how many items the city has.
+
+        Args:
+            rotation_city_id: ID of the rotation city to filter by
+            limit: Maximum number of items on the page
+            cursor: Opaque cursor returned with the previous page
+            strategy: Relationship loader strategy for the repository query
+            fieldset: Optional sparse fieldset limiting what is loaded
+            filters: Optional conditions items must satisfy
+            sort: Feed order; cursors are only valid for the order that
+                produced them
+
+        Returns:
+            Tuple of (transformed items, next_cursor or None on the last page)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        items = self.item_repo.get_all_items_with_details(
+            rotation_city_id,
+            limit=limit + 1,
+            cursor=self._decode_feed_cursor(cursor, sort),
+            strategy=strategy,
+            fieldset=fieldset,
+            filters=filters,
+            sort=sort
+        )
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = self._encode_feed_cursor(items[-1], sort)
+
+        items = [self._transform_item_for_response(item, fieldset) for item in items]
+        return items, next_cursor
 
-    def get_item_by_id_with_details(self, item_id: int, rotation_city_id: int) -> Item:
+    @staticmethod
+    def _decode_feed_cursor(cursor: Optional[str], sort: ItemSort) -> Optional[tuple]:
+        """Decode a feed cursor into the (sort key, item_id) of its order."""
+        if not cursor:
+            return None
+        return decode_cursor(cursor, float if sort is ItemSort.FRESHNESS else datetime)
+
+    @staticmethod
+    def _encode_feed_cursor(last, sort: ItemSort) -> str:
+        """Cursor of the feed page ending with an item or document row."""
+        key = last.freshness if sort is ItemSort.FRESHNESS else last.created_at
+        return encode_cursor(key, last.item_id)
+
+    def get_item_by_id_with_details(
+        self,
+        item_id: int,
+        rotation_city_id: int,
+        strategy: ItemLoadStrategy = ItemLoadStrategy.JOINED,
+        fieldset: Optional[Fieldset] = None
+    ) -> Item:
         """
         Get item by ID with full relationship data (must belong to rotation city).
         
         Args:
             item_id: ID of the item to retrieve
             rotation_city_id: ID of the rotation city to filter by
+            strategy: Relationship loader strategy for the repository query
+            fieldset: Optional sparse fieldset limiting what is loaded
             
         Returns:
             Item object with relationships loaded and transformed
@@ -289,23 +647,32 @@ class ItemService:
         Raises:
             ValueError: If item not found or doesn't belong to the rotation city
         """
-        item = self.item_repo.get_item_by_id_with_details(item_id, rotation_city_id)
+        item = self.item_repo.get_item_by_id_with_details(
+            item_id, rotation_city_id, strategy=strategy, fieldset=fieldset
+        )
         if not item:
             raise ValueError(f"Item with ID {item_id} not found in your rotation city")
-        return self._transform_item_for_response(item)
+        return self._transform_item_for_response(item, fieldset)
 
-    def get_user_items(self, user_id: int) -> list[Item]:
+    def get_user_items(
+        self,
+        user_id: int,
+        strategy: ItemLoadStrategy = ItemLoadStrategy.SELECTIN,
+        fieldset: Optional[Fieldset] = None
+    ) -> list[Item]:
         """
         Get all items added by a specific user.
         
         Args:
             user_id: ID of the user who added the items
+            strategy: Relationship loader strategy for the repository query
+            fieldset: Optional sparse fieldset limiting what is loaded
             
         Returns:
             List of Item objects with relationships loaded and transformed
         """
-        items = self.item_repo.get_items_by_user(user_id)
-        return [self._transform_item_for_response(item) for item in items]
+        items = self.item_repo.get_items_by_user(user_id, strategy=strategy, fieldset=fieldset)
+        return [self._transform_item_for_response(item, fieldset) for item in items]
         """
         Get all items.
         
@@ -314,6 +681,407 @@ class ItemService:
         """
         return self.item_repo.get_all_items()
 
+    def refresh_item_documents(
+        self,
+        item_ids: list[int],
+        bump_versions: bool = True
+    ) -> dict[int, str]:
+        """
+        Rebuild the stored JSON documents of the given items.
+        
+        Must be called by every write path that changes what an item
+        renders as (its columns, categories, tag values, city or author).
+        Also updates the items' search index entries and bumps the feed
+        version of every affected city so cached feeds are no longer served.
+        
+        Args:
+            item_ids: IDs of the items whose documents are stale
+            bump_versions: False when only filling in missing documents,
+                which does not change what readers see
+            
+        Returns:
+            Mapping of item_id to the freshly rendered document
+        """
+        items = self.item_repo.get_items_by_ids_with_details(list(set(item_ids)))
+        documents = {
+            item.item_id: self._render_item_document(self._transform_item_for_response(item))
+            for item in items
+        }
+        self.item_document_repo.save_documents(documents)
+        self.search_index_repo.index_items(item_ids)
+        if bump_versions and items:
+            self.data_version_repo.bump_versions(
+                [DataVersion.ITEMS] + [
+                    DataVersion.city_items_scope(item.rotation_city_id) for item in items
+                ]
+            )
+        return documents
+
+    def delete_item(self, item_id: int) -> bool:
+        """
+        Delete an item with its categories, tag values, verifications and document.
+        
+        The dependent rows go with the item through ON DELETE CASCADE, so
+        nothing is loaded into the session.
+        
+        Args:
+            item_id: ID of the item to delete
+            
+        Returns:
+            True if the item existed and was deleted
+        """
+        item_cities = self.item_repo.get_item_city_ids([item_id])
+        if not item_cities:
+            return False
+        with UnitOfWork():
+            self.item_repo.delete_item(item_id)
+            self.remove_deleted_items(item_cities)
+        return True
+
+    def remove_deleted_items(self, item_cities: dict[int, int]) -> None:
+        """
+        Drop deleted items from the search index and invalidate their feeds.
+        
+        Args:
+            item_cities: Mapping of each deleted item's ID to its rotation
+                city ID, read before the delete
+        """
+        if not item_cities:
+            return
+        self.search_index_repo.index_items(list(item_cities))
+        self.data_version_repo.bump_versions(
+            [DataVersion.ITEMS] + [
+                DataVersion.city_items_scope(rotation_city_id)
+                for rotation_city_id in set(item_cities.values())
+            ]
+        )
+
+    def remove_city_items(self, rotation_city_id: int) -> None:
+        """
+        Drop every item of a deleted city from the search index and feeds.
+        
+        Args:
+            rotation_city_id: ID of the deleted rotation city
+        """
+        self.search_index_repo.remove_city_items(rotation_city_id)
+        self.data_version_repo.bump_versions(
+            [DataVersion.ITEMS, DataVersion.city_items_scope(rotation_city_id)]
+        )
+
+    def recount_verifications(self, item_ids: list[int]) -> None:
+        """
+        Recount the verifications of items that lost some, and refresh them.
+        
+        Their counters, daily counts, last_verified_date and freshness are
+        recomputed from the verifications that remain.
+        
+        Args:
+            item_ids: IDs of items whose verifications were deleted
+        """
+        if not item_ids:
+            return
+        self.daily_count_repo.rebuild(item_ids)
+        self.item_repo.reconcile_verification_counts(item_ids)
+        self.item_repo.backfill_freshness(item_ids)
+        self.refresh_item_documents(item_ids)
+
+    def backfill_freshness(self) -> int:
+        """
+        Recompute every item's last_verified_date and freshness.
+        
+        One set-based pass over the verifications, for databases from
+        before freshness was maintained or after changing the half-life.
+        Every city's feed version is bumped since freshness order changed;
+        documents keep their old last_verified_date until rebuilt.
+        
+        Returns:
+            Number of items updated
+        """
+        with UnitOfWork():
+            updated = self.item_repo.backfill_freshness()
+            self.data_version_repo.bump_versions(
+                [DataVersion.ITEMS] + [
+                    DataVersion.city_items_scope(city_id)
+                    for city_id in self.item_repo.get_rotation_city_ids()
+                ]
+            )
+        return updated
+
+    def refresh_value_item_documents(self, value_id: int) -> None:
+        """
+        Rebuild the documents of every item that uses a tag value.
+        
+        Args:
+            value_id: ID of the value that was changed
+        """
+        item_ids = self.item_tag_value_repo.get_item_ids_by_value(value_id)
+        if item_ids:
+            self.refresh_item_documents(item_ids)
+
+    def refresh_user_item_documents(self, user_id: int) -> None:
+        """
+        Rebuild the documents of every item added by a user.
+        
+        Args:
+            user_id: ID of the user whose embedded profile changed
+        """
+        item_ids = self.item_repo.get_item_ids_by_user(user_id)
+        if item_ids:
+            self.refresh_item_documents(item_ids)
+
+    def get_item_documents(
+        self,
+        rotation_city_id: int,
+        filters: Optional[ItemFilters] = None,
+        sort: ItemSort = ItemSort.NEWEST
+    ) -> list[str]:
+        """
+        Get the rendered JSON documents of all items in a rotation city.
+        
+        Args:
+            rotation_city_id: ID of the rotation city to filter by
+            filters: Optional conditions items must satisfy
+            sort: Feed order
+            
+        Returns:
+            List of item JSON documents in feed order
+        """
+        documents, _ = self._cached_feed(
+            rotation_city_id,
+            ('all', filters, sort),
+            lambda: (self._fill_missing_documents(
+                self.item_document_repo.get_city_documents(
+                    rotation_city_id, filters=filters, sort=sort
+                )
+            ), None)
+        )
+        return list(documents)
+
+    def get_item_documents_page(
+        self,
+        rotation_city_id: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        filters: Optional[ItemFilters] = None,
+        sort: ItemSort = ItemSort.NEWEST
+    ) -> tuple[list[str], Optional[str]]:
+        """
+        Get one keyset page of rendered item documents for a rotation city.
+        
+        Args:
+            rotation_city_id: ID of the rotation city to filter by
+            limit: Maximum number of items on the page
+            cursor: Opaque cursor returned with the previous page
+            filters: Optional conditions items must satisfy
+            sort: Feed order; cursors are only valid for the order that
+                produced them
+            
+        Returns:
+            Tuple of (item JSON documents, next_cursor or None on the last page)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        position = self._decode_feed_cursor(cursor, sort)
+
+        def load_page():
+            rows = self.item_document_repo.get_city_documents(
+                rotation_city_id, limit=limit + 1, cursor=position, filters=filters, sort=sort
+            )
+            next_cursor = None
+            if len(rows) > limit:
+                rows = rows[:limit]
+                next_cursor = self._encode_feed_cursor(rows[-1], sort)
+            return self._fill_missing_documents(rows), next_cursor
+
+        documents, next_cursor = self._cached_feed(
+            rotation_city_id, ('page', limit, position, filters, sort), load_page
+        )
+        return list(documents), next_cursor
+
+    def _cached_feed(self, rotation_city_id: int, variant: tuple, load) -> tuple:
+        """
+        Serve a city feed result from the response cache, keyed by city version.
+        
+        Args:
+            rotation_city_id: ID of the rotation city
+            variant: Hashable description of which slice of the feed is wanted
+            load: Callable returning (documents, next_cursor) on a cache miss
+            
+        Returns:
+            Tuple of (documents, next_cursor)
+        """
+        def load_result():
+            documents, next_cursor = load()
+            return (tuple(documents), next_cursor)
+
+        return self._cached_for_city(
+            rotation_city_id,
+            ('item_feed',) + variant,
+            load_result,
+            lambda result: sum(len(doc) for doc in result[0])
+        )
+
+    def _cached_for_city(self, rotation_city_id: int, key: tuple, load, size):
+        """
+        Serve a result derived from a city's items from the response cache.
+        
+        The key embeds the city's current items version, so any write that
+        bumps it makes older entries unreachable; they are then evicted by
+        the LRU policy.
+        
+        Args:
+            rotation_city_id: ID of the rotation city
+            key: Hashable description of the result
+            load: Callable computing the result on a cache miss
+            size: Callable estimating the cached size of a result in bytes
+            
+        Returns:
+            The cached or freshly loaded result
+        """
+        cache = current_app.extensions['response_cache']
+        version = self.data_version_repo.get_version(
+            DataVersion.city_items_scope(rotation_city_id)
+        )
+        key = (rotation_city_id, version) + key
+
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = load()
+        cache.set(key, result, size=size(result) or 1)
+        return result
+
+    def get_item_facets(
+        self,
+        rotation_city_id: int,
+        filters: Optional[ItemFilters] = None
+    ) -> str:
+        """
+        Get category and tag value counts over a rotation city's items.
+        
+        Counts are computed by grouped aggregate queries over the items
+        matching filters, so they describe exactly the filtered feed.
+        
+        Args:
+            rotation_city_id: ID of the rotation city to count in
+            filters: Optional conditions items must satisfy
+            
+        Returns:
+            Rendered ItemFacetsResponse JSON document
+        """
+        return self._cached_for_city(
+            rotation_city_id,
+            ('item_facets', filters),
+            lambda: self._render_item_facets(rotation_city_id, filters),
+            len
+        )
+
+    def _render_item_facets(self, rotation_city_id: int, filters: Optional[ItemFilters]) -> str:
+        """Run the facet aggregates and render them as JSON."""
+        # Imported here: the api package imports this service at load time
+        from app.api.v1.schemas.item_schema import ItemFacetsResponse
+
+        tags = {}
+        for row in self.item_repo.get_tag_value_counts(rotation_city_id, filters):
+            value_type = TagValueType.from_code(row.value_type)
+            value = {
+                TagValueType.BOOLEAN: row.boolean_val,
+                TagValueType.TEXT: row.name_val,
+                TagValueType.NUMERIC: row.numerical_value
+            }[value_type]
+            if value is None:
+                continue
+            tag = tags.setdefault(row.tag_id, {
+                'tag_id': row.tag_id,
+                'name': row.name,
+                'value_type': value_type.label,
+                'values': []
+            })
+            tag['values'].append({'value': value, 'count': row.count})
+
+        facets = ItemFacetsResponse(
+            total=self.item_repo.count_items(rotation_city_id, filters),
+            categories=[
+                {'category_id': row.category_id, 'name': row.category_name, 'count': row.count}
+                for row in self.item_repo.get_category_counts(rotation_city_id, filters)
+            ],
+            tags=list(tags.values())
+        )
+        return current_app.json.dumps(facets.model_dump())
+
+    def get_item_document(self, item_id: int, rotation_city_id: int) -> str:
+        """
+        Get the rendered JSON document of one item in a rotation city.
+        
+        Args:
+            item_id: ID of the item to retrieve
+            rotation_city_id: ID of the rotation city to filter by
+            
+        Returns:
+            Item JSON document
+            
+        Raises:
+            ValueError: If item not found or doesn't belong to the rotation city
+        """
+        row = self.item_document_repo.get_document(item_id, rotation_city_id)
+        if not row:
+            raise ValueError(f"Item with ID {item_id} not found in your rotation city")
+        return self._fill_missing_documents([row])[0]
+
+    def get_user_item_documents(self, user_id: int) -> list[str]:
+        """
+        Get the rendered JSON documents of all items added by a user.
+        
+        Args:
+            user_id: ID of the user who added the items
+            
+        Returns:
+            List of item JSON documents, newest first
+        """
+        rows = self.item_document_repo.get_user_documents(user_id)
+        return self._fill_missing_documents(rows)
+
+    def search_item_documents(
+        self,
+        rotation_city_id: int,
+        query: str,
+        limit: int = 20
+    ) -> list[str]:
+        """
+        Full-text search the items of a rotation city.
+        
+        Matches item name, location and text tag values; results are ranked
+        by relevance blended with the number of verifications.
+        
+        Args:
+            rotation_city_id: ID of the rotation city to search in
+            query: Search text (every word must match, as a prefix)
+            limit: Maximum number of results
+            
+        Returns:
+            List of item JSON documents, best match first
+        """
+        item_ids = self.search_index_repo.search_items(rotation_city_id, query, limit)
+        rows = {row.item_id: row for row in self.item_document_repo.get_documents(item_ids)}
+        return self._fill_missing_documents([rows[i] for i in item_ids if i in rows])
+
+    def _fill_missing_documents(self, rows: list) -> list[str]:
+        """Return documents for (item_id, created_at, document) rows, building any missing ones."""
+        missing_ids = [row.item_id for row in rows if row.document is None]
+        built = (
+            self.refresh_item_documents(missing_ids, bump_versions=False)
+            if missing_ids else {}
+        )
+        return [row.document if row.document is not None else built[row.item_id] for row in rows]
+
+    def _render_item_document(self, item: Item) -> str:
+        """Render a transformed item exactly as the API serializes it."""
+        # Imported here: the api package imports this service at load time
+        from app.api.v1.schemas.item_schema import ItemResponse
+        return current_app.json.dumps(ItemResponse.model_validate(item).model_dump())
+
     def get_item_by_id(self, item_id: int) -> Item:
         """
         Get item by ID.
@@ -1,9 +1,17 @@
 """Rotation city service for business logic"""
 from typing import Optional, List
+from app.models.data_version import DataVersion
 from app.models.rotation_city import RotationCity
 from app.repositories.implementations.rotation_city_repository import (
     RotationCityRepository
 )
+from app.repositories.implementations.data_version_repository import DataVersionRepository
+from app.repositories.implementations.item_repository import ItemRepository
+from app.repositories.implementations.item_verification_repository import (
+    ItemVerificationRepository
+)
+from app.repositories.unit_of_work import UnitOfWork
+from app.services.item_service import ItemService
 
 
 class RotationCityService:
@@ -14,16 +22,28 @@ class RotationCityService:
 
     def __init__(
         self,
-        rotation_city_repository: RotationCityRepository = None
+        rotation_city_repository: RotationCityRepository = None,
+        item_repository: ItemRepository = None,
+        item_verification_repository: ItemVerificationRepository = None,
+        data_version_repository: DataVersionRepository = None,
+        item_service: ItemService = None
     ):
         """Initialize service with optional dependency injection.
         
         Args:
             rotation_city_repository: Optional RotationCityRepository instance for testing/DI
+            item_repository: Optional ItemRepository for testing/DI
+            item_verification_repository: Optional ItemVerificationRepository for testing/DI
+            data_version_repository: Optional DataVersionRepository for testing/DI
+            item_service: Optional ItemService keeping item read models in step
         """
         self.rotation_city_repo = (
             rotation_city_repository or RotationCityRepository()
         )
+        self.item_repo = item_repository or ItemRepository()
+        self.item_verification_repo = item_verification_repository or ItemVerificationRepository()
+        self.data_version_repo = data_version_repository or DataVersionRepository()
+        self.item_service = item_service or ItemService()
 
     def get_rotation_city(self, city_id: int) -> Optional[RotationCity]:
         """Retrieve a rotation city by its ID.
@@ -54,3 +74,38 @@ class RotationCityService:
             RotationCity object if found, None otherwise
         """
         return self.rotation_city_repo.get_rotation_city_by_name(name)
+
+    def delete_rotation_city(self, city_id: int) -> bool:
+        """Delete a retired rotation city with all of its users and items.
+        
+        The database cascades the delete to users, items and everything
+        depending on them, so this is a handful of statements however big
+        the city is. The few items outside the city that its users added
+        or verified are cleaned up afterwards.
+        
+        Args:
+            city_id: The ID of the rotation city to delete
+            
+        Returns:
+            True if the city existed and was deleted
+        """
+        if not self.rotation_city_repo.check_city_exists(city_id):
+            return False
+
+        with UnitOfWork():
+            # Read before the delete: other cities' items the users touched
+            added_elsewhere = self.item_repo.get_item_city_ids(
+                self.item_repo.get_item_ids_added_outside_city(city_id)
+            )
+            verified_elsewhere = [
+                item_id
+                for item_id in self.item_verification_repo.get_item_ids_verified_outside_city(city_id)
+                if item_id not in added_elsewhere
+            ]
+
+            self.item_service.remove_city_items(city_id)
+            self.rotation_city_repo.delete_rotation_city(city_id)
+            self.item_service.remove_deleted_items(added_elsewhere)
+            self.item_service.recount_verifications(verified_elsewhere)
+            self.data_version_repo.bump_versions([DataVersion.ROTATION_CITIES])
+        return True
@@ -1,8 +1,18 @@
+from operator import attrgetter
 from typing import Optional, List
 
 from app.repositories.implementations.user_repository import UserRepository
+from app.repositories.loaders import DataLoader, get_loader
 from app.repositories.implementations.rotation_city_repository import RotationCityRepository
+from app.repositories.implementations.item_repository import ItemRepository
+from app.repositories.implementations.item_verification_repository import (
+    ItemVerificationRepository
+)
+from app.repositories.unit_of_work import UnitOfWork
+from app.services.blob_service import BlobService
+from app.services.item_service import ItemService
 from app.models.user import User
+from app.utils.fieldsets import Fieldset
 
 class UserService:
     """Service for user-related operations.
@@ -14,27 +24,52 @@ class UserService:
     def __init__(
             self,
             user_repository: UserRepository = None,
-            rotation_city_repository: RotationCityRepository = None
+            rotation_city_repository: RotationCityRepository = None,
+            item_service: ItemService = None,
+            blob_service: BlobService = None,
+            item_repository: ItemRepository = None,
+            item_verification_repository: ItemVerificationRepository = None
         ):
         """Initialize service with optional dependency injection.
         
         Args:
             user_repository: Optional UserRepository instance for testing/DI
             rotation_city_repository: Optional RotationCityRepository for city validation
+            item_service: Optional ItemService used to refresh item documents
+            blob_service: Optional BlobService storing profile pictures
+            item_repository: Optional ItemRepository for testing/DI
+            item_verification_repository: Optional ItemVerificationRepository for testing/DI
         """
         self.user_repository = user_repository or UserRepository()
         self.rotation_city_repository = rotation_city_repository or RotationCityRepository()
+        self.item_service = item_service or ItemService()
+        self.blob_service = blob_service or BlobService()
+        self.item_repository = item_repository or ItemRepository()
+        self.item_verification_repository = (
+            item_verification_repository or ItemVerificationRepository()
+        )
 
-    def get_user_by_id(self, user_id: int) -> Optional[User]:
+    @property
+    def user_loader(self) -> DataLoader:
+        """Request-scoped batching loader of users by ID."""
+        return get_loader(self.user_repository.get_users_by_ids, attrgetter('user_id'))
+
+    def get_user_by_id(self, user_id: int, fieldset: Optional[Fieldset] = None) -> Optional[User]:
         """Retrieve a user by their ID.
         
+        Full users are served by the request's user loader, so the same
+        user (typically the authenticated one) is queried once per request.
+        
         Args:
-            user_id: The ID of the user to retrieve
+            user_id: The ID of the user to retrieve (JWT identities are strings)
+            fieldset: Optional sparse fieldset limiting the columns loaded
             
         Returns:
             User object if found, None otherwise
         """
-        return self.user_repository.get_user_by_id(user_id)
+        if fieldset is not None:
+            return self.user_repository.get_user_by_id(user_id, fieldset)
+        return self.user_loader.load(int(user_id))
 
     def get_user_by_email(self, email: str) -> Optional[User]:
         """Retrieve a user by their email address.
@@ -64,20 +99,60 @@ class UserService:
         if "rotation_city_id" in data:
             data["rotation_city_id"] = \
                 self.rotation_city_repository.validate_city_id(data["rotation_city_id"])
+        
+        if "profile_picture" in data:
+            data["profile_picture"] = self.blob_service.store_image(data["profile_picture"])
             
         self.user_repository.update(user_id, **data)
+        
+        # Items embed their author's profile, so their documents are now stale
+        self.item_service.refresh_user_item_documents(user_id)
         return user
     
-    def get_verified_user_by_id(self, user_id: int) -> Optional[User]:
+    def delete_user(self, user_id: int) -> bool:
+        """Delete a user with the items they added and their verifications.
+        
+        The database cascades the delete to the user's items, verifications,
+        verification codes and idempotency keys. Items they only verified
+        get their verification counts recomputed.
+        
+        Args:
+            user_id: The ID of the user to delete
+            
+        Returns:
+            True if the user existed and was deleted
+        """
+        with UnitOfWork():
+            # Read before the delete: the items the user added or verified
+            added = self.item_repository.get_item_city_ids(
+                self.item_repository.get_item_ids_by_user(user_id)
+            )
+            verified = [
+                item_id
+                for item_id in self.item_verification_repository.get_item_ids_verified_by_user(user_id)
+                if item_id not in added
+            ]
+            if not self.user_repository.delete_user(user_id):
+                return False
+            self.item_service.remove_deleted_items(added)
+            self.item_service.recount_verifications(verified)
+        return True
+    
+    def get_verified_user_by_id(
+            self,
+            user_id: int,
+            fieldset: Optional[Fieldset] = None
+        ) -> Optional[User]:
         """Retrieve a verified user by their ID.
         
         Args:
             user_id: The ID of the user to retrieve
+            fieldset: Optional sparse fieldset limiting the columns loaded
             
         Returns:
             User object if found and verified, None otherwise
         """
-        user = self.user_repository.get_user_by_id(user_id)
+        user = self.user_repository.get_user_by_id(user_id, fieldset)
         if user and user.is_verified:
             return user
         return None
\ No newline at end of file
@@ -1,9 +1,12 @@
 """Value service for business logic."""
 from typing import List, Optional
 from app.models.value import Value
+from app.models.data_version import DataVersion
 from app.models.tag import TagValueType
 from app.repositories.implementations.value_repository import ValueRepository
 from app.repositories.implementations.tag_repository import TagRepository
+from app.repositories.implementations.data_version_repository import DataVersionRepository
+from app.services.item_service import ItemService
 
 
 class ValueService:
@@ -17,15 +20,21 @@ class ValueService:
     def __init__(
             self,
             value_repository: ValueRepository = None,
-            tag_repository: TagRepository = None
+            tag_repository: TagRepository = None,
+            item_service: ItemService = None,
+            data_version_repository: DataVersionRepository = None
     )   -> None:
         """Initialize service with optional dependency injection.
         
         Args:
             value_repository: Optional ValueRepository instance for testing/DI
+            item_service: Optional ItemService used to refresh item documents
+            data_version_repository: Optional DataVersionRepository for testing/DI
         """
         self.value_repository = value_repository or ValueRepository()
         self.tag_repository = tag_repository or TagRepository()
+        self.item_service = item_service or ItemService()
+        self.data_version_repository = data_version_repository or DataVersionRepository()
 
     def get_value_by_id(self, value_id: int) -> Optional[Value]:
         """Get value by ID.
@@ -69,10 +78,11 @@ class ValueService:
         name_val: Optional[str] = None,
         numerical_value: Optional[float] = None
     ) -> Optional[Value]:
-        """Create new value.
+        """Get or create a value of a tag.
         
         Note: This method is kept for backward compatibility.
-        Internally delegates to repository for data access.
+        Values are interned, so an existing value of the tag is returned
+        instead of a duplicate.
         
         Args:
             tag_id: ID of the tag this value belongs to
@@ -88,14 +98,18 @@ class ValueService:
         if not tag:
             return None
 
-        if tag.value_type == TagValueType.BOOLEAN and boolean_val is not None:
-            return self.value_repository.create_value(tag_id, boolean_val, TagValueType.BOOLEAN.value)
-        elif tag.value_type == TagValueType.TEXT and name_val is not None:
-            return self.value_repository.create_value(tag_id, name_val, TagValueType.TEXT.value)
-        elif tag.value_type == TagValueType.NUMERIC and numerical_value is not None:
-            return self.value_repository.create_value(tag_id, numerical_value, TagValueType.NUMERIC.value)
+        value_type = TagValueType.from_code(tag.value_type)
+        typed = {
+            TagValueType.BOOLEAN: boolean_val,
+            TagValueType.TEXT: name_val,
+            TagValueType.NUMERIC: numerical_value
+        }[value_type]
+        if typed is None:
+            return None
 
-        return None
+        value = self.value_repository.create_value(tag_id, typed, value_type.label)
+        self.data_version_repository.bump_versions([DataVersion.VALUES])
+        return value
 
     def update_value(
         self,
@@ -106,6 +120,11 @@ class ValueService:
     ) -> Optional[Value]:
         """Update an existing value.
         
+        Values are shared by all items using them, so the change applies to
+        every such item. If the tag already has the new value, the two are
+        merged: items move over to the existing value and this one is
+        deleted.
+        
         Args:
             value_id: ID of the value to update
             boolean_val: New boolean value (optional)
@@ -113,7 +132,7 @@ class ValueService:
             numerical_value: New numeric value (optional)
             
         Returns:
-            Updated Value object or None if not found
+            Updated (or merged into) Value object or None if not found
         """
         value = self.value_repository.get_value_by_id(value_id)
 
@@ -121,14 +140,33 @@ class ValueService:
             return None
 
         value_type = self.tag_repository.get_tag_by_id(value.tag_id).value_type
+        typed = {
+            TagValueType.BOOLEAN.code: boolean_val,
+            TagValueType.TEXT.code: name_val,
+            TagValueType.NUMERIC.code: numerical_value
+        }[value_type]
 
-        return self.value_repository.update_value(
+        existing = None
+        if typed is not None:
+            existing = self.value_repository.find_value(value.tag_id, value_type, typed)
+        if existing is not None and existing.value_id != value_id:
+            self.value_repository.merge_values(value_id, existing.value_id)
+            self.item_service.refresh_value_item_documents(existing.value_id)
+            self.data_version_repository.bump_versions([DataVersion.VALUES])
+            return existing
+
+        value = self.value_repository.update_value(
             value_id=value_id,
             value_type=value_type,
             boolean_val=boolean_val,
             name_val=name_val,
             numerical_value=numerical_value
         )
+
+        # Items embed their tag values, so their documents are now stale
+        self.item_service.refresh_value_item_documents(value_id)
+        self.data_version_repository.bump_versions([DataVersion.VALUES])
+        return value
     
     def find_similar_text_values(
         self,
@@ -2,12 +2,22 @@
 Item Verification Service
 Business logic for item verification operations.
 """
-from typing import Optional, Dict, Any
+from datetime import date, datetime, timedelta
+from typing import Optional, Dict, Any, List, Tuple
+from sqlalchemy.engine import Row
 from app.repositories.implementations.item_verification_repository import (
     ItemVerificationRepository
 )
 from app.repositories.implementations.item_repository import ItemRepository
-from app.models.item_verification import ItemVerification
+from app.repositories.implementations.user_repository import UserRepository
+from app.repositories.implementations.rotation_city_repository import RotationCityRepository
+from app.repositories.implementations.verification_daily_count_repository import (
+    VerificationDailyCountRepository
+)
+from app.repositories.unit_of_work import UnitOfWork
+from app.services.item_service import ItemService
+from app.utils.fieldsets import Fieldset
+from app.utils.pagination import decode_cursor, encode_cursor
 
 
 class ItemNotFoundError(Exception):
@@ -25,12 +35,25 @@ class VerificationNotFoundError(Exception):
     pass
 
 
+class RotationCityNotFoundError(Exception):
+    """Raised when a rotation city doesn't exist."""
+    pass
+
+
+# Longest range of days a trend request may cover
+MAX_TREND_DAYS = 366
+
+
 class VerificationService:
     """Service for managing item verifications."""
     
     def __init__(self):
         self.verification_repo = ItemVerificationRepository()
         self.item_repo = ItemRepository()
+        self.user_repo = UserRepository()
+        self.rotation_city_repo = RotationCityRepository()
+        self.daily_count_repo = VerificationDailyCountRepository()
+        self.item_service = ItemService()
     
     def verify_item(
         self,
@@ -69,20 +92,20 @@ class VerificationService:
                 f"You have already verified item {item_id} today"
             )
         
-        # Create verification
-        verification = self.verification_repo.create_verification(
-            user_id=user_id,
-            item_id=item_id,
-            note=note
-        )
-        
-        # Get updated verification count and update item
-        verification_count = (
-            self.verification_repo.get_verification_count_for_item(
-                item_id
+        # The verification, the item's counter, last_verified_date and
+        # freshness, its daily count and its document commit together; the
+        # counters are bumped in place instead of recounted
+        with UnitOfWork(expire_on_commit=False):
+            verification = self.verification_repo.create_verification(
+                user_id=user_id,
+                item_id=item_id,
+                note=note
             )
-        )
-        self.item_repo.update_verification_count(item_id, verification_count)
+            verification_count = self.item_repo.increment_verification_count(
+                item_id, verified_at=verification.created_at
+            )
+            self.daily_count_repo.add_verifications([item_id], verification.created_at)
+            self.item_service.refresh_item_documents([item_id])
         
         # Get user and item names
         user_name = (
@@ -102,12 +125,103 @@ class VerificationService:
             "verification_count": verification_count
         }
     
-    def get_verification(self, verification_id: int) -> Dict[str, Any]:
+    def verify_items(
+        self,
+        user_id: int,
+        entries: List[Tuple[int, Optional[str]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Verify several items at once, e.g. during a verification walk.
+        
+        Each item is checked like verify_item, but for all items together:
+        one query finds the existing items, one finds those already verified
+        today, one INSERT adds every verification, one UPDATE bumps the
+        counters and one upsert adds to the daily counts. Items that cannot
+        be verified are reported instead of failing the batch.
+        
+        Args:
+            user_id: ID of the user verifying the items
+            entries: (item_id, note) pairs
+            
+        Returns:
+            One result per entry, in order, with:
+                - item_id
+                - status: 'verified', 'not_found', 'already_verified_today'
+                  or 'duplicate' (item listed earlier in the batch)
+                - message: Why the item was not verified, or None
+                - verification: Verification data as returned by
+                  verify_item, or None
+        """
+        item_ids = list(dict.fromkeys(item_id for item_id, _ in entries))
+        item_names = self.item_repo.get_item_names(item_ids)
+        verified_today = self.verification_repo.get_item_ids_verified_today(
+            user_id, list(item_names)
+        )
+        
+        results = []
+        to_verify = []
+        seen = set()
+        for item_id, note in entries:
+            result = {"item_id": item_id, "status": "verified", "message": None, "verification": None}
+            if item_id in seen:
+                result.update(status="duplicate", message=f"Item {item_id} is listed more than once")
+            elif item_id not in item_names:
+                result.update(status="not_found", message=f"Item with id {item_id} not found")
+            elif item_id in verified_today:
+                result.update(
+                    status="already_verified_today",
+                    message=f"You have already verified item {item_id} today"
+                )
+            else:
+                to_verify.append((item_id, note))
+            seen.add(item_id)
+            results.append(result)
+        
+        if not to_verify:
+            return results
+        
+        created_at = datetime.utcnow()
+        verified_ids = [item_id for item_id, _ in to_verify]
+        with UnitOfWork(expire_on_commit=False):
+            verification_ids = self.verification_repo.create_verifications(
+                user_id, to_verify, created_at
+            )
+            counts = self.item_repo.increment_verification_counts(verified_ids, created_at)
+            self.daily_count_repo.add_verifications(verified_ids, created_at)
+            self.item_service.refresh_item_documents(verified_ids)
+        
+        user = self.user_repo.get_user_by_id(user_id)
+        user_name = f"{user.first_name} {user.last_name}"
+        verifications = {
+            item_id: {
+                "verification_id": verification_id,
+                "user_id": int(user_id),
+                "user_name": user_name,
+                "item_id": item_id,
+                "item_name": item_names[item_id],
+                "note": note,
+                "created_at": created_at.isoformat(),
+                "verification_count": counts[item_id]
+            }
+            for verification_id, (item_id, note) in zip(verification_ids, to_verify)
+        }
+        for result in results:
+            if result["status"] == "verified":
+                result["verification"] = verifications[result["item_id"]]
+        return results
+    
+    def get_verification(
+        self,
+        verification_id: int,
+        fieldset: Optional[Fieldset] = None
+    ) -> Dict[str, Any]:
         """
         Get a single verification by ID.
         
         Args:
             verification_id: ID of the verification
+            fieldset: Optional sparse fieldset; only requested computed
+                fields are resolved
             
         Returns:
             Dict with verification data
@@ -115,108 +229,274 @@ class VerificationService:
         Raises:
             VerificationNotFoundError: If verification doesn't exist
         """
-        verification = self.verification_repo.get_verification_by_id(
-            verification_id
+        verification = self.verification_repo.get_verification_row(
+            verification_id, fieldset
         )
         if not verification:
             raise VerificationNotFoundError(
                 f"Verification with id {verification_id} not found"
             )
         
-        return self._format_verification(verification)
+        return self._format_verification(verification, fieldset)
     
     def get_item_verifications(
         self,
         item_id: int,
-        limit: Optional[int] = 50
+        limit: Optional[int] = 50,
+        fieldset: Optional[Fieldset] = None,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        Get all verifications for an item.
+        Get one page of the verifications of an item, newest first.
+        
+        Pages are keyset-paginated on (created_at, verification_id); one
+        extra row is fetched to detect whether another page exists. The
+        total comes from the item's stored counter rather than a COUNT of
+        its verifications.
         
         Args:
             item_id: ID of the item
             limit: Maximum number of verifications to return (default 50)
+            fieldset: Optional sparse fieldset; only requested computed
+                fields are resolved
+            cursor: Opaque cursor returned with the previous page
             
         Returns:
             Dict with:
                 - verifications: List of verification dicts
                 - total_count: Total verification count
                 - item_id: ID of the item
+                - next_cursor: Cursor of the next page, None on the last
+            
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        verifications = self.verification_repo.get_verifications_by_item_id(
-            item_id, limit
-        )
-        total_count = self.verification_repo.get_verification_count_for_item(
-            item_id
+        verifications, next_cursor = self._page(
+            self.verification_repo.get_verifications_by_item_id,
+            item_id, limit, fieldset, cursor
         )
+        total_count = self.item_repo.get_verification_count(item_id)
         
         return {
             "item_id": item_id,
             "verifications": [
-                self._format_verification(v) for v in verifications
+                self._format_verification(v, fieldset) for v in verifications
             ],
             "total_count": total_count,
-            "returned_count": len(verifications)
+            "returned_count": len(verifications),
+            "next_cursor": next_cursor
         }
     
     def get_user_verifications(
         self,
         user_id: int,
-        limit: Optional[int] = 50
+        limit: Optional[int] = 50,
+        fieldset: Optional[Fieldset] = None,
+        cursor: Optional[str] = None
     ) -> Dict[str, Any]:
         """
-        Get all verifications by a user.
+        Get one page of the verifications by a user, newest first.
         
         Args:
             user_id: ID of the user
             limit: Maximum number of verifications to return (default 50)
+            fieldset: Optional sparse fieldset; only requested computed
+                fields are resolved
+            cursor: Opaque cursor returned with the previous page
             
         Returns:
             Dict with:
                 - verifications: List of verification dicts
                 - user_id: ID of the user
                 - count: Number of verifications returned
+                - next_cursor: Cursor of the next page, None on the last
+            
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        verifications = self.verification_repo.get_verifications_by_user_id(
-            user_id, limit
+        verifications, next_cursor = self._page(
+            self.verification_repo.get_verifications_by_user_id,
+            user_id, limit, fieldset, cursor
         )
         
         return {
             "user_id": user_id,
             "verifications": [
-                self._format_verification(v) for v in verifications
+                self._format_verification(v, fieldset) for v in verifications
             ],
-            "count": len(verifications)
+            "count": len(verifications),
+            "next_cursor": next_cursor
+        }
+    
+    @staticmethod
+    def _page(
+        fetch,
+        owner_id: int,
+        limit: Optional[int],
+        fieldset: Optional[Fieldset],
+        cursor: Optional[str]
+    ) -> Tuple[List[Row], Optional[str]]:
+        """
+        Fetch one keyset page of verifications.
+        
+        Args:
+            fetch: Repository method listing the verifications of an item
+                or user
+            owner_id: ID of that item or user
+            limit: Maximum number of verifications on the page, or None for
+                all of them
+            fieldset: Optional sparse fieldset limiting the columns loaded
+            cursor: Opaque cursor returned with the previous page
+            
+        Returns:
+            Tuple of (verifications, next_cursor or None on the last page)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        position = decode_cursor(cursor) if cursor else None
+        verifications = fetch(
+            owner_id,
+            limit=limit + 1 if limit else None,
+            fieldset=fieldset,
+            cursor=position
+        )
+        
+        next_cursor = None
+        if limit and len(verifications) > limit:
+            verifications = verifications[:limit]
+            last = verifications[-1]
+            next_cursor = encode_cursor(last.created_at, last.verification_id)
+        return verifications, next_cursor
+    
+    def reconcile_verification_counts(self) -> list[int]:
+        """
+        Correct item verification counters that drifted from the actual rows.
+        
+        Counters are only ever incremented; this recounts all items in one
+        statement and rebuilds the documents of the ones that were off.
+        
+        Returns:
+            IDs of the items whose counter was corrected
+        """
+        with UnitOfWork():
+            item_ids = self.item_repo.reconcile_verification_counts()
+            if item_ids:
+                self.item_service.refresh_item_documents(item_ids)
+        return item_ids
+    
+    def rebuild_daily_counts(self) -> int:
+        """
+        Recompute the daily verification rollup from the verification rows.
+        
+        One DELETE and one grouped INSERT ... SELECT, for databases from
+        before the rollup was maintained or rows written outside the API.
+        
+        Returns:
+            Number of (city, day, item) rows written
+        """
+        with UnitOfWork():
+            return self.daily_count_repo.rebuild()
+    
+    def get_verification_trend(
+        self,
+        start: date,
+        end: date,
+        rotation_city_id: Optional[int] = None,
+        item_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the verifications per day of a city or of one item.
+        
+        Served from the daily rollup, so the cost depends on the number of
+        days (and items verified on them), not on how many verifications
+        were made.
+        
+        Args:
+            start: First day (UTC)
+            end: Last day (UTC), inclusive
+            rotation_city_id: City whose items' verifications are counted
+            item_id: Item whose verifications are counted; takes precedence
+                over rotation_city_id
+        
+        Returns:
+            Dict with:
+                - rotation_city_id: ID of the city, or None for an item
+                - item_id: ID of the item, or None for a city
+                - start, end: The days covered, ISO formatted
+                - total_count: Verifications over the whole range
+                - days: One {day, verification_count} per day, in order,
+                  including days without verifications
+        
+        Raises:
+            ValueError: If neither a city nor an item is given, or the range
+                is empty or longer than MAX_TREND_DAYS
+            ItemNotFoundError: If the item doesn't exist
+            RotationCityNotFoundError: If the city doesn't exist
+        """
+        if end < start:
+            raise ValueError("end must not be before start")
+        if (end - start).days + 1 > MAX_TREND_DAYS:
+            raise ValueError(f"A trend covers at most {MAX_TREND_DAYS} days")
+        
+        if item_id is not None:
+            if not self.item_repo.exists(item_id):
+                raise ItemNotFoundError(f"Item with id {item_id} not found")
+            rotation_city_id = None
+            counts = self.daily_count_repo.get_item_daily_counts(item_id, start, end)
+        elif rotation_city_id is not None:
+            if not self.rotation_city_repo.check_city_exists(rotation_city_id):
+                raise RotationCityNotFoundError(
+                    f"Rotation city with id {rotation_city_id} not found"
+                )
+            counts = self.daily_count_repo.get_city_daily_counts(rotation_city_id, start, end)
+        else:
+            raise ValueError("city_id or item_id is required")
+        
+        by_day = dict(counts)
+        days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+        return {
+            "rotation_city_id": rotation_city_id,
+            "item_id": item_id,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "total_count": sum(by_day.values()),
+            "days": [
+                {"day": day.isoformat(), "verification_count": by_day.get(day, 0)}
+                for day in days
+            ]
         }
     
     def _format_verification(
         self,
-        verification: ItemVerification
+        verification: Row,
+        fieldset: Optional[Fieldset] = None
     ) -> Dict[str, Any]:
         """
-        Format a verification model instance as a dict.
+        Format a verification row as a dict.
         
         Args:
-            verification: ItemVerification instance
+            verification: Row from the verification repository's list or
+                get_verification_row methods
+            fieldset: Optional sparse fieldset; computed fields it does not
+                request are left out since their columns were not selected
             
         Returns:
             Dict with verification data
         """
-        user_photo = verification.user.profile_picture if verification.user.profile_picture else None
-        user_name = (
-            f"{verification.user.first_name} "
-            f"{verification.user.last_name}"
-        )
-        item_name = verification.item.name
-        
-        return {
+        data = {
             "verification_id": verification.verification_id,
             "user_id": verification.user_id,
-            "user_name": user_name,
             "item_id": verification.item_id,
-            "item_name": item_name,
             "note": verification.note,
-            "created_at": verification.created_at.isoformat(),
-            "user_photo": user_photo
-
+            "created_at": verification.created_at.isoformat()
         }
+        
+        if fieldset is None or fieldset.wants('user_name'):
+            data["user_name"] = f"{verification.first_name} {verification.last_name}"
+        if fieldset is None or fieldset.wants('item_name'):
+            data["item_name"] = verification.item_name
+        if fieldset is None or fieldset.wants('user_photo'):
+            data["user_photo"] = verification.profile_picture or None
+        
+        return data
@@ -0,0 +1,74 @@
+"""Content-addressed blob references.
+
+Columns such as User.profile_picture and Category.category_pic hold the
+SHA-256 hash of a stored blob. These helpers hash content, recognise such
+references and turn them into the URL the blob is served from.
+"""
+import hashlib
+import re
+from typing import Annotated, Optional
+
+from flask import current_app, has_app_context
+from pydantic import AfterValidator
+
+BLOB_PATH = '/api/v1/blob/'
+
+_BLOB_HASH = re.compile(r'^[0-9a-f]{64}$')
+
+# Leading bytes of the image formats accepted for upload
+_IMAGE_SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+)
+
+
+def content_hash(data: bytes) -> str:
+    """Return the hex SHA-256 of some content."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def is_blob_hash(value: Optional[str]) -> bool:
+    """Check whether a stored value is a blob reference."""
+    return bool(value) and bool(_BLOB_HASH.match(value))
+
+
+def sniff_image_type(data: bytes) -> Optional[str]:
+    """Detect the MIME type of image content from its leading bytes.
+    
+    Args:
+        data: Raw content
+        
+    Returns:
+        MIME type, or None if the content is not a supported image
+    """
+    for signature, content_type in _IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return content_type
+    if data[:4] == b'RIFF' and data[8:12] == b'WEBP':
+        return 'image/webp'
+    return None
+
+
+def blob_url(reference: Optional[str]) -> Optional[str]:
+    """Turn a stored blob reference into the URL it is served from.
+    
+    Values that are not blob references (None, external URLs, data not yet
+    migrated) are returned unchanged. The URL is prefixed with the
+    BLOB_BASE_URL setting so clients on another origin can load it.
+    
+    Args:
+        reference: Value of an image column
+        
+    Returns:
+        URL of the blob, or the value unchanged
+    """
+    if not is_blob_hash(reference):
+        return reference
+    base = current_app.config.get('BLOB_BASE_URL', '') if has_app_context() else ''
+    return f"{base.rstrip('/')}{BLOB_PATH}{reference}"
+
+
+# Response field type rendering an image column as the URL of its blob
+BlobUrl = Annotated[Optional[str], AfterValidator(blob_url)]
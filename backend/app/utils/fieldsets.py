@@ -0,0 +1,194 @@
+"""Sparse fieldsets for API responses.
+
+Clients pass ``fields=`` (keep only these) and/or ``exclude=`` (drop these)
+as comma-separated field names of the response schema. A name may be dotted
+one level into a nested object, e.g. ``exclude=added_by_user.profile_picture``
+or ``fields=name,added_by_user.first_name``.
+
+Routes parse a Fieldset from the query string, repositories use it to load
+only the columns the requested fields need, and ``project`` builds the pruned
+response body from the loaded objects.
+"""
+from typing import Any, Dict, List, Optional, Set, Type, get_args
+
+from pydantic import AfterValidator, BaseModel, BeforeValidator
+from sqlalchemy import inspect
+
+
+def _nested_schema(annotation) -> Optional[Type[BaseModel]]:
+    """Return the pydantic model behind a field annotation, if any.
+
+    Handles ``Model``, ``Optional[Model]`` and ``List[Model]``.
+    """
+    for candidate in (annotation, *get_args(annotation)):
+        if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+            return candidate
+    return None
+
+
+class Fieldset:
+    """The set of response fields a client asked for.
+
+    Attributes:
+        schema: Pydantic response schema the field names refer to
+    """
+
+    def __init__(
+        self,
+        schema: Type[BaseModel],
+        fields: Optional[str] = None,
+        exclude: Optional[str] = None
+    ):
+        """Parse ``fields`` / ``exclude`` strings against a response schema.
+
+        Args:
+            schema: Pydantic response schema the field names refer to
+            fields: Comma-separated fields to keep (None keeps all)
+            exclude: Comma-separated fields to drop (None drops none)
+
+        Raises:
+            ValueError: If a field is not part of the schema
+        """
+        self.schema = schema
+        self._include = self._parse(fields)
+        self._exclude = self._parse(exclude) or {}
+
+    @classmethod
+    def from_args(cls, args, schema: Type[BaseModel]) -> Optional['Fieldset']:
+        """Build a Fieldset from request query args.
+
+        Args:
+            args: Request query args (``request.args``)
+            schema: Pydantic response schema the field names refer to
+
+        Returns:
+            Fieldset, or None if neither ``fields`` nor ``exclude`` was given
+
+        Raises:
+            ValueError: If a field is not part of the schema
+        """
+        fields = args.get('fields')
+        exclude = args.get('exclude')
+        if fields is None and exclude is None:
+            return None
+        return cls(schema, fields, exclude)
+
+    def _parse(self, value: Optional[str]) -> Optional[Dict[str, Optional[Set[str]]]]:
+        """Parse a comma-separated field list into {name: subfields or None}."""
+        if value is None:
+            return None
+
+        paths: Dict[str, Optional[Set[str]]] = {}
+        for path in filter(None, (part.strip() for part in value.split(','))):
+            name, _, sub = path.partition('.')
+            if name not in self.schema.model_fields:
+                raise ValueError(f"Unknown field: {path}")
+            if not sub:
+                paths[name] = None
+                continue
+
+            nested = _nested_schema(self.schema.model_fields[name].annotation)
+            if nested is None or sub not in nested.model_fields:
+                raise ValueError(f"Unknown field: {path}")
+            if name not in paths:
+                paths[name] = set()
+            if paths[name] is not None:
+                paths[name].add(sub)
+        return paths
+
+    def wants(self, name: str, sub: Optional[str] = None) -> bool:
+        """Check whether a field (or a field of a nested object) is requested.
+
+        Args:
+            name: Top-level field name
+            sub: Optional field name inside the nested object ``name``
+
+        Returns:
+            True if the field should be loaded and rendered
+        """
+        if self._include is not None:
+            if name not in self._include:
+                return False
+            included = self._include[name]
+            if sub is not None and included is not None and sub not in included:
+                return False
+
+        excluded = self._exclude.get(name, set())
+        if name in self._exclude and excluded is None:
+            return False
+        return sub is None or sub not in excluded
+
+    def attributes(self, model, name: Optional[str] = None) -> List[Any]:
+        """Model attributes needed to render the requested fields.
+
+        Fields are matched to attributes by alias or name; fields with no
+        matching column (computed fields) are skipped. The primary key is
+        always included so the result can be passed to ``load_only``.
+
+        Args:
+            model: SQLAlchemy model class the fields are read from
+            name: Nested field whose subfields to map, or None for top level
+
+        Returns:
+            List of instrumented attributes of ``model``
+        """
+        schema = self.schema
+        if name is not None:
+            schema = _nested_schema(schema.model_fields[name].annotation)
+
+        columns = inspect(model).columns
+        keys = [column.key for column in inspect(model).primary_key]
+        for field, info in schema.model_fields.items():
+            key = info.alias or field
+            wanted = self.wants(field) if name is None else self.wants(name, field)
+            if wanted and key in columns and key not in keys:
+                keys.append(key)
+        return [getattr(model, key) for key in keys]
+
+    def project(self, obj: Any) -> Dict[str, Any]:
+        """Render the requested fields of an object or dict.
+
+        Plain validators attached to a field type (e.g. BlobUrl) are
+        applied, so values render as they would through the schema.
+
+        Args:
+            obj: Loaded model instance (or dict) shaped like the schema
+
+        Returns:
+            Dictionary holding only the requested fields
+        """
+        result = {}
+        for name, info in self.schema.model_fields.items():
+            if not self.wants(name):
+                continue
+            value = _read(obj, name, info)
+            nested = _nested_schema(info.annotation)
+            if nested is not None and value is not None:
+                if isinstance(value, list):
+                    value = [self._project_nested(name, nested, v) for v in value]
+                else:
+                    value = self._project_nested(name, nested, value)
+            result[name] = value
+        return result
+
+    def _project_nested(self, name: str, nested: Type[BaseModel], obj: Any) -> Dict[str, Any]:
+        """Render the requested subfields of one nested object."""
+        return {
+            field: _read(obj, field, info)
+            for field, info in nested.model_fields.items()
+            if self.wants(name, field)
+        }
+
+
+def _read(obj: Any, name: str, info) -> Any:
+    """Read a schema field from a dict or an object attribute."""
+    alias = info.alias
+    if isinstance(obj, dict):
+        value = obj.get(name, obj.get(alias) if alias else None)
+    else:
+        value = getattr(obj, alias or name, None)
+
+    for validator in info.metadata:
+        if isinstance(validator, (AfterValidator, BeforeValidator)):
+            value = validator.func(value)
+    return value
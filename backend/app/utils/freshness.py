@@ -0,0 +1,81 @@
+"""Time-decayed item freshness.
+
+An item's freshness score is the sum over its verifications of
+``2 ** (-age / half_life)``: a verification made now counts 1, one made a
+half-life ago counts 0.5, and so on. That sum changes with every passing
+second, so it cannot be stored or indexed directly. Instead
+``Item.freshness`` stores
+
+    ln(sum(exp(weight(t_i))))    with weight(t) = ln 2 * (t - EPOCH) / half_life
+
+which is the score scaled by a factor shared by every item. It only changes
+when an item is verified, and sorting by it is sorting by the current score.
+A new verification at t is folded in with a numerically stable log-add-exp
+(see ``ItemRepository``), and the current score is recovered by
+``current_score``. Items never verified keep 0, below any verified item
+since weights after the epoch are positive.
+
+The SQL uses ln and exp, which SQLite only has when built with math
+functions; ``app`` registers Python versions on connections that lack them.
+
+Changing FRESHNESS_HALF_LIFE_DAYS changes every weight; run
+``scripts/backfill_freshness.py`` afterwards.
+"""
+import math
+from datetime import datetime
+from typing import Optional
+
+from flask import current_app
+
+# Reference time of the weights; any verification after it weighs more than 0
+EPOCH = datetime(2020, 1, 1)
+
+
+def decay_rate(half_life_days: Optional[float] = None) -> float:
+    """Weight gained per second, ln 2 / half-life.
+
+    Args:
+        half_life_days: Half-life in days; defaults to the
+            FRESHNESS_HALF_LIFE_DAYS setting
+
+    Returns:
+        Decay rate per second
+    """
+    if half_life_days is None:
+        half_life_days = current_app.config['FRESHNESS_HALF_LIFE_DAYS']
+    return math.log(2) / (half_life_days * 86400)
+
+
+def verification_weight(verified_at: datetime, half_life_days: Optional[float] = None) -> float:
+    """Log weight of a verification made at verified_at.
+
+    Args:
+        verified_at: When the verification was made (naive UTC)
+        half_life_days: Half-life in days; defaults to the setting
+
+    Returns:
+        ln 2 * (verified_at - EPOCH) / half-life
+    """
+    return decay_rate(half_life_days) * (verified_at - EPOCH).total_seconds()
+
+
+def current_score(
+    freshness: float,
+    at: Optional[datetime] = None,
+    half_life_days: Optional[float] = None
+) -> float:
+    """Decayed verification count of an item at a given time.
+
+    Args:
+        freshness: Stored Item.freshness
+        at: Time to evaluate the score at (default now)
+        half_life_days: Half-life in days; defaults to the setting
+
+    Returns:
+        Sum of 2 ** (-age / half-life) over the item's verifications,
+        0.0 for an item never verified
+    """
+    if not freshness:
+        return 0.0
+    at = at or datetime.utcnow()
+    return math.exp(freshness - verification_weight(at, half_life_days))
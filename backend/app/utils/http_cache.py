@@ -0,0 +1,81 @@
+"""HTTP conditional request support (ETag / Last-Modified) for read endpoints."""
+import hashlib
+from functools import wraps
+from typing import Callable, Iterable, Optional
+
+from flask import make_response, request
+
+from app.repositories.implementations.data_version_repository import DataVersionRepository
+
+
+def conditional(scopes: Callable[..., Optional[Iterable[str]]]):
+    """Decorator answering conditional GETs from data versions.
+    
+    The ETag is derived from the current versions of the data scopes the
+    endpoint reads plus the request path and query string, so it costs one
+    indexed lookup instead of rendering and hashing the body. When the
+    client's If-None-Match (or If-Modified-Since) still matches, a 304 is
+    returned without calling the view at all.
+    
+    Place it below @jwt_required() so authentication still runs first.
+    
+    Args:
+        scopes: Callable receiving the view's arguments and returning the
+            DataVersion scopes the response depends on, or None to skip
+            conditional handling for this request
+    
+    Returns:
+        Decorated view function
+        
+    Example:
+        @category_bp.route('/', methods=['GET'])
+        @jwt_required()
+        @conditional(lambda: [DataVersion.CATEGORIES])
+        def get_categories():
+            ...
+    """
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            scope_names = scopes(*args, **kwargs)
+            if scope_names is None:
+                return f(*args, **kwargs)
+
+            scope_names = sorted(set(scope_names))
+            rows = {row.scope: row for row in DataVersionRepository().get_versions(scope_names)}
+            fingerprint = ';'.join(
+                f"{scope}={rows[scope].version if scope in rows else 0}"
+                for scope in scope_names
+            )
+            etag = hashlib.sha1(
+                f"{fingerprint}|{request.full_path}".encode('utf-8')
+            ).hexdigest()
+
+            # Last-Modified is only meaningful once every scope has been bumped
+            last_modified = None
+            if rows and len(rows) == len(scope_names):
+                last_modified = max(row.updated_at for row in rows.values())
+
+            if _not_modified(etag, last_modified):
+                response = make_response('', 304)
+            else:
+                response = make_response(f(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag)
+            if last_modified is not None:
+                response.last_modified = last_modified
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
+
+
+def _not_modified(etag: str, last_modified) -> bool:
+    """Check the request's validators against the current ones."""
+    if request.if_none_match:
+        return request.if_none_match.contains(etag)
+    if request.if_modified_since and last_modified is not None:
+        return last_modified.replace(microsecond=0) <= request.if_modified_since.replace(tzinfo=None)
+    return False
@@ -0,0 +1,123 @@
+"""Idempotency-Key support for write endpoints."""
+import hashlib
+import time
+from datetime import datetime, timedelta
+from functools import wraps
+
+from flask import current_app, jsonify, make_response, request
+from flask_jwt_extended import get_jwt_identity
+
+from app import db
+from app.repositories.implementations.idempotency_key_repository import IdempotencyKeyRepository
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+REPLAYED_HEADER = 'Idempotent-Replayed'
+MAX_KEY_LENGTH = 255
+# Seconds between checks while waiting for an in-flight request with the same key
+POLL_INTERVAL = 0.1
+
+
+def idempotent(f):
+    """Decorator making a write endpoint safe to retry with an Idempotency-Key.
+
+    Requests without the header run as usual. The first request with a
+    given key (per user) claims it, runs, and its response is stored for
+    IDEMPOTENCY_TTL_SECONDS; retries get that response back, marked with
+    an Idempotent-Replayed header, without running the view again. A retry
+    arriving while the first request is still running waits up to
+    IDEMPOTENCY_WAIT_SECONDS for its response.
+
+    Server errors (5xx) are not stored: the key is released so the client
+    can retry for real. Reusing a key for a different request is rejected.
+
+    Place it below @jwt_required() so keys are scoped to the caller.
+
+    Returns:
+        Decorated view function; besides the view's own responses it can
+        answer 400 (malformed key), 409 (same key still in progress) or
+        422 (key used with a different request)
+
+    Example:
+        @item_bp.route('/', methods=['POST'])
+        @jwt_required()
+        @idempotent
+        def create_item():
+            ...
+    """
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if key is None:
+            return f(*args, **kwargs)
+        if not key or len(key) > MAX_KEY_LENGTH:
+            return jsonify({
+                'message': f'{IDEMPOTENCY_HEADER} must be 1-{MAX_KEY_LENGTH} characters'
+            }), 400
+
+        user_id = int(get_jwt_identity())
+        request_hash = fingerprint_request()
+        config = current_app.config
+        repo = IdempotencyKeyRepository()
+
+        deadline = time.monotonic() + config['IDEMPOTENCY_WAIT_SECONDS']
+        while not repo.claim(
+            user_id, key, request_hash,
+            datetime.utcnow() + timedelta(seconds=config['IDEMPOTENCY_LOCK_SECONDS'])
+        ):
+            record = repo.get(user_id, key)
+            if record is None:
+                # Expired and removed since the claim; try again
+                continue
+            if record.request_hash != request_hash:
+                return jsonify({
+                    'message': f'{IDEMPOTENCY_HEADER} was already used for a different request'
+                }), 422
+            if record.response_status is not None:
+                response = make_response(
+                    record.response_body, record.response_status,
+                    {'Content-Type': record.content_type}
+                )
+                response.headers[REPLAYED_HEADER] = 'true'
+                return response
+            if time.monotonic() >= deadline:
+                response = jsonify({
+                    'message': f'A request with this {IDEMPOTENCY_HEADER} is still in progress'
+                })
+                response.headers['Retry-After'] = '1'
+                return response, 409
+            # End the read transaction so the next check sees the other request's commit
+            db.session.rollback()
+            time.sleep(POLL_INTERVAL)
+
+        try:
+            response = make_response(f(*args, **kwargs))
+        except Exception:
+            db.session.rollback()
+            repo.release(user_id, key)
+            raise
+
+        if response.status_code >= 500 or response.is_streamed:
+            # Leave nothing stored, so a retry runs the request again
+            db.session.rollback()
+            repo.release(user_id, key)
+        else:
+            repo.complete(
+                user_id, key,
+                status=response.status_code,
+                body=response.get_data(as_text=True),
+                content_type=response.content_type,
+                expires_at=datetime.utcnow() + timedelta(seconds=config['IDEMPOTENCY_TTL_SECONDS'])
+            )
+        return response
+    return wrapper
+
+
+def fingerprint_request() -> str:
+    """Hex SHA-256 of the current request's method, path, query and body."""
+    return hashlib.sha256(
+        b'\n'.join([
+            request.method.encode('utf-8'),
+            request.full_path.encode('utf-8'),
+            request.get_data(cache=True)
+        ])
+    ).hexdigest()
@@ -0,0 +1,118 @@
+"""Item feed filters.
+
+Parsed from ``GET /item`` query parameters and compiled into SQL by
+``ItemRepository.apply_filters``:
+
+- ``category_id=<id>`` (repeatable; items in any of the categories)
+- ``tag_bool=<tag_id>:<true|false>`` boolean tag equals
+- ``tag_min=<tag_id>:<number>`` / ``tag_max=<tag_id>:<number>`` numeric tag range
+- ``tag_text=<tag_id>:<text>`` text tag equals (case-insensitive)
+- ``max_walking_distance=<meters>``
+- ``min_verifications=<count>``
+
+Tag parameters are repeatable and all of them must match.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+FILTER_PARAMS = (
+    'category_id', 'tag_bool', 'tag_min', 'tag_max', 'tag_text',
+    'max_walking_distance', 'min_verifications'
+)
+
+
+@dataclass(frozen=True)
+class ItemFilters:
+    """Conditions an item must satisfy to be listed.
+    
+    Frozen and built from sorted tuples so equal filters compare and hash
+    equal, which lets them be part of cache keys.
+    
+    Attributes:
+        category_ids: Item must be in at least one of these categories
+        boolean_tags: (tag_id, value) pairs the item's boolean tags must equal
+        numeric_ranges: (tag_id, min, max) bounds on numeric tags (None = open)
+        text_tags: (tag_id, text) pairs the item's text tags must equal
+        max_walking_distance: Upper bound on walking_distance in meters
+        min_verifications: Lower bound on number_of_verifications
+    """
+    category_ids: Tuple[int, ...] = ()
+    boolean_tags: Tuple[Tuple[int, bool], ...] = ()
+    numeric_ranges: Tuple[Tuple[int, Optional[float], Optional[float]], ...] = ()
+    text_tags: Tuple[Tuple[int, str], ...] = ()
+    max_walking_distance: Optional[float] = None
+    min_verifications: Optional[int] = None
+
+    @classmethod
+    def from_args(cls, args) -> Optional['ItemFilters']:
+        """Build filters from request query args.
+        
+        Args:
+            args: Request query args (``request.args``)
+            
+        Returns:
+            ItemFilters, or None if no filter parameter was given
+            
+        Raises:
+            ValueError: If a parameter is malformed
+        """
+        if not any(param in args for param in FILTER_PARAMS):
+            return None
+
+        ranges: Dict[int, List[Optional[float]]] = {}
+        for tag_id, bound in _tag_pairs(args, 'tag_min', _number):
+            ranges.setdefault(tag_id, [None, None])[0] = bound
+        for tag_id, bound in _tag_pairs(args, 'tag_max', _number):
+            ranges.setdefault(tag_id, [None, None])[1] = bound
+
+        return cls(
+            category_ids=tuple(sorted({
+                _integer('category_id', value) for value in args.getlist('category_id')
+            })),
+            boolean_tags=tuple(sorted(dict(_tag_pairs(args, 'tag_bool', _boolean)).items())),
+            numeric_ranges=tuple(sorted((tag_id, low, high) for tag_id, (low, high) in ranges.items())),
+            text_tags=tuple(sorted(dict(_tag_pairs(args, 'tag_text', str.strip)).items())),
+            max_walking_distance=(
+                _number(args['max_walking_distance'])
+                if 'max_walking_distance' in args else None
+            ),
+            min_verifications=(
+                _integer('min_verifications', args['min_verifications'])
+                if 'min_verifications' in args else None
+            )
+        )
+
+
+def _tag_pairs(args, param: str, parse) -> List[Tuple[int, object]]:
+    """Parse repeated ``<tag_id>:<value>`` parameters."""
+    pairs = []
+    for raw in args.getlist(param):
+        tag_id, sep, value = raw.partition(':')
+        if not sep or not value:
+            raise ValueError(f"{param} must look like <tag_id>:<value>")
+        pairs.append((_integer(param, tag_id), parse(value)))
+    return pairs
+
+
+def _integer(param: str, value: str) -> int:
+    """Parse an integer parameter."""
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{param} must be an integer")
+
+
+def _number(value: str) -> float:
+    """Parse a numeric bound."""
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"Invalid number: {value}")
+
+
+def _boolean(value: str) -> bool:
+    """Parse a boolean tag value."""
+    lowered = value.lower()
+    if lowered not in ('true', 'false'):
+        raise ValueError("tag_bool value must be true or false")
+    return lowered == 'true'
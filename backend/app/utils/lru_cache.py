@@ -0,0 +1,78 @@
+"""Bounded in-process LRU cache with hit/miss accounting."""
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache bounded by entries and size.
+    
+    Callers pass the size of each value (e.g. its length in characters) so
+    memory stays bounded even when entries vary widely in size. Keys should
+    embed a data version so stale entries are simply never requested again
+    and age out through eviction instead of needing explicit invalidation.
+    
+    Attributes:
+        max_entries (int): Maximum number of cached values
+        max_size (int): Maximum total size of cached values
+        hits (int): Number of lookups that found a value
+        misses (int): Number of lookups that found nothing
+        evictions (int): Number of values dropped to stay within bounds
+    """
+
+    def __init__(self, max_entries: int = 256, max_size: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, size: int = 1) -> None:
+        """Store a value, evicting least recently used entries as needed.
+        
+        Values larger than max_size on their own are not cached.
+        """
+        if size > self.max_size:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (value, size)
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_size:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Return a snapshot of the cache counters."""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'size': self._size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
@@ -0,0 +1,55 @@
+"""Keyset pagination helpers.
+
+Cursors are opaque, URL-safe tokens that encode the ``(sort key, id)``
+position of the last row on a page, where the sort key is a timestamp
+(e.g. ``created_at``) or a number (e.g. ``freshness``). Clients pass them
+back unchanged to fetch the next page; the server never needs an OFFSET.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Tuple, Union
+
+SortKey = Union[datetime, float]
+
+
+def encode_cursor(key: SortKey, row_id: int) -> str:
+    """Encode a keyset position as an opaque cursor string.
+
+    Args:
+        key: Sort key of the last row returned (timestamp or number)
+        row_id: Primary key of the last row returned
+
+    Returns:
+        URL-safe base64 cursor string
+    """
+    value = key.isoformat() if isinstance(key, datetime) else float(key)
+    payload = json.dumps([value, row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, key_type: type = datetime) -> Tuple[SortKey, int]:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor string from a previous page
+        key_type: Expected type of the sort key, datetime or float
+
+    Returns:
+        Tuple of (sort key, row_id)
+
+    Raises:
+        ValueError: If the cursor is malformed or its key is not a key_type
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        key, row_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if key_type is datetime:
+            key = datetime.fromisoformat(key)
+        elif isinstance(key, (int, float)) and not isinstance(key, bool):
+            key = float(key)
+        else:
+            raise ValueError
+        return key, int(row_id)
+    except (ValueError, TypeError, UnicodeError):
+        raise ValueError("Invalid cursor")
@@ -0,0 +1,43 @@
+"""
+Backfill Freshness
+Recomputes every item's last_verified_date and freshness from its verifications.
+
+Verifying an item maintains both in place; run this once after migrating
+a database whose items predate them (migration 0004), or after changing
+FRESHNESS_HALF_LIFE_DAYS. It is one set-based UPDATE over the
+verifications, not a per-item loop. Item documents show the new
+last_verified_date once rebuilt (scripts/rebuild_item_documents.py).
+
+Usage:
+    cd backend
+    python scripts/backfill_freshness.py
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add backend directory to path so we can import app modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dotenv import load_dotenv
+
+from app import create_app
+from app.services.item_service import ItemService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.parse_args()
+
+    load_dotenv()
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    with app.app_context():
+        started = time.perf_counter()
+        updated = ItemService().backfill_freshness()
+        print(f"✅ Updated {updated} items in {time.perf_counter() - started:.1f}s "
+              f"(half-life {app.config['FRESHNESS_HALF_LIFE_DAYS']:g} days)")
+
+
+if __name__ == '__main__':
+    main()
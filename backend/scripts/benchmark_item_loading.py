@@ -0,0 +1,184 @@
+"""
+Item Loader Strategy Benchmark
+Compares the relationship loader strategies of ItemRepository on a large city.
+
+Builds a throwaway in-memory SQLite database with one rotation city holding
+N items (default 10,000), each linked to several categories and tag values,
+then times the item feed queries for every ItemLoadStrategy and reports how
+many rows the database sent back for each.
+
+Usage:
+    cd backend
+    python scripts/benchmark_item_loading.py
+    python scripts/benchmark_item_loading.py --items 10000 --page-size 50
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+# Add backend directory to path so we can import app modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from sqlalchemy import event, insert
+
+from app import create_app, db
+from app.models.category import Category
+from app.models.category_item import CategoryItem
+from app.models.item import Item
+from app.models.item_tag_value import ItemTagValue
+from app.models.rotation_city import RotationCity
+from app.models.tag import Tag, TagValueType
+from app.models.user import User
+from app.models.value import Value
+from app.repositories.base.item_repository_interface import ItemLoadStrategy
+from app.repositories.implementations.item_repository import ItemRepository
+
+CATEGORIES_PER_ITEM = 2
+TAGS_PER_ITEM = 4
+CHUNK_SIZE = 5000
+
+
+def _insert_chunked(model, rows):
+    """Insert rows with multi-row INSERT statements in fixed-size chunks."""
+    for start in range(0, len(rows), CHUNK_SIZE):
+        db.session.execute(insert(model), rows[start:start + CHUNK_SIZE])
+
+
+def build_city(item_count: int, seed: int = 162) -> int:
+    """Populate one rotation city with item_count fully tagged items.
+
+    Returns:
+        The city_id of the generated city
+    """
+    rng = random.Random(seed)
+
+    city = RotationCity(name='Benchmark City', time_zone='UTC')
+    db.session.add(city)
+    db.session.flush()
+
+    users = [
+        User(
+            first_name=f'User{i}',
+            last_name='Bench',
+            email=f'user{i}@bench.example',
+            rotation_city_id=city.city_id,
+            is_verified=True
+        )
+        for i in range(50)
+    ]
+    categories = [Category(category_name=f'Category {i}') for i in range(8)]
+    tags = [
+        Tag(name=f'Tag {i}', value_type=TagValueType.BOOLEAN.code)
+        for i in range(TAGS_PER_ITEM * 3)
+    ]
+    db.session.add_all(users + categories + tags)
+    db.session.flush()
+
+    _insert_chunked(Item, [
+        {
+            'item_id': item_id,
+            'name': f'Item {item_id}',
+            'location': f'Street {item_id}',
+            'walking_distance': rng.uniform(50, 3000),
+            'rotation_city_id': city.city_id,
+            'added_by_user_id': rng.choice(users).user_id,
+            'number_of_verifications': 0,
+        }
+        for item_id in range(1, item_count + 1)
+    ])
+
+    # Values are unique per (tag, value), so items share one row per pair
+    value_ids = {}
+    category_rows, link_rows = [], []
+    for item_id in range(1, item_count + 1):
+        for category in rng.sample(categories, CATEGORIES_PER_ITEM):
+            category_rows.append({'item_id': item_id, 'category_id': category.category_id})
+        for tag in rng.sample(tags, TAGS_PER_ITEM):
+            key = (tag.tag_id, rng.random() < 0.5)
+            value_id = value_ids.setdefault(key, len(value_ids) + 1)
+            link_rows.append({'item_id': item_id, 'value_id': value_id})
+
+    _insert_chunked(CategoryItem, category_rows)
+    _insert_chunked(Value, [
+        {'value_id': value_id, 'tag_id': tag_id, 'boolean_val': boolean_val}
+        for (tag_id, boolean_val), value_id in value_ids.items()
+    ])
+    _insert_chunked(ItemTagValue, link_rows)
+    db.session.commit()
+    return city.city_id
+
+
+class RowCounter:
+    """Records every SELECT issued and counts the rows each one returns.
+
+    Rows are counted after the timed run by re-running each captured
+    statement wrapped in SELECT COUNT(*), so counting never affects timings.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def __enter__(self):
+        event.listen(self.engine, 'before_cursor_execute', self._capture)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, 'before_cursor_execute', self._capture)
+
+    def _capture(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            self.statements.append((statement, parameters))
+
+    def total_rows(self) -> int:
+        total = 0
+        with self.engine.connect() as conn:
+            for statement, parameters in self.statements:
+                total += conn.exec_driver_sql(
+                    f'SELECT COUNT(*) FROM ({statement})', parameters
+                ).scalar()
+        return total
+
+
+def run(label: str, fn) -> None:
+    """Time fn once with a cold session and print rows, queries and wall time."""
+    db.session.expunge_all()
+    with RowCounter(db.engine) as counter:
+        started = time.perf_counter()
+        items = fn()
+        elapsed = time.perf_counter() - started
+    print(
+        f'{label:<28} items={len(items):>6}  queries={len(counter.statements):>2}  '
+        f'rows={counter.total_rows():>8}  time={elapsed * 1000:>9.1f} ms'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--items', type=int, default=10_000, help='items in the city')
+    parser.add_argument('--page-size', type=int, default=50, help='feed page size')
+    args = parser.parse_args()
+
+    app = create_app('testing')
+    with app.app_context():
+        print(f'Building city with {args.items} items...')
+        city_id = build_city(args.items)
+        repo = ItemRepository()
+
+        for strategy in ItemLoadStrategy:
+            run(
+                f'full feed / {strategy.value}',
+                lambda: repo.get_all_items_with_details(city_id, strategy=strategy)
+            )
+            run(
+                f'page of {args.page_size} / {strategy.value}',
+                lambda: repo.get_all_items_with_details(
+                    city_id, limit=args.page_size, strategy=strategy
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Delete Records
+Deletes a rotation city, user or item together with everything depending on it.
+
+Deletes rely on the database's ON DELETE CASCADE foreign keys, so removing a
+retired city with all of its users, items and verifications is a handful of
+statements. Without --yes it only reports what would be removed.
+
+    city <id>   the city, its users, their items and verifications
+    user <id>   the user, the items they added and their verifications
+    item <id>   the item with its categories, tags and verifications
+
+Usage:
+    cd backend
+    python scripts/delete_records.py city 7
+    python scripts/delete_records.py city 7 --yes
+"""
+import argparse
+import os
+import sys
+
+# Add backend directory to path so we can import app modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dotenv import load_dotenv
+from sqlalchemy import func, or_
+
+from app import create_app, db
+from app.models.item import Item
+from app.models.item_verification import ItemVerification
+from app.models.user import User
+from app.services.item_service import ItemService
+from app.services.rotation_city_service import RotationCityService
+from app.services.user_service import UserService
+
+
+def _count(model, *criteria) -> int:
+    """Count the rows of model matching criteria."""
+    return db.session.execute(db.select(func.count()).select_from(model).filter(*criteria)).scalar()
+
+
+def _impact(kind: str, record_id: int) -> dict:
+    """Count the rows the delete would remove."""
+    if kind == 'city':
+        user_ids = db.select(User.user_id).filter(User.rotation_city_id == record_id)
+        items = or_(Item.rotation_city_id == record_id, Item.added_by_user_id.in_(user_ids))
+        item_ids = db.select(Item.item_id).filter(items)
+        return {
+            'users': _count(User, User.rotation_city_id == record_id),
+            'items': _count(Item, items),
+            'verifications': _count(ItemVerification, or_(
+                ItemVerification.item_id.in_(item_ids), ItemVerification.user_id.in_(user_ids)
+            ))
+        }
+    if kind == 'user':
+        item_ids = db.select(Item.item_id).filter(Item.added_by_user_id == record_id)
+        return {
+            'items': _count(Item, Item.added_by_user_id == record_id),
+            'verifications': _count(ItemVerification, or_(
+                ItemVerification.item_id.in_(item_ids), ItemVerification.user_id == record_id
+            ))
+        }
+    return {'verifications': _count(ItemVerification, ItemVerification.item_id == record_id)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('kind', choices=['city', 'user', 'item'], help='what to delete')
+    parser.add_argument('id', type=int, help='ID of the city, user or item')
+    parser.add_argument('--yes', action='store_true', help='delete instead of only reporting')
+    args = parser.parse_args()
+
+    load_dotenv()
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    with app.app_context():
+        impact = ', '.join(f"{count} {name}" for name, count in _impact(args.kind, args.id).items())
+        if not args.yes:
+            print(f"ℹ️  Deleting {args.kind} {args.id} would also remove {impact}. "
+                  f"Run again with --yes to delete.")
+            return
+
+        delete = {
+            'city': RotationCityService().delete_rotation_city,
+            'user': UserService().delete_user,
+            'item': ItemService().delete_item,
+        }[args.kind]
+        if not delete(args.id):
+            print(f"❌ No {args.kind} with ID {args.id}")
+            sys.exit(1)
+        print(f"✅ Deleted {args.kind} {args.id} with {impact}")
+
+
+if __name__ == '__main__':
+    main()
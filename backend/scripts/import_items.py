@@ -0,0 +1,84 @@
+"""
+Import Items
+Bulk imports items from an NDJSON or CSV file into a rotation city.
+
+The file is streamed and written in batches, so it can be much larger than
+the row limit of the POST /item/import endpoint. Invalid rows are listed
+with their line number and skipped. See app/services/item_import_service.py
+for the row format.
+
+Usage:
+    cd backend
+    python scripts/import_items.py items.ndjson --city-id 1 --user-email admin@example.com
+    python scripts/import_items.py items.csv --city-id 1 --user-email admin@example.com --chunk-size 1000
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add backend directory to path so we can import app modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dotenv import load_dotenv
+
+from app import create_app, db
+from app.models.rotation_city import RotationCity
+from app.models.user import User
+from app.services.item_import_service import (
+    IMPORT_CHUNK_SIZE,
+    ItemImportService,
+    read_csv,
+    read_ndjson
+)
+
+READERS = {'ndjson': read_ndjson, 'csv': read_csv}
+# Errors printed before summarizing the rest
+MAX_ERRORS_SHOWN = 50
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('file', help='NDJSON (.ndjson, .jsonl) or CSV (.csv) file')
+    parser.add_argument('--format', choices=sorted(READERS), help='file format (default: from extension)')
+    parser.add_argument('--city-id', type=int, required=True, help='rotation city to add the items to')
+    parser.add_argument('--user-email', required=True, help='email of the user recorded as adding the items')
+    parser.add_argument('--chunk-size', type=int, default=IMPORT_CHUNK_SIZE, help='rows per transaction')
+    args = parser.parse_args()
+
+    file_format = args.format or ('csv' if args.file.lower().endswith('.csv') else 'ndjson')
+
+    load_dotenv()
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    with app.app_context():
+        if db.session.get(RotationCity, args.city_id) is None:
+            sys.exit(f"❌ Rotation city {args.city_id} not found")
+        user = db.session.execute(
+            db.select(User).filter_by(email=args.user_email)
+        ).scalar_one_or_none()
+        if user is None:
+            sys.exit(f"❌ User {args.user_email} not found")
+
+        print(f"📥 Importing {args.file} ({file_format})...")
+        started = time.perf_counter()
+        with open(args.file, encoding='utf-8', newline='') as lines:
+            report = ItemImportService().import_rows(
+                READERS[file_format](lines),
+                rotation_city_id=args.city_id,
+                added_by_user_id=user.user_id,
+                chunk_size=args.chunk_size
+            )
+        elapsed = time.perf_counter() - started
+
+        for error in report.errors[:MAX_ERRORS_SHOWN]:
+            print(f"  ⚠️  line {error['row']}: {error['message']}")
+        if len(report.errors) > MAX_ERRORS_SHOWN:
+            print(f"  ... and {len(report.errors) - MAX_ERRORS_SHOWN} more errors")
+
+        rate = report.imported / elapsed if elapsed else 0
+        print(f"✅ Imported {report.imported} items in {elapsed:.1f}s ({rate:.0f}/s), "
+              f"{len(report.errors)} rows skipped")
+
+
+if __name__ == '__main__':
+    main()
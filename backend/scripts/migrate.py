@@ -0,0 +1,49 @@
+"""
+Migrate
+Applies pending schema migrations, or lists them with --status.
+
+The app also migrates on startup unless MIGRATE_ON_STARTUP=false; run this
+on deploy, before the new version starts, so that workers never race to
+migrate. A new database is created at the latest version.
+
+Usage:
+    cd backend
+    python scripts/migrate.py
+    python scripts/migrate.py --status
+"""
+import argparse
+import os
+import sys
+
+# Add backend directory to path so we can import app modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dotenv import load_dotenv
+
+from app import create_app
+from app.migrations import applied_versions, load_migrations, upgrade_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--status', action='store_true', help='list migrations and whether they are applied')
+    args = parser.parse_args()
+
+    load_dotenv()
+    os.environ['MIGRATE_ON_STARTUP'] = 'false'
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    with app.app_context():
+        if not args.status:
+            for migration in upgrade_database():
+                print(f"🔧 Applied {migration.version:04d} {migration.name}")
+        applied = applied_versions()
+        migrations = load_migrations()
+        if args.status:
+            for migration in migrations:
+                mark = '✓' if migration.version in applied else ' '
+                print(f"  [{mark}] {migration.version:04d} {migration.name}: {migration.description}")
+        print(f"✅ Database schema is at version {max(applied, default=0)} of {len(migrations)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""
+Migrate Images To Blobs
+Moves base64 images out of user.profile_picture and category.category_pic
+into the content-addressed blob store.
+
+Each inline image is stored as a blob and its column is rewritten to the
+blob hash. Values that already are blob hashes or http(s) URLs are left
+alone, so the migration can be re-run safely. Item documents embedding
+a migrated avatar are rebuilt and cached responses invalidated.
+
+Usage:
+    cd backend
+    python scripts/migrate_images_to_blobs.py
+    python scripts/migrate_images_to_blobs.py --batch-size 50 --dry-run
+"""
+import argparse
+import os
+import sys
+
+# Add backend directory to path so we can import app modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dotenv import load_dotenv
+from sqlalchemy import or_
+
+from app import create_app, db
+from app.models.category import Category
+from app.models.data_version import DataVersion
+from app.models.user import User
+from app.repositories.implementations.data_version_repository import DataVersionRepository
+from app.services.blob_service import BlobService
+from app.services.item_service import ItemService
+from app.utils.blobs import is_blob_hash
+
+
+def _inline_images(key_column, image_column):
+    """Filter matching rows whose image column may still hold inline data."""
+    return db.select(key_column, image_column).filter(
+        image_column.isnot(None),
+        image_column != '',
+        ~or_(image_column.like('http://%'), image_column.like('https://%'))
+    )
+
+
+def migrate(model, key_column, image_column, batch_size: int, dry_run: bool) -> list:
+    """Move the inline images of one column into blobs.
+    
+    Rows are walked in primary-key batches and only their key and image
+    columns are loaded, so memory stays bounded by one batch of images.
+    
+    Returns:
+        Keys of the rows that were rewritten
+    """
+    blob_service = BlobService()
+    migrated = []
+    last_key = 0
+
+    while True:
+        rows = db.session.execute(
+            _inline_images(key_column, image_column)
+            .filter(key_column > last_key)
+            .order_by(key_column)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return migrated
+
+        for key, value in rows:
+            last_key = key
+            if is_blob_hash(value):
+                continue
+            try:
+                blob_hash = blob_service.store_image(value)
+            except ValueError as e:
+                print(f"  ⚠️  {model.__tablename__} {key}: {e}; left unchanged")
+                continue
+            if not dry_run:
+                db.session.execute(
+                    db.update(model)
+                    .where(key_column == key)
+                    .values({image_column.key: blob_hash})
+                )
+            migrated.append(key)
+
+        db.session.commit()
+        db.session.expunge_all()
+        print(f"  {model.__tablename__}: {len(migrated)} images migrated...")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--batch-size', type=int, default=100, help='rows per batch')
+    parser.add_argument('--dry-run', action='store_true', help='store blobs but do not rewrite rows')
+    args = parser.parse_args()
+
+    load_dotenv()
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    with app.app_context():
+        print("🖼️  Moving inline images into the blob store...")
+        user_ids = migrate(User, User.user_id, User.profile_picture, args.batch_size, args.dry_run)
+        category_ids = migrate(
+            Category, Category.category_id, Category.category_pic, args.batch_size, args.dry_run
+        )
+
+        if not args.dry_run:
+            item_service = ItemService()
+            for user_id in user_ids:
+                item_service.refresh_user_item_documents(user_id)
+            DataVersionRepository().bump_versions([DataVersion.CATEGORIES, DataVersion.ITEMS])
+
+        print(f"✅ Migrated {len(user_ids)} profile pictures and {len(category_ids)} category images")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""
+Purge Idempotency Keys
+Deletes expired Idempotency-Key records and their stored responses.
+
+Expired keys are already ignored and replaced when reused; this only
+reclaims their space. Meant to run periodically, e.g. daily from cron.
+
+Usage:
+    cd backend
+    python scripts/purge_idempotency_keys.py
+"""
+import argparse
+import os
+import sys
+from datetime import datetime
+
+# Add backend directory to path so we can import app modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dotenv import load_dotenv
+
+from app import create_app
+from app.repositories.implementations.idempotency_key_repository import IdempotencyKeyRepository
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.parse_args()
+
+    load_dotenv()
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    with app.app_context():
+        deleted = IdempotencyKeyRepository().delete_expired(datetime.utcnow())
+        print(f"✅ Deleted {deleted} expired idempotency keys")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Rebuild Item Documents
+Regenerates the precomputed item_document read model for every item.
+
+Documents are normally maintained by the write paths and built lazily on
+first read; run this after deploying the read model to an existing database
+or after changing how items are rendered.
+
+Usage:
+    cd backend
+    python scripts/rebuild_item_documents.py
+    python scripts/rebuild_item_documents.py --batch-size 500
+"""
+import argparse
+import os
+import sys
+
+# Add backend directory to path so we can import app modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dotenv import load_dotenv
+
+from app import create_app, db
+from app.models.item import Item
+from app.services.item_service import ItemService
+
+
+def rebuild(batch_size: int) -> int:
+    """Rebuild documents in primary-key batches.
+
+    Returns:
+        Number of documents written
+    """
+    service = ItemService()
+    written = 0
+    last_id = 0
+
+    while True:
+        item_ids = db.session.execute(
+            db.select(Item.item_id)
+            .filter(Item.item_id > last_id)
+            .order_by(Item.item_id)
+            .limit(batch_size)
+        ).scalars().all()
+        if not item_ids:
+            return written
+
+        written += len(service.refresh_item_documents(item_ids))
+        last_id = item_ids[-1]
+        db.session.expunge_all()
+        print(f"  rebuilt {written} documents...")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--batch-size', type=int, default=200, help='items per batch')
+    args = parser.parse_args()
+
+    load_dotenv()
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    with app.app_context():
+        print("📄 Rebuilding item documents...")
+        written = rebuild(args.batch_size)
+        print(f"✅ Rebuilt {written} item documents")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Rebuild Search Index
+Re-indexes every item and text tag value for full-text search.
+
+The index is normally maintained by the write paths; run this after
+deploying search to an existing database or after importing rows that
+bypassed the services.
+
+Usage:
+    cd backend
+    python scripts/rebuild_search_index.py
+    python scripts/rebuild_search_index.py --batch-size 1000
+"""
+import argparse
+import os
+import sys
+
+# Add backend directory to path so we can import app modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dotenv import load_dotenv
+
+from app import create_app, db
+from app.models.item import Item
+from app.models.value import Value
+from app.repositories.implementations.search_index_repository import get_search_index_repository
+
+
+def rebuild(column, index, batch_size: int) -> int:
+    """Index all rows of one table in primary-key batches.
+
+    Args:
+        column: Primary key column of the table to walk
+        index: Callable indexing a list of primary keys
+
+    Returns:
+        Number of rows processed
+    """
+    processed = 0
+    last_id = 0
+
+    while True:
+        ids = db.session.execute(
+            db.select(column)
+            .filter(column > last_id)
+            .order_by(column)
+            .limit(batch_size)
+        ).scalars().all()
+        if not ids:
+            return processed
+
+        index(ids)
+        processed += len(ids)
+        last_id = ids[-1]
+        print(f"  indexed {processed} rows...")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--batch-size', type=int, default=500, help='rows per batch')
+    args = parser.parse_args()
+
+    load_dotenv()
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    with app.app_context():
+        search_index = get_search_index_repository()
+        print("🔎 Rebuilding search index...")
+        values = rebuild(Value.value_id, search_index.index_values, args.batch_size)
+        items = rebuild(Item.item_id, search_index.index_items, args.batch_size)
+        print(f"✅ Indexed {items} items and {values} values")
+
+
+if __name__ == '__main__':
+    main()
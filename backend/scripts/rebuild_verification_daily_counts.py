@@ -0,0 +1,41 @@
+"""
+Rebuild Verification Daily Counts
+Recomputes the per-city, per-item daily verification rollup from the verifications.
+
+Verifying an item adds to its row for the day in place, and migration 0005
+fills the rollup once. Rows inserted or deleted outside the API leave it
+off; this replaces it with one DELETE and one grouped INSERT ... SELECT over
+item_verification, not a per-item loop.
+
+Usage:
+    cd backend
+    python scripts/rebuild_verification_daily_counts.py
+"""
+import argparse
+import os
+import sys
+import time
+
+# Add backend directory to path so we can import app modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dotenv import load_dotenv
+
+from app import create_app
+from app.services.verification_service import VerificationService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.parse_args()
+
+    load_dotenv()
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    with app.app_context():
+        started = time.perf_counter()
+        rows = VerificationService().rebuild_daily_counts()
+        print(f"✅ Wrote {rows} daily count rows in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
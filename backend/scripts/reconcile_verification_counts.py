@@ -0,0 +1,42 @@
+"""
+Reconcile Verification Counts
+Recounts item verifications and fixes counters that have drifted.
+
+Verifying an item increments its number_of_verifications in place. Rows
+deleted or inserted outside the API leave the counter off; this corrects
+every such item with one set-based UPDATE. Meant to run periodically,
+e.g. nightly from cron.
+
+Usage:
+    cd backend
+    python scripts/reconcile_verification_counts.py
+"""
+import argparse
+import os
+import sys
+
+# Add backend directory to path so we can import app modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from dotenv import load_dotenv
+
+from app import create_app
+from app.services.verification_service import VerificationService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.parse_args()
+
+    load_dotenv()
+    app = create_app(os.getenv('FLASK_ENV', 'development'))
+    with app.app_context():
+        item_ids = VerificationService().reconcile_verification_counts()
+        if item_ids:
+            print(f"🔧 Corrected {len(item_ids)} items: {', '.join(map(str, item_ids[:20]))}"
+                  f"{' ...' if len(item_ids) > 20 else ''}")
+        print("✅ Verification counts are consistent")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,19 +3,36 @@ Seed Script - Populate Initial Data
 Standalone script to populate rotation cities and other initial data.
 Run this once to set up the database with seed data.
 
+With --synthetic it instead generates a large random dataset for load and
+benchmark runs: N cities x M users x K items, with tags, categories, avatars
+and verifications, reproducible from --seed. Rows are written with bulk Core
+inserts.
+
 Usage:
     cd backend
     python seed/seed.py
     # or
     .venv\Scripts\python.exe seed/seed.py
+    # synthetic dataset, e.g. ~1M verifications
+    python seed/seed.py --synthetic --cities 4 --users-per-city 500 \
+        --items-per-city 25000 --tags 60 --verifications 1000000
 """
+import argparse
 import os
+import random
+import struct
 import sys
 import base64
+import time
+import zlib
+from bisect import bisect
+from datetime import datetime, timedelta
 
 # Add backend directory to path so we can import app modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+from sqlalchemy import insert
+
 from app import create_app, db
 from app.models.rotation_city import RotationCity
 from app.models.category import Category
@@ -24,7 +41,18 @@ from app.models.value import Value
 from app.models.item import Item
 from app.models.category_item import CategoryItem
 from app.models.item_tag_value import ItemTagValue
+from app.models.item_verification import ItemVerification
 from app.models.user import User
+from app.models.verification_stutus_enum import VerificationStatusEnum
+from app.models.data_version import DataVersion
+from app.repositories.bulk_insert import insert_returning_ids
+from app.repositories.implementations.data_version_repository import DataVersionRepository
+from app.repositories.implementations.item_repository import ItemRepository
+from app.repositories.implementations.search_index_repository import get_search_index_repository
+from app.repositories.implementations.verification_daily_count_repository import (
+    VerificationDailyCountRepository
+)
+from app.services.blob_service import BlobService
 
 
 def load_image_as_base64(image_path):
@@ -148,16 +176,17 @@ def seed_categories():
     ]
     
     # Create and add categories
+    blob_service = BlobService()
     for cat_data in categories:
         image_path = cat_data.pop('image_path')
         
         # Load image as base64
         image_base64 = load_image_as_base64(image_path)
         
-        # Create category with base64 encoded image
+        # Store the image as a blob; the category keeps its hash
         category = Category(
             category_name=cat_data['category_name'],
-            category_pic=image_base64
+            category_pic=blob_service.store_image(image_base64)
         )
         db.session.add(category)
     
@@ -277,8 +306,12 @@ def seed_items_argentina():
     # Get categories and tags
     categories = {cat.category_name: cat for cat in db.session.query(Category).all()}
     tags = {tag.name: tag for tag in db.session.query(Tag).all()}
+    # Values are interned per (tag, typed value); reuse rows across items
     values = db.session.query(Value).all()
-    value_dict = {val.name_val: val for val in values if val.name_val}
+    value_dict = {
+        (val.tag_id, val.boolean_val, val.name_val, val.numerical_value): val
+        for val in values
+    }
     
     # Define items for Argentina
     items_data = [
@@ -374,28 +407,25 @@ def seed_items_argentina():
             if tag_name in tags:
                 tag_obj = tags[tag_name]
                 
-                # Create value if needed (for boolean/numeric)
+                # Use the existing value if available, else create it
                 if isinstance(tag_value, bool):
-                    value = Value(
-                        tag_id=tag_obj.tag_id,
-                        boolean_val=tag_value
-                    )
+                    key = (tag_obj.tag_id, tag_value, None, None)
                 elif isinstance(tag_value, (int, float)):
+                    key = (tag_obj.tag_id, None, None, float(tag_value))
+                else:
+                    key = (tag_obj.tag_id, None, tag_value, None)
+                
+                value = value_dict.get(key)
+                if not value:
                     value = Value(
                         tag_id=tag_obj.tag_id,
-                        numerical_value=tag_value
+                        boolean_val=key[1],
+                        name_val=key[2],
+                        numerical_value=key[3]
                     )
-                else:
-                    # Use existing value if available
-                    value = value_dict.get(tag_value)
-                    if not value:
-                        value = Value(
-                            tag_id=tag_obj.tag_id,
-                            name_val=tag_value
-                        )
-                
-                db.session.add(value)
-                db.session.flush()
+                    db.session.add(value)
+                    db.session.flush()
+                    value_dict[key] = value
                 
                 # Link value to item
                 itv = ItemTagValue(
@@ -412,8 +442,316 @@ def seed_items_argentina():
         print(f"   {i}. {item.name} (ID: {item.item_id}) - {item.location}")
 
 
+# Synthetic dataset generation ------------------------------------------------
+
+# Rows sent per INSERT ... VALUES batch
+SYNTHETIC_CHUNK_SIZE = 20000
+# Distinct generated avatars; users reuse them so blob storage stays small
+SYNTHETIC_AVATARS = 64
+# Share of users with a profile picture
+SYNTHETIC_AVATAR_RATE = 0.7
+# Zipf exponent for how unevenly tags, values, categories and authors are used
+SYNTHETIC_SKEW = 1.1
+SYNTHETIC_HISTORY_DAYS = 365
+
+_TIME_ZONES = ['America/Los_Angeles', 'Asia/Seoul', 'Asia/Kolkata', 'Europe/Berlin',
+               'America/Argentina/Buenos_Aires', 'Asia/Taipei', 'Europe/London', 'Asia/Tokyo']
+_FIRST_NAMES = ['Ana', 'Ben', 'Chloe', 'Diego', 'Emma', 'Farah', 'Gabe', 'Hana', 'Ivan',
+                'Jia', 'Kofi', 'Lena', 'Mateo', 'Nia', 'Omar', 'Priya', 'Rui', 'Sofia']
+_LAST_NAMES = ['Kim', 'Garcia', 'Chen', 'Okafor', 'Silva', 'Novak', 'Patel', 'Rossi',
+               'Haddad', 'Tanaka', 'Muller', 'Lopez', 'Nguyen', 'Smith']
+_ITEM_WORDS = ['Corner', 'Central', 'Green', 'Old Town', 'Riverside', 'Night', 'Family',
+               'Campus', 'Little', 'Grand', 'Sunny', 'Quiet', 'Express', 'Golden']
+_ITEM_KINDS = ['Cafe', 'Market', 'Pharmacy', 'Gym', 'Library', 'Bakery', 'Kiosk', 'Bank',
+               'Laundry', 'Diner', 'Station', 'Bookshop', 'Noodle Bar', 'Co-working']
+_STREETS = ['Main St', 'Market St', 'Av. Corrientes', 'Gangnam-daero', 'Xinyi Rd',
+            'Harbour Rd', 'Park Ave', 'Station Sq', 'Mill Ln', 'Hill St']
+_TAG_WORDS = ['Wifi', 'Outlets', 'Card Payment', 'Price Range', 'Noise Level', 'Cuisine',
+              'Opening Hours', 'Rating', 'Seats', 'Student Discount', 'Open Late',
+              'Wheelchair Access', 'Queue Time', 'Language', 'Pet Friendly']
+_TEXT_WORDS = ['Cheap', 'Mid-range', 'Pricey', 'Quiet', 'Lively', 'Vegan', 'Local',
+               'Spanish', 'English', 'Korean', 'Mandarin', 'Mornings', 'Evenings',
+               'Weekends', 'Excellent', 'Good', 'Fair', 'Busy', 'Calm', 'Cozy']
+_NOTES = ['Still here', 'Open today', 'Prices went up', 'Card machine works',
+          'Closed early', 'Busy at lunch', 'New owners', 'Renovated']
+
+
+def _zipf_cum_weights(count, skew=SYNTHETIC_SKEW):
+    """Cumulative Zipf weights for picking among count ranked options."""
+    total = 0.0
+    cum_weights = []
+    for rank in range(1, count + 1):
+        total += 1.0 / rank ** skew
+        cum_weights.append(total)
+    return cum_weights
+
+
+def _pick_distinct(rng, cum_weights, k):
+    """Pick k distinct indexes, favouring low ranks."""
+    k = min(k, len(cum_weights))
+    picked = []
+    while len(picked) < k:
+        index = bisect(cum_weights, rng.random() * cum_weights[-1])
+        if index not in picked:
+            picked.append(index)
+    return picked
+
+
+def _avatar_png(rng):
+    """A random 8x8 identicon scaled to 64x64, as PNG bytes."""
+    color = bytes(rng.randrange(40, 220) for _ in range(3))
+    background = b'\xf0\xf0\xf0'
+    cells = [[rng.random() < 0.5 for _ in range(4)] for _ in range(8)]
+    rows = []
+    for y in range(64):
+        cell_row = cells[y // 8]
+        mirrored = cell_row + cell_row[::-1]
+        pixels = b''.join((color if mirrored[x // 8] else background) for x in range(64))
+        rows.append(b'\x00' + pixels)
+
+    def chunk(kind, data):
+        return (struct.pack('>I', len(data)) + kind + data
+                + struct.pack('>I', zlib.crc32(kind + data) & 0xffffffff))
+
+    return (b'\x89PNG\r\n\x1a\n'
+            + chunk(b'IHDR', struct.pack('>IIBBBBB', 64, 64, 8, 2, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(b''.join(rows)))
+            + chunk(b'IEND', b''))
+
+
+def _insert_chunked(table, rows):
+    """Insert an iterable of row dicts with multi-row INSERTs in fixed-size chunks.
+
+    Returns:
+        Number of rows inserted
+    """
+    inserted = 0
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == SYNTHETIC_CHUNK_SIZE:
+            db.session.execute(insert(table), chunk)
+            inserted += len(chunk)
+            chunk = []
+    if chunk:
+        db.session.execute(insert(table), chunk)
+        inserted += len(chunk)
+    return inserted
+
+
+def seed_synthetic(cities, users_per_city, items_per_city, tags, verifications,
+                   max_tags_per_item=6, seed=162):
+    """Generate a large, reproducible random dataset.
+
+    Tag, value, category and author usage follow Zipf distributions, so a
+    few are very common and most are rare; verifications concentrate on
+    popular items the same way. Item counters (number_of_verifications,
+    last_verified_date, freshness) and the daily verification counts match
+    the generated verifications.
+
+    Args:
+        cities: Number of rotation cities to create
+        users_per_city: Users created in each city
+        items_per_city: Items created in each city
+        tags: Number of tags shared by all cities
+        verifications: Total verifications across all items
+        max_tags_per_item: Upper bound on tags per item
+        seed: Random seed; the same arguments and seed give the same data
+    """
+    rng = random.Random(seed)
+    now = datetime.utcnow().replace(microsecond=0)
+    started = time.perf_counter()
+    print(f"🧪 Generating synthetic dataset (seed {seed})...")
+
+    city_names = [f'Synthetic {seed}-{n + 1}' for n in range(cities)]
+    if db.session.query(RotationCity).filter(RotationCity.name.in_(city_names)).count():
+        print(f"ℹ️  A synthetic dataset with seed {seed} already exists. Skipping.")
+        return
+
+    seed_categories()
+    category_ids = [category_id for (category_id,) in db.session.query(Category.category_id).all()]
+    rng.shuffle(category_ids)
+    category_weights = _zipf_cum_weights(len(category_ids))
+
+    blob_service = BlobService()
+    avatars = [
+        blob_service.store_image(base64.b64encode(_avatar_png(rng)).decode('ascii'))
+        for _ in range(SYNTHETIC_AVATARS)
+    ]
+
+    # Tags, their interned values and how often each is used
+    tag_rows = []
+    for n in range(tags):
+        kind = rng.choices(
+            [TagValueType.BOOLEAN, TagValueType.TEXT, TagValueType.NUMERIC], [4, 4, 2]
+        )[0]
+        tag_rows.append({
+            'name': f'{_TAG_WORDS[n % len(_TAG_WORDS)]} {seed}-{n + 1}',
+            'value_type': kind.code,
+            'can_add_new_value': True
+        })
+    tag_ids = insert_returning_ids(Tag.tag_id, tag_rows)
+    value_rows = []
+    for tag_id, tag_row in zip(tag_ids, tag_rows):
+        if tag_row['value_type'] == TagValueType.BOOLEAN.code:
+            typed = [('boolean_val', flag) for flag in (True, False)]
+        elif tag_row['value_type'] == TagValueType.TEXT.code:
+            typed = [('name_val', word) for word in rng.sample(_TEXT_WORDS, rng.randint(3, 12))]
+        else:
+            typed = [('numerical_value', float(number))
+                     for number in sorted(rng.sample(range(1, 200), rng.randint(5, 40)))]
+        for column, val in typed:
+            value_rows.append({'tag_id': tag_id, 'boolean_val': None, 'name_val': None,
+                               'numerical_value': None, column: val})
+    value_ids = insert_returning_ids(Value.value_id, value_rows)
+    values_by_tag = {}
+    for value_id, value_row in zip(value_ids, value_rows):
+        values_by_tag.setdefault(value_row['tag_id'], []).append(value_id)
+    value_weights = {tag_id: _zipf_cum_weights(len(ids)) for tag_id, ids in values_by_tag.items()}
+    tag_weights = _zipf_cum_weights(len(tag_ids))
+    print(f"   {len(tag_ids)} tags with {len(value_ids)} values")
+
+    city_ids = insert_returning_ids(RotationCity.city_id, [
+        {'name': name, 'time_zone': _TIME_ZONES[n % len(_TIME_ZONES)],
+         'res_hall_location': f'{rng.randint(1, 999)} {rng.choice(_STREETS)}'}
+        for n, name in enumerate(city_names)
+    ])
+
+    user_rows = []
+    for city_index, city_id in enumerate(city_ids):
+        for n in range(users_per_city):
+            joined = now - timedelta(days=rng.uniform(0, SYNTHETIC_HISTORY_DAYS))
+            user_rows.append({
+                'rotation_city_id': city_id,
+                'first_name': rng.choice(_FIRST_NAMES),
+                'last_name': rng.choice(_LAST_NAMES),
+                'email': f'user{city_index + 1}.{n + 1}.{seed}@synthetic.example',
+                'profile_picture': rng.choice(avatars) if rng.random() < SYNTHETIC_AVATAR_RATE else None,
+                'created_at': joined,
+                'updated_at': joined,
+                'is_verified': True,
+                'status': VerificationStatusEnum.VERIFIED.code
+            })
+    user_ids = insert_returning_ids(User.user_id, user_rows)
+    users_by_city = {
+        city_id: user_ids[index * users_per_city:(index + 1) * users_per_city]
+        for index, city_id in enumerate(city_ids)
+    }
+    author_weights = _zipf_cum_weights(users_per_city)
+    print(f"   {len(city_ids)} cities with {len(user_ids)} users")
+
+    # Verifications land on items by popularity
+    item_count = cities * items_per_city
+    popularity = list(range(item_count))
+    rng.shuffle(popularity)
+    counts = [0] * item_count
+    item_weights = _zipf_cum_weights(item_count, skew=0.8)
+    for rank in rng.choices(range(item_count), cum_weights=item_weights, k=verifications):
+        counts[popularity[rank]] += 1
+
+    item_rows = []
+    verification_plan = []
+    for index in range(item_count):
+        city_id = city_ids[index // items_per_city]
+        city_users = users_by_city[city_id]
+        created_at = now - timedelta(seconds=rng.uniform(0, SYNTHETIC_HISTORY_DAYS * 86400))
+        last_verified = None
+        if counts[index]:
+            # The latest of n uniform draws over the item's lifetime
+            span = (now - created_at).total_seconds()
+            last_verified = created_at + timedelta(seconds=span * rng.random() ** (1 / counts[index]))
+        verification_plan.append((created_at, last_verified))
+        item_rows.append({
+            'added_by_user_id': city_users[bisect(author_weights, rng.random() * author_weights[-1])],
+            'rotation_city_id': city_id,
+            'name': f'{rng.choice(_ITEM_WORDS)} {rng.choice(_ITEM_KINDS)} {index + 1}',
+            'location': f'{rng.randint(1, 2999)} {rng.choice(_STREETS)}',
+            'walking_distance': round(rng.lognormvariate(6, 0.8), 1) if rng.random() < 0.8 else None,
+            'last_verified_date': last_verified,
+            'number_of_verifications': counts[index],
+            'created_at': created_at
+        })
+    item_ids = []
+    for start in range(0, item_count, SYNTHETIC_CHUNK_SIZE):
+        item_ids += insert_returning_ids(Item.item_id, item_rows[start:start + SYNTHETIC_CHUNK_SIZE])
+    print(f"   {len(item_ids)} items")
+
+    def category_links():
+        for item_id in item_ids:
+            for index in _pick_distinct(rng, category_weights, rng.choices([1, 2, 3], [6, 3, 1])[0]):
+                yield {'item_id': item_id, 'category_id': category_ids[index]}
+
+    def tag_value_links():
+        for item_id in item_ids:
+            for index in _pick_distinct(rng, tag_weights, rng.randint(0, max_tags_per_item)):
+                tag_id = tag_ids[index]
+                weights = value_weights[tag_id]
+                value_index = bisect(weights, rng.random() * weights[-1])
+                yield {'item_id': item_id, 'value_id': values_by_tag[tag_id][value_index]}
+
+    def verification_rows():
+        for index, item_id in enumerate(item_ids):
+            if not counts[index]:
+                continue
+            city_users = users_by_city[item_rows[index]['rotation_city_id']]
+            created_at, last_verified = verification_plan[index]
+            span = (last_verified - created_at).total_seconds()
+            for n in range(counts[index]):
+                yield {
+                    'user_id': rng.choice(city_users),
+                    'item_id': item_id,
+                    'note': rng.choice(_NOTES) if rng.random() < 0.15 else None,
+                    'created_at': last_verified if n == 0 else created_at + timedelta(
+                        seconds=span * rng.random()
+                    )
+                }
+
+    print(f"   {_insert_chunked(CategoryItem.__table__, category_links())} category links")
+    print(f"   {_insert_chunked(ItemTagValue.__table__, tag_value_links())} tag value links")
+    print(f"   {_insert_chunked(ItemVerification.__table__, verification_rows())} verifications")
+    ItemRepository().backfill_freshness()
+    VerificationDailyCountRepository().rebuild()
+    db.session.commit()
+    print(f"✅ Generated synthetic dataset in {time.perf_counter() - started:.1f}s")
+    print("   Item documents are built on first read; run scripts/rebuild_item_documents.py")
+    print("   and scripts/rebuild_search_index.py to precompute them and the search index.")
+
+
+def bump_data_versions():
+    """Invalidate cached responses and ETags for everything seeded."""
+    city_ids = [city_id for (city_id,) in db.session.query(RotationCity.city_id).all()]
+    DataVersionRepository().bump_versions(
+        [
+            DataVersion.CATEGORIES,
+            DataVersion.TAGS,
+            DataVersion.VALUES,
+            DataVersion.ROTATION_CITIES,
+            DataVersion.ITEMS
+        ] + [DataVersion.city_items_scope(city_id) for city_id in city_ids]
+    )
+
+
+def build_search_index():
+    """Index seeded items and text values for full-text search."""
+    search_index = get_search_index_repository()
+    search_index.index_values([value_id for (value_id,) in db.session.query(Value.value_id).all()])
+    search_index.index_items([item_id for (item_id,) in db.session.query(Item.item_id).all()])
+
+
 def main():
     """Main seed function."""
+    parser = argparse.ArgumentParser(description='Populate the database with seed data.')
+    parser.add_argument('--synthetic', action='store_true',
+                        help='generate a large random dataset instead of the fixed seed data')
+    parser.add_argument('--cities', type=int, default=3, help='synthetic rotation cities')
+    parser.add_argument('--users-per-city', type=int, default=200, help='synthetic users per city')
+    parser.add_argument('--items-per-city', type=int, default=5000, help='synthetic items per city')
+    parser.add_argument('--tags', type=int, default=40, help='synthetic tags')
+    parser.add_argument('--max-tags-per-item', type=int, default=6, help='upper bound on tags per item')
+    parser.add_argument('--verifications', type=int, default=100000, help='synthetic verifications in total')
+    parser.add_argument('--seed', type=int, default=162, help='random seed for the synthetic dataset')
+    args = parser.parse_args()
+
     # Get environment from OS variable, default to 'development'
     config_name = os.getenv('FLASK_ENV', 'development')
     
@@ -428,6 +766,23 @@ def main():
         print(f"Database: {app.config.get('SQLALCHEMY_DATABASE_URI')}")
         print()
         
+        if args.synthetic:
+            seed_synthetic(
+                cities=args.cities,
+                users_per_city=args.users_per_city,
+                items_per_city=args.items_per_city,
+                tags=args.tags,
+                verifications=args.verifications,
+                max_tags_per_item=args.max_tags_per_item,
+                seed=args.seed
+            )
+            bump_data_versions()
+            print()
+            print("=" * 60)
+            print("✅ Seeding completed successfully!")
+            print("=" * 60)
+            return
+        
         # Run seed functions
         seed_rotation_cities()
         print()
@@ -438,6 +793,8 @@ def main():
         seed_values()
         print()
         seed_items_argentina()
+        build_search_index()
+        bump_data_versions()
         
         print()
         print("=" * 60)
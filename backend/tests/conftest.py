@@ -4,6 +4,7 @@ Pytest setup, hooks, and infrastructure fixtures.
 All model-specific fixtures are in tests/fixtures/ directory.
 """
 import pytest
+from sqlalchemy import event
 from app import create_app, db
 
 # Import all fixtures from the fixtures package
@@ -27,13 +28,15 @@ def setup_database(app):
     
     This fixture runs before each test and:
     1. Creates all tables
-    2. Yields control to the test
-    3. Drops all tables after the test
+    2. Clears the in-process response cache
+    3. Yields control to the test
+    4. Drops all tables after the test
     
     This ensures complete isolation between tests.
     """
     with app.app_context():
         db.create_all()
+        app.extensions['response_cache'].clear()
         yield
         db.session.remove()
         db.drop_all()
@@ -61,3 +64,21 @@ def db_session(app):
     """
     with app.app_context():
         yield db.session
+
+
+@pytest.fixture
+def sql_statements(app):
+    """Record the SQL statements executed while the test runs.
+    
+    Yields a list that fills up with every statement sent to the database,
+    for asserting on what a request actually queried.
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', record)
+        yield statements
+        event.remove(db.engine, 'before_cursor_execute', record)
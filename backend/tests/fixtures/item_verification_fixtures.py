@@ -48,6 +48,7 @@ def old_verification(db_session, user, item):
     # Manually set created_at to yesterday
     yesterday = datetime.utcnow() - timedelta(days=1)
     verification.created_at = yesterday
+    item.number_of_verifications = 1
     db_session.commit()
     db_session.refresh(verification)
     return verification
@@ -85,6 +86,7 @@ def multiple_verifications(db_session, user, verified_user, item):
     db_session.add(v3)
     verifications.append(v3)
     
+    item.number_of_verifications = len(verifications)
     db_session.commit()
     for v in verifications:
         db_session.refresh(v)
@@ -0,0 +1,51 @@
+"""Integration tests for blob routes."""
+import base64
+import pytest
+from app.services.auth.token_service import TokenService
+
+PNG = b'\x89PNG\r\n\x1a\n' + b'\x01' * 32
+PNG_DATA_URI = 'data:image/png;base64,' + base64.b64encode(PNG).decode('ascii')
+
+
+@pytest.mark.integration
+class TestBlobRoutes:
+    """Tests for the /api/v1/blob endpoint."""
+
+    def test_profile_picture_is_served_as_blob_url(
+        self,
+        client,
+        verified_user,
+        app_context
+    ):
+        """Test that an uploaded avatar is returned as a URL serving its bytes."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+
+        client.put('/api/v1/user/me', json={'profile_picture': PNG_DATA_URI}, headers=headers)
+        url = client.get('/api/v1/user/me', headers=headers).get_json()['profile_picture']
+
+        assert url.startswith('/api/v1/blob/')
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.data == PNG
+        assert response.mimetype == 'image/png'
+        assert response.headers['Cache-Control'] == 'public, max-age=31536000, immutable'
+
+    def test_get_blob_not_modified(self, client, verified_user, app_context):
+        """Test that a cached blob is answered with 304."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        client.put('/api/v1/user/me', json={'profile_picture': PNG_DATA_URI}, headers=headers)
+        url = client.get('/api/v1/user/me', headers=headers).get_json()['profile_picture']
+        blob_hash = url.rsplit('/', 1)[-1]
+
+        response = client.get(url, headers={'If-None-Match': f'"{blob_hash}"'})
+
+        assert response.status_code == 304
+        assert response.data == b''
+
+    def test_get_blob_not_found(self, client):
+        """Test that an unknown hash returns 404."""
+        response = client.get('/api/v1/blob/' + '0' * 64)
+
+        assert response.status_code == 404
@@ -3,6 +3,7 @@ Integration tests for category routes
 """
 import pytest
 from app.services.auth.token_service import TokenService
+from app.services.category_service import CategoryService
 
 
 @pytest.mark.integration
@@ -173,3 +174,41 @@ class TestCategoryRoutes:
         )
         
         assert response.status_code == 401
+
+    def test_get_all_categories_not_modified(
+        self, client, category, verified_user, app_context
+    ):
+        """Test GET /api/v1/category/ answers 304 for a current ETag"""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+
+        response = client.get('/api/v1/category/', headers=headers)
+        etag = response.headers['ETag']
+        assert response.headers['Cache-Control'] == 'private, no-cache'
+
+        response = client.get(
+            '/api/v1/category/',
+            headers={**headers, 'If-None-Match': etag}
+        )
+
+        assert response.status_code == 304
+        assert response.data == b''
+
+    def test_get_all_categories_etag_changes_after_write(
+        self, client, category, verified_user, app_context
+    ):
+        """Test a category write invalidates previously issued ETags"""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+
+        etag = client.get('/api/v1/category/', headers=headers).headers['ETag']
+        CategoryService().add_category('Garden', None)
+
+        response = client.get(
+            '/api/v1/category/',
+            headers={**headers, 'If-None-Match': etag}
+        )
+
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+        assert len(response.get_json()) == 2
@@ -0,0 +1,147 @@
+"""Integration tests for Idempotency-Key handling on write endpoints."""
+from datetime import datetime, timedelta
+import pytest
+from flask import json
+from app import db
+from app.models import IdempotencyKey, Item, ItemVerification
+from app.models.category import Category
+from app.repositories.implementations.idempotency_key_repository import IdempotencyKeyRepository
+from app.services.auth.token_service import TokenService
+from app.utils import idempotency
+
+
+@pytest.mark.integration
+@pytest.mark.api
+class TestIdempotency:
+    """Test that retried writes with an Idempotency-Key run once."""
+
+    @pytest.fixture
+    def headers(self, verified_user):
+        tokens = TokenService.generate_tokens(verified_user)
+        return {'Authorization': f'Bearer {tokens["access_token"]}', 'Idempotency-Key': 'retry-1'}
+
+    @pytest.fixture
+    def item_body(self, db_session):
+        category = Category(category_name="Food")
+        db.session.add(category)
+        db.session.commit()
+        return {
+            "name": "Corner Cafe",
+            "location": "Centro",
+            "category_ids": [category.category_id],
+            "existing_tags": [],
+            "new_tags": []
+        }
+
+    def test_retried_create_item_is_replayed(self, client, headers, item_body, app_context):
+        """Test that a retry returns the first response without a second item."""
+        first = client.post('/api/v1/item/', headers=headers, json=item_body)
+        retry = client.post('/api/v1/item/', headers=headers, json=item_body)
+
+        assert first.status_code == 201
+        assert retry.status_code == 201
+        assert retry.headers['Idempotent-Replayed'] == 'true'
+        assert 'Idempotent-Replayed' not in first.headers
+        assert json.loads(retry.data) == json.loads(first.data)
+        assert db.session.query(Item).count() == 1
+
+    def test_requests_without_key_are_not_deduplicated(self, client, headers, item_body, app_context):
+        """Test that the header is opt-in."""
+        del headers['Idempotency-Key']
+        client.post('/api/v1/item/', headers=headers, json=item_body)
+        client.post('/api/v1/item/', headers=headers, json=item_body)
+
+        assert db.session.query(Item).count() == 2
+
+    def test_key_reused_for_different_request_is_rejected(self, client, headers, item_body, app_context):
+        """Test that one key cannot stand for two different requests."""
+        client.post('/api/v1/item/', headers=headers, json=item_body)
+
+        response = client.post('/api/v1/item/', headers=headers, json={**item_body, "name": "Other"})
+
+        assert response.status_code == 422
+        assert db.session.query(Item).count() == 1
+
+    def test_retried_verification_is_replayed(self, client, headers, item, app_context):
+        """Test that a retried verification neither duplicates nor fails as 'already verified'."""
+        url = f'/api/v1/verification/items/{item.item_id}'
+
+        first = client.post(url, headers=headers, json={'note': 'Still here'})
+        retry = client.post(url, headers=headers, json={'note': 'Still here'})
+
+        assert first.status_code == 201
+        assert retry.status_code == 201
+        assert json.loads(retry.data)['verification_id'] == json.loads(first.data)['verification_id']
+        assert db.session.query(ItemVerification).count() == 1
+
+    def test_server_error_releases_key(self, client, headers, item, app_context, monkeypatch):
+        """Test that a failed request is not replayed, so the retry runs."""
+        from app.api.v1 import verification
+        url = f'/api/v1/verification/items/{item.item_id}'
+        real_verify = verification.verification_service.verify_item
+
+        def fail(**kwargs):
+            raise RuntimeError("database went away")
+
+        monkeypatch.setattr(verification.verification_service, 'verify_item', fail)
+        assert client.post(url, headers=headers, json={}).status_code == 500
+        monkeypatch.setattr(verification.verification_service, 'verify_item', real_verify)
+
+        assert client.post(url, headers=headers, json={}).status_code == 201
+
+    def test_duplicate_in_flight_waits_for_first_response(
+        self, client, headers, item, verified_user, app_context, monkeypatch
+    ):
+        """Test that a retry arriving mid-request gets the first request's response."""
+        url = f'/api/v1/verification/items/{item.item_id}'
+        # Take the first request's response, then stage it as still running
+        stored = client.post(url, headers=headers, json={})
+        record = db.session.get(IdempotencyKey, (verified_user.user_id, 'retry-1'))
+        request_hash = record.request_hash
+        db.session.delete(record)
+        db.session.commit()
+        repo = IdempotencyKeyRepository()
+        repo.claim(verified_user.user_id, 'retry-1', request_hash, datetime.utcnow() + timedelta(minutes=1))
+
+        def finish_first_request(seconds):
+            repo.complete(
+                verified_user.user_id, 'retry-1',
+                status=201,
+                body=stored.get_data(as_text=True),
+                content_type='application/json',
+                expires_at=datetime.utcnow() + timedelta(days=1)
+            )
+
+        monkeypatch.setattr(idempotency.time, 'sleep', finish_first_request)
+        response = client.post(url, headers=headers, json={})
+
+        assert response.status_code == 201
+        assert response.headers['Idempotent-Replayed'] == 'true'
+        assert db.session.query(ItemVerification).count() == 1
+
+    def test_duplicate_in_flight_times_out(self, client, headers, item, verified_user, app, app_context, monkeypatch):
+        """Test that a retry gives up with 409 if the first request does not finish."""
+        url = f'/api/v1/verification/items/{item.item_id}'
+        with app.test_request_context(url, method='POST', json={}):
+            request_hash = idempotency.fingerprint_request()
+        IdempotencyKeyRepository().claim(
+            verified_user.user_id, 'retry-1', request_hash, datetime.utcnow() + timedelta(minutes=1)
+        )
+        monkeypatch.setitem(app.config, 'IDEMPOTENCY_WAIT_SECONDS', 0)
+
+        response = client.post(url, headers=headers, json={})
+
+        assert response.status_code == 409
+        assert response.headers['Retry-After'] == '1'
+        assert db.session.query(ItemVerification).count() == 0
+
+    def test_expired_claim_can_be_taken_over(self, client, headers, item, verified_user, app_context):
+        """Test that a key held by a request that died is claimed again."""
+        IdempotencyKeyRepository().claim(
+            verified_user.user_id, 'retry-1', 'dead-request', datetime.utcnow() - timedelta(seconds=1)
+        )
+
+        response = client.post(f'/api/v1/verification/items/{item.item_id}', headers=headers, json={})
+
+        assert response.status_code == 201
+        assert IdempotencyKeyRepository().delete_expired(datetime.utcnow()) == 0
@@ -600,3 +600,653 @@ class TestItemRoutes:
         assert data[1]['name'] == "Item 1"
         assert data[2]['name'] == "Item 0"
 
+
+    def test_get_all_items_paginates_with_cursor(self, client, verified_user, app_context, db_session):
+        """Test that limit/cursor walk the feed newest first without gaps."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        category = Category(category_name="Test")
+        db.session.add(category)
+        db.session.commit()
+        
+        for i in range(5):
+            item_data = {
+                "name": f"Item {i}",
+                "location": f"Location {i}",
+                "category_ids": [category.category_id],
+                "existing_tags": [],
+                "new_tags": []
+            }
+            client.post('/api/v1/item/', headers=headers, json=item_data)
+        
+        response = client.get('/api/v1/item/?limit=2', headers=headers)
+        
+        assert response.status_code == 200
+        page = json.loads(response.data)
+        assert [item['name'] for item in page['items']] == ["Item 4", "Item 3"]
+        assert page['next_cursor'] is not None
+        
+        names = [item['name'] for item in page['items']]
+        while page['next_cursor']:
+            response = client.get(
+                f"/api/v1/item/?limit=2&cursor={page['next_cursor']}",
+                headers=headers
+            )
+            assert response.status_code == 200
+            page = json.loads(response.data)
+            names.extend(item['name'] for item in page['items'])
+        
+        assert names == ["Item 4", "Item 3", "Item 2", "Item 1", "Item 0"]
+
+    def test_get_all_items_sorted_by_freshness(self, client, verified_user, app_context, db_session):
+        """Test that sort=freshness pages items by decayed verification count."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        category = Category(category_name="Test")
+        db.session.add(category)
+        db.session.commit()
+        item_ids = []
+        for i in range(3):
+            response = client.post('/api/v1/item/', headers=headers, json={
+                "name": f"Item {i}",
+                "location": f"Location {i}",
+                "category_ids": [category.category_id]
+            })
+            item_ids.append(json.loads(response.data)['item_id'])
+        # Item 0 is the only verified one; unverified items follow newest first
+        client.post(f'/api/v1/verification/items/{item_ids[0]}', headers=headers, json={})
+        
+        names = []
+        cursor = ''
+        while cursor is not None:
+            response = client.get(f'/api/v1/item/?sort=freshness&limit=2&cursor={cursor}', headers=headers)
+            assert response.status_code == 200
+            page = json.loads(response.data)
+            names.extend(item['name'] for item in page['items'])
+            cursor = page['next_cursor']
+        
+        assert names == ["Item 0", "Item 2", "Item 1"]
+        assert page['items'][-1]['last_verified_date'] is None
+        first = json.loads(client.get('/api/v1/item/?sort=freshness', headers=headers).data)[0]
+        assert first['last_verified_date'] is not None
+
+    def test_get_all_items_rejects_unknown_sort(self, client, verified_user, app_context):
+        """Test that an unknown sort returns 400."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        response = client.get('/api/v1/item/?sort=popular', headers=headers)
+        
+        assert response.status_code == 400
+        assert 'sort' in json.loads(response.data)['message']
+
+    def test_get_all_items_rejects_invalid_cursor(self, client, verified_user, app_context):
+        """Test that a malformed cursor returns 400."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        response = client.get('/api/v1/item/?cursor=not-a-cursor', headers=headers)
+        
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert 'cursor' in data['message'].lower()
+
+    def test_get_all_items_etag_changes_after_create(self, client, verified_user, app_context, db_session):
+        """Test that the feed answers 304 until an item is added to the city."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        category = Category(category_name="Test")
+        db.session.add(category)
+        db.session.commit()
+        
+        etag = client.get('/api/v1/item/', headers=headers).headers['ETag']
+        response = client.get('/api/v1/item/', headers={**headers, 'If-None-Match': etag})
+        assert response.status_code == 304
+        
+        client.post('/api/v1/item/', headers=headers, json={
+            "name": "Lamp",
+            "location": "Shop",
+            "category_ids": [category.category_id],
+            "existing_tags": [],
+            "new_tags": []
+        })
+        response = client.get('/api/v1/item/', headers={**headers, 'If-None-Match': etag})
+        
+        assert response.status_code == 200
+        assert [item['name'] for item in json.loads(response.data)] == ["Lamp"]
+
+    def test_get_all_items_exclude_prunes_profile_picture_query(
+        self, client, verified_user, item, app_context, sql_statements
+    ):
+        """Test that exclude= keeps the author's avatar out of the response and SQL."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        item.added_by_user.profile_picture = 'data:image/png;base64,AVATAR'
+        db.session.commit()
+        sql_statements.clear()
+        
+        response = client.get(
+            '/api/v1/item/?exclude=added_by_user.profile_picture,tags',
+            headers=headers
+        )
+        
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data[0]['name'] == item.name
+        assert data[0]['added_by_user']['first_name'] == item.added_by_user.first_name
+        assert 'profile_picture' not in data[0]['added_by_user']
+        assert 'tags' not in data[0]
+        item_queries = [s for s in sql_statements if 'FROM item' in s]
+        assert item_queries
+        assert not any('profile_picture' in s for s in item_queries)
+
+    def test_get_item_by_id_fields_returns_only_requested(
+        self, client, verified_user, item, app_context
+    ):
+        """Test that fields= on item detail returns just the listed fields."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        response = client.get(
+            f'/api/v1/item/{item.item_id}?fields=name,categories.name',
+            headers=headers
+        )
+        
+        assert response.status_code == 200
+        assert json.loads(response.data) == {
+            'name': item.name,
+            'categories': [{'name': 'Electronics'}]
+        }
+
+    def test_get_all_items_rejects_unknown_field(self, client, verified_user, app_context):
+        """Test that an unknown field in fields= returns 400."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        response = client.get('/api/v1/item/?fields=price', headers=headers)
+        
+        assert response.status_code == 400
+        assert 'price' in json.loads(response.data)['message']
+
+    def test_get_all_items_filters_by_category_tags_and_distance(
+        self, client, verified_user, app_context, db_session
+    ):
+        """Test that filter parameters combine and apply to documents and pages."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        food = Category(category_name="Food")
+        gear = Category(category_name="Gear")
+        db.session.add_all([food, gear])
+        db.session.commit()
+        tag_repo = TagRepository()
+        vegan = tag_repo.create_tag(name="Vegan", value_type="boolean")
+        price = tag_repo.create_tag(name="Price", value_type="numeric")
+        
+        def create(name, category, is_vegan, cost, distance):
+            client.post('/api/v1/item/', headers=headers, json={
+                "name": name,
+                "location": "Downtown",
+                "walking_distance": distance,
+                "category_ids": [category.category_id],
+                "existing_tags": [
+                    {"tag_id": vegan.tag_id, "value": is_vegan},
+                    {"tag_id": price.tag_id, "value": cost}
+                ],
+                "new_tags": []
+            })
+        
+        create("Falafel", food, True, 5, 200)
+        create("Steak", food, False, 30, 300)
+        create("Salad", food, True, 12, 900)
+        create("Tent", gear, False, 80, 100)
+        
+        def names(query):
+            response = client.get(f'/api/v1/item/?{query}', headers=headers)
+            assert response.status_code == 200
+            data = json.loads(response.data)
+            items = data['items'] if isinstance(data, dict) else data
+            return [item['name'] for item in items]
+        
+        assert names(f'category_id={food.category_id}') == ["Salad", "Steak", "Falafel"]
+        assert names(f'tag_bool={vegan.tag_id}:true') == ["Salad", "Falafel"]
+        assert names(f'tag_min={price.tag_id}:10&tag_max={price.tag_id}:50') == ["Salad", "Steak"]
+        assert names(
+            f'category_id={food.category_id}&tag_bool={vegan.tag_id}:true&max_walking_distance=500'
+        ) == ["Falafel"]
+        assert names(
+            f'category_id={food.category_id}&category_id={gear.category_id}&tag_max={price.tag_id}:10'
+        ) == ["Falafel"]
+        assert names(f'tag_bool={vegan.tag_id}:true&limit=1') == ["Salad"]
+        assert names(f'tag_bool={vegan.tag_id}:true&fields=name') == ["Salad", "Falafel"]
+        assert names('min_verifications=1') == []
+
+    def test_get_all_items_rejects_malformed_filter(self, client, verified_user, app_context):
+        """Test that a malformed filter parameter returns 400."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        response = client.get('/api/v1/item/?tag_bool=3:maybe', headers=headers)
+        
+        assert response.status_code == 400
+        assert 'tag_bool' in json.loads(response.data)['message']
+
+    def test_search_items_matches_name_location_and_text_tags(
+        self, client, verified_user, app_context, db_session
+    ):
+        """Test that search matches word prefixes across indexed fields."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        category = Category(category_name="Food")
+        db.session.add(category)
+        db.session.commit()
+        cuisine = TagRepository().create_tag(name="Cuisine", value_type="text")
+        
+        def create(name, location, dish):
+            client.post('/api/v1/item/', headers=headers, json={
+                "name": name,
+                "location": location,
+                "category_ids": [category.category_id],
+                "existing_tags": [{"tag_id": cuisine.tag_id, "value": dish}],
+                "new_tags": []
+            })
+        
+        create("Café Roma", "Palermo Soho", "Italian")
+        create("Green Bowl", "Recoleta", "Vegan salads")
+        create("Parrilla Don Julio", "Palermo", "Steakhouse")
+        
+        def search(query):
+            response = client.get(f'/api/v1/item/search?q={query}', headers=headers)
+            assert response.status_code == 200
+            return [item['name'] for item in json.loads(response.data)]
+        
+        assert search("cafe") == ["Café Roma"]
+        assert sorted(search("palerm")) == ["Café Roma", "Parrilla Don Julio"]
+        assert search("vegan") == ["Green Bowl"]
+        assert search("palermo steak") == ["Parrilla Don Julio"]
+        assert search("sushi") == []
+
+    def test_search_items_ranks_verified_items_higher(
+        self, client, verified_user, item, app_context, db_session
+    ):
+        """Test that equally relevant matches are ordered by verifications."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        for name, count in [("Bike Shop North", 0), ("Bike Shop South", 12)]:
+            response = client.post('/api/v1/item/', headers=headers, json={
+                "name": name,
+                "location": "Center",
+                "category_ids": [item.category_items[0].category_id],
+                "existing_tags": [],
+                "new_tags": []
+            })
+            created = db.session.get(type(item), json.loads(response.data)['item_id'])
+            created.number_of_verifications = count
+        db.session.commit()
+        
+        response = client.get('/api/v1/item/search?q=bike shop', headers=headers)
+        
+        assert [i['name'] for i in json.loads(response.data)] == [
+            "Bike Shop South", "Bike Shop North"
+        ]
+
+    def test_search_items_requires_query(self, client, verified_user, app_context):
+        """Test that an empty search query returns 400."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        response = client.get('/api/v1/item/search?q=', headers=headers)
+        
+        assert response.status_code == 400
+
+    def test_get_item_facets_counts_categories_and_tag_values(
+        self, client, verified_user, app_context, db_session
+    ):
+        """Test that facets count the filtered items per category and tag value."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        food = Category(category_name="Food")
+        gear = Category(category_name="Gear")
+        db.session.add_all([food, gear])
+        db.session.commit()
+        vegan = TagRepository().create_tag(name="Vegan", value_type="boolean")
+        
+        for name, category, is_vegan in [
+            ("Falafel", food, True), ("Salad", food, True),
+            ("Steak", food, False), ("Tent", gear, False)
+        ]:
+            client.post('/api/v1/item/', headers=headers, json={
+                "name": name,
+                "location": "Downtown",
+                "category_ids": [category.category_id],
+                "existing_tags": [{"tag_id": vegan.tag_id, "value": is_vegan}],
+                "new_tags": []
+            })
+        
+        response = client.get('/api/v1/item/facets', headers=headers)
+        
+        assert response.status_code == 200
+        facets = json.loads(response.data)
+        assert facets['total'] == 4
+        assert facets['categories'] == [
+            {'category_id': food.category_id, 'name': 'Food', 'count': 3},
+            {'category_id': gear.category_id, 'name': 'Gear', 'count': 1}
+        ]
+        assert facets['tags'][0]['name'] == 'Vegan'
+        assert {v['value']: v['count'] for v in facets['tags'][0]['values']} == {True: 2, False: 2}
+        
+        response = client.get(
+            f'/api/v1/item/facets?tag_bool={vegan.tag_id}:false', headers=headers
+        )
+        facets = json.loads(response.data)
+        assert facets['total'] == 2
+        assert [c['count'] for c in facets['categories']] == [1, 1]
+        assert facets['tags'][0]['values'] == [{'value': False, 'count': 2}]
+
+    def test_get_item_facets_cached_until_city_changes(
+        self, client, verified_user, item, app_context, db_session, sql_statements
+    ):
+        """Test that repeated facet requests skip the aggregates until a write."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        first = json.loads(client.get('/api/v1/item/facets', headers=headers).data)
+        sql_statements.clear()
+        second = json.loads(client.get('/api/v1/item/facets', headers=headers).data)
+        
+        assert first == second
+        assert not any('GROUP BY' in s for s in sql_statements)
+        
+        client.post('/api/v1/item/', headers=headers, json={
+            "name": "Another",
+            "location": "Here",
+            "category_ids": [item.category_items[0].category_id],
+            "existing_tags": [],
+            "new_tags": []
+        })
+        third = json.loads(client.get('/api/v1/item/facets', headers=headers).data)
+        assert third['total'] == first['total'] + 1
+
+    def test_import_items_ndjson_reports_bad_rows_and_imports_the_rest(
+        self, client, verified_user, app_context, db_session
+    ):
+        """Test that an NDJSON import skips invalid rows and imports valid ones."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        category = Category(category_name="Food")
+        db.session.add(category)
+        db.session.commit()
+        TagRepository().create_tag(name="Price", value_type="numeric")
+        
+        rows = [
+            {"name": "Green Bowl", "location": "Recoleta", "categories": ["food"],
+             "tags": {"Price": 12, "Vegan": True, "Cuisine": "Salads"}},
+            {"name": "Taco Stand", "location": "Palermo", "categories": [category.category_id],
+             "tags": {"Vegan": False}},
+            {"name": "", "location": "Nowhere", "categories": ["Food"]},
+            {"name": "Lost", "location": "Nowhere", "categories": ["Unknown"]},
+            {"name": "Cheap", "location": "Center", "categories": ["Food"], "tags": {"Price": "free"}},
+        ]
+        body = '\n'.join(json.dumps(row) for row in rows) + '\n{not json\n'
+        
+        response = client.post(
+            '/api/v1/item/import', headers=headers, data=body, content_type='application/x-ndjson'
+        )
+        
+        assert response.status_code == 200
+        report = json.loads(response.data)
+        assert report['imported'] == 2
+        assert [error['row'] for error in report['errors']] == [3, 4, 5, 6]
+        assert 'Unknown' in report['errors'][1]['message']
+        assert "Price" in report['errors'][2]['message']
+        
+        items = json.loads(client.get('/api/v1/item/', headers=headers).data)
+        by_name = {item['name']: item for item in items}
+        assert set(by_name) == {"Green Bowl", "Taco Stand"}
+        assert {tag['name']: tag['value'] for tag in by_name["Green Bowl"]['tags']} == {
+            "Price": 12.0, "Vegan": True, "Cuisine": "Salads"
+        }
+        assert by_name["Green Bowl"]['categories'][0]['category_id'] == category.category_id
+        # The new Vegan tag was created once and reused by the second row
+        assert TagRepository().get_tag_by_name("Vegan").value_type_label == "boolean"
+        
+        search = json.loads(client.get('/api/v1/item/search?q=salads', headers=headers).data)
+        assert [item['name'] for item in search] == ["Green Bowl"]
+
+    def test_import_items_csv(self, client, verified_user, app_context, db_session):
+        """Test that a CSV import maps tag columns and category lists."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        db.session.add_all([Category(category_name="Food"), Category(category_name="Cafes")])
+        db.session.commit()
+        
+        body = (
+            "name,location,walking_distance,categories,tag:Wifi,tag:Seats\n"
+            "Café Roma,Palermo,250,Food;Cafes,true,40\n"
+            "Corner Shop,Center,,Food,,\n"
+        )
+        
+        response = client.post(
+            '/api/v1/item/import', headers=headers, data=body, content_type='text/csv'
+        )
+        
+        assert json.loads(response.data) == {'imported': 2, 'failed': 0, 'errors': []}
+        items = {item['name']: item for item in json.loads(client.get('/api/v1/item/', headers=headers).data)}
+        assert items["Café Roma"]['walking_distance'] == 250.0
+        assert sorted(c['name'] for c in items["Café Roma"]['categories']) == ["Cafes", "Food"]
+        assert {tag['name']: tag['value'] for tag in items["Café Roma"]['tags']} == {
+            "Wifi": True, "Seats": 40.0
+        }
+        assert items["Corner Shop"]['walking_distance'] is None
+        assert items["Corner Shop"]['tags'] == []
+
+    def test_import_items_rejects_unsupported_content_type(self, client, verified_user, app_context):
+        """Test that bodies other than NDJSON or CSV return 415."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        response = client.post('/api/v1/item/import', headers=headers, json=[])
+        
+        assert response.status_code == 415
+
+    def test_create_item_loads_existing_tags_and_user_once(
+        self, client, verified_user, app_context, db_session, sql_statements
+    ):
+        """Test that tag and user lookups are batched per request."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        category = Category(category_name="Food")
+        db.session.add(category)
+        db.session.commit()
+        repo = TagRepository()
+        tags = [repo.create_tag(name=name, value_type="text") for name in ("Cuisine", "Diet", "Area")]
+        body = {
+            "name": "Green Bowl",
+            "location": "Recoleta",
+            "category_ids": [category.category_id],
+            "existing_tags": [{"tag_id": tag.tag_id, "value": "x"} for tag in tags],
+            "new_tags": []
+        }
+        sql_statements.clear()
+        
+        response = client.post('/api/v1/item/', headers=headers, json=body)
+        
+        assert response.status_code == 201
+        tag_queries = [s for s in sql_statements if s.startswith('SELECT') and 'FROM tag' in s]
+        assert len(tag_queries) == 1
+        
+        sql_statements.clear()
+        client.get('/api/v1/item/facets', headers=headers)
+        # The conditional-GET check and the view share the request's user lookup
+        assert sum('FROM user' in s for s in sql_statements) == 1
+
+    def test_create_item_rejects_taken_new_tag_name(self, client, verified_user, app_context, db_session):
+        """Test that a new tag whose name exists is rejected before any write."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        category = Category(category_name="Food")
+        db.session.add(category)
+        db.session.commit()
+        TagRepository().create_tag(name="Wifi", value_type="boolean")
+        
+        response = client.post('/api/v1/item/', headers=headers, json={
+            "name": "Cafe",
+            "location": "Center",
+            "category_ids": [category.category_id],
+            "existing_tags": [],
+            "new_tags": [{"name": "wifi", "value_type": "boolean", "value": True}]
+        })
+        
+        assert response.status_code == 400
+        assert "already exists" in json.loads(response.data)['message']
+
+    # PATCH /api/v1/item/<id> tests
+
+    @pytest.fixture
+    def patch_setup(self, client, verified_user, app_context, db_session):
+        """An item created through the API, with two categories and two tags."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        categories = [Category(category_name=name) for name in ("Food", "Study", "Night")]
+        db.session.add_all(categories)
+        db.session.commit()
+        repo = TagRepository()
+        wifi = repo.create_tag(name="Wifi", value_type="boolean")
+        cuisine = repo.create_tag(name="Cuisine", value_type="text")
+        response = client.post('/api/v1/item/', headers=headers, json={
+            "name": "Green Bowl",
+            "location": "Recoleta",
+            "category_ids": [categories[0].category_id, categories[1].category_id],
+            "existing_tags": [
+                {"tag_id": wifi.tag_id, "value": True},
+                {"tag_id": cuisine.tag_id, "value": "Vegan"}
+            ],
+            "new_tags": []
+        })
+        assert response.status_code == 201
+        return {
+            'headers': headers,
+            'item_id': json.loads(response.data)['item_id'],
+            'categories': [c.category_id for c in categories],
+            'wifi': wifi.tag_id,
+            'cuisine': cuisine.tag_id,
+        }
+
+    def test_update_item_writes_only_the_difference(self, client, patch_setup, sql_statements):
+        """Test that PATCH diffs links and returns the same document a rebuild gives."""
+        from app.models.category_item import CategoryItem
+        from app.services.item_service import ItemService
+        s = patch_setup
+        url = f"/api/v1/item/{s['item_id']}"
+        kept_link = db.session.execute(
+            db.select(CategoryItem.category_item_id).filter_by(
+                item_id=s['item_id'], category_id=s['categories'][0]
+            )
+        ).scalar_one()
+        sql_statements.clear()
+        
+        response = client.patch(url, headers=s['headers'], json={
+            "name": "Green Bowl Café",
+            "category_ids": [s['categories'][0], s['categories'][2]],
+            "existing_tags": [{"tag_id": s['cuisine'], "value": "Vegan"}],
+            "new_tags": [{"name": "Price", "value_type": "numeric", "value": 12}]
+        })
+        
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['name'] == "Green Bowl Café"
+        assert data['location'] == "Recoleta"
+        assert [c['name'] for c in data['categories']] == ["Food", "Night"]
+        assert [(t['name'], t['value']) for t in data['tags']] == [("Cuisine", "Vegan"), ("Price", 12.0)]
+        # One DELETE and one INSERT per link table; the kept links are untouched
+        assert sum(q.startswith('DELETE FROM category_item') for q in sql_statements) == 1
+        assert sum(q.startswith('INSERT INTO category_item') for q in sql_statements) == 1
+        assert sum(q.startswith('DELETE FROM item_tag_value') for q in sql_statements) == 1
+        assert sum(q.startswith('INSERT INTO item_tag_value') for q in sql_statements) == 1
+        assert db.session.execute(
+            db.select(CategoryItem.category_item_id).filter_by(
+                item_id=s['item_id'], category_id=s['categories'][0]
+            )
+        ).scalar_one() == kept_link
+        
+        # The patched document matches a full re-render and is what readers get
+        rebuilt = ItemService().refresh_item_documents([s['item_id']], bump_versions=False)
+        assert json.loads(rebuilt[s['item_id']]) == data
+        assert json.loads(client.get(url, headers=s['headers']).data) == data
+        found = client.get('/api/v1/item/search?q=cafe', headers=s['headers'])
+        assert [i['item_id'] for i in json.loads(found.data)] == [s['item_id']]
+
+    def test_update_item_without_changes_writes_nothing(self, client, patch_setup, sql_statements):
+        """Test that sending the current values is a no-op."""
+        s = patch_setup
+        sql_statements.clear()
+        
+        response = client.patch(f"/api/v1/item/{s['item_id']}", headers=s['headers'], json={
+            "name": "Green Bowl",
+            "category_ids": s['categories'][:2],
+            "existing_tags": [
+                {"tag_id": s['cuisine'], "value": "Vegan"},
+                {"tag_id": s['wifi'], "value": True}
+            ]
+        })
+        
+        assert response.status_code == 200
+        assert not any(q.split()[0] in ('INSERT', 'UPDATE', 'DELETE') for q in sql_statements)
+
+    def test_update_item_invalid_tag_value_changes_nothing(self, client, patch_setup):
+        """Test that a validation error leaves the item as it was."""
+        s = patch_setup
+        url = f"/api/v1/item/{s['item_id']}"
+        before = json.loads(client.get(url, headers=s['headers']).data)
+        
+        response = client.patch(url, headers=s['headers'], json={
+            "name": "Renamed",
+            "existing_tags": [{"tag_id": s['wifi'], "value": "yes"}]
+        })
+        
+        assert response.status_code == 400
+        assert json.loads(client.get(url, headers=s['headers']).data) == before
+
+    def test_update_item_validation_errors_match_create(self, client, patch_setup):
+        """Test that PATCH reports validation errors in the same shape as POST."""
+        s = patch_setup
+        
+        created = client.post('/api/v1/item/', headers=s['headers'], json={
+            "name": "x" * 201, "location": "Center", "category_ids": [s['categories'][0]]
+        })
+        updated = client.patch(
+            f"/api/v1/item/{s['item_id']}", headers=s['headers'], json={"name": "x" * 201}
+        )
+        
+        assert updated.status_code == 400
+        created_error = json.loads(created.data)['errors'][0]
+        updated_error = json.loads(updated.data)['errors'][0]
+        assert updated_error == created_error
+        assert updated_error['ctx'] == {'max_length': '200'}
+
+    def test_update_item_by_another_user_is_forbidden(self, client, patch_setup, user):
+        """Test that only the user who added an item can edit it."""
+        s = patch_setup
+        url = f"/api/v1/item/{s['item_id']}"
+        tokens = TokenService.generate_tokens(user)
+        other_headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        before = json.loads(client.get(url, headers=s['headers']).data)
+        
+        response = client.patch(url, headers=other_headers, json={"name": "Renamed"})
+        
+        assert response.status_code == 403
+        assert json.loads(client.get(url, headers=s['headers']).data) == before
+
+    def test_update_item_not_found(self, client, patch_setup):
+        """Test that PATCH on a missing item returns 404."""
+        response = client.patch('/api/v1/item/9999', headers=patch_setup['headers'], json={"name": "X"})
+        
+        assert response.status_code == 404
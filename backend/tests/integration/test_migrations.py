@@ -0,0 +1,184 @@
+"""Integration tests for the schema migration runner and migrations."""
+import pytest
+from sqlalchemy import MetaData, inspect
+
+from app import db
+from app.migrations import applied_versions, load_migrations, upgrade_database
+from app.migrations.versions.v0006_cascade_foreign_keys import CASCADING_FOREIGN_KEYS
+from app.models import (
+    Category, CategoryItem, Item, ItemTagValue, ItemVerification, RotationCity, Tag, User,
+    Value, VerificationDailyCount, VerificationStatusEnum
+)
+from app.services.rotation_city_service import RotationCityService
+from app.services.user_service import UserService
+
+
+def _index_names(table: str) -> set[str]:
+    """Names of the indexes on a table."""
+    return {index['name'] for index in inspect(db.engine).get_indexes(table)}
+
+
+def _create_pre_cascade_schema():
+    """Create the tables as databases from before the cascades have them.
+
+    Foreign keys migration 0006 makes cascade are plain REFERENCES, and no
+    migration is recorded yet.
+    """
+    db.session.remove()
+    db.drop_all()
+    baseline = MetaData()
+    for table in db.metadata.sorted_tables:
+        if table.name == 'schema_version':
+            continue
+        copy = table.to_metadata(baseline)
+        for constraint in copy.foreign_key_constraints:
+            if constraint.column_keys[0] in CASCADING_FOREIGN_KEYS.get(table.name, ()):
+                constraint.ondelete = None
+                for foreign_key in constraint.elements:
+                    foreign_key.ondelete = None
+    baseline.create_all(db.engine)
+
+
+def _cascading_columns(table: str) -> set[str]:
+    """Foreign key columns of a table that cascade on delete."""
+    return {
+        foreign_key['constrained_columns'][0]
+        for foreign_key in inspect(db.engine).get_foreign_keys(table)
+        if (foreign_key.get('options') or {}).get('ondelete') == 'CASCADE'
+    }
+
+
+@pytest.mark.integration
+class TestMigrations:
+    """Test that databases old and new end up at the latest schema version."""
+
+    def test_new_database_is_created_at_latest_version(self, app_context):
+        """Test that a new database is stamped without running migrations."""
+        db.drop_all()
+
+        ran = upgrade_database()
+
+        assert ran == []
+        assert applied_versions() == {migration.version for migration in load_migrations()}
+        assert 'ix_item_tag_value_value_id_item_id' in _index_names('item_tag_value')
+
+    def test_existing_database_gets_pending_migrations(self, app_context):
+        """Test that a database from before migrations gets its missing indexes once."""
+        # create_all built the tables without recording any version
+        index = next(
+            index for index in ItemTagValue.__table__.indexes
+            if index.name == 'ix_item_tag_value_value_id_item_id'
+        )
+        index.drop(db.engine)
+
+        ran = upgrade_database()
+
+        assert [migration.version for migration in ran] == [
+            migration.version for migration in load_migrations()
+        ]
+        assert 'ix_item_tag_value_value_id_item_id' in _index_names('item_tag_value')
+        assert upgrade_database() == []
+
+    def test_intern_values_collapses_duplicates(self, db_session, verified_user, rotation_city):
+        """Test that values duplicated before interning collapse into one row."""
+        for index in Value.__table__.indexes:
+            if index.unique:
+                index.drop(db.engine)
+        tag = Tag(name="Wifi", value_type=1)
+        db.session.add(tag)
+        db.session.flush()
+        values = [Value(tag_id=tag.tag_id, boolean_val=True) for _ in range(3)]
+        items = [
+            Item(
+                name=f"Cafe {n}",
+                location="Centro",
+                added_by_user_id=verified_user.user_id,
+                rotation_city_id=rotation_city.city_id
+            )
+            for n in range(2)
+        ]
+        db.session.add_all(values + items)
+        db.session.flush()
+        db.session.add_all([
+            ItemTagValue(item_id=items[0].item_id, value_id=values[0].value_id),
+            ItemTagValue(item_id=items[0].item_id, value_id=values[1].value_id),
+            ItemTagValue(item_id=items[1].item_id, value_id=values[2].value_id),
+        ])
+        db.session.commit()
+        item_ids = [item.item_id for item in items]
+        kept_id = values[0].value_id
+
+        upgrade_database()
+
+        assert db.session.query(Value).count() == 1
+        links = db.session.query(ItemTagValue.item_id, ItemTagValue.value_id).all()
+        assert sorted(links) == [(item_ids[0], kept_id), (item_ids[1], kept_id)]
+        assert {'uq_value_tag_id_boolean_val', 'uq_value_tag_id_name_val'} <= _index_names('value')
+
+    def test_daily_counts_filled_from_existing_verifications(
+        self, db_session, user, verified_user, item
+    ):
+        """Test that verifications from before the rollup are counted per day."""
+        db.session.add_all([
+            ItemVerification(user_id=user.user_id, item_id=item.item_id),
+            ItemVerification(user_id=verified_user.user_id, item_id=item.item_id),
+        ])
+        db.session.commit()
+
+        upgrade_database()
+
+        rows = db.session.query(VerificationDailyCount).all()
+        assert [(row.item_id, row.rotation_city_id, row.verification_count) for row in rows] == [
+            (item.item_id, item.rotation_city_id, 2)
+        ]
+
+    def test_cascade_foreign_keys_make_deletes_work_on_old_databases(self, app_context):
+        """Test that a pre-cascade database can delete users and cities once migrated."""
+        _create_pre_cascade_schema()
+        assert 'user_id' not in _cascading_columns('item_verification')
+        city = RotationCity(name='Seoul', time_zone='Asia/Seoul')
+        other_city = RotationCity(name='Berlin', time_zone='Europe/Berlin')
+        category = Category(category_name='Cafes')
+        db.session.add_all([city, other_city, category])
+        db.session.flush()
+        author, verifier = [
+            User(
+                first_name=name, last_name='Kim', email=f'{name.lower()}@example.com',
+                rotation_city_id=city_id, is_verified=True,
+                status=VerificationStatusEnum.VERIFIED.code
+            )
+            for name, city_id in (('Min', city.city_id), ('Lena', other_city.city_id))
+        ]
+        db.session.add_all([author, verifier])
+        db.session.flush()
+        item = Item(
+            name='Hangang Cafe', location='Mapo', added_by_user_id=author.user_id,
+            rotation_city_id=city.city_id, number_of_verifications=2
+        )
+        db.session.add(item)
+        db.session.flush()
+        db.session.add_all([
+            CategoryItem(item_id=item.item_id, category_id=category.category_id),
+            ItemVerification(user_id=author.user_id, item_id=item.item_id),
+            ItemVerification(user_id=verifier.user_id, item_id=item.item_id),
+        ])
+        db.session.commit()
+        ids = (city.city_id, other_city.city_id, verifier.user_id, item.item_id)
+        db.session.remove()
+
+        upgrade_database()
+
+        city_id, other_city_id, verifier_id, item_id = ids
+        for table, columns in CASCADING_FOREIGN_KEYS.items():
+            assert set(columns) <= _cascading_columns(table), table
+        # Rebuilt tables keep their indexes and rows
+        assert 'ix_item_verification_item_id_created_at' in _index_names('item_verification')
+        assert db.session.query(ItemVerification).count() == 2
+        assert UserService().delete_user(verifier_id) is True
+        assert db.session.get(Item, item_id).number_of_verifications == 1
+        assert RotationCityService().delete_rotation_city(city_id) is True
+        assert db.session.query(Item).count() == 0
+        assert db.session.query(CategoryItem).count() == 0
+        assert db.session.query(ItemVerification).count() == 0
+        assert db.session.query(User).count() == 0
+        assert db.session.get(RotationCity, other_city_id) is not None
@@ -0,0 +1,161 @@
+"""Check that repository queries filter through indexes.
+
+Each case runs a repository method while recording its SQL, then asks
+SQLite for the plan of every statement (EXPLAIN QUERY PLAN). A ``SCAN`` of
+a table that grows with usage, whether of the table itself or of a whole
+index, means a filter or join column lacks a usable index; add one (and a
+migration creating it) when this fails.
+"""
+import re
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import event
+
+from app import db
+from app.models import Tag, Value
+from app.repositories.base.item_repository_interface import ItemSort
+from app.repositories.implementations.category_item_repository import CategoryItemRepository
+from app.repositories.implementations.idempotency_key_repository import IdempotencyKeyRepository
+from app.repositories.implementations.item_document_repository import ItemDocumentRepository
+from app.repositories.implementations.item_repository import ItemRepository
+from app.repositories.implementations.item_tag_value_repository import ItemTagValueRepository
+from app.repositories.implementations.item_verification_repository import (
+    ItemVerificationRepository
+)
+from app.repositories.implementations.user_repository import UserRepository
+from app.repositories.implementations.value_repository import ValueRepository
+from app.repositories.implementations.verification_code_repository import (
+    VerificationCodeRepository
+)
+from app.repositories.implementations.verification_daily_count_repository import (
+    VerificationDailyCountRepository
+)
+from app.utils.item_filters import ItemFilters
+
+# Reference data small enough to scan
+SCANNABLE_TABLES = {'category', 'tag', 'rotation_city', 'data_version', 'schema_version'}
+
+# Full scans of a table or of one of its indexes; SQLAlchemy aliases end in _<n>
+_SCAN = re.compile(r'^SCAN (\w+?)(?:_\d+)?(?: USING (?:COVERING )?INDEX \w+)?$')
+
+CASES = {
+    'items added by user': lambda d: ItemRepository().get_item_ids_by_user(d['user_id']),
+    'items of user with details': lambda d: ItemRepository().get_items_by_user(d['user_id']),
+    'items added outside city': lambda d: ItemRepository().get_item_ids_added_outside_city(d['city_id']),
+    'item with details': lambda d: ItemRepository().get_item_by_id_with_details(d['item_id'], d['city_id']),
+    'items by ids with details': lambda d: ItemRepository().get_items_by_ids_with_details([d['item_id']]),
+    'count filtered items': lambda d: ItemRepository().count_items(d['city_id'], d['filters']),
+    'category facet counts': lambda d: ItemRepository().get_category_counts(d['city_id'], d['filters']),
+    'tag value facet counts': lambda d: ItemRepository().get_tag_value_counts(d['city_id']),
+    'recount verifications': lambda d: ItemRepository().reconcile_verification_counts([d['item_id']]),
+    'city feed documents': lambda d: ItemDocumentRepository().get_city_documents(
+        d['city_id'], limit=20, cursor=(datetime.utcnow(), d['item_id']), filters=d['filters']
+    ),
+    'city feed documents by freshness': lambda d: ItemDocumentRepository().get_city_documents(
+        d['city_id'], limit=20, cursor=(1.0, d['item_id']), sort=ItemSort.FRESHNESS
+    ),
+    'user documents': lambda d: ItemDocumentRepository().get_user_documents(d['user_id']),
+    'categories of item': lambda d: CategoryItemRepository().get_category_ids_by_item(d['item_id']),
+    'items of category': lambda d: CategoryItemRepository().get_item_ids_by_category(d['category_id']),
+    'values of item': lambda d: ItemTagValueRepository().get_value_ids_by_item(d['item_id']),
+    'items of value': lambda d: ItemTagValueRepository().get_item_ids_by_value(d['value_id']),
+    'text values of tag': lambda d: ValueRepository().get_text_values_by_tag(d['tag_id']),
+    'item history': lambda d: ItemVerificationRepository().get_verifications_by_item_id(d['item_id'], 20),
+    'user history': lambda d: ItemVerificationRepository().get_verifications_by_user_id(d['user_id'], 20),
+    'item history page': lambda d: ItemVerificationRepository().get_verifications_by_item_id(
+        d['item_id'], 20, cursor=(datetime.utcnow(), 1)
+    ),
+    'user history page': lambda d: ItemVerificationRepository().get_verifications_by_user_id(
+        d['user_id'], 20, cursor=(datetime.utcnow(), 1)
+    ),
+    'verified today': lambda d: ItemVerificationRepository().user_verified_item_today(
+        d['user_id'], d['item_id']
+    ),
+    'batch verified today': lambda d: ItemVerificationRepository().get_item_ids_verified_today(
+        d['user_id'], [d['item_id']]
+    ),
+    'items verified by user': lambda d: ItemVerificationRepository().get_item_ids_verified_by_user(
+        d['user_id']
+    ),
+    'items verified outside city': lambda d: (
+        ItemVerificationRepository().get_item_ids_verified_outside_city(d['city_id'])
+    ),
+    'verification count': lambda d: ItemVerificationRepository().get_verification_count_for_item(
+        d['item_id']
+    ),
+    'city daily verification counts': lambda d: VerificationDailyCountRepository().get_city_daily_counts(
+        d['city_id'], date(2026, 1, 1), date(2026, 12, 31)
+    ),
+    'item daily verification counts': lambda d: VerificationDailyCountRepository().get_item_daily_counts(
+        d['item_id'], date(2026, 1, 1), date(2026, 12, 31)
+    ),
+    'rebuild item daily counts': lambda d: VerificationDailyCountRepository().rebuild([d['item_id']]),
+    'user by email': lambda d: UserRepository().get_user_by_email('john@example.com'),
+    'active login code': lambda d: VerificationCodeRepository().find_most_recent_active_code(
+        d['user_id'], 'login'
+    ),
+    'recent codes': lambda d: VerificationCodeRepository().count_recent_codes(d['user_id'], 'login', 60),
+    'idempotency key': lambda d: IdempotencyKeyRepository().get(d['user_id'], 'key'),
+    'expired idempotency keys': lambda d: IdempotencyKeyRepository().delete_expired(datetime.utcnow()),
+}
+
+
+def unindexed_scans(statement: str, parameters) -> list[str]:
+    """Tables a statement reads in full, per SQLite's query plan."""
+    plan = db.session.connection().exec_driver_sql(
+        f'EXPLAIN QUERY PLAN {statement}', parameters
+    ).all()
+    scans = []
+    for row in plan:
+        match = _SCAN.match(row.detail)
+        if match and match.group(1) not in SCANNABLE_TABLES:
+            scans.append(match.group(1))
+    return scans
+
+
+@pytest.fixture
+def data(db_session, user, item, category):
+    """IDs of a small dataset covering every table the cases read."""
+    tag = Tag(name='Wifi', value_type=1)
+    db_session.add(tag)
+    db_session.flush()
+    value = Value(tag_id=tag.tag_id, boolean_val=True)
+    db_session.add(value)
+    db_session.commit()
+    return {
+        'user_id': user.user_id,
+        'city_id': user.rotation_city_id,
+        'item_id': item.item_id,
+        'category_id': category.category_id,
+        'tag_id': tag.tag_id,
+        'value_id': value.value_id,
+        'filters': ItemFilters(
+            category_ids=(category.category_id,),
+            boolean_tags=((tag.tag_id, True),),
+            min_verifications=1
+        )
+    }
+
+
+@pytest.mark.integration
+@pytest.mark.repository
+@pytest.mark.parametrize('case', sorted(CASES))
+def test_query_uses_indexes(case, data, app_context):
+    """Test that no statement of a repository method scans a large table."""
+    recorded = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().startswith(('SELECT', 'UPDATE', 'DELETE', 'WITH')):
+            recorded.append((statement, parameters))
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        CASES[case](data)
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+
+    assert recorded
+    for statement, parameters in recorded:
+        scans = unindexed_scans(statement, parameters)
+        assert not scans, f"{case}: full scan of {', '.join(scans)} in\n{statement}"
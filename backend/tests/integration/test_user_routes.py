@@ -67,6 +67,44 @@ class TestGetCurrentUserRoute:
         assert data['message'] == 'User not found.'
 
 
+    def test_get_current_user_fields_returns_only_requested(
+        self,
+        client,
+        verified_user,
+        rotation_city,
+        app_context
+    ):
+        """Test that fields= limits the response to the listed fields."""
+        tokens = TokenService.generate_tokens(verified_user)
+
+        response = client.get(
+            '/api/v1/user/me?fields=first_name,rotation_city.name',
+            headers={'Authorization': f'Bearer {tokens["access_token"]}'}
+        )
+
+        assert response.status_code == 200
+        assert response.get_json() == {
+            'first_name': verified_user.first_name,
+            'rotation_city': {'name': rotation_city.name}
+        }
+
+    def test_get_current_user_rejects_unknown_field(
+        self,
+        client,
+        verified_user,
+        app_context
+    ):
+        """Test that an unknown field returns 400."""
+        tokens = TokenService.generate_tokens(verified_user)
+
+        response = client.get(
+            '/api/v1/user/me?exclude=password',
+            headers={'Authorization': f'Bearer {tokens["access_token"]}'}
+        )
+
+        assert response.status_code == 400
+
+
 @pytest.mark.integration
 class TestGetUserByIdRoute:
     """Tests for the GET /api/v1/user/<user_id> endpoint."""
@@ -100,3 +100,44 @@ class TestValueRoutes:
         assert response.status_code == 404
         data = json.loads(response.data)
         assert 'error' in data
+
+    def test_items_share_interned_values(self, client, verified_user, app_context, db_session):
+        """Test that items with the same tag value link one value row."""
+        from app import db
+        from app.models.category import Category
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        category = Category(category_name="Cafe")
+        db.session.add(category)
+        db.session.commit()
+        brand = TagRepository().create_tag(name="Brand", value_type=TagValueType.TEXT.code)
+        
+        for name in ("North Cafe", "South Cafe"):
+            response = client.post('/api/v1/item/', headers=headers, json={
+                "name": name,
+                "location": "Centro",
+                "category_ids": [category.category_id],
+                "existing_tags": [{"tag_id": brand.tag_id, "value": "Acme"}],
+                "new_tags": []
+            })
+            assert response.status_code == 201
+        
+        response = client.get(f'/api/v1/value/tag/{brand.tag_id}', headers=headers)
+        
+        assert [v['name_val'] for v in json.loads(response.data)] == ["Acme"]
+
+    def test_update_value_to_existing_value_merges(self, client, verified_user, app_context, db_session):
+        """Test that updating a value to one the tag already has merges the two."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        brand = TagRepository().create_tag(name="Brand", value_type=TagValueType.TEXT.code)
+        value_repo = ValueRepository()
+        acme = value_repo.create_value(brand.tag_id, "Acme", "text")
+        acme_id = acme.value_id
+        typo_id = value_repo.create_value(brand.tag_id, "Acme ", "text").value_id
+        
+        response = client.put(f'/api/v1/value/{typo_id}', headers=headers, json={"name_val": "Acme"})
+        
+        assert response.status_code == 200
+        assert json.loads(response.data)['value_id'] == acme_id
+        assert value_repo.get_value_by_id(typo_id) is None
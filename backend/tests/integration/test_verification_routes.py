@@ -1,5 +1,6 @@
 """Integration tests for Verification API endpoints."""
 import pytest
+from datetime import datetime, timedelta
 from flask import json
 from app.services.auth.token_service import TokenService
 from app.models import ItemVerification
@@ -47,6 +48,35 @@ class TestVerificationRoutes:
         assert data['verification_count'] == 1
         assert 'created_at' in data
 
+    def test_verify_item_refreshes_item_document(
+        self,
+        client,
+        verified_user,
+        item,
+        app_context
+    ):
+        """Test that item detail and feed reflect a new verification immediately."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        # Prime the stored document and cached feed before verifying
+        client.get(f'/api/v1/item/{item.item_id}', headers=headers)
+        client.get('/api/v1/item/', headers=headers)
+        client.post(
+            f'/api/v1/verification/items/{item.item_id}',
+            headers=headers,
+            json={}
+        )
+        
+        response = client.get(f'/api/v1/item/{item.item_id}', headers=headers)
+        
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['number_of_verifications'] == 1
+        
+        feed = json.loads(client.get('/api/v1/item/', headers=headers).data)
+        assert feed[0]['number_of_verifications'] == 1
+
     def test_verify_item_without_note(
         self,
         client,
@@ -276,6 +306,45 @@ class TestVerificationRoutes:
         assert data['returned_count'] == 2
         assert len(data['verifications']) == 2
 
+    def test_get_item_verifications_next_page(
+        self,
+        client,
+        verified_user,
+        item,
+        multiple_verifications,
+        app_context
+    ):
+        """Test fetching the next page with the returned cursor."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        first = json.loads(client.get(
+            f'/api/v1/verification/items/{item.item_id}?limit=2', headers=headers
+        ).data)
+        response = client.get(
+            f'/api/v1/verification/items/{item.item_id}?limit=2&cursor={first["next_cursor"]}',
+            headers=headers
+        )
+        
+        assert response.status_code == 200
+        second = json.loads(response.data)
+        assert second['returned_count'] == 1
+        assert second['next_cursor'] is None
+        ids = [v['verification_id'] for v in first['verifications'] + second['verifications']]
+        assert sorted(ids) == sorted(v.verification_id for v in multiple_verifications)
+
+    def test_get_user_verifications_invalid_cursor(self, client, verified_user, app_context):
+        """Test that a malformed cursor is a 400."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        response = client.get(
+            f'/api/v1/verification/users/{verified_user.user_id}?cursor=bogus',
+            headers=headers
+        )
+        
+        assert response.status_code == 400
+
     def test_get_item_verifications_empty(self, client, verified_user, item, app_context):
         """Test getting verifications for item with no verifications."""
         tokens = TokenService.generate_tokens(verified_user)
@@ -422,3 +491,162 @@ class TestVerificationRoutes:
         assert user_verifs_response.status_code == 200
         user_verifs_data = json.loads(user_verifs_response.data)
         assert user_verifs_data['count'] == 1
+
+    def test_get_item_verifications_exclude_user_photo(
+        self,
+        client,
+        verified_user,
+        item,
+        multiple_verifications,
+        app_context,
+        sql_statements
+    ):
+        """Test that exclude=user_photo never reads profile pictures."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        sql_statements.clear()
+        
+        response = client.get(
+            f'/api/v1/verification/items/{item.item_id}?exclude=user_photo,note',
+            headers=headers
+        )
+        
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['total_count'] == 3
+        for v in data['verifications']:
+            assert 'user_photo' not in v
+            assert 'note' not in v
+            assert v['item_name'] == item.name
+            assert v['user_name']
+        assert not any('profile_picture' in s for s in sql_statements)
+
+
+    # POST /api/v1/verification/items/batch tests
+
+    def test_verify_items_batch(
+        self, client, verified_user, user, item, book, app_context, sql_statements
+    ):
+        """Test that a batch verifies what it can and reports the rest."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        client.post(f'/api/v1/verification/items/{book.item_id}', headers=headers, json={})
+        sql_statements.clear()
+        
+        response = client.post('/api/v1/verification/items/batch', headers=headers, json={
+            'items': [
+                {'item_id': item.item_id, 'note': ' On the shelf '},
+                {'item_id': book.item_id},
+                {'item_id': 9999},
+                {'item_id': item.item_id},
+            ]
+        })
+        
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert [r['status'] for r in data['results']] == [
+            'verified', 'already_verified_today', 'not_found', 'duplicate'
+        ]
+        assert data['verified_count'] == 1
+        assert data['failed_count'] == 3
+        verification = data['results'][0]['verification']
+        assert verification['note'] == 'On the shelf'
+        assert verification['verification_count'] == 1
+        assert verification['item_name'] == item.name
+        assert verification['user_id'] == verified_user.user_id
+        assert db.session.query(ItemVerification).filter_by(item_id=item.item_id).count() == 1
+        
+        # Lookups, the insert and the counter update are one statement each
+        assert sum(s.startswith('SELECT item.item_id, item.name') for s in sql_statements) == 1
+        assert sum(s.startswith('SELECT item_verification.item_id') for s in sql_statements) == 1
+        assert sum(s.startswith('INSERT INTO item_verification') for s in sql_statements) == 1
+        assert sum(s.startswith('UPDATE item SET number_of_verifications') for s in sql_statements) == 1
+
+    def test_verify_items_batch_counts_each_item_once(
+        self, client, verified_user, item, book, app_context
+    ):
+        """Test that counters of every verified item are bumped."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        response = client.post('/api/v1/verification/items/batch', headers=headers, json={
+            'items': [{'item_id': item.item_id}, {'item_id': book.item_id}]
+        })
+        
+        data = json.loads(response.data)
+        assert data['verified_count'] == 2
+        ids = [r['verification']['verification_id'] for r in data['results']]
+        rows = {v.verification_id: v.item_id for v in db.session.query(ItemVerification)}
+        assert [rows[i] for i in ids] == [item.item_id, book.item_id]
+        item_response = client.get(f'/api/v1/verification/items/{book.item_id}', headers=headers)
+        assert json.loads(item_response.data)['total_count'] == 1
+
+    def test_verify_items_batch_validation(self, client, verified_user, app_context):
+        """Test that empty and oversized batches are rejected."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        empty = client.post('/api/v1/verification/items/batch', headers=headers, json={'items': []})
+        too_many = client.post('/api/v1/verification/items/batch', headers=headers, json={
+            'items': [{'item_id': n} for n in range(1, 52)]
+        })
+        
+        assert empty.status_code == 400
+        assert too_many.status_code == 400
+
+    # GET /api/v1/verification/trend tests
+
+    def test_get_verification_trend(
+        self, client, verified_user, item, book, app_context, sql_statements
+    ):
+        """Test that city and item trends count today's verifications."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        client.post(f'/api/v1/verification/items/{item.item_id}', headers=headers, json={})
+        sql_statements.clear()
+        client.post('/api/v1/verification/items/batch', headers=headers, json={
+            'items': [{'item_id': book.item_id}]
+        })
+        assert sum(s.startswith('INSERT INTO verification_daily_count') for s in sql_statements) == 1
+        today = datetime.utcnow().date()
+        
+        response = client.get(
+            f'/api/v1/verification/trend?city_id={item.rotation_city_id}'
+            f'&start={(today - timedelta(days=6)).isoformat()}',
+            headers=headers
+        )
+        default_range = client.get(
+            f'/api/v1/verification/trend?item_id={item.item_id}', headers=headers
+        )
+        
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['rotation_city_id'] == item.rotation_city_id
+        assert data['end'] == today.isoformat()
+        assert len(data['days']) == 7
+        assert data['days'][-1] == {'day': today.isoformat(), 'verification_count': 2}
+        assert data['total_count'] == 2
+        item_data = json.loads(default_range.data)
+        assert len(item_data['days']) == 30
+        assert item_data['total_count'] == 1
+
+    def test_get_verification_trend_validation(self, client, verified_user, item, app_context):
+        """Test that trend requests need a known city or item and valid days."""
+        tokens = TokenService.generate_tokens(verified_user)
+        headers = {'Authorization': f'Bearer {tokens["access_token"]}'}
+        
+        missing = client.get('/api/v1/verification/trend', headers=headers)
+        bad_day = client.get(
+            f'/api/v1/verification/trend?item_id={item.item_id}&start=yesterday', headers=headers
+        )
+        too_long = client.get(
+            f'/api/v1/verification/trend?item_id={item.item_id}&start=2020-01-01&end=2026-01-01',
+            headers=headers
+        )
+        unknown_city = client.get('/api/v1/verification/trend?city_id=9999', headers=headers)
+        
+        assert missing.status_code == 400
+        assert bad_day.status_code == 400
+        assert 'YYYY-MM-DD' in json.loads(bad_day.data)['message']
+        assert too_long.status_code == 400
+        assert unknown_city.status_code == 404
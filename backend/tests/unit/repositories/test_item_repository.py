@@ -1,5 +1,14 @@
 """Unit tests for ItemRepository."""
+import math
+import sqlite3
 import pytest
+from app import _ensure_sqlite_math_functions
+from app.models.category import Category
+from app.models.category_item import CategoryItem
+from app.models.item_tag_value import ItemTagValue
+from app.models.tag import Tag, TagValueType
+from app.models.value import Value
+from app.repositories.base.item_repository_interface import ItemLoadStrategy
 from app.repositories.implementations.item_repository import ItemRepository
 from app.repositories.implementations.user_repository import UserRepository
 from app.repositories.implementations.rotation_city_repository import RotationCityRepository
@@ -88,3 +97,64 @@ class TestItemRepository:
         assert item1.item_id != item2.item_id
         assert item1.name == "Item 1"
         assert item2.name == "Item 2"
+
+    @pytest.mark.parametrize("strategy", list(ItemLoadStrategy))
+    def test_get_all_items_with_details_strategies_agree(
+        self, db_session, verified_user, rotation_city, strategy
+    ):
+        """Test every loader strategy returns the same ordered, fully loaded items."""
+        repo = ItemRepository()
+        electronics = Category(category_name="Electronics")
+        furniture = Category(category_name="Furniture")
+        tag = Tag(name="WiFi", value_type=TagValueType.BOOLEAN.code)
+        db_session.add_all([electronics, furniture, tag])
+        db_session.commit()
+        # Values are interned: every item shares the one WiFi=true row
+        value = Value(tag_id=tag.tag_id, boolean_val=True)
+        db_session.add(value)
+        db_session.commit()
+
+        for i in range(3):
+            item = repo.create_item(
+                name=f"Item {i}",
+                location=f"Location {i}",
+                rotation_city_id=rotation_city.city_id,
+                added_by_user_id=verified_user.user_id
+            )
+            db_session.add_all([
+                CategoryItem(item_id=item.item_id, category_id=electronics.category_id),
+                CategoryItem(item_id=item.item_id, category_id=furniture.category_id),
+                ItemTagValue(item_id=item.item_id, value_id=value.value_id)
+            ])
+            db_session.commit()
+        city_id = rotation_city.city_id
+        user_id = verified_user.user_id
+        db_session.expunge_all()
+
+        items = repo.get_all_items_with_details(city_id, limit=2, strategy=strategy)
+
+        assert [item.name for item in items] == ["Item 2", "Item 1"]
+        for item in items:
+            assert len(item.category_items) == 2
+            assert item.item_tag_values[0].value.tag.name == "WiFi"
+            assert item.added_by_user.user_id == user_id
+
+    def test_freshness_math_on_sqlite_without_math_functions(self):
+        """Test ln and exp are registered when SQLite was built without them."""
+        class WithoutMathFunctions(sqlite3.Connection):
+            def execute(self, sql, *args):
+                if 'ln(' in sql and not hasattr(self, 'functions_registered'):
+                    raise sqlite3.OperationalError('no such function: ln')
+                return super().execute(sql, *args)
+
+            def create_function(self, *args, **kwargs):
+                self.functions_registered = True
+                return super().create_function(*args, **kwargs)
+
+        connection = sqlite3.connect(':memory:', factory=WithoutMathFunctions)
+        _ensure_sqlite_math_functions(connection, None)
+
+        ln, exp = connection.execute('SELECT ln(1 + exp(-3)), exp(0)').fetchone()
+        assert ln == pytest.approx(math.log1p(math.exp(-3)))
+        assert exp == 1
+        connection.close()
@@ -0,0 +1,59 @@
+"""Unit tests for request-scoped DataLoaders."""
+from operator import attrgetter
+import pytest
+from app.models.tag import TagValueType
+from app.repositories.implementations.tag_repository import TagRepository
+from app.repositories.loaders import DataLoader, get_loader
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+class TestDataLoader:
+    """Test DataLoader batching and memoization."""
+
+    @pytest.fixture
+    def tags(self, db_session):
+        repo = TagRepository()
+        return [
+            repo.create_tag(name=name, value_type=TagValueType.TEXT.code)
+            for name in ("Cuisine", "Wifi", "Price")
+        ]
+
+    def test_queued_keys_load_with_one_query(self, tags, sql_statements):
+        """Test that wanted keys are fetched together and remembered."""
+        loader = DataLoader(TagRepository().get_tags_by_ids, attrgetter('tag_id'))
+        ids = [tag.tag_id for tag in tags]
+        sql_statements.clear()
+
+        loader.want(ids + [999])
+        loaded = [loader.load(tag_id) for tag_id in ids]
+        missing = loader.load(999)
+        again = loader.load_many(reversed(ids))
+
+        assert len(sql_statements) == 1
+        assert ' IN ' in sql_statements[0]
+        assert [tag.name for tag in loaded] == ["Cuisine", "Wifi", "Price"]
+        assert missing is None
+        assert [tag.name for tag in again] == ["Price", "Wifi", "Cuisine"]
+
+    def test_primed_objects_skip_the_query(self, tags, sql_statements):
+        """Test that primed objects are served without fetching."""
+        loader = DataLoader(TagRepository().get_tags_by_ids, attrgetter('tag_id'))
+        loader.prime(tags[0])
+        sql_statements.clear()
+
+        assert loader.load(tags[0].tag_id) is tags[0]
+        assert sql_statements == []
+
+    def test_get_loader_is_shared_within_a_request_only(self, app):
+        """Test that loaders are per request and never reused outside one."""
+        repo = TagRepository()
+
+        with app.test_request_context():
+            first = get_loader(repo.get_tags_by_ids, attrgetter('tag_id'))
+            assert get_loader(repo.get_tags_by_ids, attrgetter('tag_id')) is first
+        with app.test_request_context():
+            assert get_loader(repo.get_tags_by_ids, attrgetter('tag_id')) is not first
+        with app.app_context():
+            outside = get_loader(repo.get_tags_by_ids, attrgetter('tag_id'))
+            assert get_loader(repo.get_tags_by_ids, attrgetter('tag_id')) is not outside
@@ -0,0 +1,70 @@
+"""Unit tests for the SQLite search index repository."""
+import pytest
+from app import db
+from app.models.item_tag_value import ItemTagValue
+from app.repositories.implementations.search_index_repository import (
+    SqliteSearchIndexRepository,
+    get_search_index_repository
+)
+from app.repositories.implementations.tag_repository import TagRepository
+from app.repositories.implementations.value_repository import ValueRepository
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+class TestSearchIndexRepository:
+    """Test indexing and querying the full-text index."""
+
+    def test_factory_picks_sqlite_implementation(self, db_session):
+        """Test that the test database gets the FTS5 implementation."""
+        assert isinstance(get_search_index_repository(), SqliteSearchIndexRepository)
+
+    def test_index_items_replaces_and_removes_entries(self, db_session, item):
+        """Test that re-indexing picks up renames and drops deleted items."""
+        repo = SqliteSearchIndexRepository()
+        city_id = item.rotation_city_id
+        repo.index_items([item.item_id])
+        assert repo.search_items(city_id, item.name.split()[0], 10) == [item.item_id]
+
+        item.name = "Renamed Lamp"
+        db.session.commit()
+        repo.index_items([item.item_id])
+        assert repo.search_items(city_id, "lamp", 10) == [item.item_id]
+
+        item_id = item.item_id
+        db.session.delete(item)
+        db.session.commit()
+        repo.index_items([item_id])
+        assert repo.search_items(city_id, "lamp", 10) == []
+
+    def test_index_items_includes_text_tag_values(self, db_session, item):
+        """Test that an item is found through its text tag values."""
+        tag = TagRepository().create_tag(name="Brand", value_type="text")
+        value = ValueRepository().create_value(tag.tag_id, "Philips Hue", "text")
+        db.session.add(ItemTagValue(item_id=item.item_id, value_id=value.value_id))
+        db.session.commit()
+
+        repo = SqliteSearchIndexRepository()
+        repo.index_items([item.item_id])
+
+        assert repo.search_items(item.rotation_city_id, "hue", 10) == [item.item_id]
+        assert repo.search_items(item.rotation_city_id + 1, "hue", 10) == []
+
+    def test_query_syntax_is_treated_as_text(self, db_session, item):
+        """Test that FTS operators and quotes in user input cannot break the query."""
+        repo = SqliteSearchIndexRepository()
+        repo.index_items([item.item_id])
+
+        assert repo.search_items(item.rotation_city_id, '" OR NEAR(', 10) == []
+        assert repo.search_items(item.rotation_city_id, '***', 10) == []
+
+    def test_update_value_reindexes_text(self, db_session):
+        """Test that value writes keep the value index current."""
+        tag = TagRepository().create_tag(name="Color", value_type="text")
+        value_repo = ValueRepository()
+        value = value_repo.create_value(tag.tag_id, "Red", "text")
+
+        value_repo.update_value(value.value_id, value_type="text", name_val="Crimson")
+
+        assert value_repo.find_similar_text_values(tag.tag_id, "red") == []
+        assert [v.name_val for v in value_repo.find_similar_text_values(tag.tag_id, "crim")] == ["Crimson"]
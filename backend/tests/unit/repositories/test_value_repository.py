@@ -177,3 +177,45 @@ class TestValueRepository:
         results = value_repo.find_similar_text_values(bool_tag.tag_id, "Sam")
         
         assert len(results) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+class TestValueInterning:
+    """Test that each (tag, typed value) is stored once."""
+
+    def test_create_value_returns_existing_value(self, db_session):
+        """Test that creating a value the tag already has reuses its row."""
+        tag = TagRepository().create_tag(name="Wifi", value_type="boolean")
+        value_repo = ValueRepository()
+        
+        first = value_repo.create_value(tag.tag_id, True, "boolean")
+        second = value_repo.create_value(tag.tag_id, True, "boolean")
+        
+        assert second.value_id == first.value_id
+        assert len(value_repo.get_all_values()) == 1
+
+    def test_get_or_create_values_batches_lookups(self, db_session, sql_statements):
+        """Test that many entries resolve with one query once they exist."""
+        tag_repo = TagRepository()
+        wifi = tag_repo.create_tag(name="Wifi", value_type="boolean")
+        brand = tag_repo.create_tag(name="Brand", value_type="text")
+        price = tag_repo.create_tag(name="Price", value_type="numeric")
+        entries = [
+            (wifi.tag_id, "boolean", True),
+            (brand.tag_id, "text", "Acme"),
+            (price.tag_id, "numeric", 10),
+            (wifi.tag_id, "boolean", True),
+        ]
+        value_repo = ValueRepository()
+        
+        created = value_repo.get_or_create_values(entries)
+        sql_statements.clear()
+        again = value_repo.get_or_create_values(entries)
+        
+        assert created[0] is created[3]
+        assert [value.value_id for value in again] == [value.value_id for value in created]
+        assert created[2].numerical_value == 10.0
+        assert len(sql_statements) == 1
+        assert value_repo.find_value(brand.tag_id, "text", "Acme").value_id == created[1].value_id
+        assert value_repo.find_value(brand.tag_id, "text", "Other") is None
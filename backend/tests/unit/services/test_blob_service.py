@@ -0,0 +1,68 @@
+"""Unit tests for BlobService."""
+import base64
+import pytest
+from app.models.blob import Blob
+from app.repositories.implementations.blob_repository import (
+    DatabaseBlobRepository,
+    FileSystemBlobRepository
+)
+from app.services.blob_service import BlobService
+from app.utils.blobs import blob_url, content_hash
+
+PNG = b'\x89PNG\r\n\x1a\n' + b'\x00' * 32
+PNG_DATA_URI = 'data:image/png;base64,' + base64.b64encode(PNG).decode('ascii')
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestBlobService:
+    """Test BlobService storage and image parsing."""
+
+    def test_store_image_stores_data_uri_once(self, db_session):
+        """Test that identical uploads are stored once under their hash."""
+        service = BlobService(DatabaseBlobRepository())
+
+        first = service.store_image(PNG_DATA_URI)
+        second = service.store_image(base64.b64encode(PNG).decode('ascii'))
+
+        assert first == second == content_hash(PNG)
+        assert db_session.query(Blob).count() == 1
+        assert service.get_blob(first) == (PNG, 'image/png')
+
+    def test_store_image_passes_through_references(self, db_session):
+        """Test that empty values, hashes and URLs are not stored again."""
+        service = BlobService(DatabaseBlobRepository())
+        blob_hash = content_hash(PNG)
+
+        assert service.store_image(None) is None
+        assert service.store_image(blob_hash) == blob_hash
+        assert service.store_image('https://example.com/a.png') == 'https://example.com/a.png'
+        assert db_session.query(Blob).count() == 0
+
+    def test_store_image_rejects_non_images(self, db_session):
+        """Test that invalid base64 and non-image content are rejected."""
+        service = BlobService(DatabaseBlobRepository())
+        html = base64.b64encode(b'<script>alert(1)</script>').decode('ascii')
+
+        with pytest.raises(ValueError, match='Invalid image data'):
+            service.store_image('not base64!')
+        with pytest.raises(ValueError, match='Unsupported image type'):
+            service.store_image(f'data:image/png;base64,{html}')
+
+    def test_filesystem_repository_keeps_bytes_out_of_database(self, db_session, tmp_path):
+        """Test that filesystem storage writes files and metadata-only rows."""
+        service = BlobService(FileSystemBlobRepository(str(tmp_path)))
+
+        blob_hash = service.store_image(PNG_DATA_URI)
+
+        assert db_session.get(Blob, blob_hash).data is None
+        assert (tmp_path / blob_hash[:2] / blob_hash[2:4] / blob_hash).read_bytes() == PNG
+        assert service.get_blob(blob_hash) == (PNG, 'image/png')
+
+    def test_blob_url_only_rewrites_hashes(self, app_context):
+        """Test that only blob hashes are turned into blob URLs."""
+        blob_hash = content_hash(PNG)
+
+        assert blob_url(blob_hash) == f'/api/v1/blob/{blob_hash}'
+        assert blob_url('https://example.com/a.png') == 'https://example.com/a.png'
+        assert blob_url(None) is None
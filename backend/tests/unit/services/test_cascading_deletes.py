@@ -0,0 +1,117 @@
+"""Unit tests for deleting cities, users and items through ON DELETE CASCADE."""
+import pytest
+from datetime import datetime, timedelta
+from app import db
+from app.models import (
+    CategoryItem, Item, ItemDocument, ItemVerification, RotationCity, User,
+    VerificationDailyCount, VerificationStatusEnum
+)
+from app.repositories.implementations.search_index_repository import get_search_index_repository
+from app.services.item_service import ItemService
+from app.services.rotation_city_service import RotationCityService
+from app.services.user_service import UserService
+from app.services.verification_service import VerificationService
+from app.utils.freshness import verification_weight
+
+
+def _count(model, *criteria):
+    """Count rows through the current session."""
+    return db.session.query(model).filter(*criteria).count()
+
+
+@pytest.fixture
+def other_city_item(db_session, second_user):
+    """An item in another city, verified by second_user and by the city's user."""
+    city = RotationCity(name='Seoul', time_zone='Asia/Seoul')
+    db_session.add(city)
+    db_session.flush()
+    author = User(
+        first_name='Min', last_name='Kim', email='min@example.com',
+        rotation_city_id=city.city_id, is_verified=True,
+        status=VerificationStatusEnum.VERIFIED.code
+    )
+    db_session.add(author)
+    db_session.flush()
+    item = Item(
+        name='Hangang Cafe', location='Mapo', added_by_user_id=author.user_id,
+        rotation_city_id=city.city_id, number_of_verifications=2
+    )
+    db_session.add(item)
+    db_session.flush()
+    db_session.add(ItemVerification(user_id=second_user.user_id, item_id=item.item_id))
+    db_session.add(ItemVerification(user_id=author.user_id, item_id=item.item_id))
+    db_session.commit()
+    return item
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestCascadingDeletes:
+    """Test that deletes are done by the database, not row by row in the ORM."""
+
+    def test_delete_rotation_city_removes_everything_in_it(
+        self, db_session, rotation_city, item, item_verification, second_user, other_city_item,
+        sql_statements
+    ):
+        """Test a city delete cascades and fixes items its users verified elsewhere."""
+        city_id = rotation_city.city_id
+        item_id = item.item_id
+        other_item_id = other_city_item.item_id
+        ItemService().refresh_item_documents([item_id, other_item_id])
+        del sql_statements[:]
+
+        assert RotationCityService().delete_rotation_city(city_id) is True
+
+        assert _count(RotationCity, RotationCity.city_id == city_id) == 0
+        assert _count(User, User.rotation_city_id == city_id) == 0
+        assert _count(Item, Item.rotation_city_id == city_id) == 0
+        assert _count(CategoryItem, CategoryItem.item_id == item_id) == 0
+        assert _count(ItemDocument, ItemDocument.item_id == item_id) == 0
+        assert _count(ItemVerification) == 1
+        assert db.session.get(Item, other_item_id).number_of_verifications == 1
+        assert get_search_index_repository().search_items(city_id, 'Laptop', 10) == []
+        # Dependent tables are never deleted from one row at a time
+        deletes = [s for s in sql_statements if s.startswith('DELETE')]
+        assert not any(s.startswith(('DELETE FROM item_verification', 'DELETE FROM category_item'))
+                       for s in deletes)
+
+    def test_delete_user_removes_their_items_and_recounts_verified_ones(
+        self, db_session, second_user, other_city_item
+    ):
+        """Test a user delete cascades to their verifications and fixes counters."""
+        user_id = second_user.user_id
+        other_item_id = other_city_item.item_id
+        now = datetime.utcnow()
+        remaining_at = now - timedelta(days=5)
+        for verification in other_city_item.item_verifications:
+            verification.created_at = now if verification.user_id == user_id else remaining_at
+        db_session.commit()
+        VerificationService().rebuild_daily_counts()
+        ItemService().backfill_freshness()
+
+        assert UserService().delete_user(user_id) is True
+
+        assert _count(User, User.user_id == user_id) == 0
+        assert _count(ItemVerification, ItemVerification.user_id == user_id) == 0
+        assert db.session.get(Item, other_item_id).number_of_verifications == 1
+        assert db.session.execute(
+            db.select(VerificationDailyCount.verification_count).filter_by(item_id=other_item_id)
+        ).scalar_one() == 1
+        # Freshness and last_verified_date only reflect the remaining verification
+        remaining = db.session.execute(
+            db.select(Item.freshness, Item.last_verified_date).filter_by(item_id=other_item_id)
+        ).one()
+        assert remaining.last_verified_date == remaining_at
+        assert remaining.freshness == pytest.approx(verification_weight(remaining_at), rel=1e-9)
+        assert UserService().delete_user(user_id) is False
+
+    def test_delete_item_cascades_to_its_rows(self, db_session, item, item_verification):
+        """Test an item delete removes its categories and verifications."""
+        item_id = item.item_id
+
+        assert ItemService().delete_item(item_id) is True
+
+        assert _count(Item, Item.item_id == item_id) == 0
+        assert _count(CategoryItem, CategoryItem.item_id == item_id) == 0
+        assert _count(ItemVerification, ItemVerification.item_id == item_id) == 0
+        assert ItemService().delete_item(item_id) is False
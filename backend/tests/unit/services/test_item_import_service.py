@@ -0,0 +1,100 @@
+"""Unit tests for ItemImportService."""
+import pytest
+from sqlalchemy.exc import IntegrityError
+from app.models.category import Category
+from app.models.item import Item
+from app.models.item_tag_value import ItemTagValue
+from app.models.tag import Tag
+from app.repositories.implementations.item_repository import ItemRepository
+from app.services.item_import_service import ItemImportService, read_csv, read_ndjson
+
+
+class FailingItemRepository(ItemRepository):
+    """Item repository whose bulk insert rejects items named "Boom"."""
+
+    def insert_items(self, rows):
+        if any(row['name'] == "Boom" for row in rows):
+            raise IntegrityError("INSERT INTO item", {}, Exception("rejected"))
+        return super().insert_items(rows)
+
+
+def _rows(count, **extra):
+    """Numbered NDJSON-shaped rows in the Food category."""
+    return [
+        (number, {"name": f"Item {number}", "location": "Center", "categories": ["Food"], **extra})
+        for number in range(1, count + 1)
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.service
+class TestItemImportService:
+    """Test ItemImportService methods."""
+
+    @pytest.fixture(autouse=True)
+    def food(self, db_session):
+        category = Category(category_name="Food")
+        db_session.add(category)
+        db_session.commit()
+        return category
+
+    def test_import_writes_each_chunk_with_multi_row_inserts(
+        self, db_session, verified_user, sql_statements
+    ):
+        """Test that every chunk inserts its items and links in one statement each."""
+        sql_statements.clear()
+
+        report = ItemImportService().import_rows(
+            _rows(50, tags={"Wifi": True}),
+            verified_user.rotation_city_id,
+            verified_user.user_id,
+            chunk_size=20
+        )
+
+        assert report.imported == 50
+        assert report.errors == []
+        assert sum(s.startswith('INSERT INTO item ') for s in sql_statements) == 3
+        assert sum(s.startswith('INSERT INTO item_tag_value ') for s in sql_statements) == 3
+        # The new tag is created by the first chunk and reused afterwards
+        assert sum(s.startswith('INSERT INTO tag ') for s in sql_statements) == 1
+        assert db_session.query(Item).count() == 50
+        assert db_session.query(ItemTagValue).count() == 50
+        assert db_session.query(Tag).filter_by(name="Wifi").count() == 1
+
+    def test_import_retries_failed_chunk_row_by_row(self, db_session, verified_user):
+        """Test that a database error only fails the row that caused it."""
+        rows = _rows(4)
+        rows[2][1]['name'] = "Boom"
+        service = ItemImportService(item_repository=FailingItemRepository())
+
+        report = service.import_rows(rows, verified_user.rotation_city_id, verified_user.user_id)
+
+        assert report.imported == 3
+        assert [error['row'] for error in report.errors] == [3]
+        assert "rejected" in report.errors[0]['message']
+        assert db_session.query(Item).count() == 3
+
+    def test_import_stops_at_max_rows(self, db_session, verified_user):
+        """Test that rows past max_rows are reported, not imported."""
+        report = ItemImportService().import_rows(
+            _rows(10), verified_user.rotation_city_id, verified_user.user_id,
+            chunk_size=3, max_rows=5
+        )
+
+        assert report.imported == 5
+        assert report.to_dict()['errors'] == [
+            {'row': 6, 'message': "Import is limited to 5 rows; this and later rows were skipped"}
+        ]
+
+    def test_readers_number_rows_by_line(self):
+        """Test that readers report line numbers and unreadable rows."""
+        ndjson = list(read_ndjson(['{"name": "A"}\n', '\n', '[1]\n', '{oops\n']))
+        csv_rows = list(read_csv([
+            'name,categories,tag:Wifi\n', 'A,Food;3,yes\n', 'B,Food,,extra\n'
+        ]))
+
+        assert [number for number, _ in ndjson] == [1, 3, 4]
+        assert isinstance(ndjson[1][1], ValueError)
+        assert csv_rows[0] == (2, {'name': 'A', 'categories': ['Food', 3], 'tags': {'Wifi': 'yes'}})
+        assert csv_rows[1][0] == 3
+        assert isinstance(csv_rows[1][1], ValueError)
@@ -1,6 +1,9 @@
 """Unit tests for ItemService."""
+import json
 import pytest
 from app.services.item_service import ItemService
+from app.services.value_service import ValueService
+from app.models.item_document import ItemDocument
 from app.repositories.implementations.item_repository import ItemRepository
 from app.repositories.implementations.category_repository import CategoryRepository
 from app.repositories.implementations.rotation_city_repository import RotationCityRepository
@@ -121,3 +124,158 @@ class TestItemService:
             service.get_item_by_id_with_details(12345, rotation_city.city_id)
         
         assert "not found" in str(exc_info.value).lower()
+
+    def test_create_item_stores_rendered_document(self, db_session, verified_user):
+        """Test that creating an item stores its rendered JSON document."""
+        category = Category(category_name="Cafes")
+        db_session.add(category)
+        db_session.commit()
+        service = ItemService()
+
+        item = service.create_item(
+            name="Corner Cafe",
+            location="Main St",
+            rotation_city_id=verified_user.rotation_city_id,
+            added_by_user_id=verified_user.user_id,
+            category_ids=[category.category_id],
+            existing_tags=[],
+            new_tags=[{"name": "WiFi", "value_type": "boolean", "value": True}]
+        )
+
+        document = json.loads(
+            service.get_item_document(item.item_id, verified_user.rotation_city_id)
+        )
+        assert document['name'] == "Corner Cafe"
+        assert document['categories'][0]['name'] == "Cafes"
+        assert document['tags'][0]['value'] is True
+
+    def test_value_update_refreshes_item_documents(self, db_session, verified_user):
+        """Test that updating a tag value rebuilds documents of items using it."""
+        category = Category(category_name="Cafes")
+        db_session.add(category)
+        db_session.commit()
+        service = ItemService()
+        item = service.create_item(
+            name="Corner Cafe",
+            location="Main St",
+            rotation_city_id=verified_user.rotation_city_id,
+            added_by_user_id=verified_user.user_id,
+            category_ids=[category.category_id],
+            existing_tags=[],
+            new_tags=[{"name": "Cuisine", "value_type": "text", "value": "Thai"}]
+        )
+        value_id = item.item_tag_values[0].value_id
+
+        ValueService(item_service=service).update_value(value_id, name_val="Korean")
+
+        document = json.loads(
+            service.get_item_document(item.item_id, verified_user.rotation_city_id)
+        )
+        assert document['tags'][0]['value'] == "Korean"
+
+    def test_item_documents_built_for_items_without_one(self, db_session, item, user):
+        """Test that reads build documents for items created outside the service."""
+        service = ItemService()
+
+        documents = service.get_item_documents(user.rotation_city_id)
+
+        assert len(documents) == 1
+        assert json.loads(documents[0])['item_id'] == item.item_id
+        assert db_session.get(ItemDocument, item.item_id) is not None
+
+    def test_city_feed_served_from_cache_until_city_changes(
+        self, app, db_session, verified_user
+    ):
+        """Test that feeds are cached per city version and refreshed on writes."""
+        category = Category(category_name="Cafes")
+        db_session.add(category)
+        db_session.commit()
+        service = ItemService()
+        cache = app.extensions['response_cache']
+        city_id = verified_user.rotation_city_id
+
+        def create(name):
+            return service.create_item(
+                name=name,
+                location="Main St",
+                rotation_city_id=city_id,
+                added_by_user_id=verified_user.user_id,
+                category_ids=[category.category_id],
+                existing_tags=[],
+                new_tags=[]
+            )
+
+        create("First")
+        assert len(service.get_item_documents(city_id)) == 1
+        assert len(service.get_item_documents(city_id)) == 1
+        assert cache.stats()['hits'] == 1
+
+        create("Second")
+        documents = service.get_item_documents(city_id)
+
+        assert [json.loads(doc)['name'] for doc in documents] == ["Second", "First"]
+        assert cache.stats()['misses'] == 2
+
+    def test_create_item_commits_once(self, db_session, verified_user, sql_statements):
+        """Test that item creation runs as a single transaction without re-querying."""
+        from sqlalchemy import event
+        from app import db
+        category = Category(category_name="Cafes")
+        db_session.add(category)
+        db_session.commit()
+        service = ItemService()
+        commits = []
+
+        def record(connection):
+            commits.append(connection)
+
+        event.listen(db.engine, 'commit', record)
+        sql_statements.clear()
+
+        item = service.create_item(
+            name="Corner Cafe",
+            location="Main St",
+            rotation_city_id=verified_user.rotation_city_id,
+            added_by_user_id=verified_user.user_id,
+            category_ids=[category.category_id],
+            existing_tags=[],
+            new_tags=[
+                {"name": "WiFi", "value_type": "boolean", "value": True},
+                {"name": "Cuisine", "value_type": "text", "value": "Thai"}
+            ]
+        )
+        event.remove(db.engine, 'commit', record)
+
+        assert len(commits) == 1
+        # The response is built from the objects just written, not reloaded
+        assert not any('AS item_item_id' in s for s in sql_statements)
+        assert [tag['name'] for tag in item.tags] == ["WiFi", "Cuisine"]
+        assert item.categories[0].category_name == "Cafes"
+
+    def test_create_item_rolls_back_on_error_part_way(self, db_session, verified_user):
+        """Test that a failure after writes started leaves no partial item behind."""
+        from app.models.item import Item
+        from app.models.tag import Tag
+        from app.models.value import Value
+        category = Category(category_name="Cafes")
+        db_session.add(category)
+        db_session.commit()
+        service = ItemService()
+
+        with pytest.raises(ValueError, match="must be boolean"):
+            service.create_item(
+                name="Corner Cafe",
+                location="Main St",
+                rotation_city_id=verified_user.rotation_city_id,
+                added_by_user_id=verified_user.user_id,
+                category_ids=[category.category_id],
+                existing_tags=[],
+                new_tags=[
+                    {"name": "Cuisine", "value_type": "text", "value": "Thai"},
+                    {"name": "WiFi", "value_type": "boolean", "value": "yes"}
+                ]
+            )
+
+        assert db_session.query(Item).count() == 0
+        assert db_session.query(Value).count() == 0
+        assert db_session.query(Tag).filter_by(name="Cuisine").count() == 0
@@ -1,11 +1,37 @@
 """Unit tests for VerificationService."""
 import pytest
+from datetime import date, datetime, timedelta
+from app import db
+from app.models.item import Item
+from app.models.item_verification import ItemVerification
+from app.models.verification_daily_count import VerificationDailyCount
+from app.repositories.implementations.item_repository import ItemRepository
+from app.services.item_service import ItemService
 from app.services.verification_service import (
     VerificationService,
     ItemNotFoundError,
     AlreadyVerifiedTodayError,
+    RotationCityNotFoundError,
     VerificationNotFoundError
 )
+from app.utils.freshness import current_score
+
+
+def _daily_counts():
+    """Read the whole daily verification rollup."""
+    return sorted(db.session.execute(db.select(
+        VerificationDailyCount.rotation_city_id,
+        VerificationDailyCount.day,
+        VerificationDailyCount.item_id,
+        VerificationDailyCount.verification_count
+    )).all())
+
+
+def _counter(item_id):
+    """Read an item's stored verification count."""
+    return db.session.execute(
+        db.select(Item.number_of_verifications).filter_by(item_id=item_id)
+    ).scalar_one()
 
 
 @pytest.mark.unit
@@ -189,6 +215,81 @@ class TestVerificationService:
         assert result['returned_count'] == 0
         assert result['verifications'] == []
 
+    def test_get_item_verifications_pages_with_cursor(self, db_session, user, item):
+        """Test that following next_cursor walks every verification once, newest first."""
+        same_time = datetime(2024, 5, 1, 12, 0)
+        db_session.add_all([
+            ItemVerification(user_id=user.user_id, item_id=item.item_id, created_at=created_at)
+            for created_at in [same_time, same_time, same_time - timedelta(days=1), same_time]
+        ])
+        db_session.commit()
+        service = VerificationService()
+        
+        seen = []
+        cursor = None
+        for _ in range(3):
+            result = service.get_item_verifications(item.item_id, limit=2, cursor=cursor)
+            seen += [(v['created_at'], v['verification_id']) for v in result['verifications']]
+            cursor = result['next_cursor']
+            if cursor is None:
+                break
+        
+        assert cursor is None
+        assert len(seen) == 4
+        assert seen == sorted(seen, reverse=True)
+
+    def test_get_item_verifications_total_from_counter(
+        self,
+        db_session,
+        item,
+        multiple_verifications
+    ):
+        """Test that the total is the item's stored counter, not a recount."""
+        item.number_of_verifications = 10
+        db_session.commit()
+        service = VerificationService()
+        
+        result = service.get_item_verifications(item.item_id)
+        
+        assert result['total_count'] == 10
+        assert result['returned_count'] == 3
+        assert result['next_cursor'] is None
+
+    def test_get_user_verifications_invalid_cursor(self, db_session, user):
+        """Test that a malformed cursor is rejected."""
+        service = VerificationService()
+        
+        with pytest.raises(ValueError):
+            service.get_user_verifications(user.user_id, cursor="not-a-cursor")
+
+    def test_get_user_verifications_is_one_select(
+        self,
+        db_session,
+        user,
+        item,
+        book,
+        sql_statements
+    ):
+        """Test that a page of verifications is read with one joined SELECT."""
+        db_session.add_all([
+            ItemVerification(user_id=user.user_id, item_id=item_id)
+            for item_id in [item.item_id, book.item_id] * 5
+        ])
+        db_session.commit()
+        service = VerificationService()
+        sql_statements.clear()
+        
+        result = service.get_user_verifications(user.user_id)
+        
+        assert result['count'] == 10
+        assert {v['item_name'] for v in result['verifications']} == {item.name, book.name}
+        assert all(
+            v['user_name'] == f"{user.first_name} {user.last_name}"
+            for v in result['verifications']
+        )
+        assert len(sql_statements) == 1
+        assert 'JOIN user' in sql_statements[0] and 'JOIN item' in sql_statements[0]
+
     def test_get_user_verifications(
         self,
         db_session,
@@ -249,3 +350,161 @@ class TestVerificationService:
         
         assert result['user_name'] == f"{user.first_name} {user.last_name}"
         assert result['item_name'] == item.name
+
+    def test_verify_item_increments_counter_in_place(
+        self,
+        db_session,
+        user,
+        verified_user,
+        item,
+        sql_statements
+    ):
+        """Test that the counter is bumped atomically instead of recounted."""
+        service = VerificationService()
+        service.verify_item(user_id=user.user_id, item_id=item.item_id)
+        sql_statements.clear()
+        
+        result = service.verify_item(user_id=verified_user.user_id, item_id=item.item_id)
+        
+        assert result['verification_count'] == 2
+        assert not any('count(' in s and 'item_verification' in s for s in sql_statements)
+        assert any(s.startswith('UPDATE item SET number_of_verifications=') for s in sql_statements)
+        assert _counter(item.item_id) == 2
+
+    def test_verify_item_updates_freshness(self, db_session, user, verified_user, item, book):
+        """Test that verifying stamps last_verified_date and raises freshness."""
+        service = VerificationService()
+        service.verify_item(user_id=user.user_id, item_id=item.item_id)
+        service.verify_items(verified_user.user_id, [(item.item_id, None), (book.item_id, None)])
+        
+        rows = {
+            row.item_id: row for row in db.session.execute(
+                db.select(Item.item_id, Item.last_verified_date, Item.freshness)
+            )
+        }
+        
+        assert rows[item.item_id].last_verified_date is not None
+        # Two verifications just now count about 2, one counts about 1
+        assert current_score(rows[item.item_id].freshness) == pytest.approx(2, rel=1e-3)
+        assert current_score(rows[book.item_id].freshness) == pytest.approx(1, rel=1e-3)
+
+    def test_backfill_freshness_matches_incremental_updates(self, db_session, user, item, book):
+        """Test that the set-based backfill computes what verifying maintains."""
+        now = datetime.utcnow()
+        for days_ago in (40, 12, 3):
+            ItemRepository().increment_verification_count(
+                item.item_id, verified_at=now - timedelta(days=days_ago)
+            )
+            db_session.add(ItemVerification(
+                user_id=user.user_id,
+                item_id=item.item_id,
+                created_at=now - timedelta(days=days_ago)
+            ))
+        book.freshness = 5.0
+        db_session.commit()
+        maintained = db.session.execute(
+            db.select(Item.freshness, Item.last_verified_date).filter_by(item_id=item.item_id)
+        ).one()
+        
+        updated = ItemService().backfill_freshness()
+        
+        assert updated == 2
+        backfilled = db.session.execute(
+            db.select(Item.freshness, Item.last_verified_date).filter_by(item_id=item.item_id)
+        ).one()
+        assert backfilled.freshness == pytest.approx(maintained.freshness, rel=1e-9)
+        assert backfilled.last_verified_date == maintained.last_verified_date
+        assert current_score(backfilled.freshness, now) == pytest.approx(
+            sum(0.5 ** (days / 30) for days in (40, 12, 3)), rel=1e-6
+        )
+        # Items without verifications are reset
+        assert db.session.execute(
+            db.select(Item.freshness).filter_by(item_id=book.item_id)
+        ).scalar_one() == 0
+
+    def test_reconcile_verification_counts(
+        self,
+        db_session,
+        multiple_verifications,
+        item,
+        book
+    ):
+        """Test that drifted counters are corrected and correct ones left alone."""
+        item.number_of_verifications = 7
+        book.number_of_verifications = 0
+        db_session.commit()
+        
+        corrected = VerificationService().reconcile_verification_counts()
+        
+        assert corrected == [item.item_id]
+        assert _counter(item.item_id) == 3
+        assert VerificationService().reconcile_verification_counts() == []
+
+    def test_rebuild_daily_counts_matches_incremental_updates(
+        self, db_session, user, verified_user, item, book
+    ):
+        """Test that the bulk rebuild computes what verifying maintains."""
+        service = VerificationService()
+        service.verify_item(user.user_id, item.item_id)
+        service.verify_items(verified_user.user_id, [(item.item_id, None), (book.item_id, None)])
+        db_session.add(ItemVerification(
+            user_id=user.user_id,
+            item_id=book.item_id,
+            created_at=datetime.utcnow() - timedelta(days=3)
+        ))
+        db_session.commit()
+        today = datetime.utcnow().date()
+        assert _daily_counts() == [
+            (item.rotation_city_id, today, item.item_id, 2),
+            (book.rotation_city_id, today, book.item_id, 1),
+        ]
+        
+        rows = service.rebuild_daily_counts()
+        
+        assert rows == 3
+        assert _daily_counts() == sorted([
+            (item.rotation_city_id, today, item.item_id, 2),
+            (book.rotation_city_id, today, book.item_id, 1),
+            (book.rotation_city_id, today - timedelta(days=3), book.item_id, 1),
+        ])
+
+    def test_get_verification_trend_fills_every_day(self, db_session, user, item, book):
+        """Test that city and item trends have one entry per day."""
+        service = VerificationService()
+        service.verify_item(user.user_id, item.item_id)
+        service.verify_item(user.user_id, book.item_id)
+        today = datetime.utcnow().date()
+        
+        city_trend = service.get_verification_trend(
+            today - timedelta(days=2), today, rotation_city_id=item.rotation_city_id
+        )
+        item_trend = service.get_verification_trend(
+            today - timedelta(days=2), today, item_id=item.item_id
+        )
+        
+        assert [day["verification_count"] for day in city_trend["days"]] == [0, 0, 2]
+        assert city_trend["days"][-1]["day"] == today.isoformat()
+        assert city_trend["total_count"] == 2
+        assert item_trend["total_count"] == 1
+        assert item_trend["rotation_city_id"] is None
+
+    def test_get_verification_trend_validation(self, db_session, item):
+        """Test that trends need a known city or item and a bounded range."""
+        service = VerificationService()
+        
+        with pytest.raises(ValueError):
+            service.get_verification_trend(date(2026, 1, 1), date(2026, 1, 31))
+        with pytest.raises(ValueError):
+            service.get_verification_trend(
+                date(2026, 1, 2), date(2026, 1, 1), item_id=item.item_id
+            )
+        with pytest.raises(ValueError):
+            service.get_verification_trend(
+                date(2025, 1, 1), date(2026, 1, 2), item_id=item.item_id
+            )
+        with pytest.raises(ItemNotFoundError):
+            service.get_verification_trend(date(2026, 1, 1), date(2026, 1, 31), item_id=99999)
+        with pytest.raises(RotationCityNotFoundError):
+            service.get_verification_trend(
+                date(2026, 1, 1), date(2026, 1, 31), rotation_city_id=99999
+            )
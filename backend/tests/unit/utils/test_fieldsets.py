@@ -0,0 +1,80 @@
+"""Unit tests for sparse fieldsets."""
+import pytest
+from werkzeug.datastructures import MultiDict
+from app.api.v1.schemas.item_schema import ItemResponse
+from app.models.user import User
+from app.utils.fieldsets import Fieldset
+
+
+@pytest.mark.unit
+class TestFieldset:
+    """Test Fieldset parsing, column mapping and projection."""
+
+    def test_from_args_returns_none_without_parameters(self):
+        """Test that no fieldset is built when neither parameter is given."""
+        assert Fieldset.from_args(MultiDict(), ItemResponse) is None
+
+    def test_unknown_field_raises(self):
+        """Test that unknown top-level and nested fields are rejected."""
+        with pytest.raises(ValueError, match='Unknown field'):
+            Fieldset(ItemResponse, fields='name,colour')
+        with pytest.raises(ValueError, match='Unknown field'):
+            Fieldset(ItemResponse, exclude='added_by_user.password')
+        with pytest.raises(ValueError, match='Unknown field'):
+            Fieldset(ItemResponse, fields='name.first')
+
+    def test_fields_keeps_only_listed_paths(self):
+        """Test that fields= keeps listed fields and listed nested fields."""
+        fieldset = Fieldset(ItemResponse, fields='name,added_by_user.first_name')
+
+        assert fieldset.wants('name')
+        assert not fieldset.wants('location')
+        assert fieldset.wants('added_by_user')
+        assert fieldset.wants('added_by_user', 'first_name')
+        assert not fieldset.wants('added_by_user', 'profile_picture')
+
+    def test_exclude_drops_nested_field_only(self):
+        """Test that exclude= on a nested field keeps its parent."""
+        fieldset = Fieldset(ItemResponse, exclude='added_by_user.profile_picture,tags')
+
+        assert fieldset.wants('added_by_user')
+        assert fieldset.wants('added_by_user', 'email')
+        assert not fieldset.wants('added_by_user', 'profile_picture')
+        assert not fieldset.wants('tags')
+
+    def test_attributes_maps_fields_to_columns_with_primary_key(self):
+        """Test that nested fields map to model columns plus the primary key."""
+        fieldset = Fieldset(ItemResponse, fields='added_by_user.first_name')
+
+        attributes = fieldset.attributes(User, 'added_by_user')
+
+        assert [attribute.key for attribute in attributes] == ['user_id', 'first_name']
+
+    def test_project_prunes_objects_and_dicts(self):
+        """Test that projection reads attributes, aliases and dict keys."""
+        class Obj:
+            pass
+
+        author = Obj()
+        author.first_name = 'Ada'
+        author.profile_picture = 'data:image/png;base64,AAAA'
+        category = Obj()
+        category.category_id = 1
+        category.category_name = 'Books'
+        item = Obj()
+        item.name = 'Lamp'
+        item.added_by_user = author
+        item.categories = [category]
+        item.tags = [{'tag_id': 2, 'name': 'Working', 'value_type': 'boolean', 'value': True}]
+
+        fieldset = Fieldset(
+            ItemResponse,
+            fields='name,added_by_user.first_name,categories.name,tags.value'
+        )
+
+        assert fieldset.project(item) == {
+            'name': 'Lamp',
+            'added_by_user': {'first_name': 'Ada'},
+            'categories': [{'name': 'Books'}],
+            'tags': [{'value': True}],
+        }
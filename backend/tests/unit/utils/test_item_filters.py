@@ -0,0 +1,57 @@
+"""Unit tests for item feed filters."""
+import pytest
+from werkzeug.datastructures import MultiDict
+from app.utils.item_filters import ItemFilters
+
+
+@pytest.mark.unit
+class TestItemFilters:
+    """Test ItemFilters parsing from query args."""
+
+    def test_from_args_returns_none_without_filters(self):
+        """Test that unrelated parameters do not build filters."""
+        assert ItemFilters.from_args(MultiDict({'limit': '10', 'fields': 'name'})) is None
+
+    def test_from_args_parses_every_parameter(self):
+        """Test that all filter parameters are parsed and numeric bounds merged per tag."""
+        filters = ItemFilters.from_args(MultiDict([
+            ('category_id', '4'),
+            ('category_id', '2'),
+            ('tag_bool', '1:TRUE'),
+            ('tag_min', '5:10'),
+            ('tag_max', '5:20.5'),
+            ('tag_max', '6:3'),
+            ('tag_text', '7: Vegan '),
+            ('max_walking_distance', '500'),
+            ('min_verifications', '2'),
+        ]))
+
+        assert filters == ItemFilters(
+            category_ids=(2, 4),
+            boolean_tags=((1, True),),
+            numeric_ranges=((5, 10.0, 20.5), (6, None, 3.0)),
+            text_tags=((7, 'Vegan'),),
+            max_walking_distance=500.0,
+            min_verifications=2
+        )
+
+    def test_equal_filters_hash_equal(self):
+        """Test that parameter order does not change the cache key."""
+        first = ItemFilters.from_args(MultiDict([('category_id', '1'), ('category_id', '2')]))
+        second = ItemFilters.from_args(MultiDict([('category_id', '2'), ('category_id', '1')]))
+
+        assert hash(first) == hash(second)
+
+    @pytest.mark.parametrize('args', [
+        {'category_id': 'abc'},
+        {'tag_bool': '1'},
+        {'tag_bool': '1:maybe'},
+        {'tag_min': 'x:3'},
+        {'tag_max': '1:lots'},
+        {'max_walking_distance': 'far'},
+        {'min_verifications': '1.5'},
+    ])
+    def test_from_args_rejects_malformed_values(self, args):
+        """Test that malformed filter values raise ValueError."""
+        with pytest.raises(ValueError):
+            ItemFilters.from_args(MultiDict(args))
@@ -0,0 +1,48 @@
+"""Unit tests for LRUCache."""
+import pytest
+from app.utils.lru_cache import LRUCache
+
+
+@pytest.mark.unit
+class TestLRUCache:
+    """Test LRUCache eviction and counters."""
+
+    def test_get_counts_hits_and_misses(self):
+        """Test that lookups are counted as hits or misses."""
+        cache = LRUCache(max_entries=4)
+        cache.set('a', 1)
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_evicts_least_recently_used_entry(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = LRUCache(max_entries=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+        assert cache.stats()['evictions'] == 1
+
+    def test_bounded_by_total_size(self):
+        """Test that total size stays within max_size."""
+        cache = LRUCache(max_entries=10, max_size=10)
+        cache.set('a', 'x' * 6, size=6)
+        cache.set('b', 'y' * 6, size=6)
+
+        assert cache.get('a') is None
+        assert cache.stats()['size'] == 6
+
+    def test_skips_values_larger_than_max_size(self):
+        """Test that an oversized value is not cached."""
+        cache = LRUCache(max_entries=10, max_size=10)
+        cache.set('a', 'x' * 20, size=20)
+
+        assert cache.get('a') is None
+        assert cache.stats()['entries'] == 0